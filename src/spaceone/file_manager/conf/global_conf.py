@@ -21,7 +21,7 @@ CACHES = {
 }
 
 
-BACKEND = "GCPGCSConnector"  # AWSS3Connector | MinIOS3Connector | GCPGCSConnector
+BACKEND = "GCPGCSConnector"  # AWSS3Connector | MinIOS3Connector | GCPGCSConnector | LocalFileSystemConnector
 CONNECTORS = {
     "AWSS3Connector": {
         "backend": "spaceone.file_manager.connector.aws_s3_connector:AWSS3Connector",
@@ -44,6 +44,19 @@ CONNECTORS = {
         "bucket_name": "<required>",
         "service_account_key": "<required>",
     },
+    "LocalFileSystemConnector": {
+        "backend": "spaceone.file_manager.connector.local_fs_connector:LocalFileSystemConnector",
+        "root_path": "<required>",
+    },
+    "InlineConnector": {
+        "backend": "spaceone.file_manager.connector.inline_connector:InlineConnector",
+        "max_object_size": 4 * 1024 * 1024,  # 저장 가능한 최대 크기 (MongoDB 문서 크기 제한보다 작게)
+    },
+    "PackConnector": {
+        "backend": "spaceone.file_manager.connector.pack_connector:PackConnector",
+        "pack_backend": "<required>",  # pack 객체를 저장할 CONNECTORS 항목 (AWSS3Connector 등)
+        "max_object_size": 1024 * 1024,  # 저장 가능한 최대 크기
+    },
     "SpaceConnector": {
         "backend": "spaceone.core.connector.space_connector:SpaceConnector",
         "endpoints": {
@@ -55,3 +68,218 @@ CONNECTORS = {
 # System Token Settings
 TOKEN = ""
 FILE_MANAGER_URL = ""
+
+# Signed Download URL Settings
+# 활성화하면 download_url 에 만료 시간이 있는 서명(sig)을 포함하여 다운로드 시 token 인증/파일 정보 조회를 생략
+# key rotation: 새 key 를 keys 에 추가하고 active_key_id 로 지정한 뒤, 이전 key 는 ttl 이 지나면 제거
+# (ttl + window 는 STORAGE_TIERING, KEY_LAYOUT.rekey 의 delete_grace_period 이하로 설정, 이동된 파일의 이전 링크가
+#  유효 시간 내에 동작하도록 하며 초과하면 REST 서버 시작 시 설정 오류로 실패)
+SIGNED_URL = {
+    "enabled": False,
+    "keys": {},  # {"key-2024-01": "<secret>"}
+    "active_key_id": None,
+    "ttl": 3000,
+    "window": 300,
+}
+
+# Download Offload Settings
+# 활성화하면 nginx 를 거친 다운로드 요청은 권한 확인 후 X-Accel-Redirect 로 응답하고 본문은 nginx 가 backend 에서 직접 전송
+# (deploy/helm/config/proxy.conf 의 /_offload location 필요, presigned URL 을 지원하지 않는 Inline/Pack backend 는 제외)
+# 본문이 file-manager 를 거치지 않으므로 TRANSFER_ADMISSION 의 동시 다운로드 수 / domain_bandwidth 제한은 적용되지 않음
+DOWNLOAD_OFFLOAD = {
+    "enabled": False,
+    "location": "/_offload",
+    "request_header": "X-File-Offload",  # nginx 가 설정하는 헤더 (없는 요청은 Python 에서 스트리밍)
+    "expires_in": 60,  # backend presigned URL 유효 시간 (초)
+}
+
+# Batch Get Settings
+MAX_GET_MANY_COUNT = 100
+
+# Backend Resilience Settings
+# 멱등 요청 재시도, 지연된 GET/HEAD 의 hedge 요청, backend 별 circuit breaker (backends 로 backend 별 설정)
+# concurrency: backend 별 동시 요청 수 제한 (throttle 응답 시 절반으로 줄이고 성공하면 천천히 늘림)
+BACKEND_RESILIENCE = {
+    "enabled": True,
+    "retry": {"max_attempts": 3, "base_delay": 0.1, "max_delay": 2.0},
+    "hedge": {"enabled": True, "percentile": 0.95, "min_delay": 0.05, "max_delay": 2.0, "min_samples": 20},
+    "circuit_breaker": {"failure_threshold": 5, "reset_timeout": 30},
+    "concurrency": {"enabled": True, "initial_limit": 32, "min_limit": 1, "max_limit": 256},
+    "backends": {},
+}
+
+# Batch Upload Settings
+MAX_BATCH_UPLOAD_FILE_COUNT = 100
+BATCH_UPLOAD_CONCURRENCY = 8  # 요청 1건에서 backend 로 동시에 전송하는 파일 수
+
+# Archive Download Settings
+MAX_ARCHIVE_FILE_COUNT = 1000
+ARCHIVE_PREFETCH_WINDOW = 4
+
+# Upload Size Policy (bytes, 0: unlimited)
+# resource_group(SYSTEM | DOMAIN | WORKSPACE | PROJECT | USER) 별 설정이 없으면 default 사용
+# nginx 에서 업로드 크기를 제한하지 않으므로 default 는 유한한 값으로 유지 (0 은 명시적으로 설정한 경우에만)
+FILE_SIZE_POLICIES = {
+    "default": {"max_size": 5 * 1024 * 1024 * 1024},  # 5GB
+}
+
+# Large Object Settings
+LARGE_OBJECT = {
+    "multipart_threshold": 64 * 1024 * 1024,  # 64MB 이상은 multipart 업로드
+    "multipart_chunk_size": 64 * 1024 * 1024,  # 파트 크기 (최대 10,000 파트 기준으로 자동 확장)
+    "max_concurrency": 4,  # 파트 동시 업로드 수
+    "gcs_chunk_size": 8 * 1024 * 1024,  # GCS resumable 업로드 청크 크기 (256KB 배수)
+}
+
+# Image Derivative (Thumbnail/Preview) Settings
+# download 요청에 ?w=&h=&fmt= 지정 시 리사이즈/재압축된 이미지를 반환 (Pillow 필요)
+IMAGE_DERIVATIVE = {
+    "max_width": 2048,
+    "max_height": 2048,
+    "quality": 85,  # jpeg/webp 품질
+    "max_source_size": 50 * 1024 * 1024,  # 원본 이미지 최대 크기 (50MB)
+    "process_pool_size": 2,  # 이미지 디코딩 프로세스 수
+    "render_timeout": 60,
+    "cache_max_size": 64 * 1024 * 1024,  # 메모리 LRU 캐시 크기 (64MB)
+    "pregenerate_specs": [],  # 업로드 직후 미리 생성할 spec (예: [{"w": 64, "h": 64, "fmt": "webp"}])
+}
+
+# Transfer Memory Budget Settings
+# 업로드/다운로드 전송 버퍼의 전역/전송별 최대 메모리 (초과 시 acquire_timeout 초 동안 대기 후 실패)
+MEMORY_BUDGET = {
+    "global_max_bytes": 1024 * 1024 * 1024,  # 1GB
+    "transfer_max_bytes": 128 * 1024 * 1024,  # 128MB
+    "acquire_timeout": 30,
+}
+
+# Transfer Admission Control Settings
+# pod/domain 별 동시 전송 수와 domain 별 전송 속도 제한 (초과 시 대기열에서 대기 후 429 + Retry-After)
+TRANSFER_ADMISSION = {
+    "max_concurrent_transfers": 64,  # pod 전체 (0: 제한 없음)
+    "max_concurrent_per_domain": 16,  # domain 별 (0: 제한 없음)
+    "max_queue_size": 128,
+    "queue_timeout": 10,  # 초
+    "retry_after": 5,  # 초
+    "domain_bandwidth": 0,  # domain 별 bytes/sec (0: 제한 없음)
+    "domain_bandwidth_burst": 16 * 1024 * 1024,
+    "domain_overrides": {},  # {"domain-xxx": {"max_concurrent": 32, "bandwidth": 104857600}}
+}
+
+# Resumable Upload Settings
+# 세션 생성 -> 파트(PATCH) 전송 -> complete, 파트 크기는 backend 최대 파트 수에 맞춰 자동으로 늘어남
+RESUMABLE_UPLOAD = {
+    "part_size": 8 * 1024 * 1024,  # 8MB (최소 5MB)
+    "expire_time": 86400,  # 마지막 파트 수신 후 세션 유지 시간 (초)
+}
+
+# Storage Routing Settings
+# 업로드 시 규칙을 순서대로 검사하여 처음 일치하는 CONNECTORS 항목에 저장 (없으면 BACKEND)
+# match: resource_groups, domain_ids, min_size, max_size (bytes), content_types (glob)
+STORAGE_ROUTING = {
+    "rules": [],  # [{"backend": "AWSS3Connector", "match": {"resource_groups": ["PROJECT"], "min_size": 104857600}}]
+}
+
+# Storage Tiering Settings
+# 생성 후 min_age_days 가 지난 파일을 target_backend 로 이동 (scheduler 에서 batch_size 단위로 실행)
+# 저비용 tier 는 storage_class 를 지정한 CONNECTORS 항목으로 정의 (AWS S3: STANDARD_IA, GCS: NEARLINE 등)
+# 예) "AWSS3ConnectorIA": {"backend": "spaceone.file_manager.connector.aws_s3_connector:AWSS3Connector",
+#                         ..., "storage_class": "STANDARD_IA"}
+# min_idle_days 를 지정하면 그 기간 동안 다운로드되지 않은 파일만 이동
+STORAGE_TIERING = {
+    "rules": [],  # [{"source_backend": "AWSS3Connector", "target_backend": "AWSS3ConnectorIA", "min_age_days": 30}]
+    "batch_size": 100,
+    "delete_grace_period": 3600,  # 이동 후 이전 객체 삭제까지 유예 시간 (초)
+}
+
+# Inline Storage Settings
+# max_size 이하로 크기를 알고 있는 업로드는 STORAGE_ROUTING 보다 먼저 검사하여 backend (MongoDB) 에 저장
+# migrate 를 활성화하면 scheduler 가 max_size 변경에 맞춰 File, UserFile 을 inline <-> 일반 backend 로 batch_size 씩 이동
+# (비활성화하면 inline 에 남은 파일을 모두 일반 backend 로 이동)
+INLINE_STORAGE = {
+    "enabled": False,
+    "backend": "InlineConnector",  # CONNECTORS 항목
+    "max_size": 16 * 1024,  # 16KB
+    "migrate": False,
+    "batch_size": 100,
+}
+
+# Small File Packing Settings
+# STORAGE_ROUTING 규칙으로 PackConnector 에 저장된 작은 파일을 pack 객체로 모아 기록 (scheduler 에서 실행)
+# 예) {"backend": "PackConnector", "match": {"resource_groups": ["USER"], "max_size": 65536}}
+# 업로드된 객체는 pack 에 기록될 때까지 MongoDB 에 보관되고, pack_size 만큼 모이거나 max_wait (초) 가 지나면 기록
+# 삭제로 참조되지 않는 크기가 garbage_ratio 이상인 pack 은 남은 객체만 새 pack 으로 옮긴 뒤 유예 시간 후 삭제
+PACKING = {
+    "enabled": False,
+    "backend": "PackConnector",  # CONNECTORS 항목
+    "pack_size": 64 * 1024 * 1024,  # 64MB
+    "max_wait": 300,
+    "max_packs": 10,  # 작업 1회에 기록/compaction/삭제하는 최대 pack 수
+    "compaction": {"garbage_ratio": 0.5, "min_age": 3600},
+    "delete_grace_period": 3600,  # RETIRED 후 pack 객체 삭제까지 유예 시간 (초)
+}
+
+# Object Key Layout Settings
+# version: 새 파일의 object key 형식 (1: /files/{group}/{file_id}, 2: files/{shard}/{domain_id}/{group}/{file_id})
+# 파일마다 저장 시 사용한 버전을 기록하므로 버전을 바꿔도 기존 파일은 그대로 조회되고,
+# rekey 를 활성화하면 scheduler 가 이전 버전의 File, UserFile 객체를 batch_size 씩 새 key 로 옮긴다.
+KEY_LAYOUT = {
+    "version": 1,
+    "layouts": {},  # 추가 layout {3: "files/{shard4}/{domain_id}/{group}/{file_id}"}
+    "rekey": {"enabled": False, "batch_size": 100, "delete_grace_period": 3600},
+}
+
+# Access Tracking Settings
+# 다운로드 횟수/마지막 접근 시간을 메모리에서 모아 flush_interval 마다 bulk write
+ACCESS_TRACKING = {
+    "enabled": True,
+    "sample_rate": 1.0,  # 0.1: 10건 중 1건만 기록 (횟수는 10배로 보정)
+    "flush_interval": 60,
+    "max_pending": 10000,
+}
+
+# File Lifecycle Settings
+# 마지막 접근 (접근 기록이 없으면 생성) 후 expire_after_days 가 지난 파일 삭제 (scheduler 에서 실행)
+FILE_LIFECYCLE = {
+    "rules": [],  # [{"resource_type": "UserFile", "expire_after_days": 90}, {"resource_type": "File", "resource_groups": ["PROJECT"], "expire_after_days": 365}]
+    "batch_size": 100,
+    "max_batches": 10,  # 한 번 실행에 처리할 최대 batch 수
+}
+
+# Usage Settings
+# 사용량 counter 는 파일 추가/삭제/이동 시 증감하고, scheduler 가 주기적으로 전체 집계 값으로 보정 (초, 0: 보정 안 함)
+USAGE_RECONCILE_INTERVAL = 86400
+
+# Storage Quota Settings
+# 업로드 전 선언된 크기로 검사하고, 파일 정보 생성 시 사용량에 반영하여 동시 업로드도 포함 (bytes, 0: 제한 없음)
+STORAGE_QUOTA = {
+    "quotas": {},  # {"DOMAIN": 1099511627776, "WORKSPACE": 107374182400, "USER": 1073741824}
+    "overrides": {},  # {"workspace-xxx": 536870912000}
+    "cache_ttl": 30,  # 사용량 counter 캐시 유지 시간 (초)
+}
+
+# Queue Settings
+QUEUES = {
+    "file_manager_q": {
+        "backend": "spaceone.core.queue.redis_queue.RedisQueue",
+        "host": "redis",
+        "port": 6379,
+        "channel": "file_manager_job",
+    },
+}
+
+# Scheduler Settings
+# 만료된 업로드 세션 정리, storage tier 이동, 파일 만료, 사용량 보정 (scheduler/worker 배포 시 사용)
+SCHEDULERS = {
+    "file_manager_scheduler": {
+        "backend": "spaceone.file_manager.interface.task.v1.file_manager_scheduler:FileManagerScheduler",
+        "queue": "file_manager_q",
+        "interval": 3600,
+    },
+}
+WORKERS = {
+    "file_manager_worker": {
+        "backend": "spaceone.core.scheduler.worker:BaseWorker",
+        "queue": "file_manager_q",
+        "pool": 1,
+    },
+}
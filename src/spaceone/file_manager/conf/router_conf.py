@@ -11,4 +11,14 @@ ROUTER = [
             "prefix": "/files",
         },
     },
+    {
+        "router_path": "spaceone.file_manager.interface.rest.upload_session:router",
+        "router_options": {
+            "prefix": "/files",
+        },
+    },
+    {
+        "router_path": "spaceone.file_manager.interface.rest.metrics:router",
+        "router_options": {},
+    },
 ]
@@ -1,3 +1,20 @@
-from spaceone.file_manager.connector.aws_s3_connector import AWSS3Connector
-from spaceone.file_manager.connector.minio_connector import MinIOS3Connector
-from spaceone.file_manager.connector.gcp_gcs_connector import GCPGCSConnector
+import importlib
+
+# cloud SDK(boto3, minio, google-cloud-storage) import 비용이 커서 사용하는 connector 만 처음 참조할 때 import
+_CONNECTOR_MODULES = {
+    "AWSS3Connector": "spaceone.file_manager.connector.aws_s3_connector",
+    "MinIOS3Connector": "spaceone.file_manager.connector.minio_connector",
+    "GCPGCSConnector": "spaceone.file_manager.connector.gcp_gcs_connector",
+    "LocalFileSystemConnector": "spaceone.file_manager.connector.local_fs_connector",
+    "InlineConnector": "spaceone.file_manager.connector.inline_connector",
+    "PackConnector": "spaceone.file_manager.connector.pack_connector",
+}
+
+__all__ = list(_CONNECTOR_MODULES)
+
+
+def __getattr__(name: str):
+    if name in _CONNECTOR_MODULES:
+        return getattr(importlib.import_module(_CONNECTOR_MODULES[name]), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
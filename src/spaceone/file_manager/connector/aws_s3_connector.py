@@ -1,42 +1,62 @@
 import logging
 import boto3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import botocore
+from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig
 
+from spaceone.core import config
 from spaceone.core.error import *
+from spaceone.file_manager.error import *
+from spaceone.file_manager.lib.memory_budget import get_transfer_max_bytes
+from spaceone.file_manager.lib.size_policy import get_stream_size
+from spaceone.file_manager.lib.stream import format_range_header
 from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
 
 __all__ = ["AWSS3Connector"]
 _LOGGER = logging.getLogger(__name__)
 
+MAX_COPY_OBJECT_SIZE = 5 * 1024 * 1024 * 1024  # CopyObject 최대 크기 (5GB)
+COPY_PART_SIZE = 512 * 1024 * 1024  # UploadPartCopy 파트 크기 (512MB)
+MAX_MULTIPART_PARTS = 10000
+COPY_CONCURRENCY = 8
+
 
 class AWSS3Connector(FileBaseConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.client = None
         self.bucket_name = None
-        self._create_session()
+        # tier 별 connector 설정 (예: STANDARD_IA, GLACIER_IR), 없으면 bucket 기본값
+        self.storage_class = self.config.get("storage_class")
+        self._check_config()
         self._set_bucket()
 
+    @property
+    def client(self):
+        # boto3 client 는 생성 비용이 커서 처음 사용할 때 만들고 프로세스 내에서 공유
+        return self._get_client(self._create_session)
+
+    def _check_config(self):
+        if self.config.get("region_name") is None:
+            raise ERROR_CONNECTOR_CONFIGURATION(backend="AWSS3Connector")
+
     def _create_session(self):
         aws_access_key_id = self.config.get("aws_access_key_id")
         aws_secret_access_key = self.config.get("aws_secret_access_key")
         region_name = self.config.get("region_name")
 
-        if region_name is None:
-            raise ERROR_CONNECTOR_CONFIGURATION(backend="AWSS3Connector")
-
         if aws_access_key_id and aws_secret_access_key:
-            self.client = boto3.client(
+            return boto3.client(
                 "s3",
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
                 region_name=region_name,
             )
-        else:
-            self.client = boto3.client("s3", region_name=region_name)
+
+        return boto3.client("s3", region_name=region_name)
 
     def _set_bucket(self):
         bucket_name = self.config.get("bucket_name")
@@ -71,6 +91,7 @@ class AWSS3Connector(FileBaseConnector):
     def upload_file(self, resource_group:str, file_id: str, data: bytes) -> None:
         """
         S3 파일 업로드 (예외 전파)
+        이미 메모리에 있는 작은 객체(썸네일 등) 전용, 일반 파일은 stream_upload_file 사용
         """
         object_name = self._generate_object_name(resource_group, file_id)
 
@@ -78,7 +99,7 @@ class AWSS3Connector(FileBaseConnector):
         try:
             file_obj = BytesIO(data)
             _LOGGER.info(f"[upload_file] Uploading to S3: {object_name}")
-            self.client.upload_fileobj(file_obj, self.bucket_name, object_name)
+            self.client.upload_fileobj(file_obj, self.bucket_name, object_name, ExtraArgs=self._get_extra_args())
             _LOGGER.info(f"[upload_file] Successfully uploaded to {object_name}")
         except Exception as e:
             _LOGGER.error(f'[upload_file] Error uploading {object_name}: {e}')
@@ -124,8 +145,9 @@ class AWSS3Connector(FileBaseConnector):
                 file_stream,
                 self.bucket_name,
                 object_name,
-                ExtraArgs={'ContentType': content_type},
-                Callback=callback
+                ExtraArgs=self._get_extra_args(ContentType=content_type),
+                Callback=callback,
+                Config=self._get_transfer_config(file_stream),
             )
 
             upload_time = time.time() - start_time
@@ -135,6 +157,47 @@ class AWSS3Connector(FileBaseConnector):
             _LOGGER.error(f'[stream_upload_file] Error: {e}')
             raise e
 
+    def _get_extra_args(self, **extra_args) -> dict:
+        if self.storage_class:
+            extra_args["StorageClass"] = self.storage_class
+        return extra_args
+
+    def get_upload_buffer_size(self, file_size) -> int:
+        chunk_size, concurrency = self._get_multipart_settings(file_size)
+        return chunk_size * concurrency
+
+    def _get_transfer_config(self, file_stream) -> TransferConfig:
+        """
+        대용량 객체 multipart 설정
+        S3 multipart 는 최대 10,000 파트이므로 크기를 알면 파트 크기를 자동으로 늘린다.
+        """
+        large_object_conf = config.get_global("LARGE_OBJECT", {})
+        chunk_size, concurrency = self._get_multipart_settings(get_stream_size(file_stream))
+
+        # 읽어둔 파트 수를 동시 업로드 수로 제한하여 전송당 버퍼를 chunk_size * concurrency 로 고정
+        return TransferConfig(
+            multipart_threshold=large_object_conf.get("multipart_threshold", 64 * 1024 * 1024),
+            multipart_chunksize=chunk_size,
+            max_concurrency=concurrency,
+            max_in_memory_upload_chunks=concurrency,
+        )
+
+    @staticmethod
+    def _get_multipart_settings(file_size) -> tuple:
+        """
+        Returns: (파트 크기, 동시 업로드 수) - 전송당 메모리 예산 안에서 동시 업로드 수를 줄인다.
+        """
+        large_object_conf = config.get_global("LARGE_OBJECT", {})
+        chunk_size = large_object_conf.get("multipart_chunk_size", 64 * 1024 * 1024)
+
+        if file_size:
+            chunk_size = max(chunk_size, -(-file_size // MAX_MULTIPART_PARTS))
+
+        concurrency = large_object_conf.get("max_concurrency", 4)
+        concurrency = max(1, min(concurrency, get_transfer_max_bytes() // chunk_size))
+
+        return chunk_size, concurrency
+
     def _create_progress_callback(self, object_name: str):
         """
         진행률 콜백 함수 생성
@@ -154,15 +217,25 @@ class AWSS3Connector(FileBaseConnector):
 
         return ProgressCallback(object_name)
 
-    def download_file(self, resource_group:str, file_id: str):
+    def download_file(self, resource_group:str, file_id: str, byte_range=None):
         """
         S3 파일 다운로드 (스트림 관리 개선)
+        byte_range 지정 시 Range GET 으로 필요한 구간만 스트리밍
         """
         object_name = self._generate_object_name(resource_group, file_id)
 
         try:
             _LOGGER.info(f"[download_file] Downloading from S3: {object_name}")
-            obj = self.client.get_object(Bucket=self.bucket_name, Key=object_name)
+            get_params = {"Bucket": self.bucket_name, "Key": object_name}
+            if byte_range:
+                get_params["Range"] = format_range_header(byte_range)
+
+            try:
+                obj = self.client.get_object(**get_params)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                    raise ERROR_RANGE_NOT_SATISFIABLE(range=get_params["Range"])
+                raise
 
             # ✅ 메타데이터 검증
             if 'ContentLength' not in obj:
@@ -170,12 +243,6 @@ class AWSS3Connector(FileBaseConnector):
                     obj['Body'].close()
                 raise ValueError(f"Missing ContentLength for {object_name}")
 
-            # ✅ 파일 크기 제한 (안전장치)
-            max_size = 5 * 1024 * 1024 * 1024  # 5GB 제한
-            if obj['ContentLength'] > max_size:
-                obj['Body'].close()
-                raise ValueError(f"File too large: {obj['ContentLength']} bytes > {max_size} bytes")
-
             _LOGGER.info(f"[download_file] File size: {obj['ContentLength'] // (1024*1024)}MB")
             return obj
 
@@ -183,16 +250,118 @@ class AWSS3Connector(FileBaseConnector):
             _LOGGER.error(f'[download_file] Error downloading {object_name}: {e}')
             raise
 
+    def get_download_location(self, resource_group: str, file_id: str, expires_in: int) -> str:
+        # presigned URL 생성은 로컬 서명만 하므로 S3 요청이 발생하지 않음
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket_name, "Key": self._generate_object_name(resource_group, file_id)},
+            ExpiresIn=expires_in,
+        )
 
-    @staticmethod
-    def _generate_object_name(resource_group:str, file_id: str):
-        if resource_group == "SYSTEM":
-            return f"/files/public/{file_id}"
-        elif resource_group == "DOMAIN":
-            return f"/files/domain/{file_id}"
-        elif resource_group == "WORKSPACE":
-            return f"/files/workspace/{file_id}"
-        elif resource_group == "PROJECT":
-            return f"/files/project/{file_id}"
-        elif resource_group == "USER":
-            return f"/files/user/{file_id}"
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        """
+        S3 server-side 복사
+        5GB 이하: CopyObject, 5GB 초과: multipart UploadPartCopy
+        """
+        src_object_name = self._generate_object_name(src_resource_group, src_file_id)
+        dst_object_name = self._generate_object_name(dst_resource_group, dst_file_id)
+        copy_source = {"Bucket": self.bucket_name, "Key": src_object_name}
+
+        try:
+            head = self.client.head_object(Bucket=self.bucket_name, Key=src_object_name)
+            file_size = head["ContentLength"]
+            _LOGGER.info(f"[copy_file] Copying {src_object_name} -> {dst_object_name} ({file_size // (1024*1024)}MB)")
+
+            if file_size <= MAX_COPY_OBJECT_SIZE:
+                self.client.copy_object(
+                    Bucket=self.bucket_name,
+                    Key=dst_object_name,
+                    CopySource=copy_source,
+                    MetadataDirective="COPY",
+                    **self._get_extra_args(),
+                )
+            else:
+                self._multipart_copy(copy_source, dst_object_name, file_size, head.get("ContentType"))
+
+        except Exception as e:
+            _LOGGER.error(f"[copy_file] Error copying {src_object_name} -> {dst_object_name}: {e}")
+            raise
+
+    def _multipart_copy(self, copy_source: dict, dst_object_name: str, file_size: int, content_type: str = None) -> None:
+        # 파트 수는 최대 10,000개, 파트 크기는 최대 5GB
+        part_size = max(COPY_PART_SIZE, -(-file_size // MAX_MULTIPART_PARTS))
+
+        create_params = {"Bucket": self.bucket_name, "Key": dst_object_name, **self._get_extra_args()}
+        if content_type:
+            create_params["ContentType"] = content_type
+
+        upload_id = self.client.create_multipart_upload(**create_params)["UploadId"]
+
+        def _upload_part_copy(part_number: int, start: int) -> dict:
+            end = min(start + part_size, file_size) - 1
+            response = self.client.upload_part_copy(
+                Bucket=self.bucket_name,
+                Key=dst_object_name,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                CopySource=copy_source,
+                CopySourceRange=f"bytes={start}-{end}",
+            )
+            return {"PartNumber": part_number, "ETag": response["CopyPartResult"]["ETag"]}
+
+        try:
+            with ThreadPoolExecutor(max_workers=COPY_CONCURRENCY) as executor:
+                futures = [
+                    executor.submit(_upload_part_copy, index + 1, start)
+                    for index, start in enumerate(range(0, file_size, part_size))
+                ]
+                parts = [future.result() for future in futures]
+
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=dst_object_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            _LOGGER.info(f"[_multipart_copy] Completed {len(parts)} parts to {dst_object_name}")
+        except Exception:
+            self.client.abort_multipart_upload(
+                Bucket=self.bucket_name, Key=dst_object_name, UploadId=upload_id
+            )
+            raise
+
+    def create_multipart_upload(self, resource_group: str, file_id: str) -> str:
+        object_name = self._generate_object_name(resource_group, file_id)
+        response = self.client.create_multipart_upload(
+            Bucket=self.bucket_name, Key=object_name, **self._get_extra_args()
+        )
+        _LOGGER.info(f"[create_multipart_upload] Created multipart upload for {object_name}")
+        return response["UploadId"]
+
+    def upload_part(self, resource_group: str, file_id: str, upload_id: str, part_number: int, data: bytes) -> str:
+        object_name = self._generate_object_name(resource_group, file_id)
+        response = self.client.upload_part(
+            Bucket=self.bucket_name,
+            Key=object_name,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return response["ETag"]
+
+    def complete_multipart_upload(self, resource_group: str, file_id: str, upload_id: str, parts: list) -> None:
+        object_name = self._generate_object_name(resource_group, file_id)
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=object_name,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": [{"PartNumber": part_number, "ETag": etag} for part_number, etag in parts]},
+        )
+        _LOGGER.info(f"[complete_multipart_upload] Completed {len(parts)} parts to {object_name}")
+
+    def abort_multipart_upload(self, resource_group: str, file_id: str, upload_id: str) -> None:
+        object_name = self._generate_object_name(resource_group, file_id)
+        try:
+            self.client.abort_multipart_upload(Bucket=self.bucket_name, Key=object_name, UploadId=upload_id)
+        except self.client.exceptions.NoSuchUpload:
+            _LOGGER.debug(f"[abort_multipart_upload] Upload not found: {upload_id}")
@@ -1,9 +1,50 @@
 import abc
+import json
+import threading
+from typing import Callable, List, Optional, Tuple
 from spaceone.core.connector import BaseConnector
+from spaceone.file_manager.lib.key_layout import get_key_layout
+
+DEFAULT_UPLOAD_BUFFER_SIZE = 8 * 1024 * 1024  # 8MB
+DEFAULT_DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # 1MB
+DEFAULT_MIN_PART_SIZE = 5 * 1024 * 1024  # multipart 최소 파트 크기 (마지막 파트 제외)
+DEFAULT_MAX_PARTS = 10000
+
+# {(connector class, connector 설정): SDK client} - 요청마다 생성되는 connector 가 같은 client 를 재사용
+_clients = {}
+_clients_lock = threading.Lock()
 
 
 class FileBaseConnector(BaseConnector):
-    
+    # object key 생성 기준 (파일에 기록된 layout 버전과 domain, set_key_scope 로 지정하지 않으면 legacy layout)
+    _key_layout: Optional[int] = None
+    _key_domain_id: Optional[str] = None
+
+    def set_key_scope(self, key_layout: Optional[int], domain_id: Optional[str]) -> None:
+        self._key_layout = key_layout
+        self._key_domain_id = domain_id
+
+    def _generate_object_name(self, resource_group: str, file_id: str) -> str:
+        return get_key_layout().make_object_name(resource_group, file_id, self._key_layout, self._key_domain_id)
+
+    def _get_client(self, create_client: Callable, kind: str = "client"):
+        """
+        SDK client 를 처음 사용할 때 생성하고 같은 설정의 connector 끼리 공유 (SDK client 는 thread-safe)
+        create_client: client 생성 함수 (bucket 확인 등 최초 1회만 필요한 초기화 포함)
+        kind: connector 가 여러 종류의 client 를 공유할 때 구분 (예: GCS 다운로드용 HTTP session)
+        """
+        key = (type(self).__name__, kind, json.dumps(self.config, sort_keys=True, default=str))
+
+        client = _clients.get(key)
+        if client is None:
+            with _clients_lock:
+                client = _clients.get(key)
+                if client is None:
+                    client = create_client()
+                    _clients[key] = client
+
+        return client
+
     @abc.abstractmethod
     def check_file(self, resource_group:str, file_id:str) -> bool:
         pass
@@ -17,9 +58,80 @@ class FileBaseConnector(BaseConnector):
         pass
 
     def stream_upload_file(self, resource_group: str, file_id: str, file_obj) -> None:
-        pass
+        raise NotImplementedError(f"{type(self).__name__} does not support stream_upload_file")
+
+    def get_upload_buffer_size(self, file_size: Optional[int]) -> int:
+        """
+        업로드 1건이 backend 전송을 위해 메모리에 보관하는 최대 바이트 (memory budget 예약용)
+        file_size: 알 수 없으면 None
+        """
+        return DEFAULT_UPLOAD_BUFFER_SIZE
+
+    def get_download_buffer_size(self) -> int:
+        """
+        다운로드 1건이 backend 응답을 읽기 위해 메모리에 보관하는 최대 바이트
+        """
+        return DEFAULT_DOWNLOAD_BUFFER_SIZE
 
     @abc.abstractmethod
-    def download_file(self, resource_group:str, file_id:str ):
+    def download_file(self, resource_group:str, file_id:str, byte_range: Optional[Tuple[int, Optional[int]]] = None):
+        """
+        byte_range: (start, end) - end 포함, None 이면 끝까지
+        Returns: {'Body': stream, 'ContentLength': size, 'ContentRange': 'bytes start-end/total' (범위 요청 시),
+                  'ETag': etag, 'ContentType': content type}
+        메타데이터는 GET 응답 헤더에서 가져와 backend 요청 1회로 스트리밍을 시작한다. (별도 stat/reload 호출 금지)
+        """
         pass
-    
\ No newline at end of file
+
+    def get_download_location(self, resource_group: str, file_id: str, expires_in: int) -> Optional[str]:
+        """
+        nginx 가 backend 에서 직접 읽을 수 있는 객체 위치 (DOWNLOAD_OFFLOAD)
+        Returns: presigned URL 또는 root_path 기준 상대 경로 (지원하지 않으면 None: Python 에서 스트리밍)
+        """
+        return None
+
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        """
+        backend 내부 복사 (server-side copy, 데이터가 서비스를 거치지 않음)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support copy_file")
+    
+
+    def supports_multipart_upload(self) -> bool:
+        """
+        multipart 업로드 메서드를 구현한 connector 만 재개 가능한 업로드 세션에 사용할 수 있음
+        """
+        return type(self).create_multipart_upload is not FileBaseConnector.create_multipart_upload
+
+    def get_multipart_limits(self) -> Tuple[int, int]:
+        """
+        Returns: (최소 파트 크기, 최대 파트 수) - 재개 가능한 업로드 세션의 파트 크기 산정 기준
+        """
+        return DEFAULT_MIN_PART_SIZE, DEFAULT_MAX_PARTS
+
+    def create_multipart_upload(self, resource_group: str, file_id: str) -> str:
+        """
+        Returns: backend multipart upload id (세션에 저장하여 이후 파트 업로드/완료에 사용)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart upload")
+
+    def upload_part(self, resource_group: str, file_id: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """
+        part_number: 1부터 시작, 같은 번호로 다시 올리면 이전 파트를 대체
+        Returns: 파트 etag (complete_multipart_upload 에 전달)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart upload")
+
+    def complete_multipart_upload(
+        self, resource_group: str, file_id: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> None:
+        """
+        parts: [(part_number, etag)] - part_number 오름차순
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart upload")
+
+    def abort_multipart_upload(self, resource_group: str, file_id: str, upload_id: str) -> None:
+        """
+        업로드된 파트 정리 (이미 완료/정리된 upload id 는 무시)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support multipart upload")
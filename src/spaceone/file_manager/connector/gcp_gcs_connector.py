@@ -1,58 +1,86 @@
 import logging
+from datetime import timedelta
 import json
 import time
+import uuid
 from typing import Optional
+from urllib.parse import quote
+from google.api_core import exceptions as google_exceptions
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
 from google.oauth2 import service_account
-from io import BytesIO
 import base64
 
+from spaceone.core import config
 from spaceone.core.error import *
+from spaceone.file_manager.error import *
 from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
+from spaceone.file_manager.lib.stream import format_range_header
 
 __all__ = ["GCPGCSConnector"]
 _LOGGER = logging.getLogger(__name__)
 
+GCS_CHUNK_ALIGNMENT = 256 * 1024  # resumable 업로드 청크는 256KB 배수
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024  # 1MB
+MAX_COMPOSE_SOURCES = 32  # compose 요청 1건의 최대 원본 객체 수
+MAX_COMPOSITE_COMPONENTS = 1024  # composite 객체의 최대 구성 요소 수
+DEFAULT_API_ENDPOINT = "https://storage.googleapis.com"
+DOWNLOAD_TIMEOUT = (30, 600)  # 연결 30초, 읽기 10분
+
 
 class GCPGCSConnector(FileBaseConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.client: Optional[storage.Client] = None
         self.bucket_name: Optional[str] = None
-        self._create_client()
+        # tier 별 connector 설정 (예: NEARLINE, COLDLINE), 없으면 bucket 기본값
+        self.storage_class: Optional[str] = self.config.get("storage_class")
+        self._check_config()
         self._set_bucket()
 
-    def _create_client(self):
-        # GCP 인증 정보 설정
-        # 1. 서비스 계정 키 JSON 문자열
+    @property
+    def client(self) -> storage.Client:
+        # 인증 정보 파싱과 client 생성은 처음 사용할 때 1회만 수행하고 프로세스 내에서 공유
+        return self._get_client(self._create_client)
+
+    @property
+    def download_session(self) -> AuthorizedSession:
+        # 다운로드 스트리밍용 인증 session (client 와 같은 방식으로 공유)
+        return self._get_client(lambda: AuthorizedSession(self._create_credentials()), kind="download_session")
 
-        # print(f"config: {self.config}")
+    @property
+    def api_endpoint(self) -> str:
+        return (self.config.get("api_endpoint") or DEFAULT_API_ENDPOINT).rstrip("/")
 
+    def _check_config(self):
+        if self.config.get("project_id") is None:
+            raise Exception("GCPGCSConnector configuration error: project_id is required")
+
+    def _create_credentials(self) -> service_account.Credentials:
+        # GCP 인증 정보 설정 (서비스 계정 키 JSON 문자열, base64)
         service_account_key = self.config.get("service_account_key")
-        decoded_key = base64.b64decode(service_account_key).decode('utf-8')
 
-        # 2. 프로젝트 ID
+        try:
+            decoded_key = base64.b64decode(service_account_key).decode('utf-8')
+            # JSON 문자열을 딕셔너리로 파싱하여 서비스 계정 인증 정보 생성
+            return service_account.Credentials.from_service_account_info(json.loads(decoded_key))
+        except Exception as e:
+            _LOGGER.error(f"GCS credentials create fail: {e}")
+            _LOGGER.error(f"has_key_json={service_account_key is not None}")
+            raise Exception(f"GCPGCSConnector credentials creation failed: {e}")
+
+    def _create_client(self) -> storage.Client:
         project_id = self.config.get("project_id")
+        credentials = self._create_credentials()
 
-        if project_id is None:
-            raise Exception("GCPGCSConnector configuration error: project_id is required")
         try:
-                # JSON 문자열을 딕셔너리로 파싱
-                service_account_info = json.loads(decoded_key)
-                # 서비스 계정 인증 정보 생성
-                credentials = service_account.Credentials.from_service_account_info(
-                    service_account_info
-                )
-
-                # Storage 클라이언트 생성
-                self.client = storage.Client(
-                    credentials=credentials,
-                    project=project_id
-                )
+            client_options = {"api_endpoint": self.api_endpoint} if self.config.get("api_endpoint") else None
+
+            # Storage 클라이언트 생성
+            return storage.Client(credentials=credentials, project=project_id, client_options=client_options)
         except Exception as e:
             _LOGGER.error(f"GCS client create fail: {e}")
-            _LOGGER.error(f"project_id={project_id}, has_key_json={service_account_key is not None}")
+            _LOGGER.error(f"project_id={project_id}")
             raise Exception(f"GCPGCSConnector client creation failed: {e}")
 
     def _set_bucket(self):
@@ -99,6 +127,9 @@ class GCPGCSConnector(FileBaseConnector):
             raise e
 
     def upload_file(self, resource_group: str, file_id: str, data: bytes) -> None:
+        """
+        이미 메모리에 있는 작은 객체(썸네일 등) 전용, 일반 파일은 stream_upload_file 사용
+        """
 
         if self.client is None:
             raise Exception("GCPGCSConnector not initialized properly")
@@ -107,17 +138,14 @@ class GCPGCSConnector(FileBaseConnector):
         _LOGGER.info(f"[upload_file] Starting upload to GCS: {object_name}")
         try:
             bucket = self.client.bucket(self.bucket_name)
-            blob = bucket.blob(object_name)
+            blob = self._new_blob(bucket, object_name)
 
-            # BytesIO를 사용하여 메모리에서 업로드
-            file_obj = BytesIO(data)
-            blob.upload_from_file(file_obj)
-            _LOGGER.info(f"[upload_file] Upload completed. Size: {file_obj.getbuffer().nbytes // (1024*1024)}MB")
+            # 이미 메모리에 있는 데이터를 복사 없이 그대로 업로드
+            blob.upload_from_string(data)
+            _LOGGER.info(f"[upload_file] Upload completed. Size: {len(data) // (1024*1024)}MB")
         except Exception as e:
             _LOGGER.error(f'[upload_file] Error: {e}')
             raise e
-        finally:
-            file_obj.close()
 
     def stream_upload_file(self, resource_group: str, file_id: str, file_obj) -> None:
         """
@@ -131,12 +159,12 @@ class GCPGCSConnector(FileBaseConnector):
 
         try:
             bucket = self.client.bucket(self.bucket_name)
-            blob = bucket.blob(object_name)
+            blob = self._new_blob(bucket, object_name)
 
             _LOGGER.info(f"[stream_upload_file] Starting upload to GCS: {object_name}")
 
-            # 청크 사이즈 설정 (8MB - GCS에서 권장)
-            blob.chunk_size = 8 * 1024 * 1024  # 8MB
+            # 청크 사이즈 설정 (기본 8MB - GCS에서 권장, 256KB 배수)
+            blob.chunk_size = self._get_chunk_size()
 
             # 파일 객체 타입에 따른 처리
             if hasattr(file_obj, 'file'):
@@ -153,12 +181,15 @@ class GCPGCSConnector(FileBaseConnector):
             # 업로드 시간 측정
             start_time = time.time()
 
+            # seek 불가능한 스트림(gRPC 청크 스트림 등)은 rewind 하지 않음
+            rewind = file_stream.seekable() if hasattr(file_stream, 'seekable') else True
+
             # GCS 클라이언트가 자동으로 스트리밍 처리
             blob.upload_from_file(
                 file_stream,
                 content_type=content_type,
                 timeout=600,  # 10분 타임아웃
-                rewind=True   # 필요시 파일 포인터 초기화
+                rewind=rewind   # 필요시 파일 포인터 초기화
             )
 
             upload_time = time.time() - start_time
@@ -173,66 +204,194 @@ class GCPGCSConnector(FileBaseConnector):
             _LOGGER.error(f'[stream_upload_file] Error: {e}')
             raise e
 
-    def download_file(self, resource_group: str, file_id: str):
+    def get_upload_buffer_size(self, file_size) -> int:
+        # resumable 업로드는 청크 하나씩 메모리에 읽어 전송
+        return self._get_chunk_size()
+
+    def get_download_buffer_size(self) -> int:
+        return DOWNLOAD_BUFFER_SIZE
+
+    @staticmethod
+    def _get_chunk_size() -> int:
+        large_object_conf = config.get_global("LARGE_OBJECT", {})
+        chunk_size = large_object_conf.get("gcs_chunk_size", 8 * 1024 * 1024)
+        return max(GCS_CHUNK_ALIGNMENT, chunk_size // GCS_CHUNK_ALIGNMENT * GCS_CHUNK_ALIGNMENT)
+
+    def download_file(self, resource_group: str, file_id: str, byte_range=None):
         """
         GCS 파일 다운로드 (스트리밍)
-        타임아웃 설정으로 무한 대기 방지
+        메타데이터 조회(reload) 없이 JSON API media GET 1회로 본문과 크기/etag 를 함께 받는다.
+        byte_range 지정 시 Range 헤더로 해당 구간만 스트리밍
+        저장된 바이트를 그대로 전달하므로 (gzip 객체도 transcoding 없음) 본문 크기는 ContentLength 와 같다.
         """
-        if self.client is None:
-            raise Exception("GCPGCSConnector not initialized properly")
-
         object_name = self._generate_object_name(resource_group, file_id)
 
-        try:
-            bucket = self.client.bucket(self.bucket_name)
-            blob = bucket.blob(object_name)
-
-            # ✅ 파일 메타데이터 새로고침 (타임아웃 설정)
-            _LOGGER.info(f"[download_file] Fetching metadata for {object_name}")
-            blob.reload(timeout=30)  # 30초 타임아웃
-
-            # ✅ 파일 크기 확인
-            file_size = blob.size
-            if file_size is None:
-                raise ValueError(f"Cannot determine file size for {object_name}")
+        headers = {"Accept-Encoding": "gzip"}
+        if byte_range:
+            headers["Range"] = format_range_header(byte_range)
 
-            _LOGGER.info(f"[download_file] Downloading {file_size // (1024*1024)}MB from GCS")
+        try:
+            # blob.open() 은 reload 후 chunk_size 마다 Range GET 을 반복하므로 media URL 을 직접 스트리밍
+            response = self.download_session.get(
+                self._get_media_url(object_name),
+                headers=headers,
+                stream=True,
+                timeout=DOWNLOAD_TIMEOUT,
+            )
 
-            # ✅ 스트리밍 다운로드 (대용량 파일 지원)
-            # blob.open()은 스트림을 직접 반환하므로 메모리 효율적
-            def stream_download():
-                """스트리밍으로 파일 다운로드"""
+            if response.status_code not in (200, 206):
                 try:
-                    with blob.open("rb", timeout=600) as f:  # 10분 타임아웃
-                        while True:
-                            chunk = f.read(1024 * 1024)  # 1MB씩 읽기
-                            if not chunk:
-                                break
-                            yield chunk
-                except Exception as e:
-                    _LOGGER.error(f"[download_file] Stream error: {e}")
-                    raise
+                    if response.status_code == 416:
+                        raise ERROR_RANGE_NOT_SATISFIABLE(range=headers["Range"])
+                    if response.status_code == 404:
+                        raise FileNotFoundError(f"GCS object not found: {object_name}")
+                    # 상태 코드를 포함한 google-api-core 예외 (재시도/circuit breaker 판단용)
+                    raise google_exceptions.from_http_response(response)
+                finally:
+                    response.close()
+
+            # 본문은 urllib3 응답을 그대로 읽음 (read/close/release_conn 지원, 압축 해제 없음)
+            body = response.raw
+            body.decode_content = False
+
+            content_length = int(response.headers.get("Content-Length", -1))
+            _LOGGER.info(f"[download_file] Downloading {content_length // (1024*1024)}MB from GCS")
 
             # AWS S3 스타일 응답 형식으로 반환
-            return {
-                'Body': stream_download(),
-                'ContentLength': file_size
+            result = {
+                'Body': body,
+                'ContentLength': content_length,
+                'ETag': response.headers.get("ETag"),
+                'ContentType': response.headers.get("Content-Type"),
             }
+
+            if byte_range:
+                result['ContentRange'] = response.headers.get("Content-Range")
+
+            return result
         except Exception as e:
             _LOGGER.error(f'[download_file] Error: {e}')
             raise e
 
-    @staticmethod
-    def _generate_object_name(resource_group: str, file_id: str):
-        if resource_group == "SYSTEM":
-            return f"/files/public/{file_id}"
-        elif resource_group == "DOMAIN":
-            return f"/files/domain/{file_id}"
-        elif resource_group == "WORKSPACE":
-            return f"/files/workspace/{file_id}"
-        elif resource_group == "PROJECT":
-            return f"/files/project/{file_id}"
-        elif resource_group == "USER":
-            return f"/files/user/{file_id}"
-        else:
-            return f"/files/unknown/{file_id}"
+    def _get_media_url(self, object_name: str) -> str:
+        # JSON API 다운로드 URL (https://cloud.google.com/storage/docs/json_api/v1/objects/get)
+        return (
+            f"{self.api_endpoint}/download/storage/v1/b/{quote(self.bucket_name, safe='')}"
+            f"/o/{quote(object_name, safe='')}?alt=media"
+        )
+
+    def get_download_location(self, resource_group: str, file_id: str, expires_in: int) -> str:
+        # service account key 로 로컬 서명 (V4)
+        blob = self.client.bucket(self.bucket_name).blob(self._generate_object_name(resource_group, file_id))
+        return blob.generate_signed_url(
+            version="v4", expiration=timedelta(seconds=expires_in), method="GET", client=self.client
+        )
+
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        """
+        GCS server-side 복사 (rewrite)
+        대용량 객체는 한 번에 끝나지 않으므로 rewrite token이 없어질 때까지 반복
+        """
+        if self.client is None:
+            raise Exception("GCPGCSConnector not initialized properly")
+
+        src_object_name = self._generate_object_name(src_resource_group, src_file_id)
+        dst_object_name = self._generate_object_name(dst_resource_group, dst_file_id)
+
+        try:
+            bucket = self.client.bucket(self.bucket_name)
+            src_blob = bucket.blob(src_object_name)
+            dst_blob = self._new_blob(bucket, dst_object_name)
+
+            _LOGGER.info(f"[copy_file] Copying {src_object_name} -> {dst_object_name}")
+            token, bytes_rewritten, total_bytes = dst_blob.rewrite(src_blob, timeout=60)
+            while token is not None:
+                _LOGGER.debug(f"[copy_file] Rewritten {bytes_rewritten // (1024*1024)}MB / {total_bytes // (1024*1024)}MB")
+                token, bytes_rewritten, total_bytes = dst_blob.rewrite(src_blob, token=token, timeout=60)
+
+            _LOGGER.info(f"[copy_file] Copy completed. Size: {total_bytes // (1024*1024)}MB")
+        except Exception as e:
+            _LOGGER.error(f"[copy_file] Error copying {src_object_name} -> {dst_object_name}: {e}")
+            raise e
+
+    def get_multipart_limits(self) -> tuple:
+        # 파트를 compose 로 합치므로 composite 객체의 구성 요소 수 제한을 따른다
+        min_part_size, _ = super().get_multipart_limits()
+        return min_part_size, MAX_COMPOSITE_COMPONENTS
+
+    def create_multipart_upload(self, resource_group: str, file_id: str) -> str:
+        """
+        GCS 는 S3 방식의 multipart 업로드가 없으므로 파트를 임시 객체로 올리고 완료 시 compose 로 합친다.
+        upload id 는 임시 파트 객체의 prefix 로 사용
+        """
+        return uuid.uuid4().hex
+
+    def upload_part(self, resource_group: str, file_id: str, upload_id: str, part_number: int, data: bytes) -> str:
+        if self.client is None:
+            raise Exception("GCPGCSConnector not initialized properly")
+
+        bucket = self.client.bucket(self.bucket_name)
+        blob = bucket.blob(self._get_part_object_name(resource_group, file_id, upload_id, part_number))
+        blob.upload_from_string(data, timeout=600)
+        return blob.md5_hash or ""
+
+    def complete_multipart_upload(self, resource_group: str, file_id: str, upload_id: str, parts: list) -> None:
+        """
+        compose 1건은 최대 32개 객체만 합칠 수 있으므로 32개씩 중간 객체로 합치는 과정을 반복
+        """
+        if self.client is None:
+            raise Exception("GCPGCSConnector not initialized properly")
+
+        object_name = self._generate_object_name(resource_group, file_id)
+        prefix = self._get_parts_prefix(resource_group, file_id, upload_id)
+        bucket = self.client.bucket(self.bucket_name)
+
+        sources = [
+            bucket.blob(self._get_part_object_name(resource_group, file_id, upload_id, part_number))
+            for part_number, _ in parts
+        ]
+
+        level = 0
+        while len(sources) > MAX_COMPOSE_SOURCES:
+            composed = []
+            for index in range(0, len(sources), MAX_COMPOSE_SOURCES):
+                intermediate = bucket.blob(f"{prefix}compose-{level}-{index // MAX_COMPOSE_SOURCES:05d}")
+                intermediate.compose(sources[index:index + MAX_COMPOSE_SOURCES], timeout=60)
+                composed.append(intermediate)
+            sources = composed
+            level += 1
+
+        self._new_blob(bucket, object_name).compose(sources, timeout=60)
+        _LOGGER.info(f"[complete_multipart_upload] Composed {len(parts)} parts to {object_name}")
+
+        self._delete_parts(resource_group, file_id, upload_id)
+
+    def abort_multipart_upload(self, resource_group: str, file_id: str, upload_id: str) -> None:
+        if self.client is None:
+            raise Exception("GCPGCSConnector not initialized properly")
+
+        self._delete_parts(resource_group, file_id, upload_id)
+
+    def _delete_parts(self, resource_group: str, file_id: str, upload_id: str) -> None:
+        prefix = self._get_parts_prefix(resource_group, file_id, upload_id)
+
+        for blob in self.client.list_blobs(self.bucket_name, prefix=prefix):
+            try:
+                blob.delete()
+            except Exception as e:
+                _LOGGER.warning(f"[_delete_parts] Failed to delete part object {blob.name}: {e}")
+
+    def _new_blob(self, bucket, object_name: str):
+        """
+        새로 쓰는 객체 (storage_class 설정 시 해당 class 로 저장)
+        """
+        blob = bucket.blob(object_name)
+        if self.storage_class:
+            blob.storage_class = self.storage_class
+        return blob
+
+    def _get_parts_prefix(self, resource_group: str, file_id: str, upload_id: str) -> str:
+        return f"{self._generate_object_name(resource_group, file_id)}.uploads/{upload_id}/"
+
+    def _get_part_object_name(self, resource_group: str, file_id: str, upload_id: str, part_number: int) -> str:
+        return f"{self._get_parts_prefix(resource_group, file_id, upload_id)}{part_number:05d}"
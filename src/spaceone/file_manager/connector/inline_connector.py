@@ -0,0 +1,120 @@
+import hashlib
+import logging
+from datetime import datetime
+from io import BytesIO
+from typing import Optional, Tuple
+
+from mongoengine import NotUniqueError
+
+from spaceone.file_manager.error import *
+from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
+from spaceone.file_manager.lib.stream import format_range_header
+from spaceone.file_manager.model.inline_object.database import InlineObject
+
+__all__ = ["InlineConnector"]
+_LOGGER = logging.getLogger(__name__)
+
+# MongoDB 문서 최대 크기(16MB)보다 충분히 작게 제한 (INLINE_STORAGE.max_size 는 이보다 작아야 함)
+DEFAULT_MAX_OBJECT_SIZE = 4 * 1024 * 1024  # 4MB
+READ_BUFFER_SIZE = 64 * 1024  # 64KB
+
+
+class InlineConnector(FileBaseConnector):
+    """
+    작은 파일을 MongoDB(inline_object collection)에 저장하는 backend
+    bucket 요청 없이 메타데이터와 같은 DB 에서 읽고 쓰므로 수 KB 크기 파일의 지연과 요청 비용을 줄인다.
+    object key 는 다른 backend 와 같은 key layout 으로 생성하므로 파일 문서의 backend/key_layout 만으로 위치가 결정된다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.max_object_size = int(self.config.get("max_object_size", DEFAULT_MAX_OBJECT_SIZE))
+
+    def check_file(self, resource_group: str, file_id: str) -> bool:
+        object_name = self._generate_object_name(resource_group, file_id)
+        return InlineObject.objects(object_name=object_name).only("object_name").first() is not None
+
+    def delete_file(self, resource_group: str, file_id: str) -> None:
+        object_name = self._generate_object_name(resource_group, file_id)
+        if InlineObject.objects(object_name=object_name).delete() == 0:
+            _LOGGER.debug(f"[delete_file] File not found: {file_id}")
+
+    def upload_file(self, resource_group: str, file_id: str, data: bytes) -> None:
+        if len(data) > self.max_object_size:
+            raise ERROR_FILE_TOO_LARGE(size=len(data), max_size=self.max_object_size, resource_group=resource_group)
+
+        self._put_object(self._generate_object_name(resource_group, file_id), bytes(data))
+
+    def stream_upload_file(self, resource_group: str, file_id: str, file_obj) -> None:
+        file_stream = file_obj.file if hasattr(file_obj, "file") else file_obj
+
+        # 제한보다 1 byte 더 읽어서 초과 여부 확인 (전체를 읽지 않고 실패)
+        buffer = BytesIO()
+        while buffer.tell() <= self.max_object_size:
+            chunk = file_stream.read(min(READ_BUFFER_SIZE, self.max_object_size + 1 - buffer.tell()))
+            if not chunk:
+                break
+            buffer.write(chunk)
+
+        self.upload_file(resource_group, file_id, buffer.getvalue())
+
+    def get_upload_buffer_size(self, file_size: Optional[int]) -> int:
+        if file_size is None:
+            return self.max_object_size
+        return min(file_size, self.max_object_size)
+
+    def get_download_buffer_size(self) -> int:
+        return READ_BUFFER_SIZE
+
+    def download_file(self, resource_group: str, file_id: str, byte_range: Optional[Tuple[int, Optional[int]]] = None):
+        object_name = self._generate_object_name(resource_group, file_id)
+        inline_object_vo = InlineObject.objects(object_name=object_name).first()
+        if inline_object_vo is None:
+            raise FileNotFoundError(f"Inline object not found: {object_name}")
+
+        data = inline_object_vo.data
+        file_size = len(data)
+
+        start, end = 0, file_size - 1
+        if byte_range:
+            start = byte_range[0]
+            if byte_range[1] is not None:
+                end = min(byte_range[1], file_size - 1)
+
+            if start >= file_size:
+                raise ERROR_RANGE_NOT_SATISFIABLE(range=format_range_header(byte_range))
+
+        result = {
+            "Body": BytesIO(data[start : end + 1]),
+            "ContentLength": max(end - start + 1, 0),
+            "ETag": f'"{inline_object_vo.etag}"',
+        }
+
+        if byte_range:
+            result["ContentRange"] = f"bytes {start}-{end}/{file_size}"
+
+        return result
+
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        src_object_name = self._generate_object_name(src_resource_group, src_file_id)
+        inline_object_vo = InlineObject.objects(object_name=src_object_name).first()
+        if inline_object_vo is None:
+            raise FileNotFoundError(f"Inline object not found: {src_object_name}")
+
+        self._put_object(self._generate_object_name(dst_resource_group, dst_file_id), inline_object_vo.data)
+
+    @staticmethod
+    def _put_object(object_name: str, data: bytes) -> None:
+        update = {
+            "set__data": data,
+            "set__size": len(data),
+            "set__etag": hashlib.md5(data).hexdigest(),
+            "set_on_insert__created_at": datetime.utcnow(),
+        }
+
+        try:
+            InlineObject.objects(object_name=object_name).update_one(upsert=True, **update)
+        except NotUniqueError:
+            # 같은 key 를 동시에 처음 쓰는 경우 한쪽이 실패하므로 다시 갱신
+            InlineObject.objects(object_name=object_name).update_one(**update)
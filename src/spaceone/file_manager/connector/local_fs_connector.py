@@ -0,0 +1,183 @@
+import hashlib
+import logging
+import os
+import shutil
+import time
+import uuid
+from typing import Optional, Tuple
+
+from spaceone.core.error import *
+from spaceone.file_manager.error import *
+from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
+from spaceone.file_manager.lib.stream import format_range_header
+
+__all__ = ["LocalFileSystemConnector"]
+_LOGGER = logging.getLogger(__name__)
+
+COPY_BUFFER_SIZE = 1024 * 1024  # 1MB
+
+
+class LocalFileSystemConnector(FileBaseConnector):
+    """
+    로컬 파일시스템 backend (개발/벤치마크용)
+    object key 를 root_path 하위 경로로 그대로 사용하며, 업로드는 임시 파일에 쓴 뒤 rename 하여 원자적으로 반영한다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.root_path = None
+        self._set_root_path()
+
+    def _set_root_path(self):
+        root_path = self.config.get("root_path")
+
+        if root_path is None:
+            raise ERROR_CONNECTOR_CONFIGURATION(backend="LocalFileSystemConnector")
+
+        self.root_path = os.path.abspath(root_path)
+        os.makedirs(self.root_path, exist_ok=True)
+
+    def check_file(self, resource_group: str, file_id: str) -> bool:
+        return os.path.isfile(self._get_path(resource_group, file_id))
+
+    def delete_file(self, resource_group: str, file_id: str) -> None:
+        try:
+            os.remove(self._get_path(resource_group, file_id))
+        except FileNotFoundError:
+            _LOGGER.debug(f"[delete_file] File not found: {file_id}")
+
+    def upload_file(self, resource_group: str, file_id: str, data: bytes) -> None:
+        with self._open_for_write(resource_group, file_id) as f:
+            f.write(data)
+
+    def stream_upload_file(self, resource_group: str, file_id: str, file_obj) -> None:
+        file_stream = file_obj.file if hasattr(file_obj, "file") else file_obj
+        path = self._get_path(resource_group, file_id)
+
+        _LOGGER.info(f"[stream_upload_file] Starting upload to local file system: {path}")
+        start_time = time.time()
+
+        with self._open_for_write(resource_group, file_id) as f:
+            shutil.copyfileobj(file_stream, f, COPY_BUFFER_SIZE)
+
+        upload_time = time.time() - start_time
+        _LOGGER.info(f"[stream_upload_file] Upload completed in {upload_time:.2f}s")
+
+    def get_upload_buffer_size(self, file_size: Optional[int]) -> int:
+        return COPY_BUFFER_SIZE
+
+    def get_download_buffer_size(self) -> int:
+        return COPY_BUFFER_SIZE
+
+    def download_file(self, resource_group: str, file_id: str, byte_range: Optional[Tuple[int, Optional[int]]] = None):
+        path = self._get_path(resource_group, file_id)
+        file_stat = os.stat(path)
+        file_size = file_stat.st_size
+
+        start, end = 0, file_size - 1
+        if byte_range:
+            start = byte_range[0]
+            if byte_range[1] is not None:
+                end = min(byte_range[1], file_size - 1)
+
+            if start >= file_size:
+                raise ERROR_RANGE_NOT_SATISFIABLE(range=format_range_header(byte_range))
+
+        content_length = end - start + 1
+
+        def stream_download():
+            remaining = content_length
+            with open(path, "rb") as f:
+                f.seek(start)
+                while remaining > 0:
+                    chunk = f.read(min(COPY_BUFFER_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+
+        result = {
+            "Body": stream_download(),
+            "ContentLength": content_length,
+            "ETag": f'"{file_stat.st_mtime_ns:x}-{file_size:x}"',
+        }
+
+        if byte_range:
+            result["ContentRange"] = f"bytes {start}-{end}/{file_size}"
+
+        return result
+
+    def get_download_location(self, resource_group: str, file_id: str, expires_in: int) -> str:
+        # nginx 의 local offload location 이 root_path 를 가리킴
+        return self._generate_object_name(resource_group, file_id).lstrip("/")
+
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        with open(self._get_path(src_resource_group, src_file_id), "rb") as src:
+            with self._open_for_write(dst_resource_group, dst_file_id) as dst:
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+    def create_multipart_upload(self, resource_group: str, file_id: str) -> str:
+        # 파트는 <object>.uploads/<upload_id>/<part_number> 파일로 저장하고 완료 시 이어 붙인다
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._get_parts_path(resource_group, file_id, upload_id), exist_ok=True)
+        return upload_id
+
+    def upload_part(self, resource_group: str, file_id: str, upload_id: str, part_number: int, data: bytes) -> str:
+        parts_path = self._get_parts_path(resource_group, file_id, upload_id)
+        if not os.path.isdir(parts_path):
+            raise FileNotFoundError(f"Upload not found: {upload_id}")
+
+        with _AtomicWriter(os.path.join(parts_path, str(part_number))) as f:
+            f.write(data)
+
+        return hashlib.md5(data).hexdigest()
+
+    def complete_multipart_upload(self, resource_group: str, file_id: str, upload_id: str, parts: list) -> None:
+        parts_path = self._get_parts_path(resource_group, file_id, upload_id)
+
+        with self._open_for_write(resource_group, file_id) as dst:
+            for part_number, _ in parts:
+                with open(os.path.join(parts_path, str(part_number)), "rb") as src:
+                    shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+
+        shutil.rmtree(parts_path, ignore_errors=True)
+
+    def abort_multipart_upload(self, resource_group: str, file_id: str, upload_id: str) -> None:
+        shutil.rmtree(self._get_parts_path(resource_group, file_id, upload_id), ignore_errors=True)
+
+    def _get_parts_path(self, resource_group: str, file_id: str, upload_id: str) -> str:
+        return f"{self._get_path(resource_group, file_id)}.uploads/{upload_id}"
+
+    def _open_for_write(self, resource_group: str, file_id: str):
+        return _AtomicWriter(self._get_path(resource_group, file_id))
+
+    def _get_path(self, resource_group: str, file_id: str) -> str:
+        object_name = self._generate_object_name(resource_group, file_id)
+        return os.path.join(self.root_path, object_name.lstrip("/"))
+
+
+class _AtomicWriter:
+    """
+    임시 파일에 쓰고 성공 시에만 최종 경로로 rename (실패 시 임시 파일 삭제)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        self._file = None
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.tmp_path, "wb")
+        return self._file
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._file.close()
+
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+
+        return False
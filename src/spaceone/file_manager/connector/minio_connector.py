@@ -1,46 +1,68 @@
 import logging
+from datetime import timedelta
 import time
 from math import log
 from minio import Minio
+from minio.commonconfig import CopySource, ComposeSource
+from minio.datatypes import Part
 from minio.error import S3Error
 from io import BytesIO
 
+from spaceone.core import config
 from spaceone.core.error import *
+from spaceone.file_manager.error import *
 from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
+from spaceone.file_manager.lib.stream import format_range_header
 
 __all__ = ["MinIOS3Connector"]
 _LOGGER = logging.getLogger(__name__)
 
+STREAM_PART_SIZE = 10 * 1024 * 1024  # 크기를 모르는 스트림 업로드 시 파트 크기 (10MB)
+MIN_PART_SIZE = 5 * 1024 * 1024  # multipart 최소 파트 크기 (5MB)
+MAX_MULTIPART_PARTS = 10000
+MAX_COPY_OBJECT_SIZE = 5 * 1024 * 1024 * 1024  # copy_object 최대 크기 (5GB)
+
 class MinIOS3Connector(FileBaseConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.client = None
         self.bucket_name = None
-        self._create_session()
+        self._check_config()
         self._set_bucket()
 
-    def _create_session(self):
+    @property
+    def client(self) -> Minio:
+        # 처음 사용할 때 client 생성 및 bucket 확인 (프로세스 내에서 1회)
+        return self._get_client(self._create_session)
+
+    def _check_config(self):
+        if self.config.get("endpoint") is None:
+            raise ERROR_CONNECTOR_CONFIGURATION(backend="MinIOS3Connector")
+
+    def _create_session(self) -> Minio:
         endpoint = self.config.get("endpoint")
         access_key_id = self.config.get("minio_access_key_id")
         secret_access_key = self.config.get("minio_secret_access_key")
 
-        if endpoint is None:
-            raise ERROR_CONNECTOR_CONFIGURATION(backend="MinIOS3Connector")
-
         if access_key_id and secret_access_key:
-            self.client = Minio(
+            client = Minio(
                 endpoint=endpoint,
                 access_key=access_key_id,
                 secret_key=secret_access_key,
                 secure=False
             )
         else:
-            self.client = Minio(
+            client = Minio(
                 endpoint=endpoint,
                 secure=False
             )
 
+        if not client.bucket_exists(self.bucket_name):
+            client.make_bucket(self.bucket_name)
+            _LOGGER.info(f"Bucket {self.bucket_name} created")
+
+        return client
+
     def _set_bucket(self):
         bucket_name = self.config.get("bucket_name")
 
@@ -48,9 +70,6 @@ class MinIOS3Connector(FileBaseConnector):
             raise ERROR_CONNECTOR_CONFIGURATION(backend="MinIOS3Connector")
 
         self.bucket_name = bucket_name
-        if not self.client.bucket_exists(bucket_name):
-            self.client.make_bucket(bucket_name)
-            logging.info(f"Bucket {bucket_name} created")
 
     def check_file(self, resource_group, file_id):
         """
@@ -81,6 +100,7 @@ class MinIOS3Connector(FileBaseConnector):
     def upload_file(self, resource_group:str, file_id:str, data: bytes) -> None:
         """
         MinIO 파일 업로드 (예외 전파)
+        이미 메모리에 있는 작은 객체(썸네일 등) 전용, 일반 파일은 stream_upload_file 사용
         """
         object_name = self._generate_object_name(resource_group, file_id)
 
@@ -126,13 +146,14 @@ class MinIOS3Connector(FileBaseConnector):
                 content_type = 'application/octet-stream'
 
             # 파일 크기 계산
-            current_pos = file_stream.tell() if hasattr(file_stream, 'tell') else 0
-            if hasattr(file_stream, 'seek'):
+            seekable = file_stream.seekable() if hasattr(file_stream, 'seekable') else hasattr(file_stream, 'seek')
+            if seekable:
+                current_pos = file_stream.tell()
                 file_stream.seek(0, 2)  # 파일 끝으로 이동
-                file_size = file_stream.tell()
+                file_size = file_stream.tell() - current_pos
                 file_stream.seek(current_pos)  # 원래 위치로 복원
             else:
-                # 크기를 모를 경우 -1 (MinIO가 처리)
+                # 크기를 모를 경우 -1 (MinIO가 part_size 단위로 multipart 처리)
                 file_size = -1
 
             # 업로드 시간 측정
@@ -144,7 +165,8 @@ class MinIOS3Connector(FileBaseConnector):
                 object_name=object_name,
                 data=file_stream,
                 length=file_size,
-                content_type=content_type
+                content_type=content_type,
+                part_size=self._get_part_size() if file_size < 0 else 0,
             )
 
             upload_time = time.time() - start_time
@@ -157,43 +179,69 @@ class MinIOS3Connector(FileBaseConnector):
             _LOGGER.error(f'[stream_upload_file] Error: {e}')
             raise e
 
-    def download_file(self, resource_group:str, file_id:str):
+    def get_upload_buffer_size(self, file_size) -> int:
+        # put_object 는 파트 하나씩 메모리에 읽어 순차 업로드
+        if file_size is None or file_size < 0:
+            return self._get_part_size()
+
+        # 크기를 알면 MinIO 가 10,000 파트 이내 최소 파트 크기를 선택
+        return min(max(MIN_PART_SIZE, -(-file_size // MAX_MULTIPART_PARTS)), max(file_size, 1))
+
+    @staticmethod
+    def _get_part_size() -> int:
+        # 크기를 모르는 스트림은 part_size 단위로 multipart 업로드 (최대 10,000 파트)
+        large_object_conf = config.get_global("LARGE_OBJECT", {})
+        return large_object_conf.get("multipart_chunk_size", STREAM_PART_SIZE)
+
+    def download_file(self, resource_group:str, file_id:str, byte_range=None):
         """
         MinIO 파일 다운로드 (스트림 관리 개선)
+        byte_range 지정 시 offset/length 로 필요한 구간만 스트리밍
         """
         obj = None
         try:
             object_name = self._generate_object_name(resource_group, file_id)
             _LOGGER.info(f"[download_file] Downloading from MinIO: {object_name}")
 
-            obj = self.client.get_object(
-                bucket_name=self.bucket_name,
-                object_name=object_name
-            )
+            offset, length = 0, 0
+            if byte_range:
+                offset, end = byte_range
+                length = 0 if end is None else end - offset + 1
+
+            try:
+                obj = self.client.get_object(
+                    bucket_name=self.bucket_name,
+                    object_name=object_name,
+                    offset=offset,
+                    length=length,
+                )
+            except S3Error as e:
+                if e.code == "InvalidRange":
+                    raise ERROR_RANGE_NOT_SATISFIABLE(range=format_range_header(byte_range))
+                raise
 
             # ✅ 스트림 정보 검증
             if not hasattr(obj, 'read'):
                 raise ValueError(f"Invalid object stream for {object_name}")
 
-            # ✅ 메타데이터 가져오기 (전체 읽기하지 않음)
-            try:
-                stat = self.client.stat_object(
-                    bucket_name=self.bucket_name,
-                    object_name=object_name
-                )
-                content_length = stat.size
-            except Exception as stat_error:
-                _LOGGER.warning(f"[download_file] Cannot get file size: {stat_error}")
-                content_length = -1
+            # 메타데이터는 GET 응답 헤더에서 가져옴 (stat_object 호출 없이 요청 1회)
+            content_length = int(obj.headers.get('Content-Length', -1))
 
             _LOGGER.info(f"[download_file] File size: {content_length // (1024*1024)}MB" if content_length > 0 else f"[download_file] Streaming object")
 
             # ✅ 스트림을 그대로 반환 (메모리 효율적)
-            return {
+            result = {
                 'Body': obj,
-                'ContentLength': content_length
+                'ContentLength': content_length,
+                'ETag': obj.headers.get('ETag'),
+                'ContentType': obj.headers.get('Content-Type'),
             }
 
+            if byte_range:
+                result['ContentRange'] = obj.headers.get('Content-Range')
+
+            return result
+
         except Exception as e:
             _LOGGER.error(f'[download_file] Error downloading: {e}')
             # ✅ 에러 시 스트림 정리
@@ -208,16 +256,72 @@ class MinIOS3Connector(FileBaseConnector):
                     pass
             raise  # ✅ 예외 전파 (None 반환 대신)
 
+    def get_download_location(self, resource_group: str, file_id: str, expires_in: int) -> str:
+        return self.client.presigned_get_object(
+            self.bucket_name,
+            self._generate_object_name(resource_group, file_id),
+            expires=timedelta(seconds=expires_in),
+        )
 
-    @staticmethod
-    def _generate_object_name(resource_group:str, file_id: str):
-        if resource_group == "SYSTEM":
-            return f"/files/public/{file_id}"
-        elif resource_group == "DOMAIN":
-            return f"/files/domain/{file_id}"
-        elif resource_group == "WORKSPACE":
-            return f"/files/workspace/{file_id}"
-        elif resource_group == "PROJECT":
-            return f"/files/project/{file_id}"
-        elif resource_group == "USER":
-            return f"/files/user/{file_id}"
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        """
+        MinIO server-side 복사
+        5GB 이하: copy_object, 5GB 초과: compose_object (UploadPartCopy로 분할 복사)
+        """
+        src_object_name = self._generate_object_name(src_resource_group, src_file_id)
+        dst_object_name = self._generate_object_name(dst_resource_group, dst_file_id)
+
+        try:
+            stat = self.client.stat_object(self.bucket_name, src_object_name)
+            _LOGGER.info(f"[copy_file] Copying {src_object_name} -> {dst_object_name} ({stat.size // (1024*1024)}MB)")
+
+            if stat.size <= MAX_COPY_OBJECT_SIZE:
+                self.client.copy_object(
+                    self.bucket_name,
+                    dst_object_name,
+                    CopySource(self.bucket_name, src_object_name),
+                )
+            else:
+                self.client.compose_object(
+                    self.bucket_name,
+                    dst_object_name,
+                    [ComposeSource(self.bucket_name, src_object_name)],
+                )
+
+        except Exception as e:
+            _LOGGER.error(f"[copy_file] Error copying {src_object_name} -> {dst_object_name}: {e}")
+            raise
+
+    def create_multipart_upload(self, resource_group: str, file_id: str) -> str:
+        """
+        MinIO multipart API 는 공개 메서드가 없어 put_object 가 내부적으로 사용하는 메서드를 직접 호출
+        """
+        object_name = self._generate_object_name(resource_group, file_id)
+        upload_id = self.client._create_multipart_upload(
+            self.bucket_name, object_name, {"Content-Type": "application/octet-stream"}
+        )
+        _LOGGER.info(f"[create_multipart_upload] Created multipart upload for {object_name}")
+        return upload_id
+
+    def upload_part(self, resource_group: str, file_id: str, upload_id: str, part_number: int, data: bytes) -> str:
+        object_name = self._generate_object_name(resource_group, file_id)
+        return self.client._upload_part(self.bucket_name, object_name, data, None, upload_id, part_number)
+
+    def complete_multipart_upload(self, resource_group: str, file_id: str, upload_id: str, parts: list) -> None:
+        object_name = self._generate_object_name(resource_group, file_id)
+        self.client._complete_multipart_upload(
+            self.bucket_name,
+            object_name,
+            upload_id,
+            [Part(part_number, etag) for part_number, etag in parts],
+        )
+        _LOGGER.info(f"[complete_multipart_upload] Completed {len(parts)} parts to {object_name}")
+
+    def abort_multipart_upload(self, resource_group: str, file_id: str, upload_id: str) -> None:
+        object_name = self._generate_object_name(resource_group, file_id)
+        try:
+            self.client._abort_multipart_upload(self.bucket_name, object_name, upload_id)
+        except S3Error as e:
+            if e.code != "NoSuchUpload":
+                raise
+            _LOGGER.debug(f"[abort_multipart_upload] Upload not found: {upload_id}")
@@ -0,0 +1,382 @@
+import hashlib
+import logging
+from datetime import datetime
+from io import BytesIO
+from typing import Iterator, Optional, Tuple
+
+from mongoengine import NotUniqueError
+
+from spaceone.file_manager.error import *
+from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
+from spaceone.file_manager.lib.key_layout import get_key_layout
+from spaceone.file_manager.lib.resilience import wrap_connector
+from spaceone.file_manager.lib.stream import ChunkIteratorReader, DownloadStream, format_range_header
+from spaceone.file_manager.model.pack.database import Pack, PackedObject
+
+__all__ = ["PackConnector"]
+_LOGGER = logging.getLogger(__name__)
+
+PACK_RESOURCE_GROUP = "PACK"
+DEFAULT_MAX_OBJECT_SIZE = 1024 * 1024  # 1MB
+READ_BUFFER_SIZE = 64 * 1024  # 64KB
+MAX_PACK_LOCATIONS = 10000
+
+# {pack_id: (backend, key_layout)} - pack 객체의 위치는 생성 후 바뀌지 않으므로 프로세스 내에서 재사용
+_pack_locations = {}
+
+
+class PackConnector(FileBaseConnector):
+    """
+    작은 파일을 큰 pack 객체로 모아 저장하는 backend (객체 수와 요청 비용 절감)
+    업로드는 먼저 MongoDB(packed_object)에 보관하고, scheduler 가 모인 객체를 pack_backend 에 pack 객체 1개로 이어 붙여 기록한다.
+    다운로드는 index (pack_id, offset, size) 로 pack 객체의 해당 구간만 범위 요청하고,
+    삭제로 빈 구간이 많아진 pack 은 남은 객체만 새 pack 으로 옮긴다. (compact_pack)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.pack_backend = self.config.get("pack_backend")
+        if self.pack_backend is None:
+            raise ERROR_CONNECTOR_CONFIGURATION(backend="PackConnector")
+
+        self.max_object_size = int(self.config.get("max_object_size", DEFAULT_MAX_OBJECT_SIZE))
+        self._pack_conns = {}
+
+    def check_file(self, resource_group: str, file_id: str) -> bool:
+        object_name = self._generate_object_name(resource_group, file_id)
+        return PackedObject.objects(object_name=object_name).only("object_name").first() is not None
+
+    def delete_file(self, resource_group: str, file_id: str) -> None:
+        object_name = self._generate_object_name(resource_group, file_id)
+        packed_object_vo = PackedObject.objects(object_name=object_name).modify(remove=True)
+        if packed_object_vo is None:
+            _LOGGER.debug(f"[delete_file] File not found: {file_id}")
+            return
+
+        self._release(packed_object_vo)
+
+    def upload_file(self, resource_group: str, file_id: str, data: bytes) -> None:
+        if len(data) > self.max_object_size:
+            raise ERROR_FILE_TOO_LARGE(size=len(data), max_size=self.max_object_size, resource_group=resource_group)
+
+        self._stage_object(self._generate_object_name(resource_group, file_id), bytes(data))
+
+    def stream_upload_file(self, resource_group: str, file_id: str, file_obj) -> None:
+        file_stream = file_obj.file if hasattr(file_obj, "file") else file_obj
+
+        # 제한보다 1 byte 더 읽어서 초과 여부 확인 (전체를 읽지 않고 실패)
+        buffer = BytesIO()
+        while buffer.tell() <= self.max_object_size:
+            chunk = file_stream.read(min(READ_BUFFER_SIZE, self.max_object_size + 1 - buffer.tell()))
+            if not chunk:
+                break
+            buffer.write(chunk)
+
+        self.upload_file(resource_group, file_id, buffer.getvalue())
+
+    def get_upload_buffer_size(self, file_size: Optional[int]) -> int:
+        if file_size is None:
+            return self.max_object_size
+        return min(file_size, self.max_object_size)
+
+    def get_download_buffer_size(self) -> int:
+        return READ_BUFFER_SIZE
+
+    def download_file(self, resource_group: str, file_id: str, byte_range: Optional[Tuple[int, Optional[int]]] = None):
+        object_name = self._generate_object_name(resource_group, file_id)
+        packed_object_vo = PackedObject.objects(object_name=object_name).first()
+        if packed_object_vo is None:
+            raise FileNotFoundError(f"Packed object not found: {object_name}")
+
+        file_size = packed_object_vo.size
+
+        start, end = 0, file_size - 1
+        if byte_range:
+            start = byte_range[0]
+            if byte_range[1] is not None:
+                end = min(byte_range[1], file_size - 1)
+
+            if start >= file_size:
+                raise ERROR_RANGE_NOT_SATISFIABLE(range=format_range_header(byte_range))
+
+        if packed_object_vo.pack_id is None:
+            body = BytesIO(packed_object_vo.data[start : end + 1])
+        elif file_size == 0:
+            body = BytesIO(b"")
+        else:
+            # pack 객체에서 이 객체의 구간만 범위 요청
+            pack_conn = self._get_pack_connector(*self._get_pack_location(packed_object_vo.pack_id))
+            offset = packed_object_vo.offset
+            result = pack_conn.download_file(
+                PACK_RESOURCE_GROUP, packed_object_vo.pack_id, byte_range=(offset + start, offset + end)
+            )
+            body = result["Body"] if isinstance(result, dict) else result
+
+        result = {
+            "Body": body,
+            "ContentLength": max(end - start + 1, 0),
+            "ETag": f'"{packed_object_vo.etag}"',
+        }
+
+        if byte_range:
+            result["ContentRange"] = f"bytes {start}-{end}/{file_size}"
+
+        return result
+
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        src_object_name = self._generate_object_name(src_resource_group, src_file_id)
+        dst_object_name = self._generate_object_name(dst_resource_group, dst_file_id)
+
+        packed_object_vo = PackedObject.objects(object_name=src_object_name).first()
+        if packed_object_vo is None:
+            raise FileNotFoundError(f"Packed object not found: {src_object_name}")
+
+        if packed_object_vo.pack_id is None:
+            self._stage_object(dst_object_name, packed_object_vo.data)
+            return
+
+        # 같은 pack 구간을 참조하는 index 만 추가 (RETIRED 로 바뀌는 중인 pack 은 참조하지 않음)
+        if Pack.objects(pack_id=packed_object_vo.pack_id, state="ACTIVE").update_one(
+            inc__live_size=packed_object_vo.size, inc__live_count=1
+        ):
+            self._put_index(
+                dst_object_name,
+                set__pack_id=packed_object_vo.pack_id,
+                set__offset=packed_object_vo.offset,
+                set__size=packed_object_vo.size,
+                set__etag=packed_object_vo.etag,
+                unset__data=True,
+                unset__staged_at=True,
+            )
+            return
+
+        download_stream = DownloadStream(self.download_file(src_resource_group, src_file_id))
+        try:
+            data = b"".join(download_stream)
+        finally:
+            download_stream.close()
+
+        self._stage_object(dst_object_name, data)
+
+    def seal_pack(self, object_names: list) -> Optional[Pack]:
+        """
+        pack 에 기록되지 않은 객체를 순서대로 이어 붙여 pack 객체 1개로 기록
+        기록 도중 삭제/덮어쓰기된 객체는 pack 에 남지만 참조되지 않는다. (compaction 대상)
+        Returns: 생성된 pack (기록할 객체가 없으면 None)
+        """
+
+        def _read_objects() -> Iterator[Tuple[str, dict, bytes]]:
+            for object_name in object_names:
+                packed_object_vo = (
+                    PackedObject.objects(object_name=object_name, pack_id=None).only("etag", "data").first()
+                )
+                if packed_object_vo is None or packed_object_vo.data is None:
+                    continue
+
+                yield object_name, {"pack_id": None, "etag": packed_object_vo.etag}, packed_object_vo.data
+
+        pack_vo, _, _ = self._write_pack(_read_objects())
+        return pack_vo
+
+    def compact_pack(self, pack_vo: Pack) -> Optional[Pack]:
+        """
+        pack 에 남아있는 객체만 새 pack 으로 옮기고 이전 pack 을 RETIRED 로 변경
+        이전 pack 은 한 번의 요청으로 처음부터 읽으면서 빈 구간을 건너뛴다.
+        Returns: 생성된 pack (남은 객체가 없으면 None)
+        """
+        pack_id = pack_vo.pack_id
+        packed_object_vos = list(
+            PackedObject.objects(pack_id=pack_id).only("object_name", "offset", "size").order_by("offset")
+        )
+
+        new_pack_vo = None
+        if packed_object_vos:
+            pack_conn = self._get_pack_connector(pack_vo.backend, pack_vo.key_layout)
+            download_stream = DownloadStream(
+                pack_conn.download_file(PACK_RESOURCE_GROUP, pack_id), chunk_size=READ_BUFFER_SIZE
+            )
+            reader = ChunkIteratorReader(download_stream)
+
+            def _read_objects() -> Iterator[Tuple[str, dict, bytes]]:
+                position = 0
+                last_range, data = None, b""
+
+                for packed_object_vo in packed_object_vos:
+                    object_range = (packed_object_vo.offset, packed_object_vo.size)
+
+                    # 복사로 같은 구간을 참조하는 객체는 앞에서 읽은 내용을 다시 사용
+                    if object_range != last_range:
+                        _skip(reader, packed_object_vo.offset - position)
+                        data = reader.read(packed_object_vo.size)
+                        if len(data) < packed_object_vo.size:
+                            raise ValueError(f"Pack is truncated: {pack_id}")
+
+                        position = packed_object_vo.offset + packed_object_vo.size
+                        last_range = object_range
+
+                    yield (
+                        packed_object_vo.object_name,
+                        {"pack_id": pack_id, "offset": packed_object_vo.offset},
+                        data,
+                    )
+
+            try:
+                new_pack_vo, moved_size, moved_count = self._write_pack(_read_objects())
+            finally:
+                reader.close()
+                download_stream.close()
+
+            Pack.objects(pack_id=pack_id).update_one(dec__live_size=moved_size, dec__live_count=moved_count)
+
+        self.retire_pack(pack_id)
+        return new_pack_vo
+
+    def retire_pack(self, pack_id: str) -> bool:
+        """
+        참조가 없는 pack 을 RETIRED 로 변경 (진행 중인 다운로드를 위해 객체는 유예 시간 후 delete_pack 으로 삭제)
+        Returns: 변경 여부
+        """
+        # copy_file 은 live_count 를 먼저 증가시키므로 조건부 변경 이후에는 새 참조가 생기지 않음
+        if not Pack.objects(pack_id=pack_id, state="ACTIVE", live_count__lte=0).update_one(
+            set__state="RETIRED", set__retired_at=datetime.utcnow()
+        ):
+            return False
+
+        if PackedObject.objects(pack_id=pack_id).only("object_name").first() is not None:
+            _LOGGER.warning(f"[retire_pack] Pack is still referenced, keep active: {pack_id}")
+            Pack.objects(pack_id=pack_id).update_one(
+                set__state="ACTIVE", set__retired_at=None, set__live_count=PackedObject.objects(pack_id=pack_id).count()
+            )
+            return False
+
+        return True
+
+    def delete_pack(self, pack_vo: Pack) -> None:
+        self._get_pack_connector(pack_vo.backend, pack_vo.key_layout).delete_file(PACK_RESOURCE_GROUP, pack_vo.pack_id)
+        Pack.objects(pack_id=pack_vo.pack_id, state__ne="ACTIVE").delete()
+        _pack_locations.pop(pack_vo.pack_id, None)
+
+    def _write_pack(self, objects: Iterator[Tuple[str, dict, bytes]]) -> Tuple[Optional[Pack], int, int]:
+        """
+        objects: (object_name, index 변경 조건, 내용) - 조건과 일치하는 index 만 새 pack 을 가리키도록 변경
+        Returns: (생성된 pack, 연결된 객체 크기 합, 연결된 객체 수)
+        """
+        pack_vo = Pack.create({"backend": self.pack_backend, "key_layout": get_key_layout().version})
+        pack_conn = self._get_pack_connector(pack_vo.backend, pack_vo.key_layout)
+        written = []
+        pack_size = 0
+
+        def _chunks() -> Iterator[bytes]:
+            nonlocal pack_size
+            for object_name, conditions, data in objects:
+                written.append((object_name, conditions, pack_size, len(data)))
+                pack_size += len(data)
+                yield data
+
+        reader = ChunkIteratorReader(_chunks())
+        try:
+            pack_conn.stream_upload_file(PACK_RESOURCE_GROUP, pack_vo.pack_id, reader)
+        except Exception:
+            # 일부만 기록된 객체가 있을 수 있으므로 delete_pack 으로 정리되도록 RETIRED 로 변경
+            pack_vo.update({"state": "RETIRED", "retired_at": datetime.utcnow()})
+            raise
+        finally:
+            reader.close()
+
+        if not written:
+            pack_vo.update({"state": "RETIRED", "retired_at": datetime.utcnow()})
+            return None, 0, 0
+
+        # 모두 참조되는 것으로 먼저 기록하고 연결하지 못한 객체만 차감 (중간에 중단되어도 live 가 실제보다 작아지지 않음)
+        pack_vo = pack_vo.update(
+            {
+                "state": "ACTIVE",
+                "size": pack_size,
+                "object_count": len(written),
+                "live_size": pack_size,
+                "live_count": len(written),
+            }
+        )
+
+        attached_size = attached_count = 0
+        for object_name, conditions, offset, size in written:
+            if PackedObject.objects(object_name=object_name, **conditions).update_one(
+                set__pack_id=pack_vo.pack_id, set__offset=offset, unset__data=True, unset__staged_at=True
+            ):
+                attached_size += size
+                attached_count += 1
+
+        if attached_count < len(written):
+            Pack.objects(pack_id=pack_vo.pack_id).update_one(
+                dec__live_size=pack_size - attached_size, dec__live_count=len(written) - attached_count
+            )
+
+        _LOGGER.info(
+            f"[_write_pack] Wrote pack {pack_vo.pack_id}: {attached_count}/{len(written)} objects, {pack_size} bytes"
+        )
+        return pack_vo, attached_size, attached_count
+
+    def _stage_object(self, object_name: str, data: bytes) -> None:
+        self._put_index(
+            object_name,
+            set__pack_id=None,
+            set__offset=None,
+            set__size=len(data),
+            set__etag=hashlib.md5(data).hexdigest(),
+            set__data=data,
+            set__staged_at=datetime.utcnow(),
+        )
+
+    def _put_index(self, object_name: str, **update) -> None:
+        try:
+            previous_vo = PackedObject.objects(object_name=object_name).modify(upsert=True, new=False, **update)
+        except NotUniqueError:
+            # 같은 key 를 동시에 처음 쓰는 경우 한쪽이 실패하므로 다시 갱신
+            previous_vo = PackedObject.objects(object_name=object_name).modify(new=False, **update)
+
+        # 덮어쓴 객체가 참조하던 pack 구간 반환
+        self._release(previous_vo)
+
+    @staticmethod
+    def _release(packed_object_vo: Optional[PackedObject]) -> None:
+        if packed_object_vo is None or packed_object_vo.pack_id is None:
+            return
+
+        Pack.objects(pack_id=packed_object_vo.pack_id).update_one(
+            dec__live_size=packed_object_vo.size, dec__live_count=1
+        )
+
+    def _get_pack_connector(self, backend: str, key_layout: Optional[int]) -> FileBaseConnector:
+        key = (backend, key_layout)
+        if key not in self._pack_conns:
+            pack_conn: FileBaseConnector = self.locator.get_connector(backend)
+            # pack 객체는 domain 에 속하지 않음
+            pack_conn.set_key_scope(key_layout, None)
+            self._pack_conns[key] = wrap_connector(backend, pack_conn)
+
+        return self._pack_conns[key]
+
+    @staticmethod
+    def _get_pack_location(pack_id: str) -> Tuple[str, Optional[int]]:
+        location = _pack_locations.get(pack_id)
+        if location is None:
+            pack_vo = Pack.objects(pack_id=pack_id).only("backend", "key_layout").first()
+            if pack_vo is None:
+                raise FileNotFoundError(f"Pack not found: {pack_id}")
+
+            if len(_pack_locations) >= MAX_PACK_LOCATIONS:
+                _pack_locations.clear()
+
+            location = (pack_vo.backend, pack_vo.key_layout)
+            _pack_locations[pack_id] = location
+
+        return location
+
+
+def _skip(reader: ChunkIteratorReader, size: int) -> None:
+    while size > 0:
+        skipped = len(reader.read(min(READ_BUFFER_SIZE, size)))
+        if skipped == 0:
+            raise ValueError("Unexpected end of pack")
+        size -= skipped
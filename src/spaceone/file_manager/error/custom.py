@@ -17,6 +17,10 @@ class ERROR_FILE_DOWNLOAD_URL_EXIST(ERROR_BASE):
 class ERROR_FILE_DOWNLOAD_FAILED(ERROR_BASE):
     _message = "File download failed. (name = {name})"
     
+class ERROR_RANGE_NOT_SATISFIABLE(ERROR_INVALID_ARGUMENT):
+    _message = "Requested range is not satisfiable. (range = {range})"
+
+
 class ERROR_NOT_MATCH_USER_ID(ERROR_BASE):
     _message = "Not match user_id. (user_id = {user_id}, domain_id = {domain_id})"
     
@@ -25,4 +29,76 @@ class ERROR_FILE_UPLOAD_FAILED(ERROR_BASE):
     
     
 class ERROR_FILE_DELETE_FAILED(ERROR_BASE):
-    _message = "File delete failed. (name = {name})"
\ No newline at end of file
+    _message = "File delete failed. (name = {name})"
+
+
+class ERROR_FILE_COPY_FAILED(ERROR_BASE):
+    _message = "File copy failed. (file_id = {file_id})"
+
+
+class ERROR_FILE_MOVE_FAILED(ERROR_BASE):
+    _message = "File move failed. (file_id = {file_id})"
+
+
+class ERROR_FILE_MOVE_CONFLICT(ERROR_BASE):
+    _message = "File was modified during move. (file_id = {file_id})"
+
+
+class ERROR_FILE_TOO_LARGE(ERROR_INVALID_ARGUMENT):
+    _message = "File size exceeds the limit. (size = {size}, max_size = {max_size}, resource_group = {resource_group})"
+
+
+class ERROR_STORAGE_QUOTA_EXCEEDED(ERROR_INVALID_ARGUMENT):
+    _message = "Storage quota exceeded. (scope_type = {scope_type}, scope_id = {scope_id}, usage = {usage}, quota = {quota})"
+
+
+class ERROR_IMAGE_DERIVATIVE_NOT_SUPPORTED(ERROR_INVALID_ARGUMENT):
+    _message = "Image derivative is not supported for this file. (name = {name})"
+
+
+class ERROR_IMAGE_DERIVATIVE_FAILED(ERROR_BASE):
+    _message = "Image derivative creation failed. (file_id = {file_id})"
+
+
+class ERROR_MEMORY_BUDGET_EXCEEDED(ERROR_BASE):
+    _message = "Transfer buffer memory budget exceeded. Try again later. (size = {size}, max_size = {max_size})"
+
+
+class ERROR_TRANSFER_REJECTED(ERROR_BASE):
+    _message = "Too many transfers in progress. Retry after {retry_after} seconds. (reason = {reason})"
+
+
+class ERROR_UPLOAD_SESSION_EXPIRED(ERROR_INVALID_ARGUMENT):
+    _message = "Upload session has expired. (upload_id = {upload_id})"
+
+
+class ERROR_UPLOAD_SESSION_NOT_IN_PROGRESS(ERROR_INVALID_ARGUMENT):
+    _message = "Upload session is not in progress. (upload_id = {upload_id}, state = {state})"
+
+
+class ERROR_UPLOAD_SESSION_INCOMPLETE(ERROR_INVALID_ARGUMENT):
+    _message = "Upload session has missing parts. (upload_id = {upload_id}, offset = {offset}, size = {size})"
+
+
+class ERROR_UPLOAD_OFFSET_MISMATCH(ERROR_INVALID_ARGUMENT):
+    _message = "Upload offset must be a multiple of part size. (offset = {offset}, part_size = {part_size})"
+
+
+class ERROR_UPLOAD_PART_SIZE_MISMATCH(ERROR_INVALID_ARGUMENT):
+    _message = "Invalid upload part size. (part_number = {part_number}, size = {size}, expected_size = {expected_size})"
+
+
+class ERROR_UPLOAD_SESSION_NOT_SUPPORTED(ERROR_INVALID_ARGUMENT):
+    _message = "Resumable upload is not supported by file backend. (backend = {backend})"
+
+
+class ERROR_BACKEND_UNAVAILABLE(ERROR_BASE):
+    _message = "File backend is temporarily unavailable. Try again later. (backend = {backend})"
+
+
+class ERROR_INVALID_SIGNED_URL(ERROR_AUTHENTICATE_FAILURE):
+    _message = "Invalid signed download url. (file_id = {file_id}, reason = {reason})"
+
+
+class ERROR_BACKEND_THROTTLED(ERROR_BASE):
+    _message = "File backend is throttling requests. Try again later. (backend = {backend})"
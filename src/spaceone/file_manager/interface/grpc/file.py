@@ -1,5 +1,6 @@
 from spaceone.api.file_manager.v1 import file_pb2, file_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.file_manager.interface.grpc.message import filter_message_fields
 from spaceone.file_manager.service.file_service import FileService
 
 
@@ -11,7 +12,7 @@ class File(BaseAPI, file_pb2_grpc.FileServicer):
         params, metadata = self.parse_request(request, context)
         file_svc = FileService(metadata)
         response: dict = file_svc.update(params)
-        return self.dict_to_message(response)
+        return self.dict_to_message(filter_message_fields(self.pb2.FileInfo, response))
 
     def delete(self, request, context):
         params, metadata = self.parse_request(request, context)
@@ -23,12 +24,15 @@ class File(BaseAPI, file_pb2_grpc.FileServicer):
         params, metadata = self.parse_request(request, context)
         file_svc = FileService(metadata)
         response: dict = file_svc.get(params)
-        return self.dict_to_message(response)
+        return self.dict_to_message(filter_message_fields(self.pb2.FileInfo, response))
 
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
         file_svc = FileService(metadata)
         response: dict = file_svc.list(params)
+        response["results"] = [
+            filter_message_fields(self.pb2.FileInfo, result) for result in response["results"]
+        ]
         return self.dict_to_message(response)
 
     def stat(self, request, context):
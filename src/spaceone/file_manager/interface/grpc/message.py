@@ -0,0 +1,10 @@
+__all__ = ["filter_message_fields"]
+
+
+def filter_message_fields(message_class, data: dict) -> dict:
+    """
+    proto message 에 없는 필드 제거 (dict_to_message 의 ParseDict 는 모르는 필드가 있으면 실패)
+    service 응답에는 REST 다운로드/서명에 필요한 내부 필드(backend, key_layout 등)가 포함된다.
+    """
+    fields = message_class.DESCRIPTOR.fields_by_name
+    return {key: value for key, value in data.items() if key in fields}
@@ -1,5 +1,6 @@
 from spaceone.api.file_manager.v1 import user_file_pb2, user_file_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.file_manager.interface.grpc.message import filter_message_fields
 from spaceone.file_manager.service.user_file_service import UserFileService
 
 
@@ -11,7 +12,7 @@ class UserFile(BaseAPI, user_file_pb2_grpc.UserFileServicer):
         params, metadata = self.parse_request(request, context)
         user_file_svc = UserFileService(metadata)
         response: dict = user_file_svc.update(params)
-        return self.dict_to_message(response)
+        return self.dict_to_message(filter_message_fields(self.pb2.UserFileInfo, response))
 
     def delete(self, request, context):
         params, metadata = self.parse_request(request, context)
@@ -23,12 +24,15 @@ class UserFile(BaseAPI, user_file_pb2_grpc.UserFileServicer):
         params, metadata = self.parse_request(request, context)
         user_file_svc = UserFileService(metadata)
         response: dict = user_file_svc.get(params)
-        return self.dict_to_message(response)
+        return self.dict_to_message(filter_message_fields(self.pb2.UserFileInfo, response))
 
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
         user_file_svc = UserFileService(metadata)
         response: dict = user_file_svc.list(params)
+        response["results"] = [
+            filter_message_fields(self.pb2.UserFileInfo, result) for result in response["results"]
+        ]
         return self.dict_to_message(response)
 
     def stat(self, request, context):
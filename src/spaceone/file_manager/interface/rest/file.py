@@ -1,23 +1,35 @@
 import logging
-from urllib.parse import quote
-from typing import Optional
-from fastapi import Request, Depends, File, UploadFile, HTTPException
-from fastapi.responses import StreamingResponse
+from typing import Optional, List
+from fastapi import Request, Depends, File, UploadFile, HTTPException, Body, Query
+from fastapi.responses import Response, StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi_utils.inferring_router import InferringRouter
+from starlette.concurrency import run_in_threadpool
 
 
 from spaceone.core import utils
 from spaceone.core.fastapi.api import BaseAPI, exception_handler
-from spaceone.file_manager.manager.streaming_file_connector_manager import StreamingFileConnectorManager
+from spaceone.file_manager.interface.rest.route import UploadSizeLimitRoute
+from spaceone.file_manager.interface.rest.transfer import (
+    download_archive,
+    download_derivative,
+    download_file,
+    upload_file,
+    upload_files,
+)
+from spaceone.file_manager.lib.offload import get_download_offload
+from spaceone.file_manager.lib.signed_url import get_url_signer
+from spaceone.file_manager.model.file.request import FileArchiveRequest, ArchiveFormat, ResourceGroup
 from spaceone.file_manager.service.file_service import FileService
 from spaceone.file_manager.error import *
 
 _LOGGER = logging.getLogger(__name__)
 _AUTH_SCHEME = HTTPBearer(auto_error=False)
 
-router = InferringRouter(include_in_schema=False)
+router = InferringRouter(include_in_schema=False, route_class=UploadSizeLimitRoute)
+# 서명 설정 (링크 유효 시간과 이전 객체 삭제 유예 시간) 을 서버 시작 시 확인
+router.add_event_handler("startup", get_url_signer)
 
 
 @cbv(router)
@@ -37,12 +49,22 @@ class Files(BaseAPI):
             "resource_group": "SYSTEM",
         }
 
-        file_info = self.upload_file(metadata, params, file)
+        file_svc = FileService(metadata)
+        file_info = await run_in_threadpool(upload_file, file_svc, params, file)
         return file_info
 
     @router.get("/public/{file_id}")
     @exception_handler
-    async def download_public_file(self, request: Request, file_id: str, token:str):
+    async def download_public_file(
+        self,
+        request: Request,
+        file_id: str,
+        token: Optional[str] = None,
+        w: Optional[int] = None,
+        h: Optional[int] = None,
+        fmt: Optional[str] = None,
+        sig: Optional[str] = None,
+    ):
 
         metadata = {
             "token": token,
@@ -51,7 +73,20 @@ class Files(BaseAPI):
             "file_id": file_id,
         }
 
-        return self.download_file(metadata, params)
+        # 서명된 링크는 token 인증과 파일 정보 조회 없이 서명에 포함된 파일 정보로 다운로드
+        file_info = get_url_signer().verify(sig, file_id, "SYSTEM") if sig else None
+
+        if w or h or fmt:
+            return await self.download_image_derivative(metadata, params, w, h, fmt, file_info)
+
+        return await run_in_threadpool(
+            self.download_file,
+            metadata,
+            params,
+            request.headers.get("range"),
+            file_info,
+            get_download_offload().is_available(request.headers),
+        )
 
     @router.post("/domain/upload")
     @exception_handler
@@ -65,12 +100,22 @@ class Files(BaseAPI):
             "resource_group": "DOMAIN",
         }
 
-        file_info = self.upload_file(metadata, params, file)
+        file_svc = FileService(metadata)
+        file_info = await run_in_threadpool(upload_file, file_svc, params, file)
         return file_info
 
     @router.get("/domain/{file_id}")
     @exception_handler
-    async def download_domain_file(self, file_id:str, token:str, request: Request) -> StreamingResponse:
+    async def download_domain_file(
+        self,
+        request: Request,
+        file_id: str,
+        token: Optional[str] = None,
+        w: Optional[int] = None,
+        h: Optional[int] = None,
+        fmt: Optional[str] = None,
+        sig: Optional[str] = None,
+    ) -> StreamingResponse:
 
         metadata = {
             "token": token,
@@ -79,7 +124,20 @@ class Files(BaseAPI):
             "file_id": file_id,
         }
 
-        return self.download_file(metadata, params)
+        # 서명된 링크는 token 인증과 파일 정보 조회 없이 서명에 포함된 파일 정보로 다운로드
+        file_info = get_url_signer().verify(sig, file_id, "DOMAIN") if sig else None
+
+        if w or h or fmt:
+            return await self.download_image_derivative(metadata, params, w, h, fmt, file_info)
+
+        return await run_in_threadpool(
+            self.download_file,
+            metadata,
+            params,
+            request.headers.get("range"),
+            file_info,
+            get_download_offload().is_available(request.headers),
+        )
 
     @router.post("/workspace/upload")
     @exception_handler
@@ -92,12 +150,22 @@ class Files(BaseAPI):
             "name": file.filename,
             "resource_group": "WORKSPACE",
         }
-        file_info = self.upload_file(metadata, params, file)
+        file_svc = FileService(metadata)
+        file_info = await run_in_threadpool(upload_file, file_svc, params, file)
         return file_info
 
     @router.get("/workspace/{file_id}")
     @exception_handler
-    async def download_workspace_file(self, file_id:str, token:str, request: Request):
+    async def download_workspace_file(
+        self,
+        request: Request,
+        file_id: str,
+        token: Optional[str] = None,
+        w: Optional[int] = None,
+        h: Optional[int] = None,
+        fmt: Optional[str] = None,
+        sig: Optional[str] = None,
+    ):
 
         metadata = {
             "token": token,
@@ -106,7 +174,20 @@ class Files(BaseAPI):
             "file_id": file_id,
         }
 
-        return self.download_file(metadata, params)
+        # 서명된 링크는 token 인증과 파일 정보 조회 없이 서명에 포함된 파일 정보로 다운로드
+        file_info = get_url_signer().verify(sig, file_id, "WORKSPACE") if sig else None
+
+        if w or h or fmt:
+            return await self.download_image_derivative(metadata, params, w, h, fmt, file_info)
+
+        return await run_in_threadpool(
+            self.download_file,
+            metadata,
+            params,
+            request.headers.get("range"),
+            file_info,
+            get_download_offload().is_available(request.headers),
+        )
 
 
     @router.post("/project/upload")
@@ -132,9 +213,12 @@ class Files(BaseAPI):
         else:
             params["project_id"] = "*"
 
-        file_info = self.upload_file(metadata, params, file)
+        file_svc = FileService(metadata)
+        file_info = await run_in_threadpool(upload_file, file_svc, params, file)
         # file_info가 dict가 아닌 경우 변환
-        if hasattr(file_info, 'to_dict'):
+        if isinstance(file_info, Response):
+            return file_info
+        elif hasattr(file_info, 'to_dict'):
             return file_info.to_dict()
         elif isinstance(file_info, dict):
             return file_info
@@ -143,7 +227,16 @@ class Files(BaseAPI):
 
     @router.get("/project/{file_id}")
     @exception_handler
-    async def download_project_file(self, file_id:str, token:str, request: Request)-> StreamingResponse:
+    async def download_project_file(
+        self,
+        request: Request,
+        file_id: str,
+        token: Optional[str] = None,
+        w: Optional[int] = None,
+        h: Optional[int] = None,
+        fmt: Optional[str] = None,
+        sig: Optional[str] = None,
+    )-> StreamingResponse:
 
         metadata = {
             "token": token,
@@ -152,72 +245,195 @@ class Files(BaseAPI):
             "file_id": file_id,
         }
 
-        return self.download_file(metadata, params)
+        # 서명된 링크는 token 인증과 파일 정보 조회 없이 서명에 포함된 파일 정보로 다운로드
+        file_info = get_url_signer().verify(sig, file_id, "PROJECT") if sig else None
 
-    def upload_file(self, metadata, params, file) :
+        if w or h or fmt:
+            return await self.download_image_derivative(metadata, params, w, h, fmt, file_info)
 
-        try:
-            file_svc = FileService(metadata)
-            file_info: dict = file_svc.add(params)
+        return await run_in_threadpool(
+            self.download_file,
+            metadata,
+            params,
+            request.headers.get("range"),
+            file_info,
+            get_download_offload().is_available(request.headers),
+        )
+
+    @router.post("/batch/upload")
+    @exception_handler
+    async def upload_batch_files(
+        self,
+        request: Request,
+        files: List[UploadFile] = File(...),
+        resource_group: ResourceGroup = Query(...),
+        project_id: Optional[str] = None,
+    ):
+        """
+        여러 파일을 multipart 요청 1건으로 업로드 (파일별 결과 반환, 일부 실패 허용)
+        """
 
-            resource_group = file_info["resource_group"]
-            file_id = file_info["file_id"]
+        metadata = {
+            "token": self.token.credentials,
+        }
+        params = {
+            "resource_group": resource_group,
+        }
 
-            # 동기 스트리밍 커넥터 사용
-            file_conn_mgr = StreamingFileConnectorManager()
+        if resource_group == "PROJECT":
+            params["project_id"] = project_id or "*"
 
-            # 스트리밍 업로드 사용 - 청크 단위로 파일 처리 (메모리 효율적)
-            _LOGGER.info(f"[upload_file] Starting streaming upload for file_id: {file_id}")
+        file_svc = FileService(metadata)
+        return await run_in_threadpool(upload_files, file_svc, params, files)
 
-            # 동기 방식으로 스트리밍 업로드 실행
-            file_conn_mgr.stream_upload_file(resource_group, file_id, file)
-            _LOGGER.info(f"[upload_file] Streaming upload completed for file_id: {file_id}")
+    @router.post("/archive")
+    @exception_handler
+    async def download_archive(self, request: Request, archive_request: FileArchiveRequest = Body(...)):
 
-        except Exception as e:
-            _LOGGER.error(f'[upload_file] Error: {e}')
-            if 'file_id' in locals() and 'file_svc' in locals():
-                file_svc.delete({"file_id":file_id})
-            raise ERROR_FILE_UPLOAD_FAILED(name=file_info["name"] if 'file_info' in locals() else "unknown")
+        metadata = {
+            "token": self.token.credentials,
+        }
 
-        return file_info
+        file_svc = FileService(metadata)
+        return await run_in_threadpool(download_archive, file_svc.list, archive_request.dict(), "File")
+
+    @router.get("/archive")
+    @exception_handler
+    async def download_archive_by_ids(
+        self,
+        request: Request,
+        token: str,
+        file_ids: List[str] = Query(...),
+        archive_format: ArchiveFormat = Query("zip", alias="format"),
+    ):
 
-    def download_file(self, metadata, params) -> StreamingResponse:
+        metadata = {
+            "token": token,
+        }
+        params = {
+            "file_ids": file_ids,
+            "format": archive_format,
+        }
 
         file_svc = FileService(metadata)
-        file_info: dict = file_svc.get(params)
-
-        resource_group = file_info["resource_group"]
-        file_id = file_info["file_id"]
-
-        try:
-            # 동기 스트리밍 커넥터 사용
-            file_conn_mgr = StreamingFileConnectorManager()
-
-            # 스트리밍 다운로드를 위한 동기 제너레이터
-            def stream_generator():
-                try:
-                    for chunk in file_conn_mgr.download_file_stream(resource_group, file_id):
-                        yield chunk
-                except Exception as e:
-                    _LOGGER.error(f"[download_file] Error during streaming: {e}")
-                    raise ERROR_FILE_DOWNLOAD_FAILED(name=file_info["name"])
-
-        except Exception as e:
-            _LOGGER.error(f'[download_file] Error: {e}')
-            raise ERROR_FILE_DOWNLOAD_FAILED(name=file_info["name"])
-
-        filename = quote(file_info['name'])
-
-        # 스트리밍 응답 헤더
-        headers = {
-            "Content-Disposition": f"attachment; filename*=UTF-8''{filename}",
-            # Content-Length는 스트리밍이므로 설정하지 않음
-            "Cache-Control": "no-cache",
-        }
-
-        # 동기 스트리밍 응답 반환
-        return StreamingResponse(
-            stream_generator(),
-            media_type="application/octet-stream",
-            headers=headers,
-        )
+        return await run_in_threadpool(download_archive, file_svc.list, params, "File")
+
+    @router.get("/usage")
+    @exception_handler
+    async def get_usage(self, project_id: Optional[str] = None):
+        """
+        domain/workspace/project 사용량 (파일 수, 전체 크기), 미리 집계된 counter 를 조회
+        """
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+        params = {
+            "project_id": project_id,
+        }
+
+        file_svc = FileService(metadata)
+        return await run_in_threadpool(file_svc.get_usage, params)
+
+    @router.post("/get-many")
+    @exception_handler
+    async def get_many_files(
+        self,
+        request: Request,
+        file_ids: List[str] = Body(..., embed=True),
+        project_id: Optional[str] = None,
+    ):
+        """
+        여러 file_id 를 한 번의 조회로 확인 (없거나 권한이 없는 file_id 는 null)
+        """
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+        params = {
+            "file_ids": file_ids,
+            "project_id": project_id,
+        }
+
+        file_svc = FileService(metadata)
+        return await run_in_threadpool(file_svc.get_many, params)
+
+    @router.post("/copy")
+    @exception_handler
+    async def copy_file(
+        self,
+        request: Request,
+        file_id: str = Body(...),
+        resource_group: ResourceGroup = Body(...),
+        name: Optional[str] = Body(None),
+        workspace_id: Optional[str] = Body(None),
+        project_id: Optional[str] = Body(None),
+    ):
+        """
+        다른 resource_group 으로 파일 복사 (backend 에서 server-side 복사)
+        """
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+        params = {
+            "file_id": file_id,
+            "resource_group": resource_group,
+            "name": name,
+        }
+
+        # 대상 workspace/project 는 지정한 경우에만 전달 (없으면 인증 정보 기준)
+        if workspace_id:
+            params["workspace_id"] = workspace_id
+        if project_id:
+            params["project_id"] = project_id
+
+        file_svc = FileService(metadata)
+        return await run_in_threadpool(file_svc.copy, params)
+
+    @router.post("/move")
+    @exception_handler
+    async def move_file(
+        self,
+        request: Request,
+        file_id: str = Body(...),
+        resource_group: ResourceGroup = Body(...),
+        workspace_id: Optional[str] = Body(None),
+        project_id: Optional[str] = Body(None),
+    ):
+        """
+        다른 resource_group 으로 파일 이동 (backend 에서 server-side 복사 후 원본 삭제)
+        """
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+        params = {
+            "file_id": file_id,
+            "resource_group": resource_group,
+        }
+
+        # 대상 workspace/project 는 지정한 경우에만 전달 (없으면 인증 정보 기준)
+        if workspace_id:
+            params["workspace_id"] = workspace_id
+        if project_id:
+            params["project_id"] = project_id
+
+        file_svc = FileService(metadata)
+        return await run_in_threadpool(file_svc.move, params)
+
+    def download_file(
+        self, metadata, params, range_header: str = None, file_info: dict = None, offload: bool = False
+    ) -> Response:
+        if file_info is None:
+            file_svc = FileService(metadata)
+            file_info: dict = file_svc.get(params)
+
+        return download_file(file_info, "File", range_header, offload)
+
+    async def download_image_derivative(self, metadata, params, w, h, fmt, file_info: dict = None) -> Response:
+        if file_info is None:
+            file_svc = FileService(metadata)
+            file_info: dict = file_svc.get(params)
+
+        return await download_derivative(file_info, w, h, fmt, "File")
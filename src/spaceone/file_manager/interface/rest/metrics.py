@@ -0,0 +1,21 @@
+import logging
+
+from fastapi.responses import PlainTextResponse
+from fastapi_utils.cbv import cbv
+from fastapi_utils.inferring_router import InferringRouter
+
+from spaceone.core.fastapi.api import BaseAPI
+from spaceone.file_manager.lib.metrics import render_metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+router = InferringRouter(include_in_schema=False)
+
+
+@cbv(router)
+class Metrics(BaseAPI):
+    service = "file-manager"
+
+    @router.get("/metrics", response_class=PlainTextResponse)
+    async def get_metrics(self):
+        return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,185 @@
+import logging
+from typing import Callable, Optional
+from urllib.parse import quote
+
+import anyio
+import anyio.to_thread
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.types import Receive, Scope, Send
+
+from spaceone.file_manager.error import *
+from spaceone.file_manager.lib.admission import get_admission_controller
+from spaceone.file_manager.lib.size_policy import check_file_size
+from spaceone.file_manager.lib.stream import TransferCancellation
+
+__all__ = [
+    "CancellableStreamingResponse",
+    "UploadSizeLimitRoute",
+    "offload_response",
+    "too_many_requests_response",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+# 업로드 경로 -> resource_group
+_UPLOAD_RESOURCE_GROUPS = {
+    "public": "SYSTEM",
+    "domain": "DOMAIN",
+    "workspace": "WORKSPACE",
+    "project": "PROJECT",
+    "user": "USER",
+}
+
+# multipart boundary, part header 등 파일 외 요청 본문 여유분
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+class UploadSizeLimitRoute(APIRoute):
+    """
+    업로드 요청의 Content-Length 를 본문 파싱(임시 파일 저장) 전에 검사하여 즉시 거부하는 route
+    Content-Length 가 없는 요청은 업로드 도중 SizeLimitedReader 로 강제된다.
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        resource_group = self._get_upload_resource_group()
+
+        if resource_group is None:
+            return original_route_handler
+
+        async def size_limit_route_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length")
+
+            if content_length and content_length.isdigit():
+                try:
+                    check_file_size(resource_group, int(content_length) - MULTIPART_OVERHEAD)
+                except ERROR_FILE_TOO_LARGE as e:
+                    _LOGGER.warning(f"[UploadSizeLimitRoute] Rejected upload: {e.message}")
+                    return JSONResponse(
+                        status_code=413,
+                        content={"detail": {"code": e.error_code, "message": e.message}},
+                    )
+
+            return await original_route_handler(request)
+
+        return size_limit_route_handler
+
+    def _get_upload_resource_group(self):
+        path_items = self.path.rstrip("/").split("/")
+        if "POST" not in self.methods or len(path_items) < 2 or path_items[-1] != "upload":
+            return None
+
+        return _UPLOAD_RESOURCE_GROUPS.get(path_items[-2])
+
+
+class CancellableStreamingResponse(StreamingResponse):
+    """
+    클라이언트 연결 종료를 감지하여 cancellation 을 취소하는 스트리밍 응답
+    StreamingResponse 는 연결이 끊겨도 스레드에서 실행 중인 동기 제너레이터를 멈추지 못하므로
+    (backend 본문 읽기가 끝까지 진행됨) 종료 시 cancellation 콜백으로 backend 스트림을 직접 닫는다.
+    시작하지 않은 제너레이터는 close() 해도 finally 가 실행되지 않으므로, ticket 반환과 스트림 정리는
+    응답이 끝나면 항상 실행되는 on_close 로 처리한다. (on_close 는 여러 번 호출되어도 안전해야 함)
+    """
+
+    def __init__(
+        self,
+        content,
+        *args,
+        cancellation: Optional[TransferCancellation] = None,
+        on_close: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ):
+        super().__init__(content, *args, **kwargs)
+        self.content = content
+        self.cancellation = cancellation or TransferCancellation()
+        self.on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            async with anyio.create_task_group() as task_group:
+
+                async def listen_for_disconnect() -> None:
+                    await self.listen_for_disconnect(receive)
+                    self.cancellation.cancel()
+                    task_group.cancel_scope.cancel()
+
+                task_group.start_soon(listen_for_disconnect)
+
+                try:
+                    await self.stream_response(send)
+                except OSError:
+                    # ASGI spec 2.4 이상 서버는 disconnect 후 send 에서 OSError 발생
+                    self.cancellation.cancel()
+                finally:
+                    task_group.cancel_scope.cancel()
+        finally:
+            # 서버 종료 등으로 이 task 가 취소되어도 정리는 끝까지 실행
+            with anyio.CancelScope(shield=True):
+                self._close_content()
+                await self._run_on_close()
+
+        if self.background is not None:
+            await self.background()
+
+    def _close_content(self) -> None:
+        close = getattr(self.content, "close", None)
+        if close is None:
+            return
+
+        try:
+            close()
+        except ValueError:
+            # 스레드에서 아직 실행 중인 제너레이터는 cancellation 으로 닫힌 본문 읽기 실패 후 종료됨
+            pass
+
+    async def _run_on_close(self) -> None:
+        if self.on_close is None:
+            return
+
+        try:
+            # backend 연결 종료가 이벤트 루프를 막지 않도록 스레드에서 실행
+            await anyio.to_thread.run_sync(self.on_close)
+        except Exception as e:
+            _LOGGER.error(f"[CancellableStreamingResponse] on_close error: {e}")
+
+
+def too_many_requests_response(error: ERROR_TRANSFER_REJECTED) -> JSONResponse:
+    """
+    admission control 거부 응답 (429 + Retry-After)
+    """
+    retry_after = get_admission_controller().conf["retry_after"]
+    return JSONResponse(
+        status_code=429,
+        content={"detail": {"code": error.error_code, "message": error.message}},
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def range_not_satisfiable_response(error: ERROR_RANGE_NOT_SATISFIABLE, file_size: Optional[int] = None) -> JSONResponse:
+    """
+    파일 크기를 벗어난 Range 요청 응답 (416 + Content-Range: bytes */{size})
+    """
+    headers = {"Content-Range": f"bytes */{file_size}"} if file_size is not None else None
+    return JSONResponse(
+        status_code=416,
+        content={"detail": {"code": error.error_code, "message": error.message}},
+        headers=headers,
+    )
+
+
+def offload_response(redirect: str, name: str) -> Response:
+    """
+    nginx X-Accel-Redirect 응답 (본문 없이 내부 location 으로 redirect, 다운로드 헤더만 설정)
+    Content-Length, ETag, Range 응답 헤더는 nginx 가 backend 응답에서 설정한다.
+    """
+    return Response(
+        status_code=200,
+        media_type="application/octet-stream",
+        headers={
+            "X-Accel-Redirect": redirect,
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(name)}",
+            "Cache-Control": "no-cache",
+        },
+    )
@@ -0,0 +1,417 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, List, Optional
+from urllib.parse import quote
+
+from fastapi import UploadFile
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from spaceone.core import config
+from spaceone.file_manager.error import *
+from spaceone.file_manager.interface.rest.route import (
+    CancellableStreamingResponse,
+    offload_response,
+    range_not_satisfiable_response,
+    too_many_requests_response,
+)
+from spaceone.file_manager.lib.access_tracker import get_access_tracker
+from spaceone.file_manager.lib.admission import get_admission_controller
+from spaceone.file_manager.lib.archive import ARCHIVE_FORMATS, iter_archive, dedupe_archive_names
+from spaceone.file_manager.lib.size_policy import check_file_size, get_stream_size
+from spaceone.file_manager.lib.stream import TransferCancellation, parse_range_header
+from spaceone.file_manager.manager.image_derivative_manager import ImageDerivativeManager
+from spaceone.file_manager.manager.streaming_file_connector_manager import StreamingFileConnectorManager
+
+__all__ = ["upload_file", "upload_files", "download_file", "download_archive", "download_derivative"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def upload_file(file_svc, params: dict, file: UploadFile, resource_group: Optional[str] = None):
+    """
+    파일 1개 업로드 (File, UserFile 라우터 공용)
+    file_svc 의 add 로 파일 정보를 만든 뒤 본문을 backend 로 스트리밍하고, 실패하면 파일 정보를 삭제한다.
+    resource_group 을 지정하지 않으면 params 의 resource_group 을 사용한다.
+    """
+    resource_group = resource_group or params["resource_group"]
+
+    # 크기를 알 수 있는 업로드는 파일 정보 생성 전에 정책 검사
+    file_size = get_stream_size(file.file)
+    check_file_size(resource_group, file_size)
+
+    # backend 라우팅 규칙에 사용
+    params["size"] = file_size
+    params["content_type"] = file.content_type
+
+    file_info = None
+
+    try:
+        file_info: dict = file_svc.add(params)
+
+        # 동기 스트리밍 커넥터 사용 (라우팅 규칙으로 선택된 backend)
+        file_conn_mgr = StreamingFileConnectorManager(
+            backend=file_info["backend"], key_layout=file_info["key_layout"], domain_id=file_info["domain_id"]
+        )
+
+        # 스트리밍 업로드 사용 - 청크 단위로 파일 처리 (메모리 효율적)
+        _LOGGER.info(f"[upload_file] Starting streaming upload for file_id: {file_info['file_id']}")
+        _upload_stream(file_conn_mgr, file_info, file, resource_group)
+        _LOGGER.info(f"[upload_file] Streaming upload completed for file_id: {file_info['file_id']}")
+
+    except Exception as e:
+        _LOGGER.error(f"[upload_file] Error: {e}")
+        # 업로드 실패 시 DB에서 파일 정보 삭제
+        if file_info:
+            try:
+                file_svc.delete({"file_id": file_info["file_id"]})
+            except Exception as delete_error:
+                _LOGGER.error(f"[upload_file] Failed to cleanup file record: {delete_error}")
+
+        if isinstance(e, ERROR_TRANSFER_REJECTED):
+            return too_many_requests_response(e)
+        if isinstance(e, ERROR_STORAGE_QUOTA_EXCEEDED):
+            raise e
+
+        raise ERROR_FILE_UPLOAD_FAILED(name=file_info["name"] if file_info else params.get("name", "unknown"))
+
+    return file_info
+
+
+def upload_files(file_svc, params: dict, files: List[UploadFile]) -> dict:
+    """
+    여러 파일을 multipart 요청 1건으로 업로드
+    인증/권한 확인과 파일 정보 생성은 add_many 1회로 처리하고, 본문은 backend 로 동시에 전송
+    동시 전송 수는 BATCH_UPLOAD_CONCURRENCY 와 memory budget, admission control 로 제한된다.
+    업로드에 실패한 파일은 파일 정보를 삭제하고 요청 순서대로 파일별 결과를 반환한다.
+    """
+    resource_group = params["resource_group"]
+    results = [None] * len(files)
+    items = []
+
+    # 크기 정책에 맞지 않는 파일은 파일 정보를 만들지 않고 실패 처리
+    for index, file in enumerate(files):
+        file_size = get_stream_size(file.file)
+        try:
+            check_file_size(resource_group, file_size)
+        except ERROR_FILE_TOO_LARGE as e:
+            results[index] = _make_batch_failure(file.filename, e)
+            continue
+
+        items.append((index, file, {"name": file.filename, "size": file_size, "content_type": file.content_type}))
+
+    files_info = []
+    if items:
+        files_info = file_svc.add_many({**params, "files": [item[2] for item in items]})["results"]
+
+    # connector 는 backend 별로 한 번만 생성하여 공유
+    file_conn_mgrs = {}
+    for file_info in files_info:
+        if file_info["backend"] not in file_conn_mgrs:
+            file_conn_mgrs[file_info["backend"]] = StreamingFileConnectorManager(
+                backend=file_info["backend"], key_layout=file_info["key_layout"], domain_id=file_info["domain_id"]
+            )
+
+    failed_file_ids = []
+    concurrency = max(1, min(config.get_global("BATCH_UPLOAD_CONCURRENCY", 8), len(files_info) or 1))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            (
+                index,
+                file,
+                file_info,
+                executor.submit(
+                    _upload_stream, file_conn_mgrs[file_info["backend"]], file_info, file, file_info["resource_group"]
+                ),
+            )
+            for (index, file, _), file_info in zip(items, files_info)
+        ]
+
+        for index, file, file_info, future in futures:
+            try:
+                future.result()
+                results[index] = {"name": file.filename, "status": "SUCCESS", "file": file_info}
+            except Exception as e:
+                _LOGGER.error(f"[upload_files] Failed to upload {file_info['file_id']}: {e}")
+                failed_file_ids.append(file_info["file_id"])
+                results[index] = _make_batch_failure(file.filename, e)
+
+    for file_id in failed_file_ids:
+        try:
+            file_svc.delete({"file_id": file_id})
+        except Exception as e:
+            _LOGGER.error(f"[upload_files] Failed to delete file info {file_id}: {e}")
+
+    failure_count = sum(1 for result in results if result["status"] == "FAILURE")
+    return {
+        "results": results,
+        "success_count": len(results) - failure_count,
+        "failure_count": failure_count,
+    }
+
+
+def _upload_stream(
+    file_conn_mgr: StreamingFileConnectorManager, file_info: dict, file: UploadFile, resource_group: str
+) -> None:
+    file_id = file_info["file_id"]
+
+    # pod/domain 동시 전송 수 제한 + tenant bandwidth 제한
+    with get_admission_controller().admit(file_info["domain_id"], "upload") as ticket:
+        file_conn_mgr.stream_upload_file(resource_group, file_id, ticket.throttle_reader(file))
+
+    # 설정된 썸네일 spec 이 있으면 백그라운드에서 미리 생성
+    ImageDerivativeManager(
+        backend=file_info["backend"], key_layout=file_info["key_layout"], domain_id=file_info["domain_id"]
+    ).pregenerate_derivatives(resource_group, file_id, file_info["name"])
+
+
+def _make_batch_failure(name: str, error: Exception) -> dict:
+    if not isinstance(error, ERROR_BASE):
+        error = ERROR_FILE_UPLOAD_FAILED(name=name)
+
+    return {
+        "name": name,
+        "status": "FAILURE",
+        "error": {"code": error.error_code, "message": error.message},
+    }
+
+
+def download_file(
+    file_info: dict,
+    resource_type: str,
+    range_header: str = None,
+    offload: bool = False,
+    resource_group: Optional[str] = None,
+) -> Response:
+    """
+    파일 1개 스트리밍 다운로드 (File, UserFile 라우터 공용)
+    resource_group 을 지정하지 않으면 파일 정보의 resource_group 을 사용한다.
+    """
+    resource_group = resource_group or file_info["resource_group"]
+    file_id = file_info["file_id"]
+
+    # nginx 가 backend 에서 직접 전송 (Python 은 권한 확인 후 내부 redirect 위치만 응답)
+    file_conn_mgr = None
+    if offload:
+        try:
+            file_conn_mgr = StreamingFileConnectorManager(
+                backend=file_info["backend"], key_layout=file_info["key_layout"], domain_id=file_info["domain_id"]
+            )
+            redirect = file_conn_mgr.get_offload_redirect(resource_group, file_id)
+        except Exception as e:
+            _LOGGER.error(f"[download_file] Failed to offload download: {e}")
+            raise ERROR_FILE_DOWNLOAD_FAILED(name=file_info["name"])
+
+        if redirect:
+            get_access_tracker().record(resource_type, file_id)
+            return offload_response(redirect, file_info["name"])
+
+    # Range 요청은 필요한 구간만 backend 에서 스트리밍
+    byte_range = parse_range_header(range_header)
+
+    try:
+        ticket = get_admission_controller().admit(file_info["domain_id"], "download")
+    except ERROR_TRANSFER_REJECTED as e:
+        return too_many_requests_response(e)
+
+    try:
+        # 동기 스트리밍 커넥터 사용
+        file_conn_mgr = file_conn_mgr or StreamingFileConnectorManager(
+            backend=file_info["backend"], key_layout=file_info["key_layout"], domain_id=file_info["domain_id"]
+        )
+        # 클라이언트 연결이 끊기면 backend 본문 읽기를 즉시 중단
+        cancellation = TransferCancellation()
+        download_stream = file_conn_mgr.open_download(resource_group, file_id, byte_range, cancellation)
+
+    except ERROR_RANGE_NOT_SATISFIABLE as e:
+        ticket.release()
+        return range_not_satisfiable_response(e, file_info.get("size"))
+
+    except Exception as e:
+        ticket.release()
+        _LOGGER.error(f"[download_file] Error: {e}")
+        raise ERROR_FILE_DOWNLOAD_FAILED(name=file_info["name"])
+
+    get_access_tracker().record(resource_type, file_id)
+
+    # 스트리밍 다운로드를 위한 동기 제너레이터
+    def stream_generator():
+        try:
+            for chunk in ticket.throttle_chunks(download_stream):
+                yield chunk
+        except Exception as e:
+            if cancellation.cancelled:
+                # 클라이언트 연결 종료로 본문을 닫은 경우 (응답은 이미 전송 불가)
+                return
+            _LOGGER.error(f"[download_file] Error during streaming: {e}")
+            raise ERROR_FILE_DOWNLOAD_FAILED(name=file_info["name"])
+
+    def close_download():
+        download_stream.close()
+        ticket.release()
+
+    filename = quote(file_info["name"])
+
+    # 스트리밍 응답 헤더
+    headers = {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{filename}",
+        "Cache-Control": "no-cache",
+        "Accept-Ranges": "bytes",
+    }
+
+    status_code = 200
+    if download_stream.content_length >= 0:
+        headers["Content-Length"] = str(download_stream.content_length)
+
+    # backend GET 응답의 etag 를 그대로 전달 (조건부 요청/캐시 검증용)
+    if download_stream.etag:
+        headers["ETag"] = download_stream.etag
+
+    if byte_range and download_stream.content_range:
+        status_code = 206
+        headers["Content-Range"] = download_stream.content_range
+
+    # 동기 스트리밍 응답 반환 (연결 종료 시 cancellation 취소, 응답이 끝나면 스트림과 ticket 반환)
+    return CancellableStreamingResponse(
+        stream_generator(),
+        status_code=status_code,
+        media_type="application/octet-stream",
+        headers=headers,
+        cancellation=cancellation,
+        on_close=close_download,
+    )
+
+
+async def download_derivative(
+    file_info: dict, w: int, h: int, fmt: str, resource_type: str, resource_group: Optional[str] = None
+) -> Response:
+    """
+    이미지 썸네일/미리보기 다운로드 (?w=&h=&fmt=, File, UserFile 라우터 공용)
+    원본 다운로드/디코딩은 스레드 풀과 프로세스 풀에서 처리하여 이벤트 루프를 막지 않는다.
+    """
+    resource_group = resource_group or file_info["resource_group"]
+    file_id = file_info["file_id"]
+
+    derivative_mgr = ImageDerivativeManager(
+        backend=file_info["backend"], key_layout=file_info["key_layout"], domain_id=file_info["domain_id"]
+    )
+    spec = derivative_mgr.parse_transform_spec(file_info["name"], w, h, fmt)
+
+    try:
+        data = await run_in_threadpool(derivative_mgr.get_derivative, resource_group, file_id, spec)
+    except ERROR_BASE as e:
+        raise e
+    except Exception as e:
+        _LOGGER.error(f"[download_derivative] Error: {e}")
+        raise ERROR_IMAGE_DERIVATIVE_FAILED(file_id=file_id)
+
+    get_access_tracker().record(resource_type, file_id)
+
+    filename = quote(file_info["name"])
+
+    headers = {
+        "Content-Disposition": f"inline; filename*=UTF-8''{filename}",
+        "Cache-Control": "private, max-age=86400",
+    }
+
+    return Response(content=data, media_type=spec.content_type, headers=headers)
+
+
+def download_archive(
+    list_files: Callable[[dict], dict], params: dict, resource_type: str, resource_group: Optional[str] = None
+) -> Response:
+    """
+    여러 파일을 하나의 ZIP/TAR 아카이브로 스트리밍 (File, UserFile 라우터 공용)
+    권한 확인은 list_files (service list) 한 번으로 처리하고, 파일 본문은 prefetch window 만큼 미리 열어서 순차적으로 기록
+    resource_group 을 지정하지 않으면 파일 정보의 resource_group 을 사용한다.
+    """
+    max_count = config.get_global("MAX_ARCHIVE_FILE_COUNT", 1000)
+    file_ids = list(dict.fromkeys(params.get("file_ids") or []))
+
+    if file_ids:
+        if len(file_ids) > max_count:
+            raise ERROR_INVALID_PARAMETER(key="file_ids", reason=f"Too many files. (max = {max_count})")
+
+        query = {"filter": [{"k": "file_id", "v": file_ids, "o": "in"}]}
+    elif params.get("query"):
+        query = dict(params["query"])
+        query["page"] = {"start": 1, "limit": max_count + 1}
+    else:
+        raise ERROR_REQUIRED_PARAMETER(key="file_ids")
+
+    files_info: list = list_files({"query": query})["results"]
+
+    if file_ids:
+        found_ids = {file_info["file_id"] for file_info in files_info}
+        not_found_ids = [file_id for file_id in file_ids if file_id not in found_ids]
+        if not_found_ids:
+            raise ERROR_NOT_FOUND(key="file_id", value=", ".join(not_found_ids))
+
+        order = {file_id: index for index, file_id in enumerate(file_ids)}
+        files_info.sort(key=lambda file_info: order[file_info["file_id"]])
+    elif len(files_info) > max_count:
+        raise ERROR_INVALID_PARAMETER(key="query", reason=f"Too many files. (max = {max_count})")
+
+    archive_format = params.get("format") or "zip"
+    media_type, extension = ARCHIVE_FORMATS[archive_format]
+    archive_name = f"files_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.{extension}"
+
+    file_conn_mgr = StreamingFileConnectorManager()
+    prefetch_window = config.get_global("ARCHIVE_PREFETCH_WINDOW", 4)
+    access_tracker = get_access_tracker()
+
+    def entry_generator():
+        names = list(dedupe_archive_names(file_info["name"] for file_info in files_info))
+        download_streams = file_conn_mgr.prefetch_download_streams(
+            [
+                (
+                    resource_group or file_info["resource_group"],
+                    file_info["file_id"],
+                    file_info["backend"],
+                    file_info["key_layout"],
+                    file_info["domain_id"],
+                )
+                for file_info in files_info
+            ],
+            window=prefetch_window,
+            cancellation=cancellation,
+        )
+
+        for name, ((_, file_id, *_), download_stream) in zip(names, download_streams):
+            access_tracker.record(resource_type, file_id)
+            yield name, download_stream.content_length, download_stream
+
+    domain_id = files_info[0]["domain_id"] if files_info else None
+    try:
+        ticket = get_admission_controller().admit(domain_id, "download")
+    except ERROR_TRANSFER_REJECTED as e:
+        return too_many_requests_response(e)
+
+    # 클라이언트 연결이 끊기면 전송 중인 스트림과 미리 열어둔 스트림을 모두 닫음
+    cancellation = TransferCancellation()
+
+    def stream_generator():
+        try:
+            for chunk in ticket.throttle_chunks(iter_archive(archive_format, entry_generator())):
+                yield chunk
+        except Exception as e:
+            if cancellation.cancelled:
+                return
+            _LOGGER.error(f"[download_archive] Error during streaming: {e}")
+            raise ERROR_FILE_DOWNLOAD_FAILED(name=archive_name)
+
+    headers = {
+        "Content-Disposition": f"attachment; filename*=UTF-8''{quote(archive_name)}",
+        "Cache-Control": "no-cache",
+    }
+
+    # 연결 종료 시 제너레이터를 닫아 미리 열어둔 다운로드 스트림 정리, 응답이 끝나면 ticket 반환
+    return CancellableStreamingResponse(
+        stream_generator(),
+        media_type=media_type,
+        headers=headers,
+        cancellation=cancellation,
+        on_close=ticket.release,
+    )
@@ -0,0 +1,204 @@
+import logging
+from typing import Optional
+from fastapi import Request, Depends, Body
+from fastapi.responses import Response, JSONResponse
+from fastapi_utils.cbv import cbv
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi_utils.inferring_router import InferringRouter
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+from spaceone.core.fastapi.api import BaseAPI, exception_handler
+from spaceone.file_manager.interface.rest.route import too_many_requests_response
+from spaceone.file_manager.lib.admission import get_admission_controller
+from spaceone.file_manager.lib.memory_budget import get_memory_budget, get_transfer_max_bytes
+from spaceone.file_manager.manager.file_connector_manager import FileConnectorManager
+from spaceone.file_manager.manager.image_derivative_manager import ImageDerivativeManager
+from spaceone.file_manager.model.file.request import ResourceGroup
+from spaceone.file_manager.service.file_service import FileService
+from spaceone.file_manager.error import *
+
+_LOGGER = logging.getLogger(__name__)
+_AUTH_SCHEME = HTTPBearer(auto_error=False)
+
+router = InferringRouter(include_in_schema=False)
+
+
+class UploadSessionCreateBody(BaseModel):
+    name: str
+    size: int
+    resource_group: ResourceGroup
+    project_id: Optional[str] = None
+
+
+@cbv(router)
+class UploadSessions(BaseAPI):
+    """
+    재개 가능한 업로드 (tus 방식)
+    1. POST   /files/uploads                      세션 생성 (upload_id, part_size 반환)
+    2. PATCH  /files/uploads/{upload_id}          Upload-Offset 헤더 위치부터 파트 1개 전송 (part_size 경계)
+    3. HEAD   /files/uploads/{upload_id}          연결이 끊긴 뒤 Upload-Offset 으로 이어 보낼 위치 확인
+    4. POST   /files/uploads/{upload_id}/complete 파트를 합쳐 파일 생성
+    DELETE /files/uploads/{upload_id} 로 업로드를 취소하며, 방치된 세션은 scheduler 가 만료 후 정리한다.
+    """
+
+    token: HTTPAuthorizationCredentials = Depends(_AUTH_SCHEME)
+    service = "file-manager"
+
+    @router.post("/uploads")
+    @exception_handler
+    async def create_upload_session(self, request: Request, upload_request: UploadSessionCreateBody = Body(...)):
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+        params = upload_request.dict()
+
+        if params["resource_group"] == "PROJECT" and not params["project_id"]:
+            params["project_id"] = "*"
+
+        file_svc = FileService(metadata)
+        session_info: dict = await run_in_threadpool(file_svc.create_upload_session, params)
+
+        return JSONResponse(
+            status_code=201,
+            content=session_info,
+            headers={
+                "Location": f"{request.url.path.rstrip('/')}/{session_info['upload_id']}",
+                **self._get_upload_headers(session_info),
+            },
+        )
+
+    @router.head("/uploads/{upload_id}")
+    @exception_handler
+    async def head_upload_session(self, upload_id: str):
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+
+        file_svc = FileService(metadata)
+        session_info: dict = await run_in_threadpool(file_svc.get_upload_session, {"upload_id": upload_id})
+
+        return Response(status_code=200, headers=self._get_upload_headers(session_info))
+
+    @router.get("/uploads/{upload_id}")
+    @exception_handler
+    async def get_upload_session(self, upload_id: str):
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+
+        file_svc = FileService(metadata)
+        return await run_in_threadpool(file_svc.get_upload_session, {"upload_id": upload_id})
+
+    @router.patch("/uploads/{upload_id}")
+    @exception_handler
+    async def upload_session_part(self, request: Request, upload_id: str):
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+
+        offset = request.headers.get("upload-offset", "")
+        if not offset.isdigit():
+            raise ERROR_REQUIRED_PARAMETER(key="Upload-Offset")
+
+        content_length = request.headers.get("content-length", "")
+        if not content_length.isdigit():
+            return Response(status_code=411)
+
+        content_length = int(content_length)
+        if content_length > get_transfer_max_bytes():
+            return Response(status_code=413)
+
+        # 본문을 읽기 전에 파트 크기만큼 메모리 예산 예약
+        memory_budget = get_memory_budget()
+        reserved = await run_in_threadpool(memory_budget.acquire, content_length)
+
+        try:
+            data = await request.body()
+            return await run_in_threadpool(self.upload_part, metadata, upload_id, int(offset), data)
+        finally:
+            memory_budget.release(reserved)
+
+    @router.post("/uploads/{upload_id}/complete")
+    @exception_handler
+    async def complete_upload_session(self, upload_id: str):
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+
+        file_svc = FileService(metadata)
+        file_info: dict = await run_in_threadpool(file_svc.complete_upload_session, {"upload_id": upload_id})
+
+        # 설정된 썸네일 spec 이 있으면 백그라운드에서 미리 생성
+        ImageDerivativeManager(
+            backend=file_info["backend"], key_layout=file_info["key_layout"], domain_id=file_info["domain_id"]
+        ).pregenerate_derivatives(file_info["resource_group"], file_info["file_id"], file_info["name"])
+
+        return file_info
+
+    @router.delete("/uploads/{upload_id}")
+    @exception_handler
+    async def delete_upload_session(self, upload_id: str):
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+
+        file_svc = FileService(metadata)
+        await run_in_threadpool(file_svc.delete_upload_session, {"upload_id": upload_id})
+
+        return Response(status_code=204)
+
+    def upload_part(self, metadata, upload_id: str, offset: int, data: bytes) -> Response:
+        file_svc = FileService(metadata)
+        part_info: dict = file_svc.check_upload_session_part(
+            {"upload_id": upload_id, "offset": offset, "size": len(data)}
+        )
+
+        try:
+            ticket = get_admission_controller().admit(part_info["domain_id"], "upload")
+        except ERROR_TRANSFER_REJECTED as e:
+            return too_many_requests_response(e)
+
+        try:
+            with ticket:
+                ticket.consume(len(data))
+                file_conn_mgr = FileConnectorManager(
+                    backend=part_info["backend"], key_layout=part_info["key_layout"], domain_id=part_info["domain_id"]
+                )
+                etag = file_conn_mgr.upload_part(
+                    part_info["resource_group"],
+                    part_info["file_id"],
+                    part_info["backend_upload_id"],
+                    part_info["part_number"],
+                    data,
+                )
+        except Exception as e:
+            _LOGGER.error(f"[upload_part] Error: {e}")
+            raise ERROR_FILE_UPLOAD_FAILED(name=upload_id)
+
+        session_info: dict = file_svc.add_upload_session_part(
+            {
+                "upload_id": upload_id,
+                "part_number": part_info["part_number"],
+                "etag": etag,
+                "size": len(data),
+            }
+        )
+
+        return Response(status_code=204, headers=self._get_upload_headers(session_info))
+
+    @staticmethod
+    def _get_upload_headers(session_info: dict) -> dict:
+        return {
+            "Upload-Offset": str(session_info["offset"]),
+            "Upload-Length": str(session_info["size"]),
+            "Upload-Part-Size": str(session_info["part_size"]),
+            "Upload-Expires": str(session_info["expires_at"]),
+            "Cache-Control": "no-store",
+        }
@@ -1,24 +1,35 @@
 
 import logging
-from urllib.parse import quote
-from fastapi import Request, Depends, File, UploadFile
-from fastapi.responses import StreamingResponse
+from typing import Optional, List
+from fastapi import Request, Depends, File, UploadFile, Body, Query
+from fastapi.responses import Response, StreamingResponse
 from fastapi_utils.cbv import cbv
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi_utils.inferring_router import InferringRouter
+from starlette.concurrency import run_in_threadpool
 
 
 from spaceone.core import utils
 from spaceone.core.fastapi.api import BaseAPI, exception_handler
-from spaceone.file_manager.manager.streaming_file_connector_manager import StreamingFileConnectorManager
+from spaceone.file_manager.interface.rest.route import UploadSizeLimitRoute
+from spaceone.file_manager.interface.rest.transfer import (
+    download_archive,
+    download_derivative,
+    download_file,
+    upload_file,
+)
+from spaceone.file_manager.lib.offload import get_download_offload
+from spaceone.file_manager.lib.signed_url import get_url_signer
 from spaceone.file_manager.model import user_file
+from spaceone.file_manager.model.file.request import ArchiveFormat
+from spaceone.file_manager.model.user_file.request import UserFileArchiveRequest
 from spaceone.file_manager.service.user_file_service import UserFileService
 from spaceone.file_manager.error import *
 
 _LOGGER = logging.getLogger(__name__)
 _AUTH_SCHEME = HTTPBearer(auto_error=False)
 
-router = InferringRouter(include_in_schema=False)
+router = InferringRouter(include_in_schema=False, route_class=UploadSizeLimitRoute)
 
 @cbv(router)
 class UserFiles(BaseAPI):
@@ -36,95 +47,124 @@ class UserFiles(BaseAPI):
             "name": file.filename,
         }
 
-        user_file_info = self.upload_file(metadata, params, file)
+        user_file_svc = UserFileService(metadata)
+        user_file_info = await run_in_threadpool(upload_file, user_file_svc, params, file, "USER")
         return user_file_info
 
-    @router.get("/user/{file_id}")
+    @router.post("/user/archive")
+    @exception_handler
+    async def download_user_archive(self, request: Request, archive_request: UserFileArchiveRequest = Body(...)):
+
+        metadata = {
+            "token": self.token.credentials,
+        }
+
+        user_file_svc = UserFileService(metadata)
+        return await run_in_threadpool(
+            download_archive, user_file_svc.list, archive_request.dict(), "UserFile", resource_group="USER"
+        )
+
+    @router.get("/user/archive")
     @exception_handler
-    async def download_user_file(self, file_id:str, token:str,  request: Request):
+    async def download_user_archive_by_ids(
+        self,
+        request: Request,
+        token: str,
+        file_ids: List[str] = Query(...),
+        archive_format: ArchiveFormat = Query("zip", alias="format"),
+    ):
 
         metadata = {
             "token": token,
         }
         params = {
-            "file_id": file_id,
+            "file_ids": file_ids,
+            "format": archive_format,
         }
 
-        return self.download_file(metadata, params)
-
-    def upload_file(self, metadata, params, file) :
-        user_file_info = None
-        file_id = None
+        user_file_svc = UserFileService(metadata)
+        return await run_in_threadpool(
+            download_archive, user_file_svc.list, params, "UserFile", resource_group="USER"
+        )
 
-        try:
-            user_file_svc = UserFileService(metadata)
-            user_file_info: dict = user_file_svc.add(params)
+    @router.get("/user/usage")
+    @exception_handler
+    async def get_user_usage(self):
+        """
+        사용자 파일 사용량 (파일 수, 전체 크기), 미리 집계된 counter 를 조회
+        """
 
-            resource_group = "USER"
-            file_id = user_file_info["file_id"]
+        metadata = {
+            "token": self.token.credentials,
+        }
 
-            # 동기 스트리밍 커넥터 사용
-            file_conn_mgr = StreamingFileConnectorManager()
+        user_file_svc = UserFileService(metadata)
+        return await run_in_threadpool(user_file_svc.get_usage, {})
 
-            # 스트리밍 업로드 사용 - 청크 단위로 파일 처리 (메모리 효율적)
-            _LOGGER.info(f"[upload_file] Starting streaming upload for file_id: {file_id}")
+    @router.post("/user/get-many")
+    @exception_handler
+    async def get_many_user_files(self, request: Request, file_ids: List[str] = Body(..., embed=True)):
+        """
+        여러 file_id 를 한 번의 조회로 확인 (없거나 권한이 없는 file_id 는 null)
+        """
 
-            # 동기 방식으로 스트리밍 업로드 실행
-            file_conn_mgr.stream_upload_file(resource_group, file_id, file)
-            _LOGGER.info(f"[upload_file] Streaming upload completed for file_id: {file_id}")
+        metadata = {
+            "token": self.token.credentials,
+        }
+        params = {
+            "file_ids": file_ids,
+        }
 
-        except Exception as e:
-            _LOGGER.error(f'[upload_file] Error: {e}')
-            # 업로드 실패 시 DB에서 파일 정보 삭제
-            if user_file_info and file_id:
-                try:
-                    user_file_svc.delete({"file_id": file_id})
-                except Exception as delete_error:
-                    _LOGGER.error(f'[upload_file] Failed to cleanup file record: {delete_error}')
+        user_file_svc = UserFileService(metadata)
+        return await run_in_threadpool(user_file_svc.get_many, params)
 
-            # 파일명이 있으면 사용, 없으면 기본 메시지
-            file_name = user_file_info.get("name", "unknown") if user_file_info else params.get("name", "unknown")
-            raise ERROR_FILE_UPLOAD_FAILED(name=file_name)
+    @router.get("/user/{file_id}")
+    @exception_handler
+    async def download_user_file(
+        self,
+        request: Request,
+        file_id: str,
+        token: Optional[str] = None,
+        w: Optional[int] = None,
+        h: Optional[int] = None,
+        fmt: Optional[str] = None,
+        sig: Optional[str] = None,
+    ):
 
-        return user_file_info
+        metadata = {
+            "token": token,
+        }
+        params = {
+            "file_id": file_id,
+        }
 
-    def download_file(self, metadata, params) -> StreamingResponse:
+        # 서명된 링크는 token 인증과 파일 정보 조회 없이 서명에 포함된 파일 정보로 다운로드
+        user_file_info = get_url_signer().verify(sig, file_id, "USER") if sig else None
 
-        user_file_svc = UserFileService(metadata)
-        user_file_info: dict = user_file_svc.get(params)
-
-        resource_group = "USER"
-        file_id = user_file_info["file_id"]
-
-        try:
-            # 동기 스트리밍 커넥터 사용
-            file_conn_mgr = StreamingFileConnectorManager()
-
-            # 스트리밍 다운로드를 위한 동기 제너레이터
-            def stream_generator():
-                try:
-                    for chunk in file_conn_mgr.download_file_stream(resource_group, file_id):
-                        yield chunk
-                except Exception as e:
-                    _LOGGER.error(f"[download_file] Error during streaming: {e}")
-                    raise ERROR_FILE_DOWNLOAD_FAILED(name=user_file_info["name"])
-
-        except Exception as e:
-            _LOGGER.error(f'[download_file] Error: {e}')
-            raise ERROR_FILE_DOWNLOAD_FAILED(name=user_file_info["name"])
-
-        filename = quote(user_file_info['name'])
-
-        # 스트리밍 응답 헤더
-        headers = {
-            "Content-Disposition": f"attachment; filename*=UTF-8''{filename}",
-            # Content-Length는 스트리밍이므로 설정하지 않음
-            "Cache-Control": "no-cache",
-        }
+        if w or h or fmt:
+            return await self.download_image_derivative(metadata, params, w, h, fmt, user_file_info)
 
-        # 동기 스트리밍 응답 반환
-        return StreamingResponse(
-            stream_generator(),
-            media_type="application/octet-stream",
-            headers=headers,
+        return await run_in_threadpool(
+            self.download_file,
+            metadata,
+            params,
+            request.headers.get("range"),
+            user_file_info,
+            get_download_offload().is_available(request.headers),
         )
+
+    def download_file(
+        self, metadata, params, range_header: str = None, user_file_info: dict = None, offload: bool = False
+    ) -> Response:
+        if user_file_info is None:
+            user_file_svc = UserFileService(metadata)
+            user_file_info: dict = user_file_svc.get(params)
+
+        return download_file(user_file_info, "UserFile", range_header, offload, resource_group="USER")
+
+    async def download_image_derivative(self, metadata, params, w, h, fmt, user_file_info: dict = None) -> Response:
+        if user_file_info is None:
+            user_file_svc = UserFileService(metadata)
+            user_file_info: dict = user_file_svc.get(params)
+
+        return await download_derivative(user_file_info, w, h, fmt, "UserFile", resource_group="USER")
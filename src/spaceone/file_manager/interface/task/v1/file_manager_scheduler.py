@@ -0,0 +1,201 @@
+import logging
+import time
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core.locator import Locator
+from spaceone.core.scheduler import IntervalScheduler
+
+__all__ = ["FileManagerScheduler"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FileManagerScheduler(IntervalScheduler):
+    def __init__(self, queue, interval):
+        super().__init__(queue, interval)
+        self.locator = Locator()
+        self._usage_reconciled_at = None
+        self._init_config()
+
+    def _init_config(self):
+        self._token = config.get_global("TOKEN")
+        if self._token is None:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+        self._usage_reconcile_interval = config.get_global("USAGE_RECONCILE_INTERVAL", 86400)
+
+    def create_task(self) -> list:
+        tasks = []
+        tasks.extend(self._create_upload_session_cleanup_task())
+        tasks.extend(self._create_storage_tiering_task())
+        tasks.extend(self._create_key_layout_rekey_task())
+        tasks.extend(self._create_inline_storage_migration_task())
+        tasks.extend(self._create_packing_task())
+        tasks.extend(self._create_file_lifecycle_task())
+        tasks.extend(self._create_usage_reconcile_task())
+        return tasks
+
+    def _create_upload_session_cleanup_task(self) -> list:
+        # 만료된 재개 가능 업로드 세션의 backend 파트 정리
+        stp = {
+            "name": "upload_session_cleanup_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "FileService",
+                    "metadata": {"token": self._token},
+                    "method": "cleanup_upload_sessions",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[_create_upload_session_cleanup_task] create task: {stp['name']}")
+        return [stp]
+
+    def _create_storage_tiering_task(self) -> list:
+        # STORAGE_TIERING 규칙이 있을 때만 tier 이동 실행
+        if not config.get_global("STORAGE_TIERING", {}).get("rules"):
+            return []
+
+        stp = {
+            "name": "storage_tiering_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "FileService",
+                    "metadata": {"token": self._token},
+                    "method": "migrate_storage_tiers",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[_create_storage_tiering_task] create task: {stp['name']}")
+        return [stp]
+
+    def _create_key_layout_rekey_task(self) -> list:
+        # KEY_LAYOUT.rekey 가 활성화되어 있을 때만 이전 layout 객체를 새 layout 으로 이동
+        if not config.get_global("KEY_LAYOUT", {}).get("rekey", {}).get("enabled"):
+            return []
+
+        stp = {
+            "name": "key_layout_rekey_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "FileService",
+                    "metadata": {"token": self._token},
+                    "method": "rekey_files",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[_create_key_layout_rekey_task] create task: {stp['name']}")
+        return [stp]
+
+    def _create_inline_storage_migration_task(self) -> list:
+        # INLINE_STORAGE.migrate 가 활성화되어 있을 때만 max_size 에 맞춰 inline <-> 일반 backend 이동
+        if not config.get_global("INLINE_STORAGE", {}).get("migrate"):
+            return []
+
+        stp = {
+            "name": "inline_storage_migration_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "FileService",
+                    "metadata": {"token": self._token},
+                    "method": "migrate_inline_storage",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[_create_inline_storage_migration_task] create task: {stp['name']}")
+        return [stp]
+
+    def _create_packing_task(self) -> list:
+        # PACKING 이 활성화되어 있을 때만 pack 기록 / compaction 실행
+        if not config.get_global("PACKING", {}).get("enabled"):
+            return []
+
+        stp = {
+            "name": "packing_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "FileService",
+                    "metadata": {"token": self._token},
+                    "method": "pack_small_files",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[_create_packing_task] create task: {stp['name']}")
+        return [stp]
+
+    def _create_file_lifecycle_task(self) -> list:
+        # FILE_LIFECYCLE 규칙이 있을 때만 만료 파일 삭제 실행
+        if not config.get_global("FILE_LIFECYCLE", {}).get("rules"):
+            return []
+
+        stp = {
+            "name": "file_lifecycle_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "FileService",
+                    "metadata": {"token": self._token},
+                    "method": "expire_files",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[_create_file_lifecycle_task] create task: {stp['name']}")
+        return [stp]
+
+    def _create_usage_reconcile_task(self) -> list:
+        # 사용량 counter 보정은 전체 집계가 필요하므로 USAGE_RECONCILE_INTERVAL 마다 실행 (0: 실행 안 함)
+        if not self._usage_reconcile_interval:
+            return []
+
+        now = time.monotonic()
+        if self._usage_reconciled_at is not None and now - self._usage_reconciled_at < self._usage_reconcile_interval:
+            return []
+
+        self._usage_reconciled_at = now
+
+        stp = {
+            "name": "usage_reconcile_schedule",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "FileService",
+                    "metadata": {"token": self._token},
+                    "method": "reconcile_usage",
+                    "params": {"params": {}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(f"[_create_usage_reconcile_task] create task: {stp['name']}")
+        return [stp]
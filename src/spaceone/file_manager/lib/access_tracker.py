@@ -0,0 +1,135 @@
+import atexit
+import logging
+import random
+import threading
+from datetime import datetime
+from typing import Dict, Tuple
+
+from pymongo import UpdateOne
+
+from spaceone.core import config
+from spaceone.file_manager.lib.metrics import Counter, Gauge, get_metric
+from spaceone.file_manager.model.file.database import File
+from spaceone.file_manager.model.user_file.database import UserFile
+
+__all__ = ["AccessTracker", "get_access_tracker"]
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_ACCESS_TRACKING = {
+    "enabled": True,
+    "sample_rate": 1.0,  # 기록할 다운로드 비율 (0.1 이면 10건 중 1건을 10회로 기록)
+    "flush_interval": 60,  # 메모리에 모은 기록을 Mongo 에 반영하는 주기 (초)
+    "max_pending": 10000,  # 모인 파일 수가 이 값을 넘으면 주기와 상관없이 반영
+}
+
+_MODELS = {
+    "File": File,
+    "UserFile": UserFile,
+}
+
+_PENDING_FILES = get_metric(Gauge, "file_manager_access_pending_files", "Number of files with unflushed access records")
+_FLUSHED_FILES = get_metric(
+    Counter, "file_manager_access_flushed_files_total", "Number of file access records written to database", ("resource_type",)
+)
+
+_access_tracker = None
+_access_tracker_lock = threading.Lock()
+
+
+class AccessTracker:
+    """
+    파일 다운로드 횟수/마지막 접근 시간 집계
+    다운로드마다 문서를 갱신하지 않고 메모리에서 파일 별로 합친 뒤, 백그라운드 스레드가 주기적으로 bulk write 한다.
+    프로세스가 비정상 종료되면 반영되지 않은 기록은 유실된다. (통계 용도이므로 허용)
+    """
+
+    def __init__(self, tracking_conf: dict):
+        self.conf = {**DEFAULT_ACCESS_TRACKING, **tracking_conf}
+        # {(resource_type, file_id): [count, last_accessed_at]}
+        self._pending: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flush_thread = None
+
+    def record(self, resource_type: str, file_id: str) -> None:
+        if not self.conf["enabled"] or not file_id:
+            return
+
+        sample_rate = self.conf["sample_rate"]
+        if sample_rate < 1 and random.random() >= sample_rate:
+            return
+
+        weight = max(1, round(1 / sample_rate)) if sample_rate > 0 else 1
+        now = datetime.utcnow()
+
+        with self._lock:
+            entry = self._pending.get((resource_type, file_id))
+            if entry is None:
+                self._pending[(resource_type, file_id)] = [weight, now]
+            else:
+                entry[0] += weight
+                entry[1] = now
+            pending_count = len(self._pending)
+
+        _PENDING_FILES.set(pending_count)
+        self._start_flush_thread()
+
+        if pending_count >= self.conf["max_pending"]:
+            self._flush_event.set()
+
+    def flush(self) -> int:
+        """
+        Returns: 반영된 파일 수
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        _PENDING_FILES.set(0)
+        if not pending:
+            return 0
+
+        requests_by_type: Dict[str, list] = {}
+        for (resource_type, file_id), (count, last_accessed_at) in pending.items():
+            requests_by_type.setdefault(resource_type, []).append(
+                UpdateOne(
+                    {"file_id": file_id},
+                    {"$inc": {"download_count": count}, "$max": {"last_accessed_at": last_accessed_at}},
+                )
+            )
+
+        for resource_type, requests in requests_by_type.items():
+            try:
+                _MODELS[resource_type]._get_collection().bulk_write(requests, ordered=False)
+                _FLUSHED_FILES.inc(len(requests), resource_type=resource_type)
+            except Exception as e:
+                _LOGGER.error(f"[AccessTracker] Failed to flush {len(requests)} {resource_type} access records: {e}")
+
+        return len(pending)
+
+    def _start_flush_thread(self) -> None:
+        if self._flush_thread is not None:
+            return
+
+        with self._lock:
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(target=self._run, name="access-tracker", daemon=True)
+                self._flush_thread.start()
+                atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while True:
+            self._flush_event.wait(self.conf["flush_interval"])
+            self._flush_event.clear()
+            self.flush()
+
+
+def get_access_tracker() -> AccessTracker:
+    global _access_tracker
+
+    if _access_tracker is None:
+        with _access_tracker_lock:
+            if _access_tracker is None:
+                _access_tracker = AccessTracker(config.get_global("ACCESS_TRACKING", {}))
+
+    return _access_tracker
@@ -0,0 +1,250 @@
+import io
+import logging
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional
+
+from spaceone.core import config
+from spaceone.file_manager.error.custom import ERROR_TRANSFER_REJECTED
+from spaceone.file_manager.lib.metrics import Counter, Gauge, get_metric
+
+__all__ = ["TokenBucket", "TransferAdmissionController", "TransferTicket", "get_admission_controller"]
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TRANSFER_ADMISSION = {
+    "max_concurrent_transfers": 64,  # pod 전체 동시 전송 수 (0: 제한 없음)
+    "max_concurrent_per_domain": 16,  # domain 별 동시 전송 수 (0: 제한 없음)
+    "max_queue_size": 128,  # 대기열 최대 길이
+    "queue_timeout": 10,  # 대기열 최대 대기 시간 (초)
+    "retry_after": 5,  # 거부 시 Retry-After (초)
+    "domain_bandwidth": 0,  # domain 별 전송 속도 (bytes/sec, 0: 제한 없음)
+    "domain_bandwidth_burst": 16 * 1024 * 1024,
+    "domain_overrides": {},  # {domain_id: {"max_concurrent": int, "bandwidth": int, "bandwidth_burst": int}}
+}
+
+_ACTIVE_TRANSFERS = get_metric(
+    Gauge, "file_manager_transfer_active", "Number of transfers in progress", ("direction",)
+)
+_QUEUE_DEPTH = get_metric(Gauge, "file_manager_transfer_queue_depth", "Number of transfers waiting for admission")
+_REJECTED_TRANSFERS = get_metric(
+    Counter, "file_manager_transfer_rejected_total", "Number of transfers rejected by admission control", ("reason",)
+)
+_THROTTLED_SECONDS = get_metric(
+    Counter, "file_manager_transfer_throttled_seconds_total", "Time spent waiting for tenant bandwidth", ("direction",)
+)
+
+_admission_controller = None
+_admission_controller_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    바이트 단위 token bucket (rate: 초당 바이트, burst: 최대 누적 바이트)
+    """
+
+    def __init__(self, rate: int, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, size: int) -> float:
+        """
+        size 바이트만큼 토큰이 쌓일 때까지 대기
+        Returns: 대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            # 토큰을 먼저 차감(음수 허용)하여 같은 bucket 의 다른 전송과 순서대로 대기
+            self._tokens -= size
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+        return wait_time
+
+
+class TransferTicket:
+    """
+    승인된 전송 1건 (release 전까지 동시 전송 슬롯을 점유)
+    """
+
+    def __init__(self, controller: "TransferAdmissionController", domain_id: str, direction: str, bucket):
+        self.controller = controller
+        self.domain_id = domain_id
+        self.direction = direction
+        self.bucket: Optional[TokenBucket] = bucket
+        self._released = False
+        self._release_lock = threading.Lock()
+
+    def throttle_chunks(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.consume(len(chunk))
+            yield chunk
+
+    def throttle_reader(self, file_obj):
+        """
+        업로드 스트림 래핑 (bandwidth 제한이 없으면 그대로 반환)
+        """
+        if self.bucket is None:
+            return file_obj
+        return _ThrottledReader(getattr(file_obj, "file", file_obj), self)
+
+    def release(self) -> None:
+        # 전송 스레드와 응답 종료 처리에서 동시에 호출될 수 있으므로 한 번만 반환
+        with self._release_lock:
+            if self._released:
+                return
+            self._released = True
+
+        self.controller.release(self)
+
+    def consume(self, size: int) -> None:
+        if self.bucket is not None and size > 0:
+            wait_time = self.bucket.consume(size)
+            if wait_time:
+                _THROTTLED_SECONDS.inc(wait_time, direction=self.direction)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+        return False
+
+
+class _ThrottledReader(io.RawIOBase):
+    """
+    업로드 스트림을 읽을 때 tenant bandwidth 만큼 속도를 제한
+    """
+
+    def __init__(self, file_stream, ticket: TransferTicket):
+        super().__init__()
+        self._file_stream = file_stream
+        self._ticket = ticket
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._file_stream.seekable() if hasattr(self._file_stream, "seekable") else False
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file_stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file_stream.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file_stream.read(size)
+        self._ticket.consume(len(chunk))
+        return chunk
+
+    def readinto(self, b) -> int:
+        chunk = self.read(len(b))
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+class TransferAdmissionController:
+    """
+    pod/domain 단위 동시 전송 수 제한 + domain 별 bandwidth 제한
+    슬롯이 없으면 대기열에서 queue_timeout 동안 기다리고, 대기열이 가득 차거나 시간이 지나면 거부한다.
+    """
+
+    def __init__(self, admission_conf: dict):
+        self.conf = {**DEFAULT_TRANSFER_ADMISSION, **admission_conf}
+        self.active = 0
+        self.active_by_domain: Dict[str, int] = {}
+        self.waiting = 0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._condition = threading.Condition()
+
+    def admit(self, domain_id: str, direction: str) -> TransferTicket:
+        domain_id = domain_id or "unknown"
+        deadline = time.monotonic() + self.conf["queue_timeout"]
+
+        with self._condition:
+            if not self._has_slot(domain_id):
+                if self.waiting >= self.conf["max_queue_size"]:
+                    self._reject("queue_full", domain_id)
+
+                self.waiting += 1
+                _QUEUE_DEPTH.set(self.waiting)
+                try:
+                    while not self._has_slot(domain_id):
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._reject("queue_timeout", domain_id)
+                        self._condition.wait(remaining)
+                finally:
+                    self.waiting -= 1
+                    _QUEUE_DEPTH.set(self.waiting)
+
+            self.active += 1
+            self.active_by_domain[domain_id] = self.active_by_domain.get(domain_id, 0) + 1
+
+        _ACTIVE_TRANSFERS.inc(direction=direction)
+        return TransferTicket(self, domain_id, direction, self._get_bucket(domain_id))
+
+    def release(self, ticket: TransferTicket) -> None:
+        with self._condition:
+            self.active -= 1
+            count = self.active_by_domain.get(ticket.domain_id, 1) - 1
+            if count > 0:
+                self.active_by_domain[ticket.domain_id] = count
+            else:
+                self.active_by_domain.pop(ticket.domain_id, None)
+            self._condition.notify_all()
+
+        _ACTIVE_TRANSFERS.dec(direction=ticket.direction)
+
+    def _has_slot(self, domain_id: str) -> bool:
+        max_concurrent = self.conf["max_concurrent_transfers"]
+        if max_concurrent and self.active >= max_concurrent:
+            return False
+
+        max_per_domain = self._get_domain_conf(domain_id, "max_concurrent", "max_concurrent_per_domain")
+        if max_per_domain and self.active_by_domain.get(domain_id, 0) >= max_per_domain:
+            return False
+
+        return True
+
+    def _reject(self, reason: str, domain_id: str) -> None:
+        _REJECTED_TRANSFERS.inc(reason=reason)
+        _LOGGER.warning(f"[TransferAdmissionController] Rejected transfer: {reason} (domain_id: {domain_id})")
+        raise ERROR_TRANSFER_REJECTED(reason=reason, retry_after=self.conf["retry_after"])
+
+    def _get_bucket(self, domain_id: str) -> Optional[TokenBucket]:
+        rate = self._get_domain_conf(domain_id, "bandwidth", "domain_bandwidth")
+        if not rate:
+            return None
+
+        with self._condition:
+            bucket = self._buckets.get(domain_id)
+            if bucket is None:
+                burst = self._get_domain_conf(domain_id, "bandwidth_burst", "domain_bandwidth_burst")
+                bucket = TokenBucket(rate, burst)
+                self._buckets[domain_id] = bucket
+            return bucket
+
+    def _get_domain_conf(self, domain_id: str, override_key: str, default_key: str):
+        override = self.conf["domain_overrides"].get(domain_id, {})
+        return override.get(override_key, self.conf[default_key])
+
+
+def get_admission_controller() -> TransferAdmissionController:
+    global _admission_controller
+
+    if _admission_controller is None:
+        with _admission_controller_lock:
+            if _admission_controller is None:
+                _admission_controller = TransferAdmissionController(config.get_global("TRANSFER_ADMISSION", {}))
+
+    return _admission_controller
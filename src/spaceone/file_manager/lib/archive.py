@@ -0,0 +1,137 @@
+import io
+import tarfile
+import time
+import zipfile
+from collections import deque
+from typing import Iterable, Iterator, Tuple
+
+__all__ = ["ARCHIVE_FORMATS", "iter_archive", "iter_zip", "iter_tar", "dedupe_archive_names"]
+
+# format: (media_type, extension)
+ARCHIVE_FORMATS = {
+    "zip": ("application/zip", "zip"),
+    "tar": ("application/x-tar", "tar"),
+}
+
+# entry: (name, size, chunks)
+ArchiveEntry = Tuple[str, int, Iterable[bytes]]
+
+
+class _StreamSink(io.RawIOBase):
+    """
+    쓰기 전용 비-seekable 버퍼
+    zipfile이 기록한 바이트를 모아두었다가 drain()으로 바로 내보낸다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = deque()
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def write(self, b) -> int:
+        if b:
+            self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> Iterator[bytes]:
+        while self._chunks:
+            yield self._chunks.popleft()
+
+
+def iter_zip(entries: Iterable[ArchiveEntry]) -> Iterator[bytes]:
+    """
+    ZIP 아카이브 스트리밍 생성 (무압축 store 모드, ZIP64)
+    출력이 seek 불가능하므로 각 파일 뒤에 data descriptor를 기록하며,
+    메모리에는 현재 청크와 central directory 정보만 유지된다.
+    """
+    sink = _StreamSink()
+
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+        for name, size, chunks in entries:
+            zinfo = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            zinfo.compress_type = zipfile.ZIP_STORED
+            if size is not None and size >= 0:
+                zinfo.file_size = size
+
+            with zf.open(zinfo, mode="w", force_zip64=True) as dest:
+                for chunk in chunks:
+                    dest.write(chunk)
+                    yield from sink.drain()
+
+            yield from sink.drain()
+
+    yield from sink.drain()
+
+
+def iter_tar(entries: Iterable[ArchiveEntry]) -> Iterator[bytes]:
+    """
+    TAR 아카이브 스트리밍 생성 (PAX 포맷)
+    헤더에 파일 크기가 필요하므로 size를 모르는 항목은 지원하지 않는다.
+    """
+    offset = 0
+    for name, size, chunks in entries:
+        if size is None or size < 0:
+            raise ValueError(f"Cannot determine file size for tar entry: {name}")
+
+        tarinfo = tarfile.TarInfo(name)
+        tarinfo.size = size
+        tarinfo.mtime = int(time.time())
+        tarinfo.mode = 0o644
+        header = tarinfo.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+        offset += len(header)
+        yield header
+
+        written = 0
+        for chunk in chunks:
+            written += len(chunk)
+            yield chunk
+
+        if written != size:
+            raise ValueError(f"Size mismatch for tar entry {name}: {written} != {size}")
+
+        offset += size
+        remainder = size % tarfile.BLOCKSIZE
+        if remainder:
+            offset += tarfile.BLOCKSIZE - remainder
+            yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
+
+    # 아카이브 종료: 0으로 채운 블록 2개 + RECORDSIZE 단위 패딩
+    offset += tarfile.BLOCKSIZE * 2
+    padding = (tarfile.RECORDSIZE - offset % tarfile.RECORDSIZE) % tarfile.RECORDSIZE
+    yield tarfile.NUL * (tarfile.BLOCKSIZE * 2 + padding)
+
+
+def iter_archive(archive_format: str, entries: Iterable[ArchiveEntry]) -> Iterator[bytes]:
+    if archive_format == "zip":
+        return iter_zip(entries)
+    elif archive_format == "tar":
+        return iter_tar(entries)
+    else:
+        raise ValueError(f"Not supported archive format: {archive_format}")
+
+
+def dedupe_archive_names(names: Iterable[str]) -> Iterator[str]:
+    """
+    아카이브 내 중복 파일명 처리: a.txt, a (1).txt, a (2).txt ...
+    """
+    used = set()
+    for name in names:
+        parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".", "..")]
+        name = "/".join(parts) or "unknown"
+        candidate = name
+        index = 1
+        while candidate in used:
+            stem, dot, ext = name.rpartition(".")
+            if dot and stem:
+                candidate = f"{stem} ({index}).{ext}"
+            else:
+                candidate = f"{name} ({index})"
+            index += 1
+
+        used.add(candidate)
+        yield candidate
@@ -0,0 +1,136 @@
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow 가 없으면 derivative 기능만 비활성화
+    Image = None
+    ImageOps = None
+
+__all__ = [
+    "TransformSpec",
+    "FORMAT_CONTENT_TYPES",
+    "is_image_supported",
+    "is_image_file",
+    "get_default_format",
+    "make_derivative_id",
+    "render_derivative",
+    "get_process_pool",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+FORMAT_CONTENT_TYPES = {
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+}
+
+_FORMAT_ALIASES = {"jpg": "jpeg"}
+
+_EXTENSION_FORMATS = {
+    ".jpg": "jpeg",
+    ".jpeg": "jpeg",
+    ".png": "png",
+    ".webp": "webp",
+    ".gif": "png",
+    ".bmp": "png",
+    ".tif": "png",
+    ".tiff": "png",
+}
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+class TransformSpec(NamedTuple):
+    """
+    derivative 변환 스펙 (0: 해당 축 제한 없음, 비율은 항상 유지)
+    """
+
+    width: int
+    height: int
+    fmt: str
+
+    @property
+    def key(self) -> str:
+        return f"w{self.width}_h{self.height}.{self.fmt}"
+
+    @property
+    def content_type(self) -> str:
+        return FORMAT_CONTENT_TYPES[self.fmt]
+
+    @classmethod
+    def normalize_format(cls, fmt: str) -> Optional[str]:
+        fmt = fmt.lower()
+        fmt = _FORMAT_ALIASES.get(fmt, fmt)
+        return fmt if fmt in FORMAT_CONTENT_TYPES else None
+
+
+def is_image_supported() -> bool:
+    return Image is not None
+
+
+def is_image_file(name: str) -> bool:
+    return os.path.splitext(name or "")[1].lower() in _EXTENSION_FORMATS
+
+
+def get_default_format(name: str) -> str:
+    return _EXTENSION_FORMATS.get(os.path.splitext(name or "")[1].lower(), "jpeg")
+
+
+def make_derivative_id(file_id: str, key: str) -> str:
+    """
+    derivative 객체 id (원본 객체와 같은 resource_group 경로에 저장)
+    """
+    return f"{file_id}@{key}"
+
+
+def render_derivative(data: bytes, width: int, height: int, fmt: str, quality: int = 85) -> bytes:
+    """
+    이미지 리사이즈 및 재압축 (프로세스 풀에서 실행)
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        max_size = (width or image.width, height or image.height)
+
+        # JPEG 는 디코딩 단계에서 축소하여 CPU/메모리 사용량 감소
+        image.draft("RGB", max_size)
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(max_size)
+
+        if fmt == "jpeg" and image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA")
+
+        output = io.BytesIO()
+        save_options = {"optimize": True}
+        if fmt in ("jpeg", "webp"):
+            save_options["quality"] = quality
+
+        image.save(output, format=fmt.upper(), **save_options)
+        return output.getvalue()
+
+
+def get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    이미지 디코딩용 프로세스 풀 (REST 워커 스레드/GIL 을 점유하지 않도록 별도 프로세스에서 실행)
+    스레드가 있는 서버 프로세스에서 fork 하지 않도록 spawn 컨텍스트를 사용한다.
+    """
+    global _process_pool
+
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _LOGGER.debug(f"[get_process_pool] Create image process pool (max_workers: {max_workers})")
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+
+    return _process_pool
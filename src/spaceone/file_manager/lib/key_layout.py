@@ -0,0 +1,99 @@
+import hashlib
+import threading
+from typing import Optional, Tuple
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+
+__all__ = ["KeyLayout", "LEGACY_KEY_LAYOUT", "get_key_layout"]
+
+LEGACY_KEY_LAYOUT = 1
+
+# 버전별 object key 형식 (파일마다 저장 시 사용한 버전을 기록하므로 기존 버전의 형식은 변경하면 안 됨)
+# {group}: resource_group 별 경로, {shard}/{shard4}: file_id hash 앞 2/4자리, {domain_id}: 파일의 domain
+KEY_LAYOUTS = {
+    1: "/files/{group}/{file_id}",
+    2: "files/{shard}/{domain_id}/{group}/{file_id}",
+}
+
+DEFAULT_KEY_LAYOUT = {
+    "version": LEGACY_KEY_LAYOUT,  # 새 파일에 사용할 layout 버전
+    "layouts": {},  # 추가 layout {버전: 형식} (기본 버전은 재정의할 수 없음)
+    "rekey": {
+        "enabled": False,  # 이전 layout 파일을 version 의 layout 으로 옮기는 작업 실행 여부
+        "batch_size": 100,  # 작업 1회에 옮기는 최대 파일 수
+        "delete_grace_period": 3600,  # 옮긴 후 이전 객체 삭제까지 유예 시간 (초)
+    },
+}
+
+_GROUP_PATHS = {
+    "SYSTEM": "public",
+    "DOMAIN": "domain",
+    "WORKSPACE": "workspace",
+    "PROJECT": "project",
+    "USER": "user",
+    "PACK": "pack",  # PackConnector 의 pack 객체
+}
+
+_key_layout = None
+_key_layout_lock = threading.Lock()
+
+
+class KeyLayout:
+    """
+    backend object key 생성 규칙
+    - 1 (legacy): resource_group 별 고정 경로 (/files/project/{file_id})
+    - 2: file_id hash 와 domain 을 앞에 두어 요청이 여러 prefix(partition)로 분산되고 domain 단위로 조회/정리 가능
+    """
+
+    def __init__(self, key_layout_conf: dict):
+        self.conf = {**DEFAULT_KEY_LAYOUT, **key_layout_conf}
+        self.conf["rekey"] = {**DEFAULT_KEY_LAYOUT["rekey"], **self.conf["rekey"]}
+
+        self.layouts = {int(version): layout for version, layout in self.conf["layouts"].items()}
+        self.layouts.update(KEY_LAYOUTS)
+
+        self.version = int(self.conf["version"])
+        if self.version not in self.layouts:
+            raise ERROR_CONFIGURATION(key="KEY_LAYOUT.version")
+
+    def make_object_name(
+        self, resource_group: str, file_id: str, key_layout: Optional[int] = None, domain_id: Optional[str] = None
+    ) -> str:
+        """
+        key_layout: 파일에 기록된 layout 버전 (기록되지 않은 기존 파일은 legacy)
+        """
+        layout = self.layouts.get(key_layout or LEGACY_KEY_LAYOUT)
+        if layout is None:
+            raise ERROR_CONFIGURATION(key=f"KEY_LAYOUT.layouts.{key_layout}")
+
+        digest = hashlib.md5(file_id.encode()).hexdigest()
+
+        return layout.format(
+            group=_GROUP_PATHS.get(resource_group, "unknown"),
+            file_id=file_id,
+            domain_id=domain_id if domain_id and domain_id != "*" else "global",
+            shard=digest[:2],
+            shard4=digest[:4],
+        )
+
+    def get_key_scope(self, key_layout: Optional[int], domain_id: Optional[str]) -> Tuple[int, Optional[str]]:
+        """
+        같은 connector 로 server-side 복사할 수 있는지 비교하는 기준 (layout 이 domain 을 사용하지 않으면 domain 무시)
+        """
+        key_layout = key_layout or LEGACY_KEY_LAYOUT
+        if "{domain_id}" not in self.layouts.get(key_layout, ""):
+            domain_id = None
+
+        return key_layout, domain_id
+
+
+def get_key_layout() -> KeyLayout:
+    global _key_layout
+
+    if _key_layout is None:
+        with _key_layout_lock:
+            if _key_layout is None:
+                _key_layout = KeyLayout(config.get_global("KEY_LAYOUT", {}))
+
+    return _key_layout
@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from spaceone.core import config
+from spaceone.file_manager.error.custom import ERROR_MEMORY_BUDGET_EXCEEDED
+
+__all__ = ["MemoryBudget", "get_memory_budget", "get_transfer_max_bytes"]
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_BUDGET = {
+    "global_max_bytes": 1024 * 1024 * 1024,  # 1GB
+    "transfer_max_bytes": 128 * 1024 * 1024,  # 128MB
+    "acquire_timeout": 30,
+}
+
+_memory_budget = None
+_memory_budget_lock = threading.Lock()
+
+
+class MemoryBudget:
+    """
+    전송 버퍼용 바이트 예산 (프로세스 전역)
+    예산이 부족하면 다른 전송이 버퍼를 반환할 때까지 대기(backpressure)하고, 대기 시간이 지나면 실패한다.
+    예산보다 큰 단일 예약은 예산 전체로 제한되어 단독으로는 항상 진행할 수 있다.
+    """
+
+    def __init__(self, max_bytes: int, acquire_timeout: float = 30):
+        self.max_bytes = max_bytes
+        self.acquire_timeout = acquire_timeout
+        self.in_use = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int, timeout: Optional[float] = None) -> int:
+        """
+        Returns: 실제 예약된 바이트 수 (release 에 그대로 전달)
+        """
+        size = min(max(size, 0), self.max_bytes)
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            self.waiting += 1
+            try:
+                while self.in_use + size > self.max_bytes:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        _LOGGER.warning(
+                            f"[MemoryBudget] Timed out waiting for {size} bytes (in_use: {self.in_use}, max: {self.max_bytes})"
+                        )
+                        raise ERROR_MEMORY_BUDGET_EXCEEDED(size=size, max_size=self.max_bytes)
+                    self._condition.wait(remaining)
+
+                self.in_use += size
+                return size
+            finally:
+                self.waiting -= 1
+
+    def release(self, size: int) -> None:
+        with self._condition:
+            self.in_use = max(0, self.in_use - size)
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, size: int, timeout: Optional[float] = None):
+        reserved = self.acquire(size, timeout)
+        try:
+            yield reserved
+        finally:
+            self.release(reserved)
+
+
+def get_memory_budget() -> MemoryBudget:
+    global _memory_budget
+
+    if _memory_budget is None:
+        with _memory_budget_lock:
+            if _memory_budget is None:
+                budget_conf = {**DEFAULT_MEMORY_BUDGET, **config.get_global("MEMORY_BUDGET", {})}
+                _memory_budget = MemoryBudget(budget_conf["global_max_bytes"], budget_conf["acquire_timeout"])
+
+    return _memory_budget
+
+
+def get_transfer_max_bytes() -> int:
+    """
+    전송 1건이 사용할 수 있는 최대 버퍼 크기 (connector 파트 크기/동시성 산정 기준)
+    """
+    budget_conf = {**DEFAULT_MEMORY_BUDGET, **config.get_global("MEMORY_BUDGET", {})}
+    return budget_conf["transfer_max_bytes"]
@@ -0,0 +1,98 @@
+import threading
+from typing import Dict, Tuple
+
+__all__ = ["Counter", "Gauge", "get_metric", "render_metrics"]
+
+_METRICS: Dict[str, "_Metric"] = {}
+_METRICS_LOCK = threading.Lock()
+
+
+class _Metric:
+    metric_type = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(label_name, "")) for label_name in self.label_names)
+
+    def _add(self, amount: float, labels: dict) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.metric_type}"]
+
+        with self._lock:
+            items = sorted(self._values.items())
+
+        for key, value in items:
+            if self.label_names:
+                label_text = ",".join(
+                    f'{label_name}="{_escape(label_value)}"' for label_name, label_value in zip(self.label_names, key)
+                )
+                lines.append(f"{self.name}{{{label_text}}} {_format_value(value)}")
+            else:
+                lines.append(f"{self.name} {_format_value(value)}")
+
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        self._add(amount, labels)
+
+
+class Gauge(_Metric):
+    metric_type = "gauge"
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        self._add(amount, labels)
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self._add(-amount, labels)
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+def get_metric(metric_class, name: str, description: str, label_names: Tuple[str, ...] = ()):
+    """
+    이름으로 metric 조회 (없으면 생성), 모듈별로 같은 metric 을 중복 생성하지 않도록 registry 에 보관
+    """
+    with _METRICS_LOCK:
+        metric = _METRICS.get(name)
+        if metric is None:
+            metric = metric_class(name, description, label_names)
+            _METRICS[name] = metric
+        return metric
+
+
+def render_metrics() -> str:
+    """
+    Prometheus text exposition format
+    """
+    with _METRICS_LOCK:
+        metrics = list(_METRICS.values())
+
+    return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
@@ -0,0 +1,77 @@
+import logging
+import threading
+from typing import Mapping, Optional
+from urllib.parse import urlsplit
+
+from spaceone.core import config
+from spaceone.file_manager.lib.metrics import Counter, get_metric
+
+__all__ = ["DownloadOffload", "get_download_offload"]
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_OFFLOAD = {
+    "enabled": False,
+    "location": "/_offload",  # nginx internal location prefix (deploy/helm/config/proxy.conf)
+    "request_header": "X-File-Offload",  # nginx 를 거친 요청에만 설정되는 헤더 (직접 호출은 Python 에서 스트리밍)
+    "expires_in": 60,  # backend presigned URL 유효 시간 (초, nginx 가 즉시 사용)
+}
+
+_OFFLOADED = get_metric(
+    Counter, "file_manager_download_offloaded_total", "Number of downloads redirected to nginx", ("backend",)
+)
+
+_download_offload = None
+_download_offload_lock = threading.Lock()
+
+
+class DownloadOffload:
+    """
+    nginx X-Accel-Redirect 다운로드
+    다운로드 요청은 권한 확인 후 backend 위치만 내부 redirect 로 응답하고, 본문은 nginx 가 backend 에서 직접 전송한다.
+    - presigned URL: {location}/remote/{scheme}/{host}/{path}?{query} -> nginx 가 backend 로 proxy
+    - 로컬 파일시스템: {location}/local/{object path} -> nginx 가 root_path 에서 직접 전송
+    Range 등 클라이언트 요청 헤더는 nginx 가 backend 로 그대로 전달한다.
+    """
+
+    def __init__(self, download_offload_conf: dict):
+        self.conf = {**DEFAULT_DOWNLOAD_OFFLOAD, **download_offload_conf}
+        self.location = self.conf["location"].rstrip("/")
+
+    @property
+    def expires_in(self) -> int:
+        return int(self.conf["expires_in"])
+
+    def is_available(self, headers: Mapping[str, str]) -> bool:
+        """
+        nginx 를 거친 요청이고 offload 가 활성화되어 있는지 확인
+        """
+        return bool(self.conf["enabled"]) and bool(headers.get(self.conf["request_header"]))
+
+    def make_redirect(self, backend: str, download_location: str) -> str:
+        """
+        download_location: connector 의 get_download_location 결과 (URL 또는 로컬 상대 경로)
+        Returns: X-Accel-Redirect 헤더 값
+        """
+        _OFFLOADED.inc(backend=backend)
+
+        if "://" not in download_location:
+            return f"{self.location}/local/{download_location.lstrip('/')}"
+
+        url = urlsplit(download_location)
+        redirect = f"{self.location}/remote/{url.scheme}/{url.netloc}{url.path}"
+        if url.query:
+            redirect += f"?{url.query}"
+
+        return redirect
+
+
+def get_download_offload() -> DownloadOffload:
+    global _download_offload
+
+    if _download_offload is None:
+        with _download_offload_lock:
+            if _download_offload is None:
+                _download_offload = DownloadOffload(config.get_global("DOWNLOAD_OFFLOAD", {}))
+
+    return _download_offload
@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from spaceone.core import config
+from spaceone.file_manager.error.custom import ERROR_STORAGE_QUOTA_EXCEEDED
+from spaceone.file_manager.lib.metrics import Counter, get_metric
+from spaceone.file_manager.model.usage.database import Usage
+
+__all__ = ["StorageQuota", "get_storage_quota"]
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STORAGE_QUOTA = {
+    "quotas": {},  # scope_type 별 최대 사용량 {"DOMAIN": bytes, "WORKSPACE": bytes, "USER": bytes} (없거나 0: 제한 없음)
+    "overrides": {},  # scope_id 별 최대 사용량 {"workspace-xxx": bytes}
+    "cache_ttl": 30,  # 사용량 counter 캐시 유지 시간 (초)
+}
+
+_QUOTA_EXCEEDED = get_metric(
+    Counter, "file_manager_storage_quota_exceeded_total", "Number of uploads rejected by storage quota", ("scope_type",)
+)
+
+_storage_quota = None
+_storage_quota_lock = threading.Lock()
+
+
+class StorageQuota:
+    """
+    domain/workspace/user 등 범위별 저장 용량 제한
+    사용량은 Usage counter 를 cache_ttl 동안 캐시하고, 이 프로세스에서 반영한 증감을 더해 판단한다.
+    업로드는 모두 크기를 먼저 선언하고 (REST 업로드 파일, 업로드 세션) 파일 정보를 만들 때 사용량에 반영되므로
+    동시에 진행 중인 업로드도 다음 검사에 포함된다.
+    (다른 pod 의 변경은 캐시가 만료된 뒤 반영되므로 한도를 약간 넘을 수 있음)
+    """
+
+    def __init__(self, quota_conf: dict):
+        self.conf = {**DEFAULT_STORAGE_QUOTA, **quota_conf}
+        # {(domain_id, scope_type, scope_id): (total_size, loaded_at)}
+        self._cache: Dict[Tuple[str, str, str], Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_quota(self, usage_key: dict) -> int:
+        quota = self.conf["overrides"].get(usage_key["scope_id"])
+        if quota is None:
+            quota = self.conf["quotas"].get(usage_key["scope_type"])
+        return int(quota or 0)
+
+    def get_limited_keys(self, usage_keys: List[dict]) -> List[dict]:
+        return [usage_key for usage_key in usage_keys if self.get_quota(usage_key)]
+
+    def check(self, usage_keys: List[dict], size: int) -> None:
+        """
+        size 바이트를 추가로 저장할 수 있는지 확인 (업로드 시작 전, 선언된 크기 기준)
+        """
+        for usage_key in self.get_limited_keys(usage_keys):
+            self.check_usage(usage_key, size)
+
+    def add_usage(self, usage_keys: List[dict], size: int) -> None:
+        """
+        Usage counter 변경을 캐시에도 반영 (캐시가 만료되기 전의 다음 검사에 포함)
+        """
+        with self._lock:
+            for usage_key in usage_keys:
+                key = self._get_key(usage_key)
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache[key] = (cached[0] + size, cached[1])
+
+    def get_usage(self, usage_key: dict) -> int:
+        key = self._get_key(usage_key)
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and now - cached[1] < self.conf["cache_ttl"]:
+                return cached[0]
+
+        usage_vo = Usage.objects(domain_id=key[0], scope_type=key[1], scope_id=key[2]).only("total_size").first()
+        total_size = usage_vo.total_size if usage_vo else 0
+
+        with self._lock:
+            self._cache[key] = (total_size, now)
+            return total_size
+
+    def check_usage(self, usage_key: dict, size: int) -> None:
+        quota = self.get_quota(usage_key)
+        usage = self.get_usage(usage_key)
+
+        if usage + size > quota:
+            _QUOTA_EXCEEDED.inc(scope_type=usage_key["scope_type"])
+            raise ERROR_STORAGE_QUOTA_EXCEEDED(
+                scope_type=usage_key["scope_type"], scope_id=usage_key["scope_id"], usage=usage, quota=quota
+            )
+
+    @staticmethod
+    def _get_key(usage_key: dict) -> Tuple[str, str, str]:
+        return usage_key["domain_id"], usage_key["scope_type"], usage_key["scope_id"]
+
+
+def get_storage_quota() -> StorageQuota:
+    global _storage_quota
+
+    if _storage_quota is None:
+        with _storage_quota_lock:
+            if _storage_quota is None:
+                _storage_quota = StorageQuota(config.get_global("STORAGE_QUOTA", {}))
+
+    return _storage_quota
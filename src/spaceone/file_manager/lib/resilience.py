@@ -0,0 +1,588 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE
+from spaceone.file_manager.error.custom import ERROR_BACKEND_THROTTLED, ERROR_BACKEND_UNAVAILABLE
+from spaceone.file_manager.lib.metrics import Counter, Gauge, get_metric
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "BackendResilience",
+    "ResilientConnector",
+    "get_backend_resilience",
+    "wrap_connector",
+]
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BACKEND_RESILIENCE = {
+    "enabled": True,
+    "retry": {
+        "max_attempts": 3,  # 멱등 요청의 최대 시도 횟수 (첫 시도 포함)
+        "base_delay": 0.1,  # 재시도 대기 시간 = random(0, min(max_delay, base_delay * 2^n)) (초)
+        "max_delay": 2.0,
+    },
+    "hedge": {
+        "enabled": True,
+        "percentile": 0.95,  # 최근 응답 시간의 이 백분위수가 지나도 응답이 없으면 같은 요청을 한 번 더 보냄
+        "min_delay": 0.05,  # hedge 대기 시간 하한/상한 (초)
+        "max_delay": 2.0,
+        "min_samples": 20,  # 응답 시간 표본이 이보다 적으면 hedge 하지 않음
+        "window": 200,  # 백분위수 계산에 사용하는 최근 응답 수
+        "max_in_flight": 32,  # pod 전체 동시 hedge 요청 수 (초과 시 hedge 없이 호출)
+    },
+    "circuit_breaker": {
+        "failure_threshold": 5,  # 연속 실패 횟수가 이 값에 도달하면 open (0: 사용 안 함)
+        "reset_timeout": 30,  # open 후 시험 요청을 허용하기까지 시간 (초)
+    },
+    "concurrency": {
+        "enabled": True,
+        "initial_limit": 32,  # backend 별 동시 요청 수 제한 (pod 기준, 처리 결과에 따라 AIMD 로 조정)
+        "min_limit": 1,
+        "max_limit": 256,
+        "increase": 1.0,  # 제한만큼 요청이 성공할 때마다 제한을 이만큼 증가
+        "decrease_factor": 0.5,  # throttle 응답을 받으면 제한에 이 값을 곱함
+        "acquire_timeout": 60,  # 제한에 걸린 요청의 최대 대기 시간 (초)
+    },
+    "backends": {},  # backend 별 설정 {"AWSS3Connector": {"hedge": {"enabled": False}}}
+}
+
+# connector 메서드별 정책 (idempotent: 재시도 가능, hedge: 지연 시 중복 요청)
+# 스트림을 소비하는 업로드와 multipart 생성/완료는 재시도하지 않는다.
+OPERATION_POLICIES = {
+    "check_file": {"idempotent": True, "hedge": True},
+    "download_file": {"idempotent": True, "hedge": True},
+    "delete_file": {"idempotent": True, "hedge": False},
+    "upload_file": {"idempotent": True, "hedge": False},
+    "copy_file": {"idempotent": True, "hedge": False},
+    "upload_part": {"idempotent": True, "hedge": False},
+    "abort_multipart_upload": {"idempotent": True, "hedge": False},
+    "stream_upload_file": {"idempotent": False, "hedge": False},
+    "create_multipart_upload": {"idempotent": False, "hedge": False},
+    "complete_multipart_upload": {"idempotent": False, "hedge": False},
+}
+
+# 재시도해도 결과가 같은 요청 오류 (408 Request Timeout, 429 Too Many Requests 는 재시도)
+_RETRYABLE_CLIENT_STATUS = (408, 429)
+
+# backend 가 요청 속도를 제한할 때의 응답 (S3: 503 SlowDown, GCS: 429, 그 외 503 은 과부하로 간주)
+_THROTTLE_STATUS = (429,)
+_OVERLOAD_STATUS = (429, 503)
+_THROTTLE_ERROR_CODES = {
+    "SlowDown",
+    "Throttling",
+    "ThrottlingException",
+    "RequestThrottled",
+    "RequestLimitExceeded",
+    "TooManyRequests",
+    "TooManyRequestsException",
+    "rateLimitExceeded",
+}
+
+_RETRIES = get_metric(
+    Counter, "file_manager_backend_retries_total", "Number of retried backend calls", ("backend", "operation")
+)
+_HEDGES = get_metric(
+    Counter,
+    "file_manager_backend_hedged_requests_total",
+    "Number of hedged backend calls",
+    ("backend", "operation", "winner"),
+)
+_CIRCUIT_OPEN = get_metric(
+    Gauge, "file_manager_backend_circuit_open", "Whether the backend circuit breaker is open", ("backend",)
+)
+_SHORT_CIRCUITED = get_metric(
+    Counter, "file_manager_backend_short_circuited_total", "Number of backend calls rejected by open circuit", ("backend",)
+)
+_THROTTLED = get_metric(
+    Counter,
+    "file_manager_backend_throttled_total",
+    "Number of backend calls rejected by backend throttling",
+    ("backend", "operation"),
+)
+_CONCURRENCY_LIMIT = get_metric(
+    Gauge, "file_manager_backend_concurrency_limit", "Current adaptive concurrency limit of backend calls", ("backend",)
+)
+_CONCURRENCY_IN_FLIGHT = get_metric(
+    Gauge, "file_manager_backend_in_flight", "Number of backend calls in flight", ("backend",)
+)
+
+_backend_resiliences: Dict[str, "BackendResilience"] = {}
+_backend_resiliences_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+class LatencyWindow:
+    """
+    최근 응답 시간 표본 (백분위수 계산용)
+    """
+
+    def __init__(self, size: int):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+
+    def percentile(self, percentile: float, min_samples: int) -> Optional[float]:
+        with self._lock:
+            if len(self._samples) < max(min_samples, 1):
+                return None
+            samples = sorted(self._samples)
+
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))]
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 에 도달하면 reset_timeout 동안 요청을 즉시 거부 (open)
+    이후 시험 요청 1건을 허용하여 성공하면 닫고, 실패하면 다시 연다. (half-open)
+    """
+
+    def __init__(self, backend: str, failure_threshold: int, reset_timeout: float):
+        self.backend = backend
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        if not self.failure_threshold:
+            return
+
+        with self._lock:
+            if self.opened_at is None:
+                return
+
+            if time.monotonic() - self.opened_at >= self.reset_timeout and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+        _SHORT_CIRCUITED.inc(backend=self.backend)
+        raise ERROR_BACKEND_UNAVAILABLE(backend=self.backend)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._trial_in_flight = False
+            if self.opened_at is not None:
+                self.opened_at = None
+                _CIRCUIT_OPEN.set(0, backend=self.backend)
+                _LOGGER.info(f"[CircuitBreaker] Circuit closed: {self.backend}")
+
+    def record_failure(self) -> None:
+        if not self.failure_threshold:
+            return
+
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    _CIRCUIT_OPEN.set(1, backend=self.backend)
+                    _LOGGER.warning(f"[CircuitBreaker] Circuit opened: {self.backend} ({self.failures} failures)")
+                self.opened_at = time.monotonic()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    backend 별 동시 요청 수 제한 (AIMD: additive-increase / multiplicative-decrease)
+    - 제한만큼의 요청이 성공할 때마다 제한을 increase 만큼 늘림 (요청 1건당 increase / limit)
+    - throttle 응답(503 SlowDown, 429 등)을 받으면 제한에 decrease_factor 를 곱함
+      (마지막 감소 이전에 시작된 요청의 throttle 응답은 이미 반영된 것으로 보고 무시)
+    대량 업로드/삭제 시 backend 가 허용하는 최대 속도 근처에서 throttle 오류 없이 요청을 보낸다.
+    """
+
+    def __init__(self, backend: str, concurrency_conf: dict):
+        self.backend = backend
+        self.min_limit = max(1, concurrency_conf["min_limit"])
+        self.max_limit = max(self.min_limit, concurrency_conf["max_limit"])
+        self.increase = concurrency_conf["increase"]
+        self.decrease_factor = concurrency_conf["decrease_factor"]
+        self.acquire_timeout = concurrency_conf["acquire_timeout"]
+        self.limit = float(min(max(concurrency_conf["initial_limit"], self.min_limit), self.max_limit))
+        self.in_flight = 0
+        self._decreased_at: Optional[float] = None
+        self._condition = threading.Condition()
+
+        _CONCURRENCY_LIMIT.set(int(self.limit), backend=backend)
+
+    def acquire(self, blocking: bool = True) -> Optional[float]:
+        """
+        blocking=False 이면 제한에 걸렸을 때 기다리지 않고 None 반환 (hedge 요청용)
+        Returns: 요청 시작 시각 (release 에 전달), 대기 시간이 지나면 None
+        """
+        with self._condition:
+            if blocking:
+                acquired = self._condition.wait_for(lambda: self.in_flight < int(self.limit), self.acquire_timeout)
+            else:
+                acquired = self.in_flight < int(self.limit)
+
+            if not acquired:
+                return None
+
+            self.in_flight += 1
+            _CONCURRENCY_IN_FLIGHT.set(self.in_flight, backend=self.backend)
+            return time.monotonic()
+
+    def release(self, started_at: float, throttled: bool = False) -> None:
+        with self._condition:
+            # 제한의 절반도 사용하지 않는 동안에는 제한을 늘리지 않음 (부하 없이 제한만 커지는 것 방지)
+            saturated = self.in_flight * 2 >= self.limit
+            self.in_flight -= 1
+
+            if throttled:
+                self._decrease(started_at)
+            elif saturated and self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+                _CONCURRENCY_LIMIT.set(int(self.limit), backend=self.backend)
+
+            _CONCURRENCY_IN_FLIGHT.set(self.in_flight, backend=self.backend)
+            self._condition.notify_all()
+
+    def _decrease(self, started_at: float) -> None:
+        if self._decreased_at is not None and started_at < self._decreased_at:
+            return
+
+        self._decreased_at = time.monotonic()
+        limit = max(self.min_limit, self.limit * self.decrease_factor)
+        if int(limit) != int(self.limit):
+            _LOGGER.info(f"[AdaptiveConcurrencyLimiter] Decrease limit of {self.backend}: {int(self.limit)} -> {int(limit)}")
+        self.limit = limit
+        _CONCURRENCY_LIMIT.set(int(self.limit), backend=self.backend)
+
+
+class BackendResilience:
+    """
+    backend 1개에 대한 재시도 / hedge / circuit breaker 정책
+    - 멱등 요청은 일시적인 오류(네트워크, 5xx, 408/429)일 때 jitter 를 둔 지수 backoff 로 재시도
+    - hedge 대상 요청은 최근 응답 시간의 백분위수만큼 기다려도 응답이 없으면 같은 요청을 한 번 더 보내고 먼저 온 응답을 사용
+    - 연속으로 실패하면 circuit 을 열어 reset_timeout 동안 backend 를 호출하지 않고 즉시 실패
+    - 모든 요청은 AdaptiveConcurrencyLimiter 를 거쳐 throttle 응답에 맞춰 동시 요청 수를 조정
+    """
+
+    def __init__(self, backend: str, resilience_conf: dict):
+        self.backend = backend
+        self.conf = _merge_conf(DEFAULT_BACKEND_RESILIENCE, resilience_conf)
+        self.conf = _merge_conf(self.conf, self.conf["backends"].get(backend, {}))
+
+        breaker_conf = self.conf["circuit_breaker"]
+        self.circuit_breaker = CircuitBreaker(
+            backend, breaker_conf["failure_threshold"], breaker_conf["reset_timeout"]
+        )
+        self._latencies: Dict[str, LatencyWindow] = {}
+        self._hedge_slots = threading.BoundedSemaphore(max(1, self.conf["hedge"]["max_in_flight"]))
+
+        concurrency_conf = self.conf["concurrency"]
+        self.limiter = AdaptiveConcurrencyLimiter(backend, concurrency_conf) if concurrency_conf["enabled"] else None
+
+    def call(
+        self,
+        operation: str,
+        func: Callable,
+        *args,
+        idempotent: bool = False,
+        hedge: bool = False,
+        on_discard: Callable = None,
+        **kwargs,
+    ):
+        """
+        on_discard: hedge 에서 사용되지 않은 응답 정리 (예: 다운로드 스트림 close)
+        """
+        retry_conf = self.conf["retry"]
+        max_attempts = max(1, retry_conf["max_attempts"]) if idempotent else 1
+        hedge = hedge and self.conf["hedge"]["enabled"]
+
+        for attempt in range(max_attempts):
+            self.circuit_breaker.before_call()
+
+            try:
+                if hedge:
+                    result = self._call_hedged(operation, func, args, kwargs, on_discard)
+                else:
+                    result = self._invoke(operation, func, args, kwargs)
+            except Exception as e:
+                if not is_retryable_error(e):
+                    # 요청 자체의 오류 (없는 파일, 잘못된 범위 등)는 backend 장애가 아님
+                    self.circuit_breaker.record_success()
+                    raise
+
+                if is_throttle_error(e):
+                    # 속도 제한은 backend 장애가 아니므로 동시 요청 수만 줄이고 backoff 후 재시도
+                    _THROTTLED.inc(backend=self.backend, operation=operation)
+                    self.circuit_breaker.record_success()
+                else:
+                    self.circuit_breaker.record_failure()
+
+                if attempt + 1 >= max_attempts:
+                    raise
+
+                delay = random.uniform(0, min(retry_conf["max_delay"], retry_conf["base_delay"] * (2**attempt)))
+                _LOGGER.warning(
+                    f"[BackendResilience] Retry {operation} on {self.backend} in {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{max_attempts}): {e}"
+                )
+                _RETRIES.inc(backend=self.backend, operation=operation)
+                time.sleep(delay)
+                continue
+
+            self.circuit_breaker.record_success()
+            return result
+
+    def get_hedge_delay(self, operation: str) -> Optional[float]:
+        hedge_conf = self.conf["hedge"]
+        latency = self._get_latency_window(operation).percentile(hedge_conf["percentile"], hedge_conf["min_samples"])
+        if latency is None:
+            return None
+
+        return min(max(latency, hedge_conf["min_delay"]), hedge_conf["max_delay"])
+
+    def _call_hedged(self, operation: str, func: Callable, args: tuple, kwargs: dict, on_discard: Callable):
+        delay = self.get_hedge_delay(operation)
+
+        # 표본이 부족하거나 hedge 요청이 너무 많으면 그대로 호출
+        if delay is None or not self._hedge_slots.acquire(blocking=False):
+            return self._invoke(operation, func, args, kwargs)
+
+        try:
+            executor = _get_hedge_executor()
+            primary = executor.submit(self._invoke, operation, func, args, kwargs)
+            done, _ = wait([primary], timeout=delay)
+            if done:
+                return primary.result()
+
+            # 동시 요청 수 제한에 여유가 없으면 (throttle 중) hedge 하지 않고 기존 요청을 기다림
+            acquired_at = self.limiter.acquire(blocking=False) if self.limiter else None
+            if self.limiter and acquired_at is None:
+                return primary.result()
+
+            secondary = executor.submit(self._invoke, operation, func, args, kwargs, acquired_at)
+            futures = {primary: "primary", secondary: "hedge"}
+
+            # 먼저 성공한 응답 사용 (하나가 실패하면 나머지를 기다림)
+            pending = set(futures)
+            error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        _HEDGES.inc(backend=self.backend, operation=operation, winner=futures[future])
+                        self._discard(pending, on_discard)
+                        return future.result()
+                    error = future.exception()
+
+            raise error
+        finally:
+            self._hedge_slots.release()
+
+    def _invoke(self, operation: str, func: Callable, args: tuple, kwargs: dict, acquired_at: float = None):
+        """
+        acquired_at: 동시 요청 수 제한의 slot 을 이미 얻은 경우 그 시각 (hedge 요청)
+        다운로드는 응답(스트림)을 받을 때까지만 slot 을 사용한다.
+        """
+        if self.limiter is None:
+            return self._invoke_backend(operation, func, args, kwargs)
+
+        if acquired_at is None:
+            acquired_at = self.limiter.acquire()
+            if acquired_at is None:
+                raise ERROR_BACKEND_THROTTLED(backend=self.backend)
+
+        throttled = False
+        try:
+            return self._invoke_backend(operation, func, args, kwargs)
+        except Exception as e:
+            throttled = is_overload_error(e)
+            raise
+        finally:
+            self.limiter.release(acquired_at, throttled)
+
+    def _invoke_backend(self, operation: str, func: Callable, args: tuple, kwargs: dict):
+        # hedge 로 줄어든 응답 시간이 아닌 backend 요청 1건의 실제 응답 시간을 기록
+        started_at = time.monotonic()
+        result = func(*args, **kwargs)
+        self._get_latency_window(operation).add(time.monotonic() - started_at)
+        return result
+
+    @staticmethod
+    def _discard(futures, on_discard: Callable) -> None:
+        """
+        늦게 도착한 응답은 완료되는 대로 정리 (연결 반환)
+        """
+
+        def _cleanup(future):
+            if future.exception() is None and on_discard:
+                try:
+                    on_discard(future.result())
+                except Exception as e:
+                    _LOGGER.debug(f"[BackendResilience] Failed to discard hedged result: {e}")
+
+        for future in futures:
+            future.add_done_callback(_cleanup)
+
+    def _get_latency_window(self, operation: str) -> LatencyWindow:
+        latency_window = self._latencies.get(operation)
+        if latency_window is None:
+            latency_window = self._latencies.setdefault(operation, LatencyWindow(self.conf["hedge"]["window"]))
+        return latency_window
+
+
+class ResilientConnector:
+    """
+    FileBaseConnector 래퍼 (OPERATION_POLICIES 에 정의된 메서드만 정책 적용, 나머지는 그대로 전달)
+    """
+
+    def __init__(self, file_conn, resilience: BackendResilience):
+        self._file_conn = file_conn
+        self._resilience = resilience
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._file_conn, name)
+        policy = OPERATION_POLICIES.get(name)
+        if policy is None or not callable(attr):
+            return attr
+
+        on_discard = _close_download if name == "download_file" else None
+
+        def _call(*args, **kwargs):
+            return self._resilience.call(
+                name,
+                attr,
+                *args,
+                idempotent=policy["idempotent"],
+                hedge=policy["hedge"],
+                on_discard=on_discard,
+                **kwargs,
+            )
+
+        return _call
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    일시적인 오류 여부 (네트워크 오류, timeout, 5xx, 408/429)
+    """
+    if isinstance(error, (ERROR_BASE, FileNotFoundError, ValueError, TypeError, NotImplementedError)):
+        return False
+
+    status_code = _get_status_code(error)
+    if status_code is not None and 400 <= status_code < 500:
+        return status_code in _RETRYABLE_CLIENT_STATUS
+
+    return True
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """
+    backend 의 속도 제한 응답 여부 (S3 SlowDown, GCS 429 등)
+    """
+    return _get_status_code(error) in _THROTTLE_STATUS or _get_error_code(error) in _THROTTLE_ERROR_CODES
+
+
+def is_overload_error(error: Exception) -> bool:
+    """
+    동시 요청 수를 줄여야 하는 응답 여부 (속도 제한 + 503)
+    """
+    return is_throttle_error(error) or _get_status_code(error) in _OVERLOAD_STATUS
+
+
+def _get_error_code(error: Exception) -> Optional[str]:
+    # botocore: response["Error"]["Code"], minio: code, google-api-core: errors[0]["reason"]
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code")
+
+    code = getattr(error, "code", None)
+    if isinstance(code, str):
+        return code
+
+    errors = getattr(error, "errors", None)
+    if errors and isinstance(errors[0], dict):
+        return errors[0].get("reason")
+
+    return None
+
+
+def _get_status_code(error: Exception) -> Optional[int]:
+    # google-api-core: code, requests: response.status_code, minio: response.status, botocore: response dict
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code
+
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+
+    for name in ("status_code", "status"):
+        status = getattr(response, name, None)
+        if isinstance(status, int):
+            return status
+
+    return None
+
+
+def _close_download(result) -> None:
+    body = result.get("Body") if isinstance(result, dict) else result
+    for method_name in ("close", "release_conn"):
+        method = getattr(body, method_name, None)
+        if method:
+            method()
+
+
+def _merge_conf(base: dict, override: dict) -> dict:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = {**merged[key], **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+
+    if _hedge_executor is None:
+        with _backend_resiliences_lock:
+            if _hedge_executor is None:
+                # hedge 요청 1건은 최대 2개의 스레드를 사용
+                max_in_flight = DEFAULT_BACKEND_RESILIENCE["hedge"]["max_in_flight"]
+                hedge_conf = config.get_global("BACKEND_RESILIENCE", {}).get("hedge", {})
+                _hedge_executor = ThreadPoolExecutor(
+                    max_workers=2 * hedge_conf.get("max_in_flight", max_in_flight), thread_name_prefix="backend-hedge"
+                )
+
+    return _hedge_executor
+
+
+def get_backend_resilience(backend: str) -> BackendResilience:
+    backend_resilience = _backend_resiliences.get(backend)
+
+    if backend_resilience is None:
+        with _backend_resiliences_lock:
+            backend_resilience = _backend_resiliences.get(backend)
+            if backend_resilience is None:
+                backend_resilience = BackendResilience(backend, config.get_global("BACKEND_RESILIENCE", {}))
+                _backend_resiliences[backend] = backend_resilience
+
+    return backend_resilience
+
+
+def wrap_connector(backend: str, file_conn):
+    """
+    connector 에 backend 별 재시도 / hedge / circuit breaker / 동시 요청 수 제한 적용 (비활성화 시 그대로 반환)
+    """
+    backend_resilience = get_backend_resilience(backend)
+    if not backend_resilience.conf["enabled"]:
+        return file_conn
+
+    return ResilientConnector(file_conn, backend_resilience)
@@ -0,0 +1,164 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from typing import Optional
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.file_manager.error.custom import ERROR_INVALID_SIGNED_URL
+from spaceone.file_manager.lib.key_layout import get_key_layout
+from spaceone.file_manager.lib.metrics import Counter, get_metric
+
+__all__ = ["UrlSigner", "get_url_signer"]
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SIGNED_URL = {
+    "enabled": False,
+    "keys": {},  # {key_id: secret} - 검증 가능한 key 목록 (rotation 시 이전 key 는 ttl 이 지날 때까지 유지)
+    "active_key_id": None,  # 서명에 사용할 key (없으면 keys 의 첫 번째)
+    "ttl": 3000,  # 서명된 다운로드 링크 유효 시간 (초, ttl + window 는 이전 객체 삭제 유예 시간 이하)
+    "window": 300,  # 만료 시간을 이 단위로 올림하여 같은 구간에 발급된 링크를 동일하게 유지 (브라우저 캐시 재사용)
+}
+
+_VERIFY_FAILED = get_metric(
+    Counter, "file_manager_signed_url_rejected_total", "Number of rejected signed download urls", ("reason",)
+)
+
+_url_signer = None
+_url_signer_lock = threading.Lock()
+
+
+class UrlSigner:
+    """
+    다운로드 링크 서명 (HMAC-SHA256)
+    서명에 파일 정보(file_id, resource_group, domain_id, backend, key_layout, name)와 만료 시간을 포함하므로
+    다운로드 요청은 token 인증(identity 조회)과 파일 정보 조회 없이 서명 검증만으로 처리된다.
+    서명 형식: {key_id}.{base64url(payload)}.{base64url(hmac)}
+    """
+
+    def __init__(self, signed_url_conf: dict):
+        self.conf = {**DEFAULT_SIGNED_URL, **signed_url_conf}
+        self.keys = {str(key_id): str(secret).encode() for key_id, secret in self.conf["keys"].items()}
+        self.active_key_id = self.conf["active_key_id"] or next(iter(self.keys), None)
+
+        if self.conf["enabled"] and self.active_key_id not in self.keys:
+            _LOGGER.error(f"[UrlSigner] Signing key is not defined: {self.active_key_id}")
+
+        if self.conf["enabled"]:
+            self._check_max_lifetime()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.conf["enabled"]) and self.active_key_id in self.keys
+
+    def sign(self, file_info: dict, resource_group: str) -> Optional[str]:
+        """
+        Returns: 다운로드 링크의 sig 파라미터 (서명이 비활성화되어 있으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        window = max(1, int(self.conf["window"]))
+        expires_at = -(-int(time.time() + self.conf["ttl"]) // window) * window
+
+        payload = {
+            "f": file_info["file_id"],
+            "r": resource_group,
+            "d": file_info.get("domain_id"),
+            "b": file_info.get("backend"),
+            "k": file_info.get("key_layout"),
+            "n": file_info.get("name"),
+            "e": expires_at,
+        }
+        encoded_payload = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+
+        return f"{self.active_key_id}.{encoded_payload}.{self._digest(self.active_key_id, encoded_payload)}"
+
+    def verify(self, signature: str, file_id: str, resource_group: str) -> dict:
+        """
+        서명과 요청 경로(file_id, resource_group)가 일치하는지 확인
+        Returns: 다운로드에 필요한 파일 정보 (file_id, resource_group, domain_id, backend, key_layout, name)
+        """
+        # 서명을 비활성화하면 key 가 남아 있어도 이미 발급된 링크는 모두 무효
+        if not self.conf["enabled"]:
+            self._reject(file_id, "disabled")
+
+        try:
+            key_id, encoded_payload, digest = signature.split(".")
+        except ValueError:
+            self._reject(file_id, "malformed")
+
+        if key_id not in self.keys:
+            self._reject(file_id, "unknown_key")
+
+        if not hmac.compare_digest(digest, self._digest(key_id, encoded_payload)):
+            self._reject(file_id, "bad_signature")
+
+        payload = json.loads(_b64decode(encoded_payload))
+
+        if payload["f"] != file_id or payload["r"] != resource_group:
+            self._reject(file_id, "scope_mismatch")
+
+        if payload["e"] < time.time():
+            self._reject(file_id, "expired")
+
+        return {
+            "file_id": payload["f"],
+            "resource_group": payload["r"],
+            "domain_id": payload["d"],
+            "backend": payload["b"],
+            "key_layout": payload.get("k"),
+            "name": payload["n"],
+        }
+
+    def _check_max_lifetime(self) -> None:
+        """
+        링크는 파일 정보(backend, key_layout)를 담고 있어 이동된 파일의 이전 링크는 이전 객체를 읽으므로,
+        링크 최대 유효 시간(ttl + window)이 이전 객체 삭제 유예 시간보다 길면 설정 오류로 처리한다.
+        """
+        max_lifetime = int(self.conf["ttl"]) + max(1, int(self.conf["window"]))
+        grace_periods = {
+            "STORAGE_TIERING.delete_grace_period": config.get_global("STORAGE_TIERING", {}).get(
+                "delete_grace_period", 3600
+            ),
+            "KEY_LAYOUT.rekey.delete_grace_period": get_key_layout().conf["rekey"]["delete_grace_period"],
+        }
+
+        for key, grace_period in grace_periods.items():
+            if max_lifetime > grace_period:
+                _LOGGER.error(
+                    f"[UrlSigner] SIGNED_URL.ttl + window ({max_lifetime}s) exceeds {key} ({grace_period}s)"
+                )
+                raise ERROR_CONFIGURATION(key="SIGNED_URL.ttl")
+
+    def _digest(self, key_id: str, encoded_payload: str) -> str:
+        return _b64encode(hmac.new(self.keys[key_id], encoded_payload.encode(), hashlib.sha256).digest())
+
+    @staticmethod
+    def _reject(file_id: str, reason: str):
+        _VERIFY_FAILED.inc(reason=reason)
+        raise ERROR_INVALID_SIGNED_URL(file_id=file_id, reason=reason)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def get_url_signer() -> UrlSigner:
+    global _url_signer
+
+    if _url_signer is None:
+        with _url_signer_lock:
+            if _url_signer is None:
+                _url_signer = UrlSigner(config.get_global("SIGNED_URL", {}))
+
+    return _url_signer
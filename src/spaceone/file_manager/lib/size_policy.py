@@ -0,0 +1,84 @@
+import io
+from typing import Optional
+
+from spaceone.core import config
+from spaceone.file_manager.error.custom import ERROR_FILE_TOO_LARGE
+
+__all__ = ["get_max_file_size", "check_file_size", "get_stream_size", "SizeLimitedReader"]
+
+# proxy 에서 업로드 크기를 제한하지 않으므로 설정이 없어도 유한한 기본값 적용 (제한 해제는 max_size 0 으로 명시)
+DEFAULT_FILE_SIZE_POLICIES = {
+    "default": {"max_size": 5 * 1024 * 1024 * 1024},
+}
+
+
+def get_max_file_size(resource_group: str) -> int:
+    """
+    resource_group 별 최대 업로드 크기 (0: 제한 없음)
+    """
+    policies = {**DEFAULT_FILE_SIZE_POLICIES, **config.get_global("FILE_SIZE_POLICIES", {})}
+    policy = policies.get(resource_group) or policies.get("default") or {}
+    return int(policy.get("max_size") or 0)
+
+
+def check_file_size(resource_group: str, size: Optional[int]) -> None:
+    if size is None or size < 0:
+        return
+
+    max_size = get_max_file_size(resource_group)
+    if max_size and size > max_size:
+        raise ERROR_FILE_TOO_LARGE(size=size, max_size=max_size, resource_group=resource_group)
+
+
+def get_stream_size(file_stream) -> Optional[int]:
+    """
+    seek 가능한 스트림의 남은 크기 (알 수 없으면 None)
+    """
+    seekable = getattr(file_stream, "seekable", None)
+    if not seekable or not seekable():
+        return None
+
+    current_pos = file_stream.tell()
+    file_stream.seek(0, io.SEEK_END)
+    size = file_stream.tell() - current_pos
+    file_stream.seek(current_pos)
+    return size
+
+
+class SizeLimitedReader(io.RawIOBase):
+    """
+    읽은 바이트 수를 세면서 최대 크기를 넘으면 즉시 예외를 발생시키는 래퍼
+    크기를 미리 알 수 없는 스트림(gRPC, chunked 요청)에 대해 업로드 도중 한도를 강제한다.
+    connector 업로드가 예외로 중단되면 backend multipart 업로드도 함께 중단(abort)된다.
+    """
+
+    def __init__(self, file_stream, resource_group: str, max_size: int = None):
+        super().__init__()
+        self._file_stream = file_stream
+        self.resource_group = resource_group
+        self.max_size = get_max_file_size(resource_group) if max_size is None else max_size
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file_stream.read(size)
+        self._count(len(chunk))
+        return chunk
+
+    def readinto(self, b) -> int:
+        chunk = self._file_stream.read(len(b))
+        b[: len(chunk)] = chunk
+        self._count(len(chunk))
+        return len(chunk)
+
+    def _count(self, size: int) -> None:
+        self.bytes_read += size
+        if self.max_size and self.bytes_read > self.max_size:
+            raise ERROR_FILE_TOO_LARGE(
+                size=self.bytes_read, max_size=self.max_size, resource_group=self.resource_group
+            )
@@ -0,0 +1,79 @@
+import fnmatch
+from typing import Optional
+
+from spaceone.core import config
+
+__all__ = ["get_default_backend", "get_file_backend", "get_inline_storage_conf", "select_backend"]
+
+DEFAULT_INLINE_STORAGE = {
+    "enabled": False,
+    "backend": "InlineConnector",
+    "max_size": 16 * 1024,
+    "migrate": False,
+    "batch_size": 100,
+}
+
+
+def get_default_backend() -> str:
+    return config.get_global("BACKEND", "FileConnectorManager")
+
+
+def get_file_backend(file_info) -> str:
+    """
+    파일이 저장된 backend (backend 가 기록되지 않은 기존 파일은 기본 BACKEND)
+    """
+    return file_info.get("backend") or get_default_backend()
+
+
+def get_inline_storage_conf() -> dict:
+    return {**DEFAULT_INLINE_STORAGE, **config.get_global("INLINE_STORAGE", {})}
+
+
+def select_backend(
+    resource_group: str,
+    domain_id: Optional[str] = None,
+    size: Optional[int] = None,
+    content_type: Optional[str] = None,
+    allow_inline: bool = True,
+) -> str:
+    """
+    STORAGE_ROUTING 규칙을 순서대로 검사하여 처음 일치하는 backend 반환 (없으면 기본 BACKEND)
+    크기를 알 수 없는 업로드는 크기 조건이 있는 규칙과 일치하지 않는다.
+    INLINE_STORAGE 가 활성화되어 있으면 max_size 이하 크기의 업로드는 규칙보다 먼저 inline backend 로 보낸다.
+    allow_inline: False 이면 inline backend 를 제외 (inline 에서 일반 backend 로 옮길 때)
+    """
+    inline_conf = get_inline_storage_conf()
+    if allow_inline and inline_conf["enabled"] and size is not None and size <= inline_conf["max_size"]:
+        return inline_conf["backend"]
+
+    for rule in config.get_global("STORAGE_ROUTING", {}).get("rules", []):
+        if not allow_inline and rule["backend"] == inline_conf["backend"]:
+            continue
+
+        if _match_rule(rule.get("match", {}), resource_group, domain_id, size, content_type):
+            return rule["backend"]
+
+    return get_default_backend()
+
+
+def _match_rule(
+    match: dict, resource_group: str, domain_id: Optional[str], size: Optional[int], content_type: Optional[str]
+) -> bool:
+    if "resource_groups" in match and resource_group not in match["resource_groups"]:
+        return False
+
+    if "domain_ids" in match and domain_id not in match["domain_ids"]:
+        return False
+
+    if "min_size" in match and (size is None or size < match["min_size"]):
+        return False
+
+    if "max_size" in match and (size is None or size > match["max_size"]):
+        return False
+
+    if "content_types" in match:
+        content_type = (content_type or "").split(";")[0].strip().lower()
+        if not any(fnmatch.fnmatch(content_type, pattern) for pattern in match["content_types"]):
+            return False
+
+    return True
@@ -0,0 +1,290 @@
+import io
+import logging
+import re
+import threading
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from spaceone.file_manager.lib.metrics import Counter, get_metric
+
+__all__ = [
+    "ChunkIteratorReader",
+    "DownloadStream",
+    "TransferCancellation",
+    "format_range_header",
+    "parse_range_header",
+    "record_cancelled_transfer",
+]
+_LOGGER = logging.getLogger(__name__)
+
+_CANCELLED_TRANSFERS = get_metric(
+    Counter, "file_manager_transfer_cancelled_total", "Number of transfers cancelled by the client", ("direction",)
+)
+# download: 클라이언트 연결 종료로 backend 에서 읽지 않은 바이트 (절약된 egress)
+_CANCELLED_BYTES = get_metric(
+    Counter,
+    "file_manager_transfer_cancelled_bytes_total",
+    "Bytes not transferred from/to the backend because the client cancelled",
+    ("direction",),
+)
+
+
+def record_cancelled_transfer(direction: str, size: int) -> None:
+    _CANCELLED_TRANSFERS.inc(direction=direction)
+    if size > 0:
+        _CANCELLED_BYTES.inc(size, direction=direction)
+
+
+class TransferCancellation:
+    """
+    클라이언트 연결 종료 신호 (REST disconnect)
+    cancel() 은 이벤트 루프에서 호출되고, 등록된 콜백으로 전송 스레드에서 진행 중인
+    backend 읽기를 닫는다. 콜백은 한 번만 실행되며, 이미 취소된 뒤 등록한 콜백은 즉시 실행된다.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def add_callback(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+
+        self._run_callback(callback)
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            self._run_callback(callback)
+
+    @staticmethod
+    def _run_callback(callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        except Exception as e:
+            _LOGGER.debug(f"[TransferCancellation] callback error: {e}")
+
+
+class ChunkIteratorReader(io.RawIOBase):
+    """
+    bytes 청크 이터레이터를 읽기 전용 파일 객체로 변환
+    다운로드 스트림처럼 순차적으로 도착하는 청크를 connector의
+    stream_upload_file에 그대로 전달하기 위해 사용한다.
+
+    다음 청크는 read 요청이 있을 때만 가져오므로 내부 버퍼는 최대 한 청크(+ 요청한 read 크기)로 제한되고,
+    소비 속도가 느리면 상위 스트림에 그대로 역압이 전달된다.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], max_chunk_size: Optional[int] = None):
+        super().__init__()
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._max_chunk_size = max_chunk_size
+        self._buffer = memoryview(b"")
+        self._eof = False
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def readinto(self, b) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed stream")
+
+        while not self._buffer and not self._eof:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._eof = True
+                break
+
+            if self._max_chunk_size and len(chunk) > self._max_chunk_size:
+                raise ValueError(
+                    f"Chunk too large: {len(chunk)} bytes > {self._max_chunk_size} bytes"
+                )
+
+            self._buffer = memoryview(chunk)
+
+        size = min(len(b), len(self._buffer))
+        if size == 0:
+            return 0
+
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        self.bytes_read += size
+        return size
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        EOF가 아니면 항상 size 만큼 채워서 반환
+        (boto3 multipart, GCS resumable 업로드는 짧은 read를 마지막 파트로 취급함)
+        """
+        if size is None or size < 0:
+            return self.readall()
+
+        data = bytearray(size)
+        view = memoryview(data)
+        filled = 0
+        while filled < size:
+            read_size = self.readinto(view[filled:])
+            if read_size == 0:
+                break
+            filled += read_size
+
+        del view
+        if filled < size:
+            del data[filled:]
+        return bytes(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._buffer = memoryview(b"")
+            close_iterator = getattr(self._chunks, "close", None)
+            if close_iterator:
+                close_iterator()
+        super().close()
+
+
+class DownloadStream:
+    """
+    connector download_file 결과를 청크 이터레이터로 감싼 객체
+    S3 스타일 응답({'Body': stream, 'ContentLength': size}), 스트림 객체, 제너레이터, bytes 를 지원한다.
+    close() 호출 시 아직 읽지 않은 본문도 즉시 닫고 연결을 반환한다.
+    다른 스레드에서 close() 하면 진행 중인 본문 읽기가 중단된다. (클라이언트 연결 종료 시 backend 읽기 취소)
+    """
+
+    def __init__(self, result, chunk_size: int = 1024 * 1024, on_close: Optional[Callable[[], None]] = None):
+        self.chunk_size = chunk_size
+        self._on_close = on_close
+        self.content_length = -1
+        self.content_range = None
+        self.etag = None
+        self.content_type = None
+        self.bytes_read = 0
+
+        if isinstance(result, dict) and "Body" in result:
+            self.body = result["Body"]
+            content_length = result.get("ContentLength")
+            if content_length is not None:
+                self.content_length = content_length
+            self.content_range = result.get("ContentRange")
+            self.etag = result.get("ETag")
+            self.content_type = result.get("ContentType")
+        else:
+            self.body = result
+            if isinstance(result, bytes):
+                self.content_length = len(result)
+
+        self.closed = False
+        self._close_lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._iter_body():
+                self.bytes_read += len(chunk)
+                yield chunk
+        finally:
+            self.close()
+
+    def _iter_body(self) -> Iterator[bytes]:
+        body = self.body
+        chunk_size = self.chunk_size
+
+        if isinstance(body, io.BytesIO):
+            body.seek(0)  # 처음부터 읽기
+            while True:
+                chunk = body.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+        elif hasattr(body, "read"):
+            # 스트림 객체
+            while True:
+                chunk = body.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+        elif hasattr(body, "__next__"):
+            # 제너레이터 (GCS 스트리밍 응답)
+            for chunk in body:
+                yield chunk
+
+        elif isinstance(body, bytes):
+            for i in range(0, len(body), chunk_size):
+                yield body[i:i + chunk_size]
+
+        elif hasattr(body, "__iter__"):
+            # 기타 이터러블 (청크 단위로 그대로 전달)
+            for chunk in body:
+                yield chunk
+
+        else:
+            # 전체를 메모리에 올리는 변환은 하지 않음
+            raise TypeError(f"Unsupported download body type: {type(body)}")
+
+    def close(self) -> None:
+        # 전송 스레드와 취소 콜백에서 동시에 호출될 수 있으므로 한 번만 실행
+        with self._close_lock:
+            if self.closed:
+                return
+            self.closed = True
+
+        body = self.body
+
+        for method_name in ("close", "release_conn"):
+            method = getattr(body, method_name, None)
+            if method:
+                try:
+                    method()
+                except Exception as e:
+                    _LOGGER.debug(f"[DownloadStream] {method_name} error: {e}")
+
+        if self._on_close:
+            self._on_close()
+
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d+)-(\d*)$")
+
+
+def parse_range_header(range_header: Optional[str]) -> Optional[Tuple[int, Optional[int]]]:
+    """
+    HTTP Range 헤더 파싱 (단일 구간 'bytes=start-' / 'bytes=start-end' 만 지원)
+    지원하지 않는 형식(다중 구간, suffix 구간)은 None 을 반환하여 전체 응답으로 처리한다.
+    """
+    if not range_header:
+        return None
+
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else None
+
+    if end is not None and end < start:
+        return None
+
+    return start, end
+
+
+def format_range_header(byte_range: Tuple[int, Optional[int]]) -> str:
+    """
+    parse_range_header 결과를 HTTP Range 헤더 값으로 변환 ('bytes=start-' / 'bytes=start-end')
+    """
+    start, end = byte_range
+    return f"bytes={start}-{'' if end is None else end}"
@@ -4,17 +4,25 @@ from spaceone.core import config, cache
 from spaceone.core.manager import BaseManager
 from spaceone.file_manager.error import *
 from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
+from spaceone.file_manager.lib.resilience import wrap_connector
+from spaceone.file_manager.lib.storage_routing import get_default_backend
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class FileConnectorManager(BaseManager):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, backend: str = None, key_layout: int = None, domain_id: str = None, **kwargs):
         super().__init__(*args, **kwargs)
-        backend = config.get_global("BACKEND", "FileConnectorManager")
+        # 파일 정보에 기록된 backend (없으면 기본 BACKEND)
+        backend = backend or get_default_backend()
+        self.backend = backend
         try:
             _LOGGER.debug(f"[FileConnectorManager] Create {backend}")
-            self.file_conn: FileBaseConnector = self.locator.get_connector(backend)
+            file_conn: FileBaseConnector = self.locator.get_connector(backend)
+            # 파일에 기록된 key layout 으로 object key 생성
+            file_conn.set_key_scope(key_layout, domain_id)
+            # 재시도 / hedge / circuit breaker 적용
+            self.file_conn: FileBaseConnector = wrap_connector(backend, file_conn)
         except Exception as e:
             _LOGGER.error(f"[FileConnectorManager] not defined backend {backend}")
             raise ERROR_NOT_DEFINED_FILE_BACKEND(backend=backend)
@@ -29,21 +37,29 @@ class FileConnectorManager(BaseManager):
         self.file_conn.upload_file( resource_group, file_id, file_binary)
 
     def stream_upload_file(self, resource_group: str, file_id: str, file_obj) -> None:
-
-        if hasattr(self.file_conn, 'stream_upload_file'):
-            self.file_conn.stream_upload_file(resource_group, file_id, file_obj)
-        else:
-            # 스트리밍을 지원하지 않는 커넥터의 경우 기존 방식으로 폴백
-            _LOGGER.warning(f"[stream_upload_file] Connector {type(self.file_conn).__name__} does not support streaming, falling back to regular upload")
-            # 청크 단위로 읽어서 메모리 사용량 최적화
-            file_data = b""
-            chunk_size = 8192  # 8KB 청크
-            while True:
-                chunk = file_obj.read(chunk_size)
-                if not chunk:
-                    break
-                file_data += chunk
-            self.file_conn.upload_file(resource_group, file_id, file_data)
+        # connector 가 청크 단위로 읽어 전송 (전체 파일을 메모리에 올리지 않음)
+        self.file_conn.stream_upload_file(resource_group, file_id, file_obj)
 
     def download_file(self, resource_group:str, file_id:str ) :
         return self.file_conn.download_file(resource_group, file_id)
+
+    def copy_file(self, src_resource_group: str, src_file_id: str, dst_resource_group: str, dst_file_id: str) -> None:
+        self.file_conn.copy_file(src_resource_group, src_file_id, dst_resource_group, dst_file_id)
+
+    def supports_multipart_upload(self) -> bool:
+        return self.file_conn.supports_multipart_upload()
+
+    def get_multipart_limits(self) -> tuple:
+        return self.file_conn.get_multipart_limits()
+
+    def create_multipart_upload(self, resource_group: str, file_id: str) -> str:
+        return self.file_conn.create_multipart_upload(resource_group, file_id)
+
+    def upload_part(self, resource_group: str, file_id: str, upload_id: str, part_number: int, data: bytes) -> str:
+        return self.file_conn.upload_part(resource_group, file_id, upload_id, part_number, data)
+
+    def complete_multipart_upload(self, resource_group: str, file_id: str, upload_id: str, parts: list) -> None:
+        self.file_conn.complete_multipart_upload(resource_group, file_id, upload_id, parts)
+
+    def abort_multipart_upload(self, resource_group: str, file_id: str, upload_id: str) -> None:
+        self.file_conn.abort_multipart_upload(resource_group, file_id, upload_id)
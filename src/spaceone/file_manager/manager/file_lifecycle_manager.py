@@ -0,0 +1,91 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Union
+from mongoengine import Q, QuerySet
+
+from spaceone.core.manager import BaseManager
+from spaceone.file_manager.error import *
+from spaceone.file_manager.manager.image_derivative_manager import ImageDerivativeManager
+from spaceone.file_manager.manager.storage_migration_manager import StorageMigrationManager
+from spaceone.file_manager.manager.streaming_file_connector_manager import StreamingFileConnectorManager
+from spaceone.file_manager.manager.usage_manager import UsageManager
+from spaceone.file_manager.model.file.database import File
+from spaceone.file_manager.model.user_file.database import UserFile
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FileLifecycleManager(BaseManager):
+    """
+    FILE_LIFECYCLE 규칙에 따른 파일 만료
+    마지막 접근(접근 기록이 없으면 생성) 후 expire_after_days 가 지난 파일을 삭제한다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.models = {
+            "File": File,
+            "UserFile": UserFile,
+        }
+
+    def list_expired_files(self, rule: dict, batch_size: int) -> QuerySet:
+        resource_type = rule.get("resource_type", "File")
+        if resource_type not in self.models:
+            raise ERROR_INVALID_PARAMETER(key="FILE_LIFECYCLE.rules.resource_type", reason=f"{resource_type}")
+
+        conditions = {}
+        if resource_type == "File" and "resource_groups" in rule:
+            conditions["resource_group__in"] = rule["resource_groups"]
+
+        if "domain_ids" in rule:
+            conditions["domain_id__in"] = rule["domain_ids"]
+
+        return (
+            self.models[resource_type]
+            .objects(self.get_idle_condition(rule["expire_after_days"]), **conditions)
+            .order_by("created_at")
+            .limit(batch_size)
+        )
+
+    def expire_file(self, file_vo: Union[File, UserFile]) -> bool:
+        """
+        파일 정보를 먼저 삭제하고 저장된 객체를 삭제 (객체 삭제에 실패해도 파일 정보가 없는 객체만 남음)
+        Returns: 삭제 여부 (조회 이후 다시 접근된 파일은 삭제하지 않음)
+        """
+        resource_group = file_vo.resource_group if isinstance(file_vo, File) else "USER"
+        has_previous_object = StorageMigrationManager.has_previous_object(file_vo)
+
+        deleted_count = file_vo.__class__.objects(
+            file_id=file_vo.file_id, last_accessed_at=file_vo.last_accessed_at
+        ).delete()
+
+        if deleted_count == 0:
+            return False
+
+        UsageManager().add_usage(file_vo, -1, -(file_vo.size or 0))
+
+        try:
+            StreamingFileConnectorManager(
+                backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+            ).delete_file(resource_group, file_vo.file_id)
+        except Exception as e:
+            _LOGGER.error(f"[expire_file] Failed to delete object : {file_vo.file_id} ({resource_group}): {e}")
+
+        if file_vo.derivatives:
+            ImageDerivativeManager(
+                backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+            ).delete_derivatives(resource_group, file_vo.file_id, file_vo.derivatives)
+
+        if has_previous_object:
+            StorageMigrationManager().delete_previous_object(file_vo)
+
+        _LOGGER.info(f"[expire_file] Expired file : {file_vo.name} ({file_vo.file_id})")
+        return True
+
+    @staticmethod
+    def get_idle_condition(idle_days: int) -> Q:
+        """
+        idle_days 동안 접근되지 않은 파일 조건 (접근 기록이 없으면 생성 시간 기준)
+        """
+        idle_since = datetime.utcnow() - timedelta(days=idle_days)
+        return Q(last_accessed_at__lt=idle_since) | Q(last_accessed_at=None, created_at__lt=idle_since)
@@ -1,9 +1,10 @@
 import logging
-from typing import Union
+from datetime import datetime
+from typing import List, Union
 from mongoengine import QuerySet
 
 
-from spaceone.core import config
+from spaceone.core import config, utils
 from spaceone.core.manager import BaseManager
 from spaceone.file_manager.model.file.database import File
 
@@ -26,6 +27,26 @@ class FileManager(BaseManager):
 
         return file_vo
 
+    def create_files(self, params_list: List[dict]) -> List[File]:
+        """
+        여러 파일 정보를 insert 1회로 생성 (일괄 업로드)
+        """
+        def _rollback(file_ids: List[str]) -> None:
+            _LOGGER.info(f"[ROLLBACK] Delete files : {file_ids}")
+            self.file_model.objects(file_id__in=file_ids).delete()
+
+        created_at = datetime.utcnow()
+        file_vos = []
+        for params in params_list:
+            file_vo = self.file_model(**params, file_id=utils.generate_id("file"), created_at=created_at)
+            file_vo.validate()
+            file_vos.append(file_vo)
+
+        file_vos = self.file_model.objects.insert(file_vos)
+        self.transaction.add_rollback(_rollback, [file_vo.file_id for file_vo in file_vos])
+
+        return file_vos
+
     def update_file_by_vo(self, params: dict, file_vo: File) -> File:
         def _rollback(old_data: dict):
             _LOGGER.info(
@@ -37,6 +58,40 @@ class FileManager(BaseManager):
 
         return file_vo.update(params)
 
+    def move_file_by_vo(self, params: dict, file_vo: File) -> File:
+        """
+        resource_group/scope 변경 (조건부 단일 문서 업데이트)
+        이동 도중 다른 요청이 같은 파일을 변경했다면 0건이 갱신되므로 충돌로 처리한다.
+        """
+        old_data = {
+            "resource_group": file_vo.resource_group,
+            "domain_id": file_vo.domain_id,
+            "workspace_id": file_vo.workspace_id,
+            "project_id": file_vo.project_id,
+        }
+
+        def _rollback(old_data: dict):
+            _LOGGER.info(
+                f'[ROLLBACK] Revert Scope : {file_vo.name} ({file_vo.file_id})'
+            )
+            self.file_model.objects(file_id=file_vo.file_id).update_one(
+                **{f"set__{key}": value for key, value in old_data.items()}
+            )
+
+        # 이동 도중 storage tier 가 바뀐 경우도 충돌로 처리
+        updated_count = self.file_model.objects(
+            file_id=file_vo.file_id, backend=file_vo.backend, **old_data
+        ).update_one(
+            **{f"set__{key}": value for key, value in params.items()}
+        )
+
+        if updated_count == 0:
+            return None
+
+        self.transaction.add_rollback(_rollback, old_data)
+        file_vo.reload()
+        return file_vo
+
     @staticmethod
     def delete_file_by_vo(file_vo: File) -> None:
         file_vo.delete()
@@ -59,6 +114,24 @@ class FileManager(BaseManager):
 
         return self.file_model.get(**condition)
 
+    def get_files(
+        self,
+        file_ids: list,
+        domain_id: str,
+        workspace_id: str = None,
+        project_id: str = None,
+    ) -> QuerySet:
+
+        condition = {
+            "file_id": file_ids,
+            "domain_id": domain_id,
+        }
+
+        if workspace_id:
+            condition["workspace_id"] = workspace_id
+
+        return self.file_model.filter(**condition)
+
     def filter_files(self, **conditions) -> QuerySet:
         return self.file_model.filter(**conditions)
 
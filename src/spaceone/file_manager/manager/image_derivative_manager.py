@@ -0,0 +1,217 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.file_manager.error import *
+from spaceone.file_manager.lib.image import (
+    TransformSpec,
+    get_default_format,
+    get_process_pool,
+    is_image_file,
+    is_image_supported,
+    make_derivative_id,
+    render_derivative,
+)
+from spaceone.file_manager.manager.streaming_file_connector_manager import StreamingFileConnectorManager
+from spaceone.file_manager.model.file.database import File
+from spaceone.file_manager.model.user_file.database import UserFile
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_IMAGE_DERIVATIVE = {
+    "max_width": 2048,
+    "max_height": 2048,
+    "quality": 85,
+    "max_source_size": 50 * 1024 * 1024,
+    "process_pool_size": 2,
+    "render_timeout": 60,
+    "cache_max_size": 64 * 1024 * 1024,
+    "pregenerate_specs": [],
+}
+
+
+class _DerivativeCache:
+    """
+    derivative 바이트 LRU 캐시 (전체 크기 기준으로 오래 사용하지 않은 항목부터 제거)
+    """
+
+    def __init__(self):
+        self._items = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Optional[bytes]:
+        with self._lock:
+            data = self._items.get(key)
+            if data is not None:
+                self._items.move_to_end(key)
+            return data
+
+    def put(self, key, data: bytes, max_size: int) -> None:
+        if len(data) > max_size:
+            return
+
+        with self._lock:
+            if key in self._items:
+                self._size -= len(self._items.pop(key))
+
+            self._items[key] = data
+            self._size += len(data)
+
+            while self._size > max_size:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= len(evicted)
+
+    def discard_file(self, resource_group: str, file_id: str) -> None:
+        prefix = make_derivative_id(file_id, "")
+        with self._lock:
+            for key in [key for key in self._items if key[0] == resource_group and key[1].startswith(prefix)]:
+                self._size -= len(self._items.pop(key))
+
+
+_DERIVATIVE_CACHE = _DerivativeCache()
+_PREGENERATE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-derivative")
+
+
+class ImageDerivativeManager(BaseManager):
+    """
+    이미지 썸네일/미리보기 derivative 생성 및 조회
+    derivative 는 원본과 같은 resource_group 경로에 '{file_id}@{spec}' 이름으로 저장되고,
+    생성된 spec 목록은 파일 정보의 derivatives 필드에 기록되어 원본 삭제 시 함께 삭제된다.
+    """
+
+    def __init__(self, *args, backend: str = None, key_layout: int = None, domain_id: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # derivative 는 원본과 같은 backend, key layout 으로 저장
+        self.file_conn_mgr = StreamingFileConnectorManager(backend=backend, key_layout=key_layout, domain_id=domain_id)
+        self.derivative_conf = {
+            **DEFAULT_IMAGE_DERIVATIVE,
+            **config.get_global("IMAGE_DERIVATIVE", {}),
+        }
+
+    def parse_transform_spec(
+        self, name: str, width: Optional[int] = None, height: Optional[int] = None, fmt: Optional[str] = None
+    ) -> TransformSpec:
+        if not is_image_supported():
+            raise ERROR_IMAGE_DERIVATIVE_NOT_SUPPORTED(name=name)
+
+        if not is_image_file(name):
+            raise ERROR_IMAGE_DERIVATIVE_NOT_SUPPORTED(name=name)
+
+        width = width or 0
+        height = height or 0
+
+        if width == 0 and height == 0:
+            raise ERROR_REQUIRED_PARAMETER(key="w or h")
+
+        if width < 0 or width > self.derivative_conf["max_width"]:
+            raise ERROR_INVALID_PARAMETER(key="w", reason=f"w must be between 0 and {self.derivative_conf['max_width']}")
+
+        if height < 0 or height > self.derivative_conf["max_height"]:
+            raise ERROR_INVALID_PARAMETER(key="h", reason=f"h must be between 0 and {self.derivative_conf['max_height']}")
+
+        if fmt:
+            normalized_fmt = TransformSpec.normalize_format(fmt)
+            if normalized_fmt is None:
+                raise ERROR_INVALID_PARAMETER(key="fmt", reason="fmt must be one of jpeg, png, webp")
+        else:
+            normalized_fmt = get_default_format(name)
+
+        return TransformSpec(width, height, normalized_fmt)
+
+    def get_derivative(self, resource_group: str, file_id: str, spec: TransformSpec) -> bytes:
+        """
+        derivative 조회 (메모리 LRU -> 버킷 -> 원본에서 생성 순)
+        """
+        derivative_id = make_derivative_id(file_id, spec.key)
+        cache_key = (resource_group, derivative_id)
+
+        data = _DERIVATIVE_CACHE.get(cache_key)
+        if data is not None:
+            return data
+
+        if self._has_derivative(resource_group, file_id, spec):
+            data = self._read_object(resource_group, derivative_id)
+        else:
+            data = self.create_derivative(resource_group, file_id, spec)
+
+        _DERIVATIVE_CACHE.put(cache_key, data, self.derivative_conf["cache_max_size"])
+        return data
+
+    def create_derivative(self, resource_group: str, file_id: str, spec: TransformSpec) -> bytes:
+        _LOGGER.info(f"[create_derivative] Create derivative: {file_id} ({spec.key})")
+
+        source = self._read_object(resource_group, file_id, self.derivative_conf["max_source_size"])
+
+        future = get_process_pool(self.derivative_conf["process_pool_size"]).submit(
+            render_derivative, source, spec.width, spec.height, spec.fmt, self.derivative_conf["quality"]
+        )
+        data = future.result(timeout=self.derivative_conf["render_timeout"])
+
+        self.file_conn_mgr.file_conn.upload_file(resource_group, make_derivative_id(file_id, spec.key), data)
+        self._get_model(resource_group).objects(file_id=file_id).update_one(add_to_set__derivatives=spec.key)
+
+        return data
+
+    def pregenerate_derivatives(self, resource_group: str, file_id: str, name: str) -> None:
+        """
+        업로드 직후 설정된 spec 의 derivative 를 백그라운드에서 미리 생성
+        """
+        specs = self.derivative_conf["pregenerate_specs"]
+        if not specs or not is_image_supported() or not is_image_file(name):
+            return
+
+        def _pregenerate():
+            for spec_conf in specs:
+                try:
+                    spec = self.parse_transform_spec(name, spec_conf.get("w"), spec_conf.get("h"), spec_conf.get("fmt"))
+                    self.create_derivative(resource_group, file_id, spec)
+                except Exception as e:
+                    _LOGGER.error(f"[pregenerate_derivatives] Failed to create derivative: {file_id} ({spec_conf}): {e}")
+
+        _PREGENERATE_EXECUTOR.submit(_pregenerate)
+
+    def delete_derivatives(self, resource_group: str, file_id: str, derivatives: list) -> None:
+        """
+        derivative 객체 삭제 (원본 삭제/이동 시 호출, 실패해도 원본 처리를 막지 않음)
+        """
+        _DERIVATIVE_CACHE.discard_file(resource_group, file_id)
+
+        for key in derivatives or []:
+            try:
+                self.file_conn_mgr.file_conn.delete_file(resource_group, make_derivative_id(file_id, key))
+            except Exception as e:
+                _LOGGER.error(f"[delete_derivatives] Failed to delete derivative: {file_id} ({key}): {e}")
+
+    def _has_derivative(self, resource_group: str, file_id: str, spec: TransformSpec) -> bool:
+        file_vo = self._get_model(resource_group).objects(file_id=file_id).only("derivatives").first()
+        return file_vo is not None and spec.key in (file_vo.derivatives or [])
+
+    def _read_object(self, resource_group: str, file_id: str, max_size: int = 0) -> bytes:
+        download_stream = self.file_conn_mgr.open_download(resource_group, file_id)
+
+        try:
+            if max_size and download_stream.content_length > max_size:
+                raise ERROR_FILE_TOO_LARGE(
+                    size=download_stream.content_length, max_size=max_size, resource_group=resource_group
+                )
+
+            chunks = []
+            total_size = 0
+            for chunk in download_stream:
+                total_size += len(chunk)
+                if max_size and total_size > max_size:
+                    raise ERROR_FILE_TOO_LARGE(size=total_size, max_size=max_size, resource_group=resource_group)
+                chunks.append(chunk)
+
+            return b"".join(chunks)
+        finally:
+            download_stream.close()
+
+    @staticmethod
+    def _get_model(resource_group: str):
+        return UserFile if resource_group == "USER" else File
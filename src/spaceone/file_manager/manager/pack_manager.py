@@ -0,0 +1,149 @@
+import logging
+from datetime import datetime, timedelta
+from typing import List
+
+from mongoengine import QuerySet
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.file_manager.error import *
+from spaceone.file_manager.model.pack.database import Pack, PackedObject
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PACKING = {
+    "enabled": False,
+    "backend": "PackConnector",
+    "pack_size": 64 * 1024 * 1024,
+    "max_wait": 300,
+    "max_packs": 10,
+    "compaction": {"garbage_ratio": 0.5, "min_age": 3600},
+    "delete_grace_period": 3600,
+}
+
+
+class PackManager(BaseManager):
+    """
+    PackConnector 의 pack 관리 (scheduler 에서 실행)
+    1. 보관 중인 객체가 pack_size 만큼 모이거나 가장 오래된 객체가 max_wait 를 넘기면 pack 기록
+    2. 삭제로 빈 구간이 garbage_ratio 이상인 pack 은 남은 객체만 새 pack 으로 옮김
+    3. 참조가 없는 pack 은 RETIRED 로 바꾸고 유예 시간이 지나면 객체 삭제
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.conf = {**DEFAULT_PACKING, **config.get_global("PACKING", {})}
+        self.conf["compaction"] = {**DEFAULT_PACKING["compaction"], **self.conf["compaction"]}
+
+        backend = self.conf["backend"]
+        try:
+            self.pack_conn = self.locator.get_connector(backend)
+        except Exception as e:
+            _LOGGER.error(f"[PackManager] not defined backend {backend}: {e}")
+            raise ERROR_NOT_DEFINED_FILE_BACKEND(backend=backend)
+
+    def seal_packs(self) -> int:
+        """
+        Returns: 생성된 pack 수
+        """
+        sealed_count = 0
+
+        for _ in range(self.conf["max_packs"]):
+            object_names = self._list_objects_to_seal()
+            if not object_names:
+                break
+
+            if self.pack_conn.seal_pack(object_names):
+                sealed_count += 1
+
+        return sealed_count
+
+    def compact_packs(self) -> int:
+        """
+        Returns: compaction 된 pack 수
+        """
+        compacted_count = 0
+
+        for pack_vo in self.list_compaction_targets():
+            try:
+                self.pack_conn.compact_pack(pack_vo)
+                compacted_count += 1
+            except Exception as e:
+                _LOGGER.error(f"[compact_packs] Failed to compact pack : {pack_vo.pack_id}: {e}")
+
+        return compacted_count
+
+    def delete_retired_packs(self) -> int:
+        """
+        참조가 없어진 pack 을 RETIRED 로 변경하고 유예 시간이 지난 pack 객체 삭제
+        Returns: 삭제된 pack 수
+        """
+        for pack_vo in Pack.objects(state="ACTIVE", live_count__lte=0).only("pack_id").limit(self.conf["max_packs"]):
+            self.pack_conn.retire_pack(pack_vo.pack_id)
+
+        expired_at = datetime.utcnow() - timedelta(seconds=self.conf["delete_grace_period"])
+        deleted_count = 0
+
+        for pack_vo in Pack.objects(state="RETIRED", retired_at__lt=expired_at).limit(self.conf["max_packs"]):
+            try:
+                self.pack_conn.delete_pack(pack_vo)
+                deleted_count += 1
+            except Exception as e:
+                _LOGGER.error(f"[delete_retired_packs] Failed to delete pack : {pack_vo.pack_id}: {e}")
+
+        # 업로드 도중 중단된 pack 은 RETIRED 로 바꿔 다음 실행에서 삭제
+        Pack.objects(state="WRITING", created_at__lt=expired_at).update(
+            set__state="RETIRED", set__retired_at=datetime.utcnow()
+        )
+
+        return deleted_count
+
+    def list_compaction_targets(self) -> QuerySet:
+        """
+        생성 후 min_age 가 지나고 참조되지 않는 크기가 garbage_ratio 이상인 pack
+        """
+        compaction_conf = self.conf["compaction"]
+        created_before = datetime.utcnow() - timedelta(seconds=compaction_conf["min_age"])
+
+        return (
+            Pack.objects(
+                state="ACTIVE",
+                created_at__lt=created_before,
+                __raw__={
+                    "$expr": {
+                        "$gte": [
+                            {"$subtract": ["$size", "$live_size"]},
+                            {"$multiply": ["$size", compaction_conf["garbage_ratio"]]},
+                        ]
+                    }
+                },
+            )
+            .order_by("created_at")
+            .limit(self.conf["max_packs"])
+        )
+
+    def _list_objects_to_seal(self) -> List[str]:
+        """
+        pack 1개에 기록할 객체 (pack_size 만큼 모이지 않았으면 가장 오래된 객체가 max_wait 를 넘긴 경우에만)
+        """
+        object_names = []
+        total_size = 0
+
+        for packed_object_vo in (
+            PackedObject.objects(pack_id=None).only("object_name", "size", "staged_at").order_by("staged_at")
+        ):
+            if total_size and total_size + packed_object_vo.size > self.conf["pack_size"]:
+                return object_names
+
+            if not object_names and packed_object_vo.staged_at > datetime.utcnow() - timedelta(
+                seconds=self.conf["max_wait"]
+            ):
+                # 가장 오래된 객체도 max_wait 를 넘기지 않았으면 pack_size 만큼 모일 때까지 대기
+                staged_size = PackedObject.objects(pack_id=None).sum("size")
+                if staged_size < self.conf["pack_size"]:
+                    return []
+
+            object_names.append(packed_object_vo.object_name)
+            total_size += packed_object_vo.size
+
+        return object_names
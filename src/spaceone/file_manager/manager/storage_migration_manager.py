@@ -0,0 +1,236 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Union
+from mongoengine import Q, QuerySet
+
+from spaceone.core.manager import BaseManager
+from spaceone.file_manager.lib.key_layout import LEGACY_KEY_LAYOUT
+from spaceone.file_manager.lib.storage_routing import get_default_backend
+from spaceone.file_manager.manager.image_derivative_manager import ImageDerivativeManager
+from spaceone.file_manager.manager.streaming_file_connector_manager import StreamingFileConnectorManager
+from spaceone.file_manager.model.file.database import File
+from spaceone.file_manager.model.user_file.database import UserFile
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StorageMigrationManager(BaseManager):
+    """
+    storage tier 간 파일 이동 / object key layout 변경 (UserFile 은 tier 규칙 대상이 아니고 inline 이동과 key layout 변경만 지원)
+    1. 대상 backend (또는 새 key layout 의 key)로 객체 복사
+    2. 조건부 업데이트로 파일 정보의 backend / key_layout 변경 (이전 값은 previous_backend / previous_key_layout 에 기록)
+    3. 진행 중인 다운로드가 끝날 수 있도록 유예 시간이 지난 뒤 이전 객체 삭제
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.file_model = File
+        self.models = {
+            "File": File,
+            "UserFile": UserFile,
+        }
+
+    def migrate_file(self, file_vo: Union[File, UserFile], target_backend: str) -> bool:
+        """
+        Returns: 이동 여부 (다른 요청이 먼저 파일을 변경했다면 복사본을 삭제하고 False)
+        """
+        source_backend = file_vo.backend
+        resource_group = self.get_resource_group(file_vo)
+        file_id = file_vo.file_id
+
+        source_mgr = StreamingFileConnectorManager(
+            backend=source_backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+        )
+        target_mgr = StreamingFileConnectorManager(
+            backend=target_backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+        )
+        target_mgr.copy_from(source_mgr, resource_group, file_id)
+
+        # derivative 는 이전 backend 에 남으므로 비우고, 필요하면 새 backend 에서 다시 생성
+        derivatives = list(file_vo.derivatives or [])
+
+        conditions = {
+            "file_id": file_id,
+            "backend": source_backend,
+            "previous_backend": None,
+            "previous_key_layout": None,
+        }
+        if isinstance(file_vo, File):
+            conditions["resource_group"] = resource_group
+
+        updated_count = file_vo.__class__.objects(**conditions).update_one(
+            set__backend=target_backend,
+            set__previous_backend=source_backend or get_default_backend(),
+            set__migrated_at=datetime.utcnow(),
+            set__derivatives=[],
+        )
+
+        if updated_count == 0:
+            _LOGGER.warning(f"[migrate_file] File changed during migration, discard copy: {file_id}")
+            target_mgr.delete_file(resource_group, file_id)
+            return False
+
+        if derivatives:
+            ImageDerivativeManager(
+                backend=source_backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+            ).delete_derivatives(resource_group, file_id, derivatives)
+
+        _LOGGER.info(f"[migrate_file] Migrated {file_id}: {source_mgr.backend} -> {target_backend}")
+        return True
+
+    def rekey_file(self, file_vo: Union[File, UserFile], target_key_layout: int) -> bool:
+        """
+        같은 backend 안에서 객체를 새 key layout 의 key 로 복사
+        Returns: 변경 여부 (다른 요청이 먼저 파일을 변경했다면 복사본을 삭제하고 False)
+        """
+        backend = file_vo.backend
+        resource_group = self.get_resource_group(file_vo)
+        file_id = file_vo.file_id
+
+        source_mgr = StreamingFileConnectorManager(
+            backend=backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+        )
+        target_mgr = StreamingFileConnectorManager(
+            backend=backend, key_layout=target_key_layout, domain_id=file_vo.domain_id
+        )
+        target_mgr.copy_from(source_mgr, resource_group, file_id)
+
+        # derivative 는 이전 key 에 남으므로 비우고, 필요하면 새 key 로 다시 생성
+        derivatives = list(file_vo.derivatives or [])
+
+        conditions = {
+            "file_id": file_id,
+            "backend": backend,
+            "key_layout": file_vo.key_layout,
+            "previous_backend": None,
+            "previous_key_layout": None,
+        }
+        if isinstance(file_vo, File):
+            conditions["resource_group"] = resource_group
+
+        updated_count = file_vo.__class__.objects(**conditions).update_one(
+            set__key_layout=target_key_layout,
+            set__previous_key_layout=file_vo.key_layout or LEGACY_KEY_LAYOUT,
+            set__migrated_at=datetime.utcnow(),
+            set__derivatives=[],
+        )
+
+        if updated_count == 0:
+            _LOGGER.warning(f"[rekey_file] File changed during rekey, discard copy: {file_id}")
+            target_mgr.delete_file(resource_group, file_id)
+            return False
+
+        if derivatives:
+            ImageDerivativeManager(
+                backend=backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+            ).delete_derivatives(resource_group, file_id, derivatives)
+
+        _LOGGER.info(
+            f"[rekey_file] Rekeyed {file_id}: key layout {file_vo.key_layout or LEGACY_KEY_LAYOUT} -> {target_key_layout}"
+        )
+        return True
+
+    def delete_previous_object(self, file_vo: Union[File, UserFile]) -> None:
+        """
+        tier 이동 / key layout 변경 후 남아있는 이전 객체 삭제
+        """
+        previous_backend = file_vo.previous_backend or file_vo.backend
+        previous_key_layout = file_vo.previous_key_layout or file_vo.key_layout
+
+        try:
+            StreamingFileConnectorManager(
+                backend=previous_backend, key_layout=previous_key_layout, domain_id=file_vo.domain_id
+            ).delete_file(self.get_resource_group(file_vo), file_vo.file_id)
+        except Exception as e:
+            _LOGGER.error(
+                f"[delete_previous_object] Failed to delete object : {file_vo.file_id} ({previous_backend}): {e}"
+            )
+            return
+
+        file_vo.__class__.objects(
+            file_id=file_vo.file_id,
+            previous_backend=file_vo.previous_backend,
+            previous_key_layout=file_vo.previous_key_layout,
+        ).update_one(set__previous_backend=None, set__previous_key_layout=None)
+
+    @staticmethod
+    def has_previous_object(file_vo: Union[File, UserFile]) -> bool:
+        return bool(file_vo.previous_backend or file_vo.previous_key_layout)
+
+    @staticmethod
+    def get_resource_group(file_vo: Union[File, UserFile]) -> str:
+        return file_vo.resource_group if isinstance(file_vo, File) else "USER"
+
+    def list_migration_targets(self, rule: dict, batch_size: int) -> QuerySet:
+        """
+        tier 규칙과 일치하는 이동 대상 파일
+        (생성 후 min_age_days 가 지나고, min_idle_days 가 있으면 그 기간 동안 접근되지 않은 파일)
+        """
+        source_backend = rule.get("source_backend", get_default_backend())
+
+        conditions = {
+            # backend 가 기록되지 않은 기존 파일은 기본 BACKEND 에 저장되어 있음
+            "backend__in": [source_backend, None] if source_backend == get_default_backend() else [source_backend],
+            "previous_backend": None,
+            "previous_key_layout": None,
+            "created_at__lt": datetime.utcnow() - timedelta(days=rule.get("min_age_days", 30)),
+        }
+
+        if "resource_groups" in rule:
+            conditions["resource_group__in"] = rule["resource_groups"]
+
+        idle_condition = Q()
+        if "min_idle_days" in rule:
+            idle_since = datetime.utcnow() - timedelta(days=rule["min_idle_days"])
+            idle_condition = Q(last_accessed_at__lt=idle_since) | Q(last_accessed_at=None)
+
+        return self.file_model.objects(idle_condition, **conditions).order_by("created_at").limit(batch_size)
+
+    def list_rekey_targets(self, target_key_layout: int, batch_size: int, resource_type: str = "File") -> QuerySet:
+        """
+        target_key_layout 이 아닌 layout 으로 저장된 파일 (기록되지 않은 기존 파일은 legacy layout)
+        """
+        key_layouts = [target_key_layout, None] if target_key_layout == LEGACY_KEY_LAYOUT else [target_key_layout]
+
+        return (
+            self.models[resource_type]
+            .objects(key_layout__nin=key_layouts, previous_backend=None, previous_key_layout=None)
+            .order_by("created_at")
+            .limit(batch_size)
+        )
+
+    def list_inline_targets(
+        self, inline_backend: str, max_size: int, batch_size: int, resource_type: str = "File"
+    ) -> QuerySet:
+        """
+        inline backend 로 옮길 파일 (max_size 이하이고 다른 backend 에 저장된 파일)
+        """
+        return (
+            self.models[resource_type]
+            .objects(
+                backend__ne=inline_backend,
+                size__lte=max_size,
+                previous_backend=None,
+                previous_key_layout=None,
+            )
+            .order_by("created_at")
+            .limit(batch_size)
+        )
+
+    def list_inline_release_targets(
+        self, inline_backend: str, max_size: int, batch_size: int, resource_type: str = "File"
+    ) -> QuerySet:
+        """
+        inline backend 에서 일반 backend 로 옮길 파일 (max_size 를 넘는 파일, max_size 가 None 이면 모든 파일)
+        """
+        conditions = {"backend": inline_backend, "previous_backend": None, "previous_key_layout": None}
+        if max_size is not None:
+            conditions["size__gt"] = max_size
+
+        return self.models[resource_type].objects(**conditions).order_by("created_at").limit(batch_size)
+
+    def list_expired_previous_objects(self, grace_period: int, batch_size: int, resource_type: str = "File") -> QuerySet:
+        return self.models[resource_type].objects(
+            Q(previous_backend__ne=None) | Q(previous_key_layout__ne=None),
+            migrated_at__lt=datetime.utcnow() - timedelta(seconds=grace_period),
+        ).limit(batch_size)
@@ -4,19 +4,37 @@ Improved Streaming File Connector Manager
 각 connector의 stream_upload_file 메서드를 활용한 구현
 """
 import logging
-from typing import Generator, BinaryIO, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, BinaryIO, Iterable, Optional, Tuple
 from io import BytesIO
 import time
 
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.file_manager.error import *
+from spaceone.file_manager.lib.memory_budget import get_memory_budget
+from spaceone.file_manager.lib.offload import get_download_offload
+from spaceone.file_manager.lib.resilience import wrap_connector
+from spaceone.file_manager.lib.size_policy import (
+    check_file_size,
+    get_max_file_size,
+    get_stream_size,
+    SizeLimitedReader,
+)
+from spaceone.file_manager.lib.storage_routing import get_default_backend
+from spaceone.file_manager.lib.stream import (
+    ChunkIteratorReader,
+    DownloadStream,
+    TransferCancellation,
+    record_cancelled_transfer,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 # 설정 상수
-DEFAULT_CHUNK_SIZE = 5 * 1024 * 1024  # 5MB
-PROGRESS_LOG_INTERVAL = 10 * 1024 * 1024  # 10MB마다 로깅
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+DEFAULT_PREFETCH_WINDOW = 4
 
 
 class StreamingFileConnectorManager(BaseManager):
@@ -25,16 +43,24 @@ class StreamingFileConnectorManager(BaseManager):
     메모리 효율적인 청크 단위 처리 + 각 connector의 네이티브 스트리밍 활용
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, backend: str = None, key_layout: int = None, domain_id: str = None, **kwargs):
         super().__init__(*args, **kwargs)
-        backend = config.get_global("BACKEND", "FileConnectorManager")
+        # 파일 정보에 기록된 backend (없으면 기본 BACKEND)
+        backend = backend or get_default_backend()
+        self.backend = backend
+        self.key_layout = key_layout
+        self.domain_id = domain_id
         connector_config = config.get_global("CONNECTORS", {}).get(backend, {})
         self.backend_type = connector_config.get("backend", backend).lower()
 
         # 동기 커넥터 초기화
         try:
             from spaceone.file_manager.connector.file_base_connector import FileBaseConnector
-            self.file_conn: FileBaseConnector = self.locator.get_connector(backend)
+            file_conn: FileBaseConnector = self.locator.get_connector(backend)
+            # 파일에 기록된 key layout 으로 object key 생성
+            file_conn.set_key_scope(key_layout, domain_id)
+            # 재시도 / hedge / circuit breaker 적용
+            self.file_conn: FileBaseConnector = wrap_connector(backend, file_conn)
         except Exception as e:
             _LOGGER.error(f"[StreamingFileConnectorManager] Failed to initialize connector {backend}: {e}")
             raise ERROR_NOT_DEFINED_FILE_BACKEND(backend=backend)
@@ -64,52 +90,125 @@ class StreamingFileConnectorManager(BaseManager):
         """
         _LOGGER.info(f"[stream_upload_file] Starting streaming upload for {file_id} (backend: {self.backend_type})")
 
+        # 크기를 알 수 있으면 업로드 전에 거부, 모르면 읽는 도중 한도 강제
+        file_stream = self._get_file_stream(file_obj)
+        file_size = get_stream_size(file_stream)
+        check_file_size(resource_group, file_size)
+
+        if file_size is None and get_max_file_size(resource_group):
+            file_obj = SizeLimitedReader(file_stream, resource_group)
+
+        # connector 전송 버퍼만큼 메모리 예산을 예약 (부족하면 다른 전송이 끝날 때까지 대기)
+        buffer_size = self.file_conn.get_upload_buffer_size(file_size)
+
         try:
-            # connector가 stream_upload_file을 지원하면 직접 사용
-            if hasattr(self.file_conn, 'stream_upload_file'):
+            with get_memory_budget().reserve(buffer_size):
                 self.file_conn.stream_upload_file(resource_group, file_id, file_obj)
-            else:
-                # stream_upload_file을 지원하지 않으면 일반 upload_file 사용
-                _LOGGER.warning(f"[stream_upload_file] Connector {type(self.file_conn).__name__} does not support stream_upload_file, falling back to upload_file")
-                self._fallback_upload(resource_group, file_id, file_obj)
 
         except Exception as e:
             _LOGGER.error(f"[stream_upload_file] Upload failed for {file_id}: {e}")
             raise
 
-    def _fallback_upload(self, resource_group: str, file_id: str, file_obj) -> None:
+    def copy_from(
+        self,
+        source_mgr: "StreamingFileConnectorManager",
+        resource_group: str,
+        file_id: str,
+        source_resource_group: str = None,
+        source_file_id: str = None,
+    ) -> int:
+        """
+        다른 backend / key layout 의 객체를 복사 (storage tier 이동, key layout 변경, domain 간 복사 용)
+        원본 위치를 지정하지 않으면 같은 resource_group, file_id 에서 복사한다.
+        이미 저장된 파일이므로 크기 정책은 다시 검사하지 않는다.
+        Returns: 복사된 전체 바이트 수
+        """
+        download_stream = source_mgr.open_download(source_resource_group or resource_group, source_file_id or file_id)
+        reader = ChunkIteratorReader(download_stream)
+
+        try:
+            with get_memory_budget().reserve(self.file_conn.get_upload_buffer_size(None)):
+                self.file_conn.stream_upload_file(resource_group, file_id, reader)
+        finally:
+            reader.close()
+            download_stream.close()
+
+        _LOGGER.info(
+            f"[copy_from] Copied {file_id} from {source_mgr.backend} to {self.backend} "
+            f"({reader.bytes_read // (1024*1024)}MB)"
+        )
+        return reader.bytes_read
+
+    def open_download(
+        self,
+        resource_group: str,
+        file_id: str,
+        byte_range: Optional[Tuple[int, Optional[int]]] = None,
+        cancellation: Optional[TransferCancellation] = None,
+    ) -> DownloadStream:
         """
-        폴백: 청크 단위로 읽어서 upload_file 사용
-        메모리 효율적 처리
+        다운로드 스트림 열기 (응답 헤더까지만 수신, 본문은 순회 시 청크 단위로 읽음)
+        반드시 close() 또는 끝까지 순회하여 연결을 반환해야 한다.
+        cancellation 이 취소되면 (클라이언트 연결 종료) 전송 중이어도 즉시 본문을 닫고 연결을 반환한다.
         """
-        _LOGGER.info(f"[_fallback_upload] Using chunked fallback upload for {file_id}")
+        memory_budget = get_memory_budget()
+        reserved = memory_budget.acquire(max(DOWNLOAD_CHUNK_SIZE, self.file_conn.get_download_buffer_size()))
 
         try:
-            chunk_size = DEFAULT_CHUNK_SIZE
-            total_size = 0
-            last_log_size = 0
+            if byte_range:
+                result = self.file_conn.download_file(resource_group, file_id, byte_range=byte_range)
+            else:
+                result = self.file_conn.download_file(resource_group, file_id)
+        except Exception:
+            memory_budget.release(reserved)
+            raise
 
-            # 파일 데이터를 청크 단위로 읽기
-            while True:
-                chunk = self._read_chunk(file_obj, chunk_size)
-                if not chunk:
-                    break
+        # 스트림을 닫을 때 예약 반환
+        download_stream = DownloadStream(
+            result, chunk_size=DOWNLOAD_CHUNK_SIZE, on_close=lambda: memory_budget.release(reserved)
+        )
 
-                # 직접 업로드
-                self.file_conn.upload_file(resource_group, file_id, chunk)
-                total_size += len(chunk)
+        if cancellation:
+            cancellation.add_callback(lambda: self._cancel_download(file_id, download_stream))
 
-                if total_size - last_log_size >= PROGRESS_LOG_INTERVAL:
-                    _LOGGER.info(f"[_fallback_upload] Uploaded {total_size // (1024*1024)}MB")
-                    last_log_size = total_size
+        return download_stream
+
+    def _cancel_download(self, file_id: str, download_stream: DownloadStream) -> None:
+        """
+        클라이언트 연결 종료 시 backend 본문 읽기 중단 (close / release_conn)
+        이미 끝까지 전송했거나 닫힌 스트림은 무시한다.
+        """
+        if download_stream.closed:
+            return
 
-            _LOGGER.info(f"[_fallback_upload] Upload completed. Total: {total_size // (1024*1024)}MB")
+        remaining = 0
+        if download_stream.content_length >= 0:
+            remaining = max(0, download_stream.content_length - download_stream.bytes_read)
 
-        except Exception as e:
-            _LOGGER.error(f"[_fallback_upload] Error: {e}")
-            raise
+        download_stream.close()
+        record_cancelled_transfer("download", remaining)
+        _LOGGER.info(
+            f"[open_download] Download cancelled by client: {file_id} ({remaining // (1024*1024)}MB not transferred)"
+        )
 
-    def download_file_stream(self, resource_group: str, file_id: str) -> Generator[bytes, None, None]:
+    def get_offload_redirect(self, resource_group: str, file_id: str) -> Optional[str]:
+        """
+        nginx 가 backend 에서 직접 전송하도록 응답할 X-Accel-Redirect 위치 (backend 가 지원하지 않으면 None)
+        """
+        download_offload = get_download_offload()
+        download_location = self.file_conn.get_download_location(resource_group, file_id, download_offload.expires_in)
+        if download_location is None:
+            return None
+
+        return download_offload.make_redirect(self.backend, download_location)
+
+    def download_file_stream(
+        self,
+        resource_group: str,
+        file_id: str,
+        byte_range: Optional[Tuple[int, Optional[int]]] = None,
+        cancellation: Optional[TransferCancellation] = None,
+    ) -> Generator[bytes, None, None]:
         """
         스트리밍 다운로드 (제너레이터로 청크 반환)
         각 connector의 download_file 메서드 활용
@@ -117,76 +216,87 @@ class StreamingFileConnectorManager(BaseManager):
         _LOGGER.info(f"[download_file_stream] Starting streaming download for {file_id}")
 
         try:
-            # connector의 download_file 메서드 호출
-            result = self.file_conn.download_file(resource_group, file_id)
-
-            # 결과 타입에 따라 청크 단위로 yield
-            chunk_size = 1024 * 1024  # 1MB
-
-            if isinstance(result, dict) and 'Body' in result:
-                # S3/MinIO 스타일 응답: {'Body': stream, 'ContentLength': size}
-                body = result['Body']
-                _LOGGER.info(f"[download_file_stream] S3-style response detected")
-
-                if isinstance(body, BytesIO):
-                    body.seek(0)  # 처음부터 읽기
-                    while True:
-                        chunk = body.read(chunk_size)
-                        if not chunk:
-                            break
-                        yield chunk
-                    body.close()
-
-                elif hasattr(body, 'read'):
-                    # 스트림 객체
-                    try:
-                        while True:
-                            chunk = body.read(chunk_size)
-                            if not chunk:
-                                break
-                            yield chunk
-                    finally:
-                        if hasattr(body, 'close'):
-                            body.close()
-                        if hasattr(body, 'release_conn'):
-                            body.release_conn()
-                else:
-                    # 기타: bytes 변환
-                    data = bytes(body)
-                    for i in range(0, len(data), chunk_size):
-                        yield data[i:i+chunk_size]
-
-            elif isinstance(result, bytes):
-                # bytes 직접 반환
-                _LOGGER.info(f"[download_file_stream] bytes response detected")
-                for i in range(0, len(result), chunk_size):
-                    yield result[i:i+chunk_size]
-
-            elif hasattr(result, 'read'):
-                # 스트림 객체
-                _LOGGER.info(f"[download_file_stream] Stream object detected")
-                try:
-                    while True:
-                        chunk = result.read(chunk_size)
-                        if not chunk:
-                            break
-                        yield chunk
-                finally:
-                    if hasattr(result, 'close'):
-                        result.close()
-                    if hasattr(result, 'release_conn'):
-                        result.release_conn()
-            else:
-                # 기타
-                _LOGGER.warning(f"[download_file_stream] Unknown result type: {type(result)}")
-                yield bytes(result)
+            download_stream = self.open_download(resource_group, file_id, byte_range, cancellation)
+            try:
+                for chunk in download_stream:
+                    yield chunk
+            finally:
+                download_stream.close()
 
             _LOGGER.info(f"[download_file_stream] Download completed")
 
         except Exception as e:
+            if cancellation and cancellation.cancelled:
+                # 클라이언트가 연결을 끊어 본문을 닫은 경우
+                return
             _LOGGER.error(f"[download_file_stream] Download failed: {e}")
             raise
 
+    def prefetch_download_streams(
+        self,
+        files: Iterable[Tuple[str, str]],
+        window: int = DEFAULT_PREFETCH_WINDOW,
+        cancellation: Optional[TransferCancellation] = None,
+    ) -> Generator[Tuple[Tuple[str, str], DownloadStream], None, None]:
+        """
+        여러 파일을 순서대로 다운로드하면서 다음 window 개 파일의 요청을 미리 열어둠
+        (backend 첫 바이트 지연을 겹쳐서 숨김)
+        열어둔 스트림은 응답 헤더만 받은 상태이므로 메모리 사용량은 window 크기에만 비례한다.
+
+        Args:
+            files: (resource_group, file_id) 또는 (resource_group, file_id, backend, key_layout, domain_id) 목록
+            window: 동시에 열어둘 최대 다운로드 수
+            cancellation: 취소되면 전송 중인 스트림과 미리 열어둔 스트림을 모두 닫음
+        Yields:
+            (files 항목, DownloadStream)
+        """
+        window = max(1, window)
+        files = iter(files)
+        pending = deque()
+        managers = {(self.backend, self.key_layout, self.domain_id): self}
+
+        def _open_download(
+            resource_group: str, file_id: str, backend: str = None, key_layout: int = None, domain_id: str = None
+        ) -> DownloadStream:
+            # 다른 backend / key layout 으로 저장된 파일은 해당 매니저로 연다
+            key = (backend or get_default_backend(), key_layout, domain_id)
+            if key not in managers:
+                managers[key] = StreamingFileConnectorManager(
+                    backend=key[0], key_layout=key_layout, domain_id=domain_id
+                )
+            return managers[key].open_download(resource_group, file_id, cancellation=cancellation)
+
+        with ThreadPoolExecutor(max_workers=window, thread_name_prefix="prefetch") as executor:
+
+            def _submit_next():
+                # 취소된 뒤에는 다음 파일을 열지 않음
+                if cancellation and cancellation.cancelled:
+                    return
+                item = next(files, None)
+                if item is not None:
+                    pending.append((item, executor.submit(_open_download, *item)))
+
+            for _ in range(window):
+                _submit_next()
+
+            try:
+                while pending:
+                    item, future = pending.popleft()
+                    _submit_next()
+                    download_stream = future.result()
+                    try:
+                        yield item, download_stream
+                    finally:
+                        download_stream.close()
+            finally:
+                # 중단된 경우 미리 열어둔 스트림 정리
+                for item, future in pending:
+                    if not future.cancel():
+                        try:
+                            future.result().close()
+                        except Exception as e:
+                            _LOGGER.debug(f"[prefetch_download_streams] Failed to open {item[1]}: {e}")
+
     # ===== 유틸리티 함수 =====
 
     def _get_file_stream(self, file_obj) -> BinaryIO:
@@ -206,24 +316,3 @@ class StreamingFileConnectorManager(BaseManager):
         else:
             # 기타: bytes를 BytesIO로 변환
             return BytesIO(file_obj)
-
-    def _read_chunk(self, file_obj, chunk_size: int) -> bytes:
-        """
-        파일 객체에서 안전하게 청크 읽기
-        FastAPI UploadFile, 파일 객체 모두 지원
-        """
-        try:
-            if hasattr(file_obj, 'file'):
-                # FastAPI UploadFile
-                chunk = file_obj.file.read(chunk_size)
-                return chunk if chunk else b''
-            elif hasattr(file_obj, 'read'):
-                # 파일 객체
-                chunk = file_obj.read(chunk_size)
-                return chunk if chunk else b''
-            else:
-                # 기타
-                return b''
-        except Exception as e:
-            _LOGGER.error(f"[_read_chunk] Error reading chunk: {e}")
-            raise
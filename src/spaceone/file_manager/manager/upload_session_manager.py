@@ -0,0 +1,129 @@
+import logging
+from datetime import datetime, timedelta
+from typing import List, Tuple, Union
+from mongoengine import QuerySet
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.file_manager.model.upload_session.database import UploadSession
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RESUMABLE_UPLOAD = {
+    "part_size": 8 * 1024 * 1024,  # 8MB
+    "expire_time": 24 * 60 * 60,  # 마지막 파트 수신 후 세션 유지 시간 (초)
+}
+
+
+class UploadSessionManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upload_session_model = UploadSession
+        self.resumable_upload_conf = {
+            **DEFAULT_RESUMABLE_UPLOAD,
+            **config.get_global("RESUMABLE_UPLOAD", {}),
+        }
+
+    def create_upload_session(self, params: dict) -> UploadSession:
+        def _rollback(vo: UploadSession) -> None:
+            _LOGGER.info(f"[ROLLBACK] Delete upload session : {vo.name} ({vo.upload_id})")
+            vo.delete()
+
+        params["expires_at"] = self.get_expires_at()
+        upload_session_vo: UploadSession = self.upload_session_model.create(params)
+        self.transaction.add_rollback(_rollback, upload_session_vo)
+
+        return upload_session_vo
+
+    def add_part(self, upload_session_vo: UploadSession, part_number: int, etag: str, size: int) -> UploadSession:
+        """
+        파트 정보 기록 (파트 별 키를 갱신하므로 동시에 여러 파트를 올려도 서로 덮어쓰지 않음)
+        같은 파트를 다시 올리면 마지막 etag 로 교체된다.
+        """
+        self.upload_session_model.objects(
+            upload_id=upload_session_vo.upload_id, state="IN_PROGRESS"
+        ).update_one(
+            **{
+                f"set__parts__{part_number}": {"etag": etag, "size": size},
+                "set__expires_at": self.get_expires_at(),
+            }
+        )
+
+        upload_session_vo.reload()
+        return upload_session_vo
+
+    def change_state(self, upload_session_vo: UploadSession, state: str, from_state: str) -> bool:
+        """
+        조건부 상태 변경 (from_state 가 아니면 다른 요청이 먼저 변경한 것이므로 False)
+        """
+        updated_count = self.upload_session_model.objects(
+            upload_id=upload_session_vo.upload_id, state=from_state
+        ).update_one(set__state=state)
+
+        if updated_count == 0:
+            return False
+
+        upload_session_vo.reload()
+        return True
+
+    @staticmethod
+    def delete_upload_session_by_vo(upload_session_vo: UploadSession) -> None:
+        upload_session_vo.delete()
+
+    def get_upload_session(self, upload_id: str, created_by: str) -> UploadSession:
+        return self.upload_session_model.get(upload_id=upload_id, created_by=created_by)
+
+    def filter_expired_upload_sessions(self) -> QuerySet:
+        return self.upload_session_model.filter(expires_at__lt=datetime.utcnow())
+
+    def get_part_size(self, file_size: int, max_parts: int, min_part_size: int) -> int:
+        """
+        backend 최대 파트 수 안에 들어오도록 파트 크기를 늘린다. (1MB 단위)
+        """
+        part_size = max(self.resumable_upload_conf["part_size"], min_part_size, -(-file_size // max_parts))
+        return -(-part_size // (1024 * 1024)) * (1024 * 1024)
+
+    def get_expires_at(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.resumable_upload_conf["expire_time"])
+
+    @staticmethod
+    def get_part_count(upload_session_vo: UploadSession) -> int:
+        return -(-upload_session_vo.size // upload_session_vo.part_size)
+
+    @staticmethod
+    def get_expected_part_size(upload_session_vo: UploadSession, part_number: int) -> int:
+        start = (part_number - 1) * upload_session_vo.part_size
+        return min(upload_session_vo.part_size, upload_session_vo.size - start)
+
+    def get_offset(self, upload_session_vo: UploadSession) -> int:
+        """
+        1번 파트부터 빠짐없이 받은 바이트 수 (클라이언트가 이어서 보낼 위치)
+        """
+        parts = upload_session_vo.parts or {}
+        offset = 0
+
+        for part_number in range(1, self.get_part_count(upload_session_vo) + 1):
+            part = parts.get(str(part_number))
+            if part is None:
+                break
+            offset += part["size"]
+
+        return offset
+
+    @staticmethod
+    def get_sorted_parts(upload_session_vo: UploadSession) -> List[Tuple[int, str]]:
+        return sorted(
+            (int(part_number), part["etag"]) for part_number, part in (upload_session_vo.parts or {}).items()
+        )
+
+    def make_session_info(self, upload_session_vo: UploadSession) -> dict:
+        return {
+            **upload_session_vo.to_dict(),
+            "part_count": self.get_part_count(upload_session_vo),
+            "offset": self.get_offset(upload_session_vo),
+            "received_parts": [part_number for part_number, _ in self.get_sorted_parts(upload_session_vo)],
+        }
+
+    @staticmethod
+    def is_expired(upload_session_vo: Union[UploadSession, dict]) -> bool:
+        return upload_session_vo["expires_at"] < datetime.utcnow()
@@ -0,0 +1,221 @@
+import logging
+from datetime import datetime
+from typing import Dict, List, Tuple, Union
+from mongoengine import NotUniqueError, Q
+
+from spaceone.core.manager import BaseManager
+from spaceone.file_manager.lib.quota import get_storage_quota
+from spaceone.file_manager.model.file.database import File
+from spaceone.file_manager.model.user_file.database import UserFile
+from spaceone.file_manager.model.usage.database import Usage
+
+_LOGGER = logging.getLogger(__name__)
+
+# scope_type 별 집계 기준 필드 (File / UserFile)
+_FILE_USAGE_GROUPS = {
+    "DOMAIN": ["domain_id"],
+    "WORKSPACE": ["domain_id", "workspace_id"],
+    "PROJECT": ["domain_id", "workspace_id", "project_id"],
+}
+_USER_FILE_USAGE_GROUPS = {
+    "DOMAIN": ["domain_id"],
+    "USER": ["domain_id", "user_id"],
+}
+_SCOPE_ID_FIELDS = {
+    "DOMAIN": "domain_id",
+    "WORKSPACE": "workspace_id",
+    "PROJECT": "project_id",
+    "USER": "user_id",
+}
+
+
+class UsageManager(BaseManager):
+    """
+    domain/workspace/project/user 별 파일 수, 전체 크기 집계
+    파일 추가/삭제/이동 시 해당 범위의 counter 를 증감하므로 조회는 문서 1건만 읽는다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.usage_model = Usage
+
+    def add_usage(self, file_vo: Union[File, UserFile], file_count: int, total_size: int) -> None:
+        usage_keys = self.get_usage_keys(file_vo)
+
+        def _rollback(keys: List[dict]) -> None:
+            _LOGGER.info(f"[ROLLBACK] Revert usage : {file_vo.file_id}")
+            self._increment(keys, -file_count, -total_size)
+
+        self._increment(usage_keys, file_count, total_size)
+        self.transaction.add_rollback(_rollback, usage_keys)
+
+    def add_usage_many(self, file_vos: List[Union[File, UserFile]]) -> None:
+        """
+        여러 파일의 사용량을 범위별로 합쳐서 반영 (같은 범위의 파일은 counter 갱신 1회)
+        """
+        usage_by_keys: Dict[str, list] = {}
+        for file_vo in file_vos:
+            usage_keys = self.get_usage_keys(file_vo)
+            usage = usage_by_keys.setdefault(repr(usage_keys), [usage_keys, 0, 0])
+            usage[1] += 1
+            usage[2] += file_vo.size or 0
+
+        def _rollback() -> None:
+            _LOGGER.info(f"[ROLLBACK] Revert usage : {len(file_vos)} files")
+            for keys, count, size in usage_by_keys.values():
+                self._increment(keys, -count, -size)
+
+        for usage_keys, file_count, total_size in usage_by_keys.values():
+            self._increment(usage_keys, file_count, total_size)
+        self.transaction.add_rollback(_rollback)
+
+    def move_usage(self, old_usage_keys: List[dict], file_vo: File) -> None:
+        """
+        범위가 바뀐 파일의 사용량을 이전 범위에서 새 범위로 이동
+        """
+        new_usage_keys = self.get_usage_keys(file_vo)
+        removed_keys = [key for key in old_usage_keys if key not in new_usage_keys]
+        added_keys = [key for key in new_usage_keys if key not in old_usage_keys]
+        size = file_vo.size or 0
+
+        def _rollback() -> None:
+            _LOGGER.info(f"[ROLLBACK] Revert usage : {file_vo.file_id}")
+            self._increment(added_keys, -1, -size)
+            self._increment(removed_keys, 1, size)
+
+        self._increment(removed_keys, -1, -size)
+        self._increment(added_keys, 1, size)
+        self.transaction.add_rollback(_rollback)
+
+    def get_usage(self, scope_type: str, scope_id: str, domain_id: str, workspace_id: str = None) -> dict:
+        conditions = {"scope_type": scope_type, "scope_id": scope_id, "domain_id": domain_id}
+        if workspace_id:
+            conditions["workspace_id"] = workspace_id
+
+        usage_vo = self.usage_model.objects(**conditions).first()
+        if usage_vo is None:
+            return {**conditions, "file_count": 0, "total_size": 0}
+
+        return usage_vo.to_dict()
+
+    def reconcile_usage(self) -> int:
+        """
+        File/UserFile 을 집계하여 counter 를 실제 값으로 보정
+        집계 도중 변경된 counter 는 다음 보정 때 반영된다.
+        Returns: 보정된 counter 수
+        """
+        started_at = datetime.utcnow()
+        actual_usage: Dict[Tuple[str, str, str], dict] = {}
+
+        for model, usage_groups in [(File, _FILE_USAGE_GROUPS), (UserFile, _USER_FILE_USAGE_GROUPS)]:
+            for scope_type, group_fields in usage_groups.items():
+                for result in self._aggregate(model, group_fields):
+                    group = result["_id"]
+                    key = (group["domain_id"], scope_type, group[_SCOPE_ID_FIELDS[scope_type]])
+                    usage = actual_usage.setdefault(
+                        key, {"file_count": 0, "total_size": 0, "workspace_id": group.get("workspace_id")}
+                    )
+                    usage["file_count"] += result["file_count"]
+                    usage["total_size"] += result["total_size"]
+
+        for (domain_id, scope_type, scope_id), usage in actual_usage.items():
+            self.usage_model.objects(domain_id=domain_id, scope_type=scope_type, scope_id=scope_id).update_one(
+                set__file_count=usage["file_count"],
+                set__total_size=usage["total_size"],
+                set__workspace_id=usage["workspace_id"],
+                set__reconciled_at=started_at,
+                upsert=True,
+            )
+
+        # 파일이 모두 삭제된 범위의 counter 정리 (집계 이후 변경된 counter 는 유지)
+        self.usage_model.objects(
+            Q(reconciled_at__lt=started_at) | Q(reconciled_at=None),
+            Q(updated_at__lt=started_at) | Q(updated_at=None),
+        ).delete()
+
+        return len(actual_usage)
+
+    def get_usage_keys(self, file_vo: Union[File, UserFile]) -> List[dict]:
+        if isinstance(file_vo, UserFile):
+            return self.make_usage_keys(file_vo.domain_id, user_id=file_vo.user_id)
+
+        return self.make_usage_keys(file_vo.domain_id, file_vo.workspace_id, file_vo.project_id)
+
+    @staticmethod
+    def make_usage_keys(
+        domain_id: str, workspace_id: str = None, project_id: str = None, user_id: str = None
+    ) -> List[dict]:
+        """
+        파일이 포함되는 사용량 범위 목록 (DOMAIN + WORKSPACE/PROJECT 또는 USER)
+        """
+        if domain_id is None:
+            return []
+
+        usage_keys = [{"domain_id": domain_id, "scope_type": "DOMAIN", "scope_id": domain_id}]
+
+        if user_id:
+            usage_keys.append({"domain_id": domain_id, "scope_type": "USER", "scope_id": user_id})
+            return usage_keys
+
+        if workspace_id and workspace_id != "*":
+            usage_keys.append(
+                {"domain_id": domain_id, "scope_type": "WORKSPACE", "scope_id": workspace_id, "workspace_id": workspace_id}
+            )
+
+            if project_id and project_id != "*":
+                usage_keys.append(
+                    {
+                        "domain_id": domain_id,
+                        "scope_type": "PROJECT",
+                        "scope_id": project_id,
+                        "workspace_id": workspace_id,
+                    }
+                )
+
+        return usage_keys
+
+    @staticmethod
+    def check_quota(usage_keys: List[dict], size: int) -> None:
+        """
+        저장 용량 제한 확인 (캐시된 counter 기준이므로 DB 조회 없이 판단)
+        """
+        get_storage_quota().check(usage_keys, size)
+
+    def _increment(self, usage_keys: List[dict], file_count: int, total_size: int) -> None:
+        now = datetime.utcnow()
+
+        for usage_key in usage_keys:
+            conditions = {key: value for key, value in usage_key.items() if key != "workspace_id"}
+            update = {
+                "inc__file_count": file_count,
+                "inc__total_size": total_size,
+                "set__workspace_id": usage_key.get("workspace_id"),
+                "set__updated_at": now,
+            }
+
+            try:
+                self.usage_model.objects(**conditions).update_one(upsert=True, **update)
+            except NotUniqueError:
+                # 같은 counter 를 동시에 처음 만드는 경우 한쪽이 실패하므로 다시 갱신
+                self.usage_model.objects(**conditions).update_one(**update)
+
+        # 용량 제한 검사에 사용하는 캐시에도 반영
+        get_storage_quota().add_usage(usage_keys, total_size)
+
+    @staticmethod
+    def _aggregate(model, group_fields: List[str]):
+        match = {field: {"$nin": [None, "*"]} for field in group_fields if field != "domain_id"}
+        match["domain_id"] = {"$ne": None}
+
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": {field: f"${field}" for field in group_fields},
+                    "file_count": {"$sum": 1},
+                    "total_size": {"$sum": {"$ifNull": ["$size", 0]}},
+                }
+            },
+        ]
+
+        return model._get_collection().aggregate(pipeline, allowDiskUse=True)
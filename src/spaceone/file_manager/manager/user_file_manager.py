@@ -46,6 +46,15 @@ class UserFileManager(BaseManager):
 
         return self.user_file_model.get(file_id=file_id, domain_id=domain_id, user_id=user_id)
 
+    def get_user_files(
+        self,
+        file_ids: list,
+        domain_id: str,
+        user_id: str,
+    ) -> QuerySet:
+
+        return self.user_file_model.filter(file_id=file_ids, domain_id=domain_id, user_id=user_id)
+
     def filter_user_files(self, **conditions) -> QuerySet:
         return self.user_file_model.filter(**conditions)
 
@@ -1,2 +1,6 @@
 from spaceone.file_manager.model.file.database import File
 from spaceone.file_manager.model.user_file.database import UserFile
+from spaceone.file_manager.model.upload_session.database import UploadSession
+from spaceone.file_manager.model.usage.database import Usage
+from spaceone.file_manager.model.inline_object.database import InlineObject
+from spaceone.file_manager.model.pack.database import Pack, PackedObject
@@ -1,23 +1,48 @@
-from typing import Union, Literal
+from typing import Union, Literal, List
 from pydantic import BaseModel
 
 
 __all__ = [
     "FileAddRequest",
+    "FileAddManyRequest",
     "FileUpdateRequest",
     "FileDeleteRequest",
     "FileGetRequest",
+    "FileGetManyRequest",
     "FileSearchQueryRequest",
     "FileStatQueryRequest",
+    "FileArchiveRequest",
+    "FileCopyRequest",
+    "FileMoveRequest",
     "ResourceGroup",
+    "ArchiveFormat",
 ]
 
 ResourceGroup = Literal["SYSTEM", "DOMAIN", "WORKSPACE", "PROJECT"]
+ArchiveFormat = Literal["zip", "tar"]
 
 
 class FileAddRequest(BaseModel):
     name: str 
     resource_group: ResourceGroup
+    size: Union[int, None] = None
+    # backend 선택용 (저장하지 않음)
+    content_type: Union[str, None] = None
+    domain_id: Union[str, None] = None
+    workspace_id: Union[str, None] = None
+    project_id: Union[str, None] = None
+
+
+class FileAddItem(BaseModel):
+    name: str
+    size: Union[int, None] = None
+    # backend 선택용 (저장하지 않음)
+    content_type: Union[str, None] = None
+
+
+class FileAddManyRequest(BaseModel):
+    files: List[FileAddItem]
+    resource_group: ResourceGroup
     domain_id: Union[str, None] = None
     workspace_id: Union[str, None] = None
     project_id: Union[str, None] = None
@@ -47,6 +72,14 @@ class FileGetRequest(BaseModel):
     user_projects: Union[list, None] = None
 
 
+class FileGetManyRequest(BaseModel):
+    file_ids: List[str]
+    domain_id: Union[list, str, None] = None
+    workspace_id: Union[list, str, None] = None
+    project_id: Union[str, None] = None
+    user_projects: Union[list, None] = None
+
+
 class FileSearchQueryRequest(BaseModel):
     query: Union[dict, None] = None
     file_id: Union[str, None] = None
@@ -64,3 +97,26 @@ class FileStatQueryRequest(BaseModel):
     domain_id: Union[list, str, None] = None
     workspace_id: Union[list, str, None] = None
     project_id: Union[str, None] = None
+
+
+class FileArchiveRequest(BaseModel):
+    file_ids: Union[List[str], None] = None
+    query: Union[dict, None] = None
+    format: ArchiveFormat = "zip"
+
+
+class FileCopyRequest(BaseModel):
+    file_id: str
+    resource_group: ResourceGroup
+    name: Union[str, None] = None
+    domain_id: Union[str, None] = None
+    workspace_id: Union[str, None] = None
+    project_id: Union[str, None] = None
+
+
+class FileMoveRequest(BaseModel):
+    file_id: str
+    resource_group: ResourceGroup
+    domain_id: Union[str, None] = None
+    workspace_id: Union[str, None] = None
+    project_id: Union[str, None] = None
@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import Union, List
+from typing import Union, List, Dict
 from pydantic import BaseModel
 
 from spaceone.core import utils, config
+from spaceone.file_manager.lib.signed_url import get_url_signer
 from spaceone.file_manager.model.file.request import ResourceGroup
 
-__all__ = ["FileResponse", "FilesResponse"]
+__all__ = ["FileResponse", "FilesResponse", "FilesByIdResponse"]
 
 
 class FileResponse(BaseModel):
@@ -18,11 +19,17 @@ class FileResponse(BaseModel):
     domain_id: Union[str, None] = None
     workspace_id: Union[str, None] = None
     project_id: Union[str, None] = None
+    size: Union[int, None] = None
+    backend: Union[str, None] = None
+    key_layout: Union[int, None] = None
+    download_count: Union[int, None] = None
+    last_accessed_at: Union[datetime, None] = None
     created_at: Union[datetime, None] = None
 
     def dict(self, *args, **kwargs):
         data = super().dict(*args, **kwargs)
         data["created_at"] = utils.datetime_to_iso8601(data["created_at"])
+        data["last_accessed_at"] = utils.datetime_to_iso8601(data["last_accessed_at"])
 
         file_manager_url = config.get_global("FILE_MANAGER_URL")
         
@@ -36,9 +43,20 @@ class FileResponse(BaseModel):
             data["download_url"] = str(file_manager_url) + "/files/project/" + data["file_id"]
         else:   
             data["download_url"] = None        
-        
+
+        # 서명된 링크는 다운로드 시 token 인증 없이 서명만 검증
+        signature = get_url_signer().sign(data, data["resource_group"]) if data["download_url"] else None
+        if signature:
+            data["download_url"] += "?sig=" + signature
+
         return data
 
 class FilesResponse(BaseModel):
     results: List[FileResponse]
     total_count: int
+
+
+class FilesByIdResponse(BaseModel):
+    # 조회되지 않은 file_id는 None
+    results: Dict[str, Union[dict, None]]
+    total_count: int
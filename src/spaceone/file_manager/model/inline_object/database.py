@@ -0,0 +1,26 @@
+import logging
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InlineObject(MongoModel):
+    # InlineConnector 에 저장된 작은 파일의 내용 (object_name 은 다른 backend 와 같은 key layout 으로 생성)
+    object_name = StringField(max_length=512, required=True, unique=True)
+    data = BinaryField(required=True)
+    size = IntField(min_value=0, required=True)
+    etag = StringField(max_length=64, required=True)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "updatable_fields": [],
+        "minimal_fields": [
+            "object_name",
+            "size",
+            "etag",
+        ],
+        "ordering": ["object_name"],
+        "indexes": [],
+    }
@@ -0,0 +1,66 @@
+import logging
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Pack(MongoModel):
+    # 작은 파일 여러 개를 이어 붙여 pack_backend 에 저장한 객체 (한 번 쓰면 변경하지 않음)
+    pack_id = StringField(max_length=40, generate_id="pack", unique=True)
+    # WRITING: 업로드 중, ACTIVE: 조회 가능, RETIRED: 유예 시간 후 삭제
+    state = StringField(max_length=20, default="WRITING", choices=("WRITING", "ACTIVE", "RETIRED"))
+    backend = StringField(max_length=255, required=True)
+    key_layout = IntField(null=True, default=None)
+    size = IntField(min_value=0, default=0)
+    object_count = IntField(min_value=0, default=0)
+    # 아직 참조되는 객체의 크기/수 (삭제되면 감소, 줄어든 만큼이 compaction 대상)
+    live_size = IntField(default=0)
+    live_count = IntField(default=0)
+    retired_at = DateTimeField(null=True, default=None)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "updatable_fields": ["state", "size", "object_count", "live_size", "live_count", "retired_at"],
+        "minimal_fields": [
+            "pack_id",
+            "state",
+            "backend",
+            "size",
+            "live_size",
+        ],
+        "ordering": ["-created_at"],
+        "indexes": [
+            "state",
+            "retired_at",
+            "created_at",
+        ],
+    }
+
+
+class PackedObject(MongoModel):
+    # PackConnector 에 저장된 객체의 위치 (object_name 은 다른 backend 와 같은 key layout 으로 생성)
+    object_name = StringField(max_length=512, required=True, unique=True)
+    # pack 에 기록되기 전에는 pack_id 가 None 이고 내용을 data 에 보관
+    pack_id = StringField(max_length=40, null=True, default=None)
+    offset = IntField(min_value=0, null=True, default=None)
+    size = IntField(min_value=0, required=True)
+    etag = StringField(max_length=64, required=True)
+    data = BinaryField(null=True, default=None)
+    staged_at = DateTimeField(null=True, default=None)
+
+    meta = {
+        "updatable_fields": [],
+        "minimal_fields": [
+            "object_name",
+            "pack_id",
+            "offset",
+            "size",
+        ],
+        "ordering": ["object_name"],
+        "indexes": [
+            "pack_id",
+            "staged_at",
+        ],
+    }
@@ -0,0 +1,51 @@
+import logging
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UploadSession(MongoModel):
+    upload_id = StringField(max_length=40, generate_id="upload", unique=True)
+    file_id = StringField(max_length=40, required=True)
+    name = StringField(max_length=255, required=True)
+    size = IntField(min_value=1, required=True)
+    part_size = IntField(min_value=1, required=True)
+    backend = StringField(max_length=255, required=True)
+    backend_upload_id = StringField(max_length=1024, required=True)
+    key_layout = IntField(null=True, default=None)
+    # {"<part_number>": {"etag": str, "size": int}}
+    parts = DictField()
+    state = StringField(
+        max_length=20, default="IN_PROGRESS", choices=("IN_PROGRESS", "COMPLETING", "COMPLETED")
+    )
+    resource_group = StringField(
+        max_length=40, choices=("SYSTEM", "DOMAIN", "WORKSPACE", "PROJECT")
+    )
+    domain_id = StringField(max_length=40, null=True, default=None)
+    workspace_id = StringField(max_length=40, null=True, default=None)
+    project_id = StringField(max_length=40, null=True, default=None)
+    created_by = StringField(max_length=255, null=True, default=None)
+    expires_at = DateTimeField(required=True)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "updatable_fields": ["parts", "state", "expires_at"],
+        "minimal_fields": [
+            "upload_id",
+            "file_id",
+            "name",
+            "size",
+            "state",
+            "resource_group",
+        ],
+        "ordering": ["-created_at"],
+        "indexes": [
+            "file_id",
+            "state",
+            "domain_id",
+            "created_by",
+            "expires_at",
+        ],
+    }
@@ -0,0 +1,47 @@
+from typing import Union
+from pydantic import BaseModel
+
+from spaceone.file_manager.model.file.request import ResourceGroup
+
+__all__ = [
+    "UploadSessionCreateRequest",
+    "UploadSessionGetRequest",
+    "UploadSessionPartCheckRequest",
+    "UploadSessionPartAddRequest",
+    "UploadSessionCompleteRequest",
+    "UploadSessionDeleteRequest",
+]
+
+
+class UploadSessionCreateRequest(BaseModel):
+    name: str
+    size: int
+    resource_group: ResourceGroup
+    domain_id: Union[str, None] = None
+    workspace_id: Union[str, None] = None
+    project_id: Union[str, None] = None
+
+
+class UploadSessionGetRequest(BaseModel):
+    upload_id: str
+
+
+class UploadSessionPartCheckRequest(BaseModel):
+    upload_id: str
+    offset: int
+    size: int
+
+
+class UploadSessionPartAddRequest(BaseModel):
+    upload_id: str
+    part_number: int
+    etag: str
+    size: int
+
+
+class UploadSessionCompleteRequest(BaseModel):
+    upload_id: str
+
+
+class UploadSessionDeleteRequest(BaseModel):
+    upload_id: str
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Union, List
+from pydantic import BaseModel
+
+from spaceone.core import utils
+from spaceone.file_manager.model.file.request import ResourceGroup
+
+__all__ = ["UploadSessionResponse", "UploadSessionPartResponse"]
+
+
+class UploadSessionResponse(BaseModel):
+    upload_id: Union[str, None] = None
+    file_id: Union[str, None] = None
+    name: Union[str, None] = None
+    size: Union[int, None] = None
+    part_size: Union[int, None] = None
+    part_count: Union[int, None] = None
+    # 앞에서부터 연속으로 받은 바이트 수 (이어서 보낼 위치)
+    offset: Union[int, None] = None
+    received_parts: List[int] = []
+    state: Union[str, None] = None
+    resource_group: Union[ResourceGroup, None] = None
+    domain_id: Union[str, None] = None
+    workspace_id: Union[str, None] = None
+    project_id: Union[str, None] = None
+    expires_at: Union[datetime, None] = None
+    created_at: Union[datetime, None] = None
+
+    def dict(self, *args, **kwargs):
+        data = super().dict(*args, **kwargs)
+        data["expires_at"] = utils.datetime_to_iso8601(data["expires_at"])
+        data["created_at"] = utils.datetime_to_iso8601(data["created_at"])
+        return data
+
+
+class UploadSessionPartResponse(BaseModel):
+    upload_id: str
+    file_id: str
+    resource_group: ResourceGroup
+    domain_id: Union[str, None] = None
+    backend: str
+    backend_upload_id: str
+    key_layout: Union[int, None] = None
+    part_number: int
@@ -0,0 +1,34 @@
+import logging
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Usage(MongoModel):
+    # 파일 추가/삭제/이동 시 증감하는 사용량 (scheduler 의 reconciler 가 주기적으로 실제 값으로 보정)
+    scope_type = StringField(max_length=20, choices=("DOMAIN", "WORKSPACE", "PROJECT", "USER"))
+    scope_id = StringField(max_length=40, required=True)
+    domain_id = StringField(max_length=40, required=True)
+    workspace_id = StringField(max_length=40, null=True, default=None)
+    file_count = IntField(default=0)
+    total_size = IntField(default=0)
+    updated_at = DateTimeField(null=True, default=None)
+    reconciled_at = DateTimeField(null=True, default=None)
+
+    meta = {
+        "updatable_fields": [],
+        "minimal_fields": [
+            "scope_type",
+            "scope_id",
+            "domain_id",
+            "file_count",
+            "total_size",
+        ],
+        "ordering": ["scope_type", "scope_id"],
+        "indexes": [
+            {"fields": ["domain_id", "scope_type", "scope_id"], "unique": True},
+            "workspace_id",
+        ],
+    }
@@ -0,0 +1,15 @@
+from typing import Union
+from pydantic import BaseModel
+
+__all__ = ["UsageGetRequest", "UserUsageGetRequest"]
+
+
+class UsageGetRequest(BaseModel):
+    domain_id: Union[str, None] = None
+    workspace_id: Union[str, None] = None
+    project_id: Union[str, None] = None
+
+
+class UserUsageGetRequest(BaseModel):
+    domain_id: Union[str, None] = None
+    user_id: Union[str, None] = None
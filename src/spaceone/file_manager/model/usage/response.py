@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Union, Literal
+from pydantic import BaseModel
+
+from spaceone.core import utils
+
+__all__ = ["UsageResponse", "UsageScopeType"]
+
+UsageScopeType = Literal["DOMAIN", "WORKSPACE", "PROJECT", "USER"]
+
+
+class UsageResponse(BaseModel):
+    scope_type: Union[UsageScopeType, None] = None
+    scope_id: Union[str, None] = None
+    domain_id: Union[str, None] = None
+    workspace_id: Union[str, None] = None
+    file_count: int = 0
+    total_size: int = 0
+    updated_at: Union[datetime, None] = None
+    reconciled_at: Union[datetime, None] = None
+
+    def dict(self, *args, **kwargs):
+        data = super().dict(*args, **kwargs)
+        data["updated_at"] = utils.datetime_to_iso8601(data["updated_at"])
+        data["reconciled_at"] = utils.datetime_to_iso8601(data["reconciled_at"])
+        return data
@@ -21,6 +21,19 @@ class UserFile(MongoModel):
     reference = EmbeddedDocumentField(UserFileReference, null=True, default=None)
     domain_id = StringField(max_length=40, null=True, default=None)
     user_id = StringField(max_length=40, null=True, default=None)
+    derivatives = ListField(StringField(max_length=40), default=[])
+    # 업로드 시 기록 (기존 파일은 None)
+    size = IntField(null=True, default=None)
+    backend = StringField(max_length=255, null=True, default=None)
+    # object key layout 버전 (기존 파일은 None: legacy layout)
+    key_layout = IntField(null=True, default=None)
+    # inline 이동 / key layout 변경 후 이전 객체의 backend, layout (유예 시간이 지나면 삭제)
+    previous_backend = StringField(max_length=255, null=True, default=None)
+    previous_key_layout = IntField(null=True, default=None)
+    migrated_at = DateTimeField(null=True, default=None)
+    # 다운로드 집계 (메모리에서 모아 주기적으로 반영되므로 최대 flush_interval 만큼 늦음)
+    download_count = IntField(default=0)
+    last_accessed_at = DateTimeField(null=True, default=None)
     created_at = DateTimeField(auto_now_add=True)
 
     meta = {
@@ -43,5 +56,11 @@ class UserFile(MongoModel):
             "reference.resource_id",
             "domain_id",
             "user_id",
+            "backend",
+            "previous_backend",
+            "key_layout",
+            "previous_key_layout",
+            "created_at",
+            "last_accessed_at",
         ],
     }
@@ -1,4 +1,4 @@
-from typing import Union, Literal
+from typing import Union, Literal, List
 from pydantic import BaseModel
 
 __all__ = [
@@ -6,12 +6,17 @@ __all__ = [
     "UserFileUpdateRequest",
     "UserFileDeleteRequest",
     "UserFileGetRequest",
+    "UserFileGetManyRequest",
     "UserFileSearchQueryRequest",
     "UserFileStatQueryRequest",
+    "UserFileArchiveRequest",
 ]
 
 class UserFileAddRequest(BaseModel):
     name: str 
+    size: Union[int, None] = None
+    # backend 선택용 (저장하지 않음)
+    content_type: Union[str, None] = None
     domain_id: Union[str, None] = None
     user_id: Union[str, None] = None
 
@@ -36,6 +41,12 @@ class UserFileGetRequest(BaseModel):
     user_id: Union[str, None] = None
 
 
+class UserFileGetManyRequest(BaseModel):
+    file_ids: List[str]
+    domain_id: Union[list, str, None] = None
+    user_id: Union[str, None] = None
+
+
 class UserFileSearchQueryRequest(BaseModel):
     query: Union[dict, None] = None
     file_id: Union[str, None] = None
@@ -50,3 +61,9 @@ class UserFileStatQueryRequest(BaseModel):
     query: dict
     domain_id: Union[list, str, None] = None
     user_id: Union[str, None] = None
+
+
+class UserFileArchiveRequest(BaseModel):
+    file_ids: Union[List[str], None] = None
+    query: Union[dict, None] = None
+    format: Literal["zip", "tar"] = "zip"
@@ -6,9 +6,24 @@ from spaceone.core.service import *
 from spaceone.file_manager.error.custom import *
 from spaceone.file_manager.model.file.request import *
 from spaceone.file_manager.model.file.response import *
+from spaceone.file_manager.model.upload_session.request import *
+from spaceone.file_manager.model.upload_session.response import *
+from spaceone.file_manager.model.usage.request import *
+from spaceone.file_manager.model.usage.response import *
+from spaceone.file_manager.lib.key_layout import get_key_layout
+from spaceone.file_manager.lib.memory_budget import get_transfer_max_bytes
+from spaceone.file_manager.lib.size_policy import check_file_size
+from spaceone.file_manager.lib.storage_routing import get_default_backend, get_inline_storage_conf, select_backend
 from spaceone.file_manager.manager.file_manager import FileManager
 from spaceone.file_manager.manager.file_connector_manager import FileConnectorManager
+from spaceone.file_manager.manager.file_lifecycle_manager import FileLifecycleManager
 from spaceone.file_manager.manager.identity_manager import IdentityManager
+from spaceone.file_manager.manager.image_derivative_manager import ImageDerivativeManager
+from spaceone.file_manager.manager.pack_manager import PackManager
+from spaceone.file_manager.manager.storage_migration_manager import StorageMigrationManager
+from spaceone.file_manager.manager.streaming_file_connector_manager import StreamingFileConnectorManager
+from spaceone.file_manager.manager.upload_session_manager import UploadSessionManager
+from spaceone.file_manager.manager.usage_manager import UsageManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +39,8 @@ class FileService(BaseService):
         super().__init__(*args, **kwargs)
         self.file_mgr = FileManager()
         self.identity_mgr = IdentityManager()
+        self.upload_session_mgr = UploadSessionManager()
+        self.usage_mgr = UsageManager()
 
     @transaction(
         permission="file-manager:File.write",
@@ -44,6 +61,8 @@ class FileService(BaseService):
                 'reference': 'dict',
                 'tags': 'dict',
                 'resource_group': 'str',    # required
+                'size': 'int',
+                'content_type': 'str',      # backend 선택용
                 'domain_id': 'str'          # injected from auth
                 'workspace_id': 'str',      # injected from auth
                 'project_id': 'str'         # injected from auth
@@ -53,37 +72,77 @@ class FileService(BaseService):
             FileResponse:
         """
 
-        role_type = self.transaction.get_meta("authorization.role_type")
-        
-        if role_type == "SYSTEM_ADMIN":
-            resource_group = "SYSTEM"
-        elif role_type == "DOMAIN_ADMIN":
-            resource_group = "DOMAIN"
-        elif role_type == "WORKSPACE_OWNER" or role_type == "WORKSPACE_MEMBER":
-            resource_group = "WORKSPACE"
-        else:
-            raise ERROR_PERMISSION_DENIED()
-        
-        if resource_group == "SYSTEM":
-            params.domain_id = "*"
-            params.workspace_id = "*"
-            params.project_id = "*"
-        elif resource_group == "DOMAIN":
-            params.workspace_id = "*"
-            params.project_id = "*"
-        elif resource_group == "WORKSPACE" :
-            self.identity_mgr.check_workspace(params.workspace_id, params.domain_id)
-            params.project_id = "*"
-        elif resource_group == "PROJECT":
-            if not params.project_id:
-                params.project_id = "*"
-            else :
-                self.identity_mgr.get_project(params.project_id, params.domain_id)
+        self._set_upload_scope(params)
 
+        # 선언된 크기로 검사하고 파일 정보 생성 시 사용량에 반영 (크기가 없으면 이미 한도를 넘었는지만 확인)
+        usage_keys = self.usage_mgr.make_usage_keys(params.domain_id, params.workspace_id, params.project_id)
+        self.usage_mgr.check_quota(usage_keys, params.size or 0)
+
+        backend = select_backend(params.resource_group, params.domain_id, params.size, params.content_type)
+        file_vo = self.file_mgr.create_file(
+            {**params.dict(exclude={"content_type"}), "backend": backend, "key_layout": get_key_layout().version}
+        )
+        self.usage_mgr.add_usage(file_vo, 1, file_vo.size or 0)
 
-        file_vo = self.file_mgr.create_file(params.dict())
         return FileResponse(**file_vo.to_dict())
 
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def add_many(self, params: FileAddManyRequest) -> Union[FilesResponse, dict]:
+        """Add multiple files in one request (batch upload)
+
+        Args:
+            params (FileAddManyRequest): {
+                'files': 'list',            # required, [{'name': 'str', 'size': 'int', 'content_type': 'str'}]
+                'resource_group': 'str',    # required
+                'domain_id': 'str'          # injected from auth
+                'workspace_id': 'str',      # injected from auth
+                'project_id': 'str'         # injected from auth
+            }
+
+        Returns:
+            FilesResponse: 요청한 files 순서와 같은 순서
+        """
+
+        max_count = config.get_global("MAX_BATCH_UPLOAD_FILE_COUNT", 100)
+        if len(params.files) > max_count:
+            raise ERROR_INVALID_PARAMETER(key="files", reason=f"Too many files. (max = {max_count})")
+
+        # 권한/범위 확인은 파일 수와 관계없이 1회
+        self._set_upload_scope(params)
+
+        usage_keys = self.usage_mgr.make_usage_keys(params.domain_id, params.workspace_id, params.project_id)
+        self.usage_mgr.check_quota(usage_keys, sum(item.size or 0 for item in params.files))
+
+        scope = params.dict(exclude={"files"})
+        key_layout = get_key_layout().version
+        file_vos = self.file_mgr.create_files(
+            [
+                {
+                    **scope,
+                    "name": item.name,
+                    "size": item.size,
+                    "backend": select_backend(params.resource_group, params.domain_id, item.size, item.content_type),
+                    "key_layout": key_layout,
+                }
+                for item in params.files
+            ]
+        )
+        self.usage_mgr.add_usage_many(file_vos)
+
+        # download_url 을 포함하도록 파일별 응답으로 변환
+        return FilesResponse(
+            results=[FileResponse(**file_vo.to_dict()).dict() for file_vo in file_vos], total_count=len(file_vos)
+        )
+
     @transaction(
         permission="file-manager:File.write",
         role_types=[
@@ -161,14 +220,885 @@ class FileService(BaseService):
         file_id = file_vo["file_id"]
         
         try:
-            file_conn_mgr = FileConnectorManager()
+            file_conn_mgr = FileConnectorManager(
+                backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+            )
             file_conn_mgr.delete_file(resource_group, file_id)
         except Exception as e:
             logging.error(f'[ERROR] Failed to delete file : {file_vo.name} ({file_vo.file_id})')
             raise ERROR_FILE_DELETE_FAILED(file_id=file_id)
 
+        if file_vo.derivatives:
+            ImageDerivativeManager(
+                backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+            ).delete_derivatives(resource_group, file_id, file_vo.derivatives)
+
+        if StorageMigrationManager.has_previous_object(file_vo):
+            # tier 이동 / key layout 변경 후 아직 정리되지 않은 이전 객체
+            StorageMigrationManager().delete_previous_object(file_vo)
+
+        self.usage_mgr.add_usage(file_vo, -1, -(file_vo.size or 0))
         self.file_mgr.delete_file_by_vo(file_vo)
 
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def copy(self, params: FileCopyRequest) -> Union[FileResponse, dict]:
+        """Copy file to resource group (server-side copy)
+
+        Args:
+            params (FileCopyRequest): {
+                'file_id': 'str',           # required
+                'resource_group': 'str',    # required
+                'name': 'str',
+                'domain_id': 'str'          # injected from auth
+                'workspace_id': 'str',      # injected from auth
+                'project_id': 'str'         # injected from auth
+            }
+
+        Returns:
+            FileResponse:
+        """
+
+        # SYSTEM 파일(템플릿)도 복사 원본으로 사용할 수 있도록 get 과 동일한 범위로 조회
+        file_vo = self.file_mgr.get_file(
+            params.file_id,
+            [params.domain_id, "*"],
+            [params.workspace_id, "*"] if params.workspace_id else None,
+        )
+
+        scope = self._get_target_scope(params.resource_group, params)
+
+        usage_keys = self.usage_mgr.make_usage_keys(scope["domain_id"], scope["workspace_id"], scope["project_id"])
+        self.usage_mgr.check_quota(usage_keys, file_vo.size or 0)
+
+        new_file_vo = self.file_mgr.create_file(
+            {
+                "name": params.name or file_vo.name,
+                "tags": file_vo.tags,
+                "reference": file_vo.reference.to_dict() if file_vo.reference else None,
+                "resource_group": params.resource_group,
+                "size": file_vo.size,
+                # server-side 복사이므로 원본과 같은 backend
+                "backend": file_vo.backend,
+                "key_layout": get_key_layout().version,
+                **scope,
+            }
+        )
+
+        key_layout = get_key_layout()
+        try:
+            if key_layout.get_key_scope(file_vo.key_layout, file_vo.domain_id) == key_layout.get_key_scope(
+                new_file_vo.key_layout, new_file_vo.domain_id
+            ):
+                file_conn_mgr = FileConnectorManager(
+                    backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+                )
+                file_conn_mgr.copy_file(
+                    file_vo.resource_group,
+                    file_vo.file_id,
+                    new_file_vo.resource_group,
+                    new_file_vo.file_id,
+                )
+            else:
+                # key layout 이나 key 에 포함된 domain 이 다르면 같은 connector 로 복사할 수 없으므로 스트림 복사
+                StreamingFileConnectorManager(
+                    backend=new_file_vo.backend, key_layout=new_file_vo.key_layout, domain_id=new_file_vo.domain_id
+                ).copy_from(
+                    StreamingFileConnectorManager(
+                        backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+                    ),
+                    new_file_vo.resource_group,
+                    new_file_vo.file_id,
+                    file_vo.resource_group,
+                    file_vo.file_id,
+                )
+        except Exception as e:
+            _LOGGER.error(f"[copy] Failed to copy file : {file_vo.name} ({file_vo.file_id}): {e}")
+            # 객체가 없는 파일 정보가 남지 않도록 정리 (사용량은 복사 성공 후에만 반영)
+            try:
+                self.file_mgr.delete_file_by_vo(new_file_vo)
+            except Exception as delete_error:
+                _LOGGER.error(f"[copy] Failed to cleanup file record : {new_file_vo.file_id}: {delete_error}")
+            raise ERROR_FILE_COPY_FAILED(file_id=file_vo.file_id)
+
+        self.usage_mgr.add_usage(new_file_vo, 1, new_file_vo.size or 0)
+
+        return FileResponse(**new_file_vo.to_dict())
+
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def move(self, params: FileMoveRequest) -> Union[FileResponse, dict]:
+        """Move file to resource group (server-side copy + delete)
+
+        Args:
+            params (FileMoveRequest): {
+                'file_id': 'str',           # required
+                'resource_group': 'str',    # required
+                'domain_id': 'str'          # injected from auth
+                'workspace_id': 'str',      # injected from auth
+                'project_id': 'str'         # injected from auth
+            }
+
+        Returns:
+            FileResponse:
+        """
+
+        file_vo = self.file_mgr.get_file(
+            params.file_id,
+            params.domain_id,
+            params.workspace_id,
+            params.project_id,
+        )
+
+        src_resource_group = file_vo.resource_group
+        scope = self._get_target_scope(params.resource_group, params)
+        usage_keys = self.usage_mgr.get_usage_keys(file_vo)
+
+        # 새로 포함되는 범위(다른 workspace/project)의 용량 제한 확인
+        target_usage_keys = self.usage_mgr.make_usage_keys(
+            scope["domain_id"], scope["workspace_id"], scope["project_id"]
+        )
+        self.usage_mgr.check_quota(
+            [usage_key for usage_key in target_usage_keys if usage_key not in usage_keys], file_vo.size or 0
+        )
+
+        if StorageMigrationManager.has_previous_object(file_vo) and src_resource_group != params.resource_group:
+            # 이전 객체는 현재 resource_group 경로로 정리해야 하므로 이동 전에 삭제
+            StorageMigrationManager().delete_previous_object(file_vo)
+
+        if src_resource_group == params.resource_group:
+            # object key 가 바뀌지 않으므로 문서만 변경
+            moved_file_vo = self.file_mgr.move_file_by_vo(
+                {"resource_group": params.resource_group, **scope}, file_vo
+            )
+            if moved_file_vo is None:
+                raise ERROR_FILE_MOVE_CONFLICT(file_id=file_vo.file_id)
+
+            self.usage_mgr.move_usage(usage_keys, moved_file_vo)
+            return FileResponse(**moved_file_vo.to_dict())
+
+        file_conn_mgr = FileConnectorManager(
+            backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+        )
+
+        try:
+            file_conn_mgr.copy_file(
+                src_resource_group, file_vo.file_id, params.resource_group, file_vo.file_id
+            )
+        except Exception as e:
+            _LOGGER.error(f"[move] Failed to copy file : {file_vo.name} ({file_vo.file_id}): {e}")
+            raise ERROR_FILE_MOVE_FAILED(file_id=file_vo.file_id)
+
+        # derivative 는 이전 resource_group 경로에 남으므로 이동 후 다시 생성
+        derivatives = list(file_vo.derivatives or [])
+
+        try:
+            moved_file_vo = self.file_mgr.move_file_by_vo(
+                {"resource_group": params.resource_group, **scope, "derivatives": []}, file_vo
+            )
+        except Exception as e:
+            _LOGGER.error(f"[move] Failed to update file : {file_vo.name} ({file_vo.file_id}): {e}")
+            moved_file_vo = None
+
+        if moved_file_vo is None:
+            # 문서 변경 실패 시 복사한 객체 정리 (원본은 그대로 유지)
+            file_conn_mgr.delete_file(params.resource_group, file_vo.file_id)
+            raise ERROR_FILE_MOVE_CONFLICT(file_id=file_vo.file_id)
+
+        self.usage_mgr.move_usage(usage_keys, moved_file_vo)
+
+        try:
+            file_conn_mgr.delete_file(src_resource_group, file_vo.file_id)
+        except Exception as e:
+            _LOGGER.error(f"[move] Failed to delete source object : {file_vo.file_id} ({src_resource_group}): {e}")
+
+        if derivatives:
+            ImageDerivativeManager(
+                backend=file_vo.backend, key_layout=file_vo.key_layout, domain_id=file_vo.domain_id
+            ).delete_derivatives(src_resource_group, file_vo.file_id, derivatives)
+
+        return FileResponse(**moved_file_vo.to_dict())
+
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def create_upload_session(self, params: UploadSessionCreateRequest) -> Union[UploadSessionResponse, dict]:
+        """Create resumable upload session
+
+        Args:
+            params (UploadSessionCreateRequest): {
+                'name': 'str',              # required
+                'size': 'int',              # required
+                'resource_group': 'str',    # required
+                'domain_id': 'str'          # injected from auth
+                'workspace_id': 'str',      # injected from auth
+                'project_id': 'str'         # injected from auth
+            }
+
+        Returns:
+            UploadSessionResponse:
+        """
+
+        if params.size <= 0:
+            raise ERROR_INVALID_PARAMETER(key="size", reason="Size must be greater than 0.")
+
+        self._set_upload_scope(params)
+        check_file_size(params.resource_group, params.size)
+        self.usage_mgr.check_quota(
+            self.usage_mgr.make_usage_keys(params.domain_id, params.workspace_id, params.project_id), params.size
+        )
+
+        # inline backend 는 multipart 를 지원하지 않음 (작은 파일은 inline 이동 작업에서 옮겨짐)
+        backend = select_backend(params.resource_group, params.domain_id, params.size, allow_inline=False)
+        key_layout = get_key_layout().version
+        file_conn_mgr = FileConnectorManager(backend=backend, key_layout=key_layout, domain_id=params.domain_id)
+
+        # 라우팅 규칙의 backend 가 multipart 를 지원하지 않으면 (PackConnector 등) 기본 backend 에 저장
+        if not file_conn_mgr.supports_multipart_upload():
+            _LOGGER.debug(f"[create_upload_session] {backend} does not support multipart upload, use default backend")
+            backend = get_default_backend()
+            file_conn_mgr = FileConnectorManager(backend=backend, key_layout=key_layout, domain_id=params.domain_id)
+            if not file_conn_mgr.supports_multipart_upload():
+                raise ERROR_UPLOAD_SESSION_NOT_SUPPORTED(backend=backend)
+        min_part_size, max_parts = file_conn_mgr.get_multipart_limits()
+        part_size = self.upload_session_mgr.get_part_size(params.size, max_parts, min_part_size)
+
+        # 파트 1개는 요청 본문으로 메모리에 올라오므로 전송당 메모리 예산을 넘을 수 없음
+        if part_size > get_transfer_max_bytes():
+            raise ERROR_INVALID_PARAMETER(key="size", reason="File is too large for resumable upload.")
+
+        # 파일 정보는 완료 시 생성하고, object key 를 위해 file_id 만 미리 발급
+        file_id = utils.generate_id("file")
+        backend_upload_id = file_conn_mgr.create_multipart_upload(params.resource_group, file_id)
+
+        try:
+            upload_session_vo = self.upload_session_mgr.create_upload_session(
+                {
+                    "file_id": file_id,
+                    "name": params.name,
+                    "size": params.size,
+                    "part_size": part_size,
+                    "backend": backend,
+                    "backend_upload_id": backend_upload_id,
+                    "key_layout": key_layout,
+                    "resource_group": params.resource_group,
+                    "domain_id": params.domain_id,
+                    "workspace_id": params.workspace_id,
+                    "project_id": params.project_id,
+                    "created_by": self._get_user_id(),
+                }
+            )
+        except Exception:
+            file_conn_mgr.abort_multipart_upload(params.resource_group, file_id, backend_upload_id)
+            raise
+
+        return UploadSessionResponse(**self.upload_session_mgr.make_session_info(upload_session_vo))
+
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def get_upload_session(self, params: UploadSessionGetRequest) -> Union[UploadSessionResponse, dict]:
+        """Get resumable upload session (progress)
+
+        Args:
+            params (UploadSessionGetRequest): {
+                'upload_id': 'str',         # required
+            }
+
+        Returns:
+            UploadSessionResponse:
+        """
+
+        upload_session_vo = self.upload_session_mgr.get_upload_session(params.upload_id, self._get_user_id())
+        return UploadSessionResponse(**self.upload_session_mgr.make_session_info(upload_session_vo))
+
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def check_upload_session_part(
+        self, params: UploadSessionPartCheckRequest
+    ) -> Union[UploadSessionPartResponse, dict]:
+        """Check part offset/size before uploading it to backend
+
+        Args:
+            params (UploadSessionPartCheckRequest): {
+                'upload_id': 'str',         # required
+                'offset': 'int',            # required
+                'size': 'int',              # required
+            }
+
+        Returns:
+            UploadSessionPartResponse:
+        """
+
+        upload_session_vo = self.upload_session_mgr.get_upload_session(params.upload_id, self._get_user_id())
+        self._check_upload_session_in_progress(upload_session_vo)
+
+        # 파트 경계에서만 이어 보낼 수 있음 (같은 offset 재전송은 해당 파트를 교체)
+        part_size = upload_session_vo.part_size
+        if params.offset % part_size != 0 or not 0 <= params.offset < upload_session_vo.size:
+            raise ERROR_UPLOAD_OFFSET_MISMATCH(offset=params.offset, part_size=part_size)
+
+        part_number = params.offset // part_size + 1
+        self._check_upload_part_size(upload_session_vo, part_number, params.size)
+
+        return UploadSessionPartResponse(
+            upload_id=upload_session_vo.upload_id,
+            file_id=upload_session_vo.file_id,
+            resource_group=upload_session_vo.resource_group,
+            domain_id=upload_session_vo.domain_id,
+            backend=upload_session_vo.backend,
+            backend_upload_id=upload_session_vo.backend_upload_id,
+            key_layout=upload_session_vo.key_layout,
+            part_number=part_number,
+        )
+
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def add_upload_session_part(self, params: UploadSessionPartAddRequest) -> Union[UploadSessionResponse, dict]:
+        """Record uploaded part
+
+        Args:
+            params (UploadSessionPartAddRequest): {
+                'upload_id': 'str',         # required
+                'part_number': 'int',       # required
+                'etag': 'str',              # required
+                'size': 'int',              # required
+            }
+
+        Returns:
+            UploadSessionResponse:
+        """
+
+        upload_session_vo = self.upload_session_mgr.get_upload_session(params.upload_id, self._get_user_id())
+        self._check_upload_session_in_progress(upload_session_vo)
+        self._check_upload_part_size(upload_session_vo, params.part_number, params.size)
+
+        upload_session_vo = self.upload_session_mgr.add_part(
+            upload_session_vo, params.part_number, params.etag, params.size
+        )
+
+        return UploadSessionResponse(**self.upload_session_mgr.make_session_info(upload_session_vo))
+
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def complete_upload_session(self, params: UploadSessionCompleteRequest) -> Union[FileResponse, dict]:
+        """Complete resumable upload session and create file
+
+        Args:
+            params (UploadSessionCompleteRequest): {
+                'upload_id': 'str',         # required
+            }
+
+        Returns:
+            FileResponse:
+        """
+
+        upload_session_vo = self.upload_session_mgr.get_upload_session(params.upload_id, self._get_user_id())
+
+        if upload_session_vo.state == "COMPLETED":
+            # 완료 응답을 받지 못한 클라이언트의 재요청은 생성된 파일을 그대로 반환
+            file_vo = self.file_mgr.get_file(upload_session_vo.file_id, upload_session_vo.domain_id)
+            return FileResponse(**file_vo.to_dict())
+
+        self._check_upload_session_in_progress(upload_session_vo)
+
+        offset = self.upload_session_mgr.get_offset(upload_session_vo)
+        if offset != upload_session_vo.size:
+            raise ERROR_UPLOAD_SESSION_INCOMPLETE(
+                upload_id=upload_session_vo.upload_id, offset=offset, size=upload_session_vo.size
+            )
+
+        # 동시에 들어온 complete 요청 중 하나만 진행
+        if not self.upload_session_mgr.change_state(upload_session_vo, "COMPLETING", "IN_PROGRESS"):
+            upload_session_vo.reload()
+            raise ERROR_UPLOAD_SESSION_NOT_IN_PROGRESS(
+                upload_id=upload_session_vo.upload_id, state=upload_session_vo.state
+            )
+
+        try:
+            file_conn_mgr = FileConnectorManager(
+                backend=upload_session_vo.backend,
+                key_layout=upload_session_vo.key_layout,
+                domain_id=upload_session_vo.domain_id,
+            )
+            file_conn_mgr.complete_multipart_upload(
+                upload_session_vo.resource_group,
+                upload_session_vo.file_id,
+                upload_session_vo.backend_upload_id,
+                self.upload_session_mgr.get_sorted_parts(upload_session_vo),
+            )
+        except Exception as e:
+            _LOGGER.error(
+                f"[complete_upload_session] Failed to complete upload : {upload_session_vo.name} ({upload_session_vo.upload_id}): {e}"
+            )
+            self.upload_session_mgr.change_state(upload_session_vo, "IN_PROGRESS", "COMPLETING")
+            raise ERROR_FILE_UPLOAD_FAILED(name=upload_session_vo.name)
+
+        file_vo = self.file_mgr.create_file(
+            {
+                "file_id": upload_session_vo.file_id,
+                "name": upload_session_vo.name,
+                "resource_group": upload_session_vo.resource_group,
+                "domain_id": upload_session_vo.domain_id,
+                "workspace_id": upload_session_vo.workspace_id,
+                "project_id": upload_session_vo.project_id,
+                "size": upload_session_vo.size,
+                "backend": upload_session_vo.backend,
+                "key_layout": upload_session_vo.key_layout,
+            }
+        )
+        self.usage_mgr.add_usage(file_vo, 1, file_vo.size)
+
+        # 세션은 만료 시까지 남겨 두어 complete 재요청에 응답
+        self.upload_session_mgr.change_state(upload_session_vo, "COMPLETED", "COMPLETING")
+
+        return FileResponse(**file_vo.to_dict())
+
+    @transaction(
+        permission="file-manager:File.write",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def delete_upload_session(self, params: UploadSessionDeleteRequest) -> None:
+        """Abort resumable upload session
+
+        Args:
+            params (UploadSessionDeleteRequest): {
+                'upload_id': 'str',         # required
+            }
+
+        Returns:
+            None:
+        """
+
+        upload_session_vo = self.upload_session_mgr.get_upload_session(params.upload_id, self._get_user_id())
+
+        if upload_session_vo.state == "COMPLETING":
+            raise ERROR_UPLOAD_SESSION_NOT_IN_PROGRESS(
+                upload_id=upload_session_vo.upload_id, state=upload_session_vo.state
+            )
+
+        if upload_session_vo.state == "IN_PROGRESS":
+            file_conn_mgr = FileConnectorManager(
+                backend=upload_session_vo.backend,
+                key_layout=upload_session_vo.key_layout,
+                domain_id=upload_session_vo.domain_id,
+            )
+            file_conn_mgr.abort_multipart_upload(
+                upload_session_vo.resource_group,
+                upload_session_vo.file_id,
+                upload_session_vo.backend_upload_id,
+            )
+
+        self.upload_session_mgr.delete_upload_session_by_vo(upload_session_vo)
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def cleanup_upload_sessions(self, params: dict) -> None:
+        """Abort and delete expired upload sessions (scheduled task)
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None:
+        """
+
+        deleted_count = 0
+
+        for upload_session_vo in self.upload_session_mgr.filter_expired_upload_sessions():
+            resource_group = upload_session_vo.resource_group
+            file_id = upload_session_vo.file_id
+
+            try:
+                file_conn_mgr = FileConnectorManager(
+                    backend=upload_session_vo.backend,
+                    key_layout=upload_session_vo.key_layout,
+                    domain_id=upload_session_vo.domain_id,
+                )
+                if upload_session_vo.state != "COMPLETED":
+                    file_conn_mgr.abort_multipart_upload(
+                        resource_group, file_id, upload_session_vo.backend_upload_id
+                    )
+
+                # 완료 도중 중단되어 파일 정보 없이 객체만 남은 경우
+                if upload_session_vo.state == "COMPLETING" and self.file_mgr.filter_files(file_id=file_id).count() == 0:
+                    if file_conn_mgr.check_file(resource_group, file_id):
+                        file_conn_mgr.delete_file(resource_group, file_id)
+
+                self.upload_session_mgr.delete_upload_session_by_vo(upload_session_vo)
+                deleted_count += 1
+            except Exception as e:
+                _LOGGER.error(
+                    f"[cleanup_upload_sessions] Failed to clean up upload session : {upload_session_vo.upload_id}: {e}"
+                )
+
+        if deleted_count:
+            _LOGGER.info(f"[cleanup_upload_sessions] Deleted {deleted_count} expired upload sessions")
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def migrate_storage_tiers(self, params: dict) -> None:
+        """Move files between storage tiers by STORAGE_TIERING rules (scheduled task)
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None:
+        """
+
+        tiering_conf = config.get_global("STORAGE_TIERING", {})
+        batch_size = tiering_conf.get("batch_size", 100)
+        grace_period = tiering_conf.get("delete_grace_period", 3600)
+        storage_migration_mgr = StorageMigrationManager()
+
+        # 유예 시간이 지난 이전 객체 정리
+        for file_vo in storage_migration_mgr.list_expired_previous_objects(grace_period, batch_size):
+            storage_migration_mgr.delete_previous_object(file_vo)
+
+        for rule in tiering_conf.get("rules", []):
+            migrated_count = 0
+
+            for file_vo in storage_migration_mgr.list_migration_targets(rule, batch_size):
+                try:
+                    if storage_migration_mgr.migrate_file(file_vo, rule["target_backend"]):
+                        migrated_count += 1
+                except Exception as e:
+                    _LOGGER.error(f"[migrate_storage_tiers] Failed to migrate file : {file_vo.file_id}: {e}")
+
+            if migrated_count:
+                _LOGGER.info(
+                    f"[migrate_storage_tiers] Migrated {migrated_count} files to {rule['target_backend']}"
+                )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def migrate_inline_storage(self, params: dict) -> None:
+        """Move File/UserFile objects between the inline backend and other backends by INLINE_STORAGE (scheduled task)
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None:
+        """
+
+        inline_conf = get_inline_storage_conf()
+        inline_backend = inline_conf["backend"]
+        batch_size = inline_conf["batch_size"]
+        storage_migration_mgr = StorageMigrationManager()
+
+        # 유예 시간이 지난 이전 객체 정리 (STORAGE_TIERING 과 같은 유예 시간 사용)
+        grace_period = config.get_global("STORAGE_TIERING", {}).get("delete_grace_period", 3600)
+        # 비활성화되었으면 inline 에 남은 파일을 모두 내보냄
+        max_size = inline_conf["max_size"] if inline_conf["enabled"] else None
+
+        for resource_type in ["File", "UserFile"]:
+            for file_vo in storage_migration_mgr.list_expired_previous_objects(grace_period, batch_size, resource_type):
+                storage_migration_mgr.delete_previous_object(file_vo)
+
+            targets = [
+                (file_vo, None)
+                for file_vo in storage_migration_mgr.list_inline_release_targets(
+                    inline_backend, max_size, batch_size, resource_type
+                )
+            ]
+            if inline_conf["enabled"]:
+                targets.extend(
+                    (file_vo, inline_backend)
+                    for file_vo in storage_migration_mgr.list_inline_targets(
+                        inline_backend, max_size, batch_size, resource_type
+                    )
+                )
+
+            migrated_count = 0
+
+            for file_vo, target_backend in targets:
+                # 일반 backend 는 업로드와 같은 STORAGE_ROUTING 규칙으로 선택
+                resource_group = storage_migration_mgr.get_resource_group(file_vo)
+                target_backend = target_backend or select_backend(
+                    resource_group, file_vo.domain_id, file_vo.size, allow_inline=False
+                )
+
+                try:
+                    if storage_migration_mgr.migrate_file(file_vo, target_backend):
+                        migrated_count += 1
+                except Exception as e:
+                    _LOGGER.error(f"[migrate_inline_storage] Failed to migrate {resource_type} : {file_vo.file_id}: {e}")
+
+            if migrated_count:
+                _LOGGER.info(
+                    f"[migrate_inline_storage] Migrated {migrated_count} {resource_type}s "
+                    f"(inline backend = {inline_backend})"
+                )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def pack_small_files(self, params: dict) -> None:
+        """Write staged small files into pack objects and compact sparse packs by PACKING settings (scheduled task)
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None:
+        """
+
+        pack_mgr = PackManager()
+
+        sealed_count = pack_mgr.seal_packs()
+        compacted_count = pack_mgr.compact_packs()
+        deleted_count = pack_mgr.delete_retired_packs()
+
+        if sealed_count or compacted_count or deleted_count:
+            _LOGGER.info(
+                f"[pack_small_files] Sealed {sealed_count}, compacted {compacted_count}, deleted {deleted_count} packs"
+            )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def rekey_files(self, params: dict) -> None:
+        """Move File/UserFile objects stored with previous key layouts to KEY_LAYOUT.version (scheduled task)
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None:
+        """
+
+        key_layout = get_key_layout()
+        rekey_conf = key_layout.conf["rekey"]
+        storage_migration_mgr = StorageMigrationManager()
+
+        for resource_type in ["File", "UserFile"]:
+            # 유예 시간이 지난 이전 객체 정리
+            for file_vo in storage_migration_mgr.list_expired_previous_objects(
+                rekey_conf["delete_grace_period"], rekey_conf["batch_size"], resource_type
+            ):
+                storage_migration_mgr.delete_previous_object(file_vo)
+
+            rekeyed_count = 0
+
+            for file_vo in storage_migration_mgr.list_rekey_targets(
+                key_layout.version, rekey_conf["batch_size"], resource_type
+            ):
+                try:
+                    if storage_migration_mgr.rekey_file(file_vo, key_layout.version):
+                        rekeyed_count += 1
+                except Exception as e:
+                    _LOGGER.error(f"[rekey_files] Failed to rekey {resource_type} : {file_vo.file_id}: {e}")
+
+            if rekeyed_count:
+                _LOGGER.info(
+                    f"[rekey_files] Rekeyed {rekeyed_count} {resource_type}s to key layout {key_layout.version}"
+                )
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def reconcile_usage(self, params: dict) -> None:
+        """Correct usage counters from File/UserFile aggregation (scheduled task)
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None:
+        """
+
+        usage_count = self.usage_mgr.reconcile_usage()
+        _LOGGER.info(f"[reconcile_usage] Reconciled {usage_count} usage counters")
+
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def expire_files(self, params: dict) -> None:
+        """Delete files not accessed for a while by FILE_LIFECYCLE rules (scheduled task)
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None:
+        """
+
+        lifecycle_conf = config.get_global("FILE_LIFECYCLE", {})
+        batch_size = lifecycle_conf.get("batch_size", 100)
+        max_batches = lifecycle_conf.get("max_batches", 10)
+        file_lifecycle_mgr = FileLifecycleManager()
+
+        for rule in lifecycle_conf.get("rules", []):
+            expired_count = 0
+
+            # 한 번 실행에 최대 batch_size * max_batches 개만 처리하고 나머지는 다음 실행에서 처리
+            for _ in range(max_batches):
+                file_vos = list(file_lifecycle_mgr.list_expired_files(rule, batch_size))
+                batch_expired_count = 0
+
+                for file_vo in file_vos:
+                    try:
+                        if file_lifecycle_mgr.expire_file(file_vo):
+                            batch_expired_count += 1
+                    except Exception as e:
+                        _LOGGER.error(f"[expire_files] Failed to expire file : {file_vo.file_id}: {e}")
+
+                expired_count += batch_expired_count
+                if len(file_vos) < batch_size or batch_expired_count == 0:
+                    break
+
+            if expired_count:
+                _LOGGER.info(
+                    f"[expire_files] Expired {expired_count} {rule.get('resource_type', 'File')} "
+                    f"(expire_after_days: {rule['expire_after_days']})"
+                )
+
+    def _check_upload_session_in_progress(self, upload_session_vo) -> None:
+        if upload_session_vo.state != "IN_PROGRESS":
+            raise ERROR_UPLOAD_SESSION_NOT_IN_PROGRESS(
+                upload_id=upload_session_vo.upload_id, state=upload_session_vo.state
+            )
+
+        if self.upload_session_mgr.is_expired(upload_session_vo):
+            raise ERROR_UPLOAD_SESSION_EXPIRED(upload_id=upload_session_vo.upload_id)
+
+    def _check_upload_part_size(self, upload_session_vo, part_number: int, size: int) -> None:
+        # 마지막 파트를 제외한 모든 파트는 part_size 와 같아야 함
+        if not 1 <= part_number <= self.upload_session_mgr.get_part_count(upload_session_vo):
+            raise ERROR_INVALID_PARAMETER(key="part_number", reason="Part number is out of range.")
+
+        expected_size = self.upload_session_mgr.get_expected_part_size(upload_session_vo, part_number)
+        if size != expected_size:
+            raise ERROR_UPLOAD_PART_SIZE_MISMATCH(
+                part_number=part_number, size=size, expected_size=expected_size
+            )
+
+    def _get_user_id(self) -> str:
+        return self.transaction.get_meta("authorization.user_id")
+
+    def _set_upload_scope(self, params) -> None:
+        """
+        role_type 에 따라 업로드 파일의 domain/workspace/project 범위 설정
+        """
+        role_type = self.transaction.get_meta("authorization.role_type")
+        
+        if role_type == "SYSTEM_ADMIN":
+            resource_group = "SYSTEM"
+        elif role_type == "DOMAIN_ADMIN":
+            resource_group = "DOMAIN"
+        elif role_type == "WORKSPACE_OWNER" or role_type == "WORKSPACE_MEMBER":
+            resource_group = "WORKSPACE"
+        else:
+            raise ERROR_PERMISSION_DENIED()
+        
+        if resource_group == "SYSTEM":
+            params.domain_id = "*"
+            params.workspace_id = "*"
+            params.project_id = "*"
+        elif resource_group == "DOMAIN":
+            params.workspace_id = "*"
+            params.project_id = "*"
+        elif resource_group == "WORKSPACE" :
+            self.identity_mgr.check_workspace(params.workspace_id, params.domain_id)
+            params.project_id = "*"
+        elif resource_group == "PROJECT":
+            if not params.project_id:
+                params.project_id = "*"
+            else :
+                self.identity_mgr.get_project(params.project_id, params.domain_id)
+
+    def _get_target_scope(self, resource_group: str, params) -> dict:
+        """
+        대상 resource_group 에 대한 권한 확인 후 domain/workspace/project 범위 반환
+        """
+        role_type = self.transaction.get_meta("authorization.role_type")
+
+        if role_type == "SYSTEM_ADMIN":
+            allowed_resource_groups = ["SYSTEM", "DOMAIN", "WORKSPACE", "PROJECT"]
+        elif role_type == "DOMAIN_ADMIN":
+            allowed_resource_groups = ["DOMAIN", "WORKSPACE", "PROJECT"]
+        elif role_type == "WORKSPACE_OWNER" or role_type == "WORKSPACE_MEMBER":
+            allowed_resource_groups = ["WORKSPACE", "PROJECT"]
+        else:
+            raise ERROR_PERMISSION_DENIED()
+
+        if resource_group not in allowed_resource_groups:
+            raise ERROR_NOT_SUPPORTED_RESOURCE_GROUP(resource_group=resource_group)
+
+        if resource_group == "SYSTEM":
+            return {"domain_id": "*", "workspace_id": "*", "project_id": "*"}
+        elif resource_group == "DOMAIN":
+            return {"domain_id": params.domain_id, "workspace_id": "*", "project_id": "*"}
+
+        if not params.workspace_id:
+            raise ERROR_REQUIRED_PARAMETER(key="workspace_id")
+
+        self.identity_mgr.check_workspace(params.workspace_id, params.domain_id)
+
+        if resource_group == "WORKSPACE":
+            return {"domain_id": params.domain_id, "workspace_id": params.workspace_id, "project_id": "*"}
+
+        if not params.project_id or params.project_id == "*":
+            raise ERROR_REQUIRED_PARAMETER(key="project_id")
+
+        self.identity_mgr.get_project(params.project_id, params.domain_id)
+        return {
+            "domain_id": params.domain_id,
+            "workspace_id": params.workspace_id,
+            "project_id": params.project_id,
+        }
+
     @transaction(
         permission="file-manager:File.read",
         role_types=[
@@ -209,6 +1139,58 @@ class FileService(BaseService):
 
         return FileResponse(**file_vo.to_dict())
 
+    @transaction(
+        permission="file-manager:File.read",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @change_value_by_rule("APPEND", "domain_id", "*")
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "project_id", "*")
+    @convert_model
+    def get_many(self, params: FileGetManyRequest) -> Union[FilesByIdResponse, dict]:
+        """Get multiple files in one query
+
+        Args:
+            params (FileGetManyRequest): {
+                'file_ids': 'list',         # required
+                'workspace_id': 'str',      # injected from auth
+                'domain_id': 'str'          # injected from auth
+                'project_id': 'str'         # injected from auth
+                'user_projects': 'list'     # injected from auth
+            }
+
+        Returns:
+            FilesByIdResponse:
+        """
+
+        file_ids = list(dict.fromkeys(params.file_ids))
+        max_count = config.get_global("MAX_GET_MANY_COUNT", 100)
+
+        if len(file_ids) > max_count:
+            raise ERROR_INVALID_PARAMETER(
+                key="file_ids", reason=f"Too many file ids. (max = {max_count})"
+            )
+
+        file_vos = self.file_mgr.get_files(
+            file_ids,
+            params.domain_id,
+            params.workspace_id,
+            params.project_id,
+        )
+
+        results = dict.fromkeys(file_ids)
+        total_count = 0
+        for file_vo in file_vos:
+            results[file_vo.file_id] = FileResponse(**file_vo.to_dict()).dict()
+            total_count += 1
+
+        return FilesByIdResponse(results=results, total_count=total_count)
+
     @transaction(
         permission="file-manager:File.read",
         role_types=[
@@ -289,3 +1271,38 @@ class FileService(BaseService):
 
         query = params.query or {}
         return self.file_mgr.stat_files(query)
+
+    @transaction(
+        permission="file-manager:File.read",
+        role_types=[
+            "SYSTEM_ADMIN",
+            "DOMAIN_ADMIN",
+            "WORKSPACE_OWNER",
+            "WORKSPACE_MEMBER",
+        ],
+    )
+    @convert_model
+    def get_usage(self, params: UsageGetRequest) -> Union[UsageResponse, dict]:
+        """Get file count and total size of domain, workspace or project
+
+        Args:
+            params (UsageGetRequest): {
+                'project_id': 'str',        # PROJECT 사용량
+                'domain_id': 'str',         # injected from auth
+                'workspace_id': 'str',      # injected from auth (WORKSPACE 사용량)
+            }
+
+        Returns:
+            UsageResponse:
+        """
+
+        if params.project_id:
+            usage_info = self.usage_mgr.get_usage(
+                "PROJECT", params.project_id, params.domain_id, params.workspace_id
+            )
+        elif params.workspace_id:
+            usage_info = self.usage_mgr.get_usage("WORKSPACE", params.workspace_id, params.domain_id)
+        else:
+            usage_info = self.usage_mgr.get_usage("DOMAIN", params.domain_id, params.domain_id)
+
+        return UsageResponse(**usage_info)
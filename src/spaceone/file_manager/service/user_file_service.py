@@ -1,14 +1,21 @@
 import logging
 from typing import Union
 
-from spaceone.core import utils
+from spaceone.core import utils, config
 from spaceone.core.service import *
 from spaceone.file_manager.error.custom import *
 from spaceone.file_manager.model.user_file.request import *
 from spaceone.file_manager.model.user_file.response import *
+from spaceone.file_manager.model.usage.request import *
+from spaceone.file_manager.model.usage.response import *
+from spaceone.file_manager.lib.key_layout import get_key_layout
+from spaceone.file_manager.lib.storage_routing import select_backend
 from spaceone.file_manager.manager.user_file_manager import UserFileManager
 from spaceone.file_manager.manager.file_connector_manager import FileConnectorManager
 from spaceone.file_manager.manager.identity_manager import IdentityManager
+from spaceone.file_manager.manager.image_derivative_manager import ImageDerivativeManager
+from spaceone.file_manager.manager.storage_migration_manager import StorageMigrationManager
+from spaceone.file_manager.manager.usage_manager import UsageManager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +31,7 @@ class UserFileService(BaseService):
         super().__init__(*args, **kwargs)
         self.user_file_mgr = UserFileManager()
         self.identity_mgr = IdentityManager()
+        self.usage_mgr = UsageManager()
 
     @transaction(
         permission="file-manager:UserFile.write",
@@ -38,6 +46,8 @@ class UserFileService(BaseService):
                 'name': 'str',              # required
                 'reference': 'dict',
                 'tags': 'dict',
+                'size': 'int',
+                'content_type': 'str',      # backend 선택용
                 'domain_id': 'str',         # injected from auth
                 'user_id': 'str',           # injected from auth
             }
@@ -45,7 +55,16 @@ class UserFileService(BaseService):
             UserFileResponse:
         """
 
-        user_file_vo = self.user_file_mgr.create_user_file(params.dict())
+        # 선언된 크기로 검사하고 파일 정보 생성 시 사용량에 반영 (크기가 없으면 이미 한도를 넘었는지만 확인)
+        usage_keys = self.usage_mgr.make_usage_keys(params.domain_id, user_id=params.user_id)
+        self.usage_mgr.check_quota(usage_keys, params.size or 0)
+
+        backend = select_backend("USER", params.domain_id, params.size, params.content_type)
+        user_file_vo = self.user_file_mgr.create_user_file(
+            {**params.dict(exclude={"content_type"}), "backend": backend, "key_layout": get_key_layout().version}
+        )
+        self.usage_mgr.add_usage(user_file_vo, 1, user_file_vo.size or 0)
+
         return UserFileResponse(**user_file_vo.to_dict())
 
     @transaction(
@@ -111,12 +130,24 @@ class UserFileService(BaseService):
         )
         
         try:
-            file_conn_mgr = FileConnectorManager()
+            file_conn_mgr = FileConnectorManager(
+                backend=user_file_vo.backend, key_layout=user_file_vo.key_layout, domain_id=user_file_vo.domain_id
+            )
             file_conn_mgr.delete_file("USER", user_file_vo.file_id)
         except Exception as e:
             _LOGGER.error(f"[delete] Failed to delete file: {user_file_vo.file_id}")
             raise ERROR_FILE_DELETE_FAILED(name=user_file_vo["download_url"])
-        
+
+        if user_file_vo.derivatives:
+            ImageDerivativeManager(
+                backend=user_file_vo.backend, key_layout=user_file_vo.key_layout, domain_id=user_file_vo.domain_id
+            ).delete_derivatives("USER", user_file_vo.file_id, user_file_vo.derivatives)
+
+        if StorageMigrationManager.has_previous_object(user_file_vo):
+            # key layout 변경 후 아직 정리되지 않은 이전 객체
+            StorageMigrationManager().delete_previous_object(user_file_vo)
+
+        self.usage_mgr.add_usage(user_file_vo, -1, -(user_file_vo.size or 0))
         self.user_file_mgr.delete_user_file_by_vo(user_file_vo)
 
     @transaction(
@@ -146,6 +177,47 @@ class UserFileService(BaseService):
 
         return UserFileResponse(**user_file_vo.to_dict())
 
+    @transaction(
+        permission="file-manager:UserFile.read",
+        role_types=["USER"],
+    )
+    @convert_model
+    def get_many(self, params: UserFileGetManyRequest) -> Union[UserFilesByIdResponse, dict]:
+        """Get multiple files in one query
+
+        Args:
+            params (UserFileGetManyRequest): {
+                'file_ids': 'list',         # required
+                'user_id': 'str',           # injected from auth
+                'domain_id': 'str'          # injected from auth
+            }
+
+        Returns:
+            UserFilesByIdResponse:
+        """
+
+        file_ids = list(dict.fromkeys(params.file_ids))
+        max_count = config.get_global("MAX_GET_MANY_COUNT", 100)
+
+        if len(file_ids) > max_count:
+            raise ERROR_INVALID_PARAMETER(
+                key="file_ids", reason=f"Too many file ids. (max = {max_count})"
+            )
+
+        user_file_vos = self.user_file_mgr.get_user_files(
+            file_ids,
+            params.domain_id,
+            params.user_id,
+        )
+
+        results = dict.fromkeys(file_ids)
+        total_count = 0
+        for user_file_vo in user_file_vos:
+            results[user_file_vo.file_id] = UserFileResponse(**user_file_vo.to_dict()).dict()
+            total_count += 1
+
+        return UserFilesByIdResponse(results=results, total_count=total_count)
+
     @transaction(
         permission="file-manager:UserFile.read",
         role_types=["USER"],
@@ -209,3 +281,23 @@ class UserFileService(BaseService):
         query = params.query or {}
         return self.user_file_mgr.stat_user_files(query)
 
+    @transaction(
+        permission="file-manager:UserFile.read",
+        role_types=["USER"],
+    )
+    @convert_model
+    def get_usage(self, params: UserUsageGetRequest) -> Union[UsageResponse, dict]:
+        """Get file count and total size of user
+
+        Args:
+            params (UserUsageGetRequest): {
+                'domain_id': 'str',         # injected from auth
+                'user_id': 'str',           # injected from auth
+            }
+
+        Returns:
+            UsageResponse:
+        """
+
+        usage_info = self.usage_mgr.get_usage("USER", params.user_id, params.domain_id)
+        return UsageResponse(**usage_info)
@@ -0,0 +1,275 @@
+"""
+File Manager backend 재시도 / hedge / circuit breaker / 동시 요청 수 제한 벤치마크
+
+지연과 오류를 주입하는 fake backend 에 대해 connector 를 그대로 호출한 경우와
+ResilientConnector(lib/resilience.py) 로 감싼 경우의 download_file 응답 시간(p50/p95/p99/max)과 실패 수를 비교한다.
+
+- tail: 대부분 빠르고 일부 요청만 느리거나 일시적으로 실패하는 backend (hedge/재시도 효과)
+- outage: 모든 요청이 timeout 까지 걸린 뒤 실패하는 backend (circuit breaker 의 빠른 실패 효과)
+- throttle: 동시 요청 수가 capacity 를 넘으면 503 SlowDown 을 반환하는 backend (AIMD 동시 요청 수 제한 효과)
+
+Usage:
+    python test/benchmark/resilience_benchmark.py
+    python test/benchmark/resilience_benchmark.py --requests 2000 --concurrency 16 --slow-rate 0.03 --output resilience.json
+    python test/benchmark/resilience_benchmark.py --throttle-capacity 8 --throttle-concurrency 64
+
+Requires: spaceone-core
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+OBJECT_SIZE = 64 * 1024
+
+
+class FaultInjectingBackend:
+    """
+    지연/오류를 주입하는 fake connector (download_file 만 구현)
+    latency: 기본 응답 시간, slow_rate 확률로 slow_latency 만큼 지연, error_rate 확률로 연결 오류
+    """
+
+    def __init__(self, latency: float, slow_rate: float, slow_latency: float, error_rate: float, seed: int = 0):
+        self.latency = latency
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.calls = 0
+        self._data = os.urandom(OBJECT_SIZE)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def download_file(self, resource_group: str, file_id: str, byte_range=None):
+        with self._lock:
+            self.calls += 1
+            roll = self._random.random()
+            jitter = self._random.uniform(0.8, 1.2)
+
+        if roll < self.error_rate:
+            time.sleep(self.latency * jitter)
+            raise ConnectionError(f"injected connection error: {file_id}")
+
+        if roll < self.error_rate + self.slow_rate:
+            time.sleep(self.slow_latency * jitter)
+        else:
+            time.sleep(self.latency * jitter)
+
+        return {"Body": io.BytesIO(self._data), "ContentLength": OBJECT_SIZE}
+
+
+class SlowDownError(Exception):
+    """
+    botocore ClientError 와 같은 형태의 S3 SlowDown 응답
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.response = {"Error": {"Code": "SlowDown"}, "ResponseMetadata": {"HTTPStatusCode": 503}}
+
+
+class ThrottlingBackend:
+    """
+    동시 요청 수가 capacity 를 넘으면 SlowDown 을 반환하는 fake connector (download_file 만 구현)
+    """
+
+    def __init__(self, latency: float, capacity: int, seed: int = 0):
+        self.latency = latency
+        self.capacity = capacity
+        self.calls = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._data = os.urandom(OBJECT_SIZE)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def download_file(self, resource_group: str, file_id: str, byte_range=None):
+        with self._lock:
+            self.calls += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            throttled = self._in_flight > self.capacity
+            jitter = self._random.uniform(0.8, 1.2)
+
+        try:
+            if throttled:
+                time.sleep(self.latency * 0.1)
+                raise SlowDownError(f"injected SlowDown: {file_id}")
+
+            time.sleep(self.latency * jitter)
+            return {"Body": io.BytesIO(self._data), "ContentLength": OBJECT_SIZE}
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+
+def run_requests(connector, requests: int, concurrency: int) -> dict:
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def _download(index: int) -> None:
+        nonlocal errors
+        started_at = time.perf_counter()
+        try:
+            result = connector.download_file("PROJECT", f"file-{index}")
+            result["Body"].read()
+            result["Body"].close()
+        except Exception:
+            with lock:
+                errors += 1
+        finally:
+            with lock:
+                latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(_download, range(requests)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "elapsed": elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "max_ms": latencies[-1] * 1000 if latencies else 0,
+    }
+
+
+def run_scenario(
+    name: str, backend_args: dict, resilience_conf: dict, args, backend_class=None, concurrency: int = None
+) -> dict:
+    from spaceone.file_manager.lib.resilience import BackendResilience, ResilientConnector
+
+    backend_class = backend_class or FaultInjectingBackend
+    concurrency = concurrency or args.concurrency
+    result = {"scenario": name}
+
+    # 같은 seed 로 주입되는 오류/지연 순서를 맞춤
+    baseline_backend = backend_class(**backend_args, seed=args.seed)
+    result["baseline"] = run_requests(baseline_backend, args.requests, concurrency)
+    result["baseline"]["backend_calls"] = baseline_backend.calls
+
+    resilient_backend = backend_class(**backend_args, seed=args.seed)
+    resilience = BackendResilience(f"benchmark-{name}", resilience_conf)
+    # 응답 시간 표본을 채운 뒤 측정 (hedge 지연 계산용)
+    run_requests(ResilientConnector(resilient_backend, resilience), args.warmup, concurrency)
+    resilient_backend.calls = 0
+
+    result["resilient"] = run_requests(ResilientConnector(resilient_backend, resilience), args.requests, concurrency)
+    result["resilient"]["backend_calls"] = resilient_backend.calls
+    if resilience.limiter:
+        result["resilient"]["concurrency_limit"] = int(resilience.limiter.limit)
+
+    for key in ("p50_ms", "p99_ms", "max_ms"):
+        baseline_value = result["baseline"][key]
+        result[f"{key}_change"] = (result["resilient"][key] - baseline_value) / baseline_value if baseline_value else 0
+
+    print(
+        f"[{name}] p99 {result['baseline']['p99_ms']:.1f}ms -> {result['resilient']['p99_ms']:.1f}ms, "
+        f"errors {result['baseline']['errors']} -> {result['resilient']['errors']}, "
+        f"backend calls {result['baseline']['backend_calls']} -> {result['resilient']['backend_calls']}",
+        file=sys.stderr,
+    )
+    return result
+
+
+def run_benchmark(args) -> dict:
+    resilience_conf = {
+        "retry": {"max_attempts": args.max_attempts, "base_delay": 0.01, "max_delay": 0.1},
+        "hedge": {"enabled": True, "percentile": 0.95, "min_delay": 0.005, "max_delay": 1.0, "min_samples": 20},
+        "circuit_breaker": {"failure_threshold": 5, "reset_timeout": 1},
+        "concurrency": {"initial_limit": args.concurrency_limit},
+    }
+
+    scenarios = [
+        run_scenario(
+            "tail",
+            {
+                "latency": args.latency,
+                "slow_rate": args.slow_rate,
+                "slow_latency": args.slow_latency,
+                "error_rate": args.error_rate,
+            },
+            resilience_conf,
+            args,
+        ),
+        run_scenario(
+            "outage",
+            {"latency": args.outage_latency, "slow_rate": 0, "slow_latency": 0, "error_rate": 1.0},
+            resilience_conf,
+            args,
+        ),
+        run_scenario(
+            "throttle",
+            {"latency": args.latency, "capacity": args.throttle_capacity},
+            resilience_conf,
+            args,
+            backend_class=ThrottlingBackend,
+            concurrency=args.throttle_concurrency,
+        ),
+    ]
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key != "output"},
+        "results": scenarios,
+    }
+
+
+def _percentile(sorted_values: list, percentile: float) -> float:
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percentile))]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="File Manager backend resilience benchmark")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per scenario")
+    parser.add_argument("--warmup", type=int, default=100, help="requests to fill latency samples before measuring")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.01, help="normal backend latency (seconds)")
+    parser.add_argument("--slow-rate", type=float, default=0.02, help="ratio of slow responses")
+    parser.add_argument("--slow-latency", type=float, default=0.5, help="slow response latency (seconds)")
+    parser.add_argument("--error-rate", type=float, default=0.01, help="ratio of transient connection errors")
+    parser.add_argument("--outage-latency", type=float, default=0.1, help="time until each call fails during outage")
+    parser.add_argument("--throttle-capacity", type=int, default=8, help="concurrent calls before SlowDown")
+    parser.add_argument("--throttle-concurrency", type=int, default=32, help="client concurrency of throttle scenario")
+    parser.add_argument("--concurrency-limit", type=int, default=32, help="initial adaptive concurrency limit")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON result to this path (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    result = run_benchmark(args)
+    output = json.dumps(result, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+File Manager 프로세스 시작 비용 벤치마크
+
+프로세스 종류(grpc, rest, scheduler, worker)별로 새 Python 프로세스에서 진입 모듈을 import 하여
+import 시간과 import 직후 RSS, 그리고 불필요하게 로드된 cloud SDK 모듈을 측정하여 JSON 으로 출력한다.
+
+--max-import-time / --max-rss 를 지정하면 한도를 넘는 프로세스가 있을 때 실패하고,
+--forbid-modules 에 지정한 모듈(기본: cloud SDK)이 import 만으로 로드되어도 실패하므로
+시작 비용 회귀 검사로 사용할 수 있다. (connector 는 처음 사용할 때 import/생성되어야 함)
+test_startup_budget.py 에서 pytest 로 이 검사를 실행한다.
+
+Usage:
+    python test/benchmark/startup_benchmark.py
+    python test/benchmark/startup_benchmark.py --process-types grpc,rest --repeat 5 --output startup.json
+    python test/benchmark/startup_benchmark.py --max-import-time 3 --max-rss 256MB
+
+Requires: spaceone-core (프로세스 종류별 의존성 포함)
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+
+# 프로세스 종류별 진입 모듈 (spaceone CLI 가 서버 시작 시 import 하는 모듈)
+PROCESS_MODULES = {
+    "grpc": ["spaceone.file_manager.interface.grpc"],
+    "rest": [
+        "spaceone.file_manager.interface.rest.file",
+        "spaceone.file_manager.interface.rest.user_file",
+        "spaceone.file_manager.interface.rest.upload_session",
+        "spaceone.file_manager.interface.rest.metrics",
+    ],
+    "scheduler": ["spaceone.file_manager.interface.task.v1.file_manager_scheduler"],
+    "worker": [
+        "spaceone.file_manager.service.file_service",
+        "spaceone.file_manager.service.user_file_service",
+    ],
+}
+# PIL 은 Pillow 가 설치되어 있으면 mongoengine (ImageField) 이 import 시 로드하므로 제외
+DEFAULT_FORBIDDEN_MODULES = "boto3,botocore,minio,google.cloud.storage"
+SIZE_UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "B": 1}
+
+
+# ---------------------------------------------------------------------------
+# 측정 대상 프로세스
+# ---------------------------------------------------------------------------
+
+
+def _get_rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+
+        # linux 외 환경은 최대 RSS 로 대체 (macOS: bytes, 그 외: KB)
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run_child(process_type: str, forbidden_modules: list) -> None:
+    """
+    새 프로세스에서 진입 모듈 import 후 측정 결과를 stdout 에 JSON 으로 출력
+    """
+    import importlib
+
+    base_rss = _get_rss()
+    started = time.perf_counter()
+
+    from spaceone.core import config
+
+    config.init_conf(package="spaceone.file_manager")
+    for module_name in PROCESS_MODULES[process_type]:
+        importlib.import_module(module_name)
+
+    import_time = time.perf_counter() - started
+    rss = _get_rss()
+
+    loaded = [
+        name
+        for name in forbidden_modules
+        if name in sys.modules or any(module.startswith(f"{name}.") for module in sys.modules)
+    ]
+
+    print(
+        json.dumps(
+            {
+                "import_time": import_time,
+                "rss": rss,
+                "rss_delta": rss - base_rss,
+                "module_count": len(sys.modules),
+                "forbidden_loaded": loaded,
+            }
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# 실행 / 검사
+# ---------------------------------------------------------------------------
+
+
+def measure(process_type: str, repeat: int, forbidden_modules: list) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+    command = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--child",
+        process_type,
+        "--forbid-modules",
+        ",".join(forbidden_modules),
+    ]
+
+    samples = []
+    # 첫 실행은 bytecode 캐시를 채우는 용도로 결과에서 제외
+    for index in range(repeat + 1):
+        completed = subprocess.run(command, env=env, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"{process_type} process failed:\n{completed.stderr}")
+        if index > 0:
+            samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+    return {
+        "process_type": process_type,
+        "import_time": statistics.median(sample["import_time"] for sample in samples),
+        "import_time_max": max(sample["import_time"] for sample in samples),
+        "rss_mb": statistics.median(sample["rss"] for sample in samples) / (1024 * 1024),
+        "rss_delta_mb": statistics.median(sample["rss_delta"] for sample in samples) / (1024 * 1024),
+        "module_count": samples[-1]["module_count"],
+        "forbidden_loaded": sorted({name for sample in samples for name in sample["forbidden_loaded"]}),
+    }
+
+
+def run_benchmark(args) -> dict:
+    results = []
+    for process_type in args.process_types:
+        summary = measure(process_type, args.repeat, args.forbid_modules)
+        results.append(summary)
+        print(
+            f"[{process_type}] import {summary['import_time'] * 1000:.0f}ms, "
+            f"RSS {summary['rss_mb']:.1f}MB (+{summary['rss_delta_mb']:.1f}MB), "
+            f"modules {summary['module_count']}, forbidden loaded: {summary['forbidden_loaded'] or '-'}",
+            file=sys.stderr,
+        )
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+
+def check_startup_budget(result: dict, max_import_time: float = None, max_rss: int = None) -> bool:
+    """
+    프로세스 시작 비용이 한도 이내이고 cloud SDK 가 import 만으로 로드되지 않는지 확인
+    """
+    passed = True
+
+    for summary in result["results"]:
+        process_type = summary["process_type"]
+
+        if max_import_time is not None and summary["import_time"] > max_import_time:
+            passed = False
+            print(
+                f"[startup] {process_type} import time {summary['import_time']:.2f}s exceeds {max_import_time:.2f}s",
+                file=sys.stderr,
+            )
+
+        if max_rss is not None and summary["rss_mb"] * 1024 * 1024 > max_rss:
+            passed = False
+            print(
+                f"[startup] {process_type} RSS {summary['rss_mb']:.1f}MB exceeds {max_rss / (1024 * 1024):.1f}MB",
+                file=sys.stderr,
+            )
+
+        if summary["forbidden_loaded"]:
+            passed = False
+            print(
+                f"[startup] {process_type} loaded {', '.join(summary['forbidden_loaded'])} at import time",
+                file=sys.stderr,
+            )
+
+    return passed
+
+
+def _parse_size(value: str) -> int:
+    value = value.strip().upper()
+    for unit in ("KB", "MB", "GB", "B"):
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)]) * SIZE_UNITS[unit])
+    return int(value)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="File Manager process startup benchmark")
+    parser.add_argument(
+        "--process-types", default=",".join(PROCESS_MODULES), help="process types to measure, comma separated"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="measurements per process type (median is reported)")
+    parser.add_argument("--output", help="write JSON result to this path (default: stdout)")
+    parser.add_argument("--max-import-time", type=float, help="fail (exit 1) if import time exceeds this (seconds)")
+    parser.add_argument("--max-rss", help="fail (exit 1) if RSS after import exceeds this size, e.g. 256MB")
+    parser.add_argument(
+        "--forbid-modules",
+        default=DEFAULT_FORBIDDEN_MODULES,
+        help="fail (exit 1) if these modules are loaded at import time, comma separated (empty to disable)",
+    )
+    parser.add_argument("--child", choices=sorted(PROCESS_MODULES), help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+    args.process_types = [process_type.strip() for process_type in args.process_types.split(",")]
+    args.forbid_modules = [name.strip() for name in args.forbid_modules.split(",") if name.strip()]
+    args.max_rss = _parse_size(args.max_rss) if args.max_rss else None
+
+    for process_type in args.process_types:
+        if process_type not in PROCESS_MODULES:
+            parser.error(f"unknown process type: {process_type}")
+
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.child:
+        run_child(args.child, args.forbid_modules)
+        return
+
+    result = run_benchmark(args)
+    output = json.dumps(result, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if not check_startup_budget(result, args.max_import_time, args.max_rss):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
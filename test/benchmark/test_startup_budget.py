@@ -0,0 +1,28 @@
+"""
+프로세스 시작 비용 회귀 테스트
+
+startup_benchmark 로 프로세스 종류별 import 시간과 RSS 를 측정하여 한도 이내인지,
+cloud SDK 가 import 만으로 로드되지 않는지 확인한다.
+
+한도는 FILE_MANAGER_STARTUP_MAX_IMPORT_TIME (초), FILE_MANAGER_STARTUP_MAX_RSS 로 조정할 수 있다.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("spaceone.core")
+
+from .startup_benchmark import check_startup_budget, parse_args, run_benchmark  # noqa: E402
+
+MAX_IMPORT_TIME = os.environ.get("FILE_MANAGER_STARTUP_MAX_IMPORT_TIME", "5")
+MAX_RSS = os.environ.get("FILE_MANAGER_STARTUP_MAX_RSS", "256MB")
+
+
+def test_startup_within_budget():
+    args = parse_args(["--repeat", "1", "--max-import-time", MAX_IMPORT_TIME, "--max-rss", MAX_RSS])
+
+    result = run_benchmark(args)
+
+    assert {summary["process_type"] for summary in result["results"]} == set(args.process_types)
+    assert check_startup_budget(result, args.max_import_time, args.max_rss), result["results"]
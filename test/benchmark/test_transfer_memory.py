@@ -0,0 +1,47 @@
+"""
+전송 메모리 상한 회귀 테스트
+
+transfer_benchmark 의 서버를 tracemalloc 으로 띄워 전송 크기보다 작은 고정 한도 안에서
+업로드/다운로드가 끝나는지 확인한다. (파일 전체를 메모리에 올리는 경로가 생기면 실패)
+
+더 큰 전송으로 확인하려면 FILE_MANAGER_MEMORY_TEST_SIZE 를 지정한다. (예: 2GB)
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("uvicorn")
+pytest.importorskip("spaceone.core")
+
+from .transfer_benchmark import check_memory_bound, parse_args, run_benchmark  # noqa: E402
+
+TRANSFER_SIZE = os.environ.get("FILE_MANAGER_MEMORY_TEST_SIZE", "64MB")
+MAX_TRACED_PEAK = os.environ.get("FILE_MANAGER_MEMORY_TEST_MAX_PEAK", "16MB")
+
+
+def test_transfer_memory_is_bounded():
+    args = parse_args(
+        [
+            "--sizes",
+            TRANSFER_SIZE,
+            "--concurrency",
+            "1",
+            "--requests",
+            "1",
+            "--max-total",
+            TRANSFER_SIZE,
+            "--max-traced-peak",
+            MAX_TRACED_PEAK,
+        ]
+    )
+    # 한도보다 큰 전송이어야 전체를 메모리에 올리는 회귀를 잡을 수 있음
+    assert min(args.sizes) > args.max_traced_peak
+
+    result = run_benchmark(args)
+
+    assert {summary["operation"] for summary in result["results"]} == {"upload", "download"}
+    assert all(summary["errors"] == 0 for summary in result["results"]), result["results"]
+    assert all("traced_peak_mb" in summary for summary in result["results"]), result["results"]
+    assert check_memory_bound(result, args.max_traced_peak), result["results"]
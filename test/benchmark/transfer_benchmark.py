@@ -0,0 +1,608 @@
+"""
+File Manager 업로드/다운로드 처리량 벤치마크
+
+실제 REST router 로 FastAPI 앱을 별도 프로세스에서 띄우고,
+FileService/UserFileService(인증, MongoDB 포함)는 프로세스 내 fake 로,
+저장소는 LocalFileSystemConnector 로 대체하여 전송 경로만 측정한다.
+
+파일 크기/동시성 조합별로 MB/s, p50/p99 latency, 서버 프로세스 RSS 를 측정하여 JSON 으로 출력하며,
+--compare 로 두 결과(예: 커밋 전/후)를 비교할 수 있다.
+
+--max-traced-peak 를 지정하면 서버 프로세스의 tracemalloc peak 가 한도를 넘는 경우 실패하므로
+대용량 전송의 메모리 상한 회귀 검사로 사용할 수 있다. (test_transfer_memory.py 에서 pytest 로 실행)
+
+Usage:
+    python test/benchmark/transfer_benchmark.py --sizes 1KB,1MB,64MB --concurrency 1,4,16 --output head.json
+    python test/benchmark/transfer_benchmark.py --sizes 1GB,4GB --concurrency 1,4 --requests 4 --max-total 16GB --max-traced-peak 256MB
+    python test/benchmark/transfer_benchmark.py --sizes 1KB,1MB,64MB,2GB --requests 8
+    python test/benchmark/transfer_benchmark.py --compare base.json head.json
+
+Requires: uvicorn, httpx
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import httpx
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "src"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+BENCHMARK_TOKEN = "benchmark-token"
+BENCHMARK_DOMAIN_ID = "domain-benchmark"
+UPLOAD_PATHS = {
+    "SYSTEM": "/files/public/upload",
+    "DOMAIN": "/files/domain/upload",
+    "WORKSPACE": "/files/workspace/upload",
+    "PROJECT": "/files/project/upload",
+    "USER": "/files/user/upload",
+}
+DOWNLOAD_PATHS = {
+    "SYSTEM": "/files/public/{file_id}",
+    "DOMAIN": "/files/domain/{file_id}",
+    "WORKSPACE": "/files/workspace/{file_id}",
+    "PROJECT": "/files/project/{file_id}",
+    "USER": "/files/user/{file_id}",
+}
+SIZE_UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "B": 1}
+READ_CHUNK_SIZE = 1024 * 1024
+RSS_SAMPLE_INTERVAL = 0.05
+
+
+# ---------------------------------------------------------------------------
+# 서버 (fake service + LocalFileSystemConnector)
+# ---------------------------------------------------------------------------
+
+
+class FakeFileStore:
+    """
+    FileService/UserFileService 를 대신하는 메모리 저장소 (인증/MongoDB 없이 파일 정보만 관리)
+    """
+
+    files = {}
+    lock = threading.Lock()
+
+
+def make_fake_service(default_resource_group: str = None):
+    from spaceone.core.error import ERROR_NOT_FOUND
+    from spaceone.file_manager.lib.key_layout import get_key_layout
+
+    class FakeService:
+        def __init__(self, metadata: dict = None, *args, **kwargs):
+            self.metadata = metadata or {}
+
+        def add(self, params: dict) -> dict:
+            resource_group = params.get("resource_group") or default_resource_group
+            prefix = "user-file" if resource_group == "USER" else "file"
+            file_info = {
+                "file_id": f"{prefix}-{uuid.uuid4().hex[:12]}",
+                "name": params["name"],
+                "resource_group": resource_group,
+                "domain_id": BENCHMARK_DOMAIN_ID,
+                "workspace_id": params.get("workspace_id"),
+                "project_id": params.get("project_id"),
+                "tags": {},
+                "reference": None,
+                "backend": None,
+                "key_layout": get_key_layout().version,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+            with FakeFileStore.lock:
+                FakeFileStore.files[file_info["file_id"]] = file_info
+
+            return dict(file_info)
+
+        def get(self, params: dict) -> dict:
+            file_info = FakeFileStore.files.get(params["file_id"])
+            if file_info is None:
+                raise ERROR_NOT_FOUND(key="file_id", value=params["file_id"])
+            return dict(file_info)
+
+        def delete(self, params: dict) -> None:
+            with FakeFileStore.lock:
+                FakeFileStore.files.pop(params["file_id"], None)
+
+        def list(self, params: dict) -> dict:
+            results = [dict(file_info) for file_info in FakeFileStore.files.values()]
+            return {"results": results, "total_count": len(results)}
+
+    return FakeService
+
+
+def create_app(root_path: str, trace_memory: bool = False):
+    """
+    실제 REST router 를 포함한 FastAPI 앱 생성 (service 계층만 fake 로 교체)
+    trace_memory: tracemalloc 으로 서버 Python 할당량을 추적하고 /_benchmark/memory 로 노출
+    """
+    from fastapi import FastAPI
+    from spaceone.core import config
+
+    config.init_conf(package="spaceone.file_manager")
+    # set_global 은 global_conf 에 정의된 항목만 변경하므로 서버와 같이 service 설정을 먼저 로드
+    config.set_service_config()
+    config.set_global(
+        BACKEND="LocalFileSystemConnector",
+        CONNECTORS={
+            "LocalFileSystemConnector": {
+                "backend": "spaceone.file_manager.connector.local_fs_connector:LocalFileSystemConnector",
+                "root_path": root_path,
+            },
+        },
+        FILE_MANAGER_URL="",
+        # 데이터베이스 없이 실행하므로 접근 기록은 반영하지 않음
+        ACCESS_TRACKING={"enabled": False},
+    )
+
+    from spaceone.file_manager.interface.rest import file as file_rest
+    from spaceone.file_manager.interface.rest import user_file as user_file_rest
+
+    file_rest.FileService = make_fake_service()
+    user_file_rest.UserFileService = make_fake_service("USER")
+
+    app = FastAPI()
+    app.include_router(file_rest.router, prefix="/files")
+    app.include_router(user_file_rest.router, prefix="/files")
+
+    if trace_memory:
+        tracemalloc.start()
+
+        @app.get("/_benchmark/memory")
+        def get_traced_memory(reset: bool = False):
+            current, peak = tracemalloc.get_traced_memory()
+            if reset:
+                tracemalloc.reset_peak()
+            return {"current": current, "peak": peak}
+
+    return app
+
+
+def run_server(port: int, root_path: str, trace_memory: bool = False) -> None:
+    import uvicorn
+
+    uvicorn.run(create_app(root_path, trace_memory), host="127.0.0.1", port=port, log_level="warning")
+
+
+class BenchmarkServer:
+    """
+    벤치마크 서버 프로세스 (RSS 와 tracemalloc 측정 대상)
+    """
+
+    def __init__(self, root_path: str, trace_memory: bool = False):
+        self.root_path = root_path
+        self.trace_memory = trace_memory
+        self.port = _get_free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.process = None
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def start(self) -> None:
+        self.process = multiprocessing.get_context("spawn").Process(
+            target=run_server, args=(self.port, self.root_path, self.trace_memory), daemon=True
+        )
+        self.process.start()
+
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            if not self.process.is_alive():
+                raise RuntimeError("Benchmark server exited during startup")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.5):
+                    return
+            except OSError:
+                time.sleep(0.1)
+
+        self.stop()
+        raise RuntimeError("Benchmark server did not start within 60s")
+
+    def stop(self) -> None:
+        if self.process:
+            self.process.terminate()
+            self.process.join(10)
+
+    def get_traced_memory(self, client: httpx.Client, reset: bool = False) -> dict:
+        if not self.trace_memory:
+            return {}
+
+        response = client.get(self.base_url + "/_benchmark/memory", params={"reset": reset})
+        response.raise_for_status()
+        return response.json()
+
+
+def _get_free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+
+class RSSSampler:
+    """
+    서버 프로세스 RSS 샘플링 (/proc/<pid>/status 의 VmRSS)
+    """
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.start_rss = 0
+        self.peak_rss = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def read_rss(self) -> int:
+        try:
+            with open(f"/proc/{self.pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        return 0
+
+    def __enter__(self):
+        self.start_rss = self.peak_rss = self.read_rss()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop_event.set()
+        self._thread.join()
+        self.peak_rss = max(self.peak_rss, self.read_rss())
+        return False
+
+    def _run(self):
+        while not self._stop_event.wait(RSS_SAMPLE_INTERVAL):
+            self.peak_rss = max(self.peak_rss, self.read_rss())
+
+
+def create_source_file(directory: str, size: int) -> str:
+    path = os.path.join(directory, f"source-{size}.bin")
+    block = os.urandom(min(size, READ_CHUNK_SIZE)) if size else b""
+
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            f.write(block[:remaining])
+            remaining -= len(block[:remaining])
+
+    return path
+
+
+def upload_once(client: httpx.Client, base_url: str, resource_group: str, source_path: str) -> dict:
+    with open(source_path, "rb") as f:
+        response = client.post(
+            base_url + UPLOAD_PATHS[resource_group],
+            files={"file": (os.path.basename(source_path), f, "application/octet-stream")},
+            headers={"Authorization": f"Bearer {BENCHMARK_TOKEN}"},
+        )
+
+    response.raise_for_status()
+    return response.json()
+
+
+def download_once(client: httpx.Client, base_url: str, resource_group: str, file_id: str) -> int:
+    url = base_url + DOWNLOAD_PATHS[resource_group].format(file_id=file_id)
+    total_size = 0
+
+    with client.stream("GET", url, params={"token": BENCHMARK_TOKEN}) as response:
+        response.raise_for_status()
+        for chunk in response.iter_bytes(READ_CHUNK_SIZE):
+            total_size += len(chunk)
+
+    return total_size
+
+
+def run_phase(server: BenchmarkServer, client: httpx.Client, concurrency: int, requests: int, func) -> dict:
+    latencies = []
+    results = []
+    errors = []
+
+    def _timed(index):
+        start_time = time.perf_counter()
+        try:
+            result = func(index)
+            latencies.append(time.perf_counter() - start_time)
+            results.append(result)
+        except Exception as e:
+            errors.append(str(e))
+
+    server.get_traced_memory(client, reset=True)
+
+    with RSSSampler(server.pid) as sampler:
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(_timed, range(requests)))
+        elapsed = time.perf_counter() - start_time
+
+    traced_memory = server.get_traced_memory(client)
+
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "results": results,
+        "errors": errors,
+        "rss_start": sampler.start_rss,
+        "rss_peak": sampler.peak_rss,
+        "traced_peak": traced_memory.get("peak"),
+    }
+
+
+def summarize(operation: str, size: int, concurrency: int, requests: int, phase: dict) -> dict:
+    completed = len(phase["latencies"])
+    elapsed = phase["elapsed"] or 1e-9
+    latencies = sorted(phase["latencies"])
+
+    summary = {
+        "operation": operation,
+        "size": size,
+        "concurrency": concurrency,
+        "requests": requests,
+        "completed": completed,
+        "errors": len(phase["errors"]),
+        "error_samples": phase["errors"][:3],
+        "throughput_mbps": round(size * completed / elapsed / (1024 * 1024), 3),
+        "requests_per_sec": round(completed / elapsed, 3),
+        "latency_p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "latency_p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+        "server_rss_start_mb": round(phase["rss_start"] / (1024 * 1024), 2),
+        "server_rss_peak_mb": round(phase["rss_peak"] / (1024 * 1024), 2),
+    }
+
+    if phase["traced_peak"] is not None:
+        summary["traced_peak_mb"] = round(phase["traced_peak"] / (1024 * 1024), 2)
+
+    return summary
+
+
+def _percentile(sorted_values: list, percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # nearest-rank
+    index = max(0, min(len(sorted_values) - 1, math.ceil(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_benchmark(args) -> dict:
+    work_dir = tempfile.mkdtemp(prefix="file-manager-benchmark-")
+    storage_path = os.path.join(work_dir, "storage")
+    source_dir = os.path.join(work_dir, "source")
+    os.makedirs(source_dir)
+
+    server = BenchmarkServer(storage_path, trace_memory=args.tracemalloc)
+    server.start()
+    base_url = server.base_url
+    results = []
+
+    try:
+        with httpx.Client(timeout=args.timeout, limits=httpx.Limits(max_connections=max(args.concurrency))) as client:
+            for size in args.sizes:
+                source_path = create_source_file(source_dir, size)
+
+                for concurrency in args.concurrency:
+                    requests = _get_request_count(size, concurrency, args)
+                    label = f"{_format_size(size)} x{requests} (c={concurrency})"
+
+                    upload_phase = run_phase(
+                        server,
+                        client,
+                        concurrency,
+                        requests,
+                        lambda index: upload_once(client, base_url, args.resource_group, source_path),
+                    )
+                    results.append(summarize("upload", size, concurrency, requests, upload_phase))
+                    _print_result(label, results[-1])
+
+                    file_ids = [file_info["file_id"] for file_info in upload_phase["results"]]
+                    if not file_ids:
+                        continue
+
+                    download_phase = run_phase(
+                        server,
+                        client,
+                        concurrency,
+                        requests,
+                        lambda index: download_once(
+                            client, base_url, args.resource_group, file_ids[index % len(file_ids)]
+                        ),
+                    )
+                    results.append(summarize("download", size, concurrency, requests, download_phase))
+                    _print_result(label, results[-1])
+
+                    _clear_storage(storage_path)
+
+                os.remove(source_path)
+    finally:
+        server.stop()
+        _remove_tree(work_dir)
+
+    return {
+        "meta": {
+            "commit": _get_git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "backend": "LocalFileSystemConnector",
+            "resource_group": args.resource_group,
+            "tracemalloc": args.tracemalloc,
+        },
+        "results": results,
+    }
+
+
+def _get_request_count(size: int, concurrency: int, args) -> int:
+    # 큰 파일은 조합당 전송량이 max_total 을 넘지 않도록 요청 수 제한 (최소 동시성만큼은 보장)
+    budget_requests = max(1, args.max_total // max(size, 1))
+    return max(concurrency, min(args.requests, budget_requests))
+
+
+def _clear_storage(storage_path: str) -> None:
+    # 서버의 fake 파일 정보는 남지만 메모리 사용량이 작으므로 저장소 파일만 정리
+    _remove_tree(storage_path)
+
+
+def _remove_tree(path: str) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _get_git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(__file__), stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def _print_result(label: str, result: dict) -> None:
+    print(
+        f"[{result['operation']:>8}] {label:<28} "
+        f"{result['throughput_mbps']:>10.2f} MB/s  "
+        f"p50 {result['latency_p50_ms']:>9.2f}ms  p99 {result['latency_p99_ms']:>9.2f}ms  "
+        f"rss {result['server_rss_peak_mb']:>8.1f}MB  errors {result['errors']}",
+        file=sys.stderr,
+    )
+
+
+# ---------------------------------------------------------------------------
+# 결과 비교
+# ---------------------------------------------------------------------------
+
+
+def compare_results(base_path: str, head_path: str) -> None:
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(head_path) as f:
+        head = json.load(f)
+
+    base_results = {(r["operation"], r["size"], r["concurrency"]): r for r in base["results"]}
+
+    print(f"base: {base['meta'].get('commit')}  head: {head['meta'].get('commit')}")
+    print(f"{'operation':>9} {'size':>8} {'c':>4} {'MB/s':>18} {'p99 ms':>22} {'rss MB':>18}")
+
+    for result in head["results"]:
+        key = (result["operation"], result["size"], result["concurrency"])
+        base_result = base_results.get(key)
+        if base_result is None:
+            continue
+
+        print(
+            f"{result['operation']:>9} {_format_size(result['size']):>8} {result['concurrency']:>4} "
+            f"{_format_delta(base_result['throughput_mbps'], result['throughput_mbps']):>18} "
+            f"{_format_delta(base_result['latency_p99_ms'], result['latency_p99_ms']):>22} "
+            f"{_format_delta(base_result['server_rss_peak_mb'], result['server_rss_peak_mb']):>18}"
+        )
+
+
+def _format_delta(base_value: float, head_value: float) -> str:
+    if not base_value:
+        return f"{head_value:.1f}"
+    return f"{head_value:.1f} ({(head_value - base_value) / base_value * 100:+.1f}%)"
+
+
+def _format_size(size: int) -> str:
+    for unit in ("GB", "MB", "KB"):
+        if size >= SIZE_UNITS[unit] and size % SIZE_UNITS[unit] == 0:
+            return f"{size // SIZE_UNITS[unit]}{unit}"
+    return f"{size}B"
+
+
+def _parse_size(value: str) -> int:
+    value = value.strip().upper()
+    for unit in ("KB", "MB", "GB", "B"):
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)]) * SIZE_UNITS[unit])
+    return int(value)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="File Manager upload/download throughput benchmark")
+    parser.add_argument("--sizes", default="1KB,1MB,16MB,64MB", help="file sizes (1KB - 2GB), comma separated")
+    parser.add_argument("--concurrency", default="1,4,16", help="concurrency levels, comma separated")
+    parser.add_argument("--requests", type=int, default=16, help="requests per size/concurrency combination")
+    parser.add_argument("--max-total", default="4GB", help="max bytes transferred per combination")
+    parser.add_argument("--resource-group", default="PROJECT", choices=sorted(UPLOAD_PATHS.keys()))
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--output", help="write JSON result to this path (default: stdout)")
+    parser.add_argument("--tracemalloc", action="store_true", help="trace server Python allocations per phase")
+    parser.add_argument(
+        "--max-traced-peak",
+        help="fail (exit 1) if any phase's traced server peak exceeds this size, e.g. 256MB (implies --tracemalloc)",
+    )
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "HEAD"), help="compare two JSON results")
+
+    args = parser.parse_args(argv)
+    if not args.compare:
+        args.sizes = [_parse_size(size) for size in args.sizes.split(",")]
+        args.concurrency = [int(concurrency) for concurrency in args.concurrency.split(",")]
+        args.max_total = _parse_size(args.max_total)
+        args.max_traced_peak = _parse_size(args.max_traced_peak) if args.max_traced_peak else None
+        args.tracemalloc = args.tracemalloc or args.max_traced_peak is not None
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.compare:
+        compare_results(*args.compare)
+        return
+
+    result = run_benchmark(args)
+    output = json.dumps(result, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.max_traced_peak is not None and not check_memory_bound(result, args.max_traced_peak):
+        sys.exit(1)
+
+
+def check_memory_bound(result: dict, max_traced_peak: int) -> bool:
+    """
+    전송 크기와 무관하게 서버 메모리 사용량이 고정 한도 이내인지 확인 (메모리 회귀 검사)
+    """
+    passed = True
+    limit_mb = max_traced_peak / (1024 * 1024)
+
+    for summary in result["results"]:
+        traced_peak_mb = summary.get("traced_peak_mb", 0)
+        if traced_peak_mb > limit_mb:
+            passed = False
+            print(
+                f"[memory] {summary['operation']} {_format_size(summary['size'])} (c={summary['concurrency']}) "
+                f"traced peak {traced_peak_mb:.1f}MB exceeds {limit_mb:.1f}MB",
+                file=sys.stderr,
+            )
+
+    return passed
+
+
+if __name__ == "__main__":
+    main()
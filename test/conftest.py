@@ -0,0 +1,7 @@
+import os
+import sys
+
+# 설치하지 않은 소스 트리에서도 실행할 수 있도록 src 를 import 경로에 추가
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
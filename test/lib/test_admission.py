@@ -0,0 +1,113 @@
+"""
+전송 admission control 단위 테스트
+
+동시 전송 슬롯 점유/반환, 대기열 거부, 대기 중인 전송의 승인, domain 별 bandwidth 제한을 확인한다.
+"""
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("spaceone.core")
+
+from spaceone.file_manager.error.custom import ERROR_TRANSFER_REJECTED  # noqa: E402
+from spaceone.file_manager.lib.admission import TokenBucket, TransferAdmissionController  # noqa: E402
+
+
+def make_controller(**conf) -> TransferAdmissionController:
+    return TransferAdmissionController({"queue_timeout": 0, **conf})
+
+
+def test_admit_and_release():
+    controller = make_controller()
+
+    with controller.admit("domain-1", "download"):
+        ticket = controller.admit("domain-1", "upload")
+        assert controller.active == 2
+        assert controller.active_by_domain == {"domain-1": 2}
+
+        # 여러 곳에서 반환해도 한 번만 반영
+        ticket.release()
+        ticket.release()
+        assert controller.active == 1
+
+    assert controller.active == 0
+    assert controller.active_by_domain == {}
+
+
+@pytest.mark.parametrize(
+    "conf",
+    [
+        {"max_concurrent_transfers": 1},
+        {"max_concurrent_per_domain": 1},
+        {"domain_overrides": {"domain-1": {"max_concurrent": 1}}},
+    ],
+)
+def test_reject_when_no_slot(conf):
+    controller = make_controller(**conf)
+    ticket = controller.admit("domain-1", "download")
+
+    with pytest.raises(ERROR_TRANSFER_REJECTED):
+        controller.admit("domain-1", "download")
+
+    ticket.release()
+    controller.admit("domain-1", "download").release()
+
+
+def test_other_domain_is_not_limited():
+    controller = make_controller(max_concurrent_per_domain=1)
+
+    with controller.admit("domain-1", "download"):
+        controller.admit("domain-2", "download").release()
+
+
+def test_reject_when_queue_is_full():
+    controller = make_controller(max_concurrent_transfers=1, max_queue_size=0, queue_timeout=10)
+
+    with controller.admit("domain-1", "download"):
+        started_at = time.monotonic()
+        with pytest.raises(ERROR_TRANSFER_REJECTED):
+            controller.admit("domain-1", "download")
+        # 대기열이 가득 차면 기다리지 않고 거부
+        assert time.monotonic() - started_at < 1
+
+
+def test_waiting_transfer_is_admitted_after_release():
+    controller = make_controller(max_concurrent_transfers=1, queue_timeout=10)
+    ticket = controller.admit("domain-1", "download")
+    admitted = []
+
+    thread = threading.Thread(target=lambda: admitted.append(controller.admit("domain-1", "download")))
+    thread.start()
+    while controller.waiting == 0:
+        time.sleep(0.01)
+
+    ticket.release()
+    thread.join(timeout=5)
+
+    assert len(admitted) == 1
+    assert controller.active == 1
+    admitted[0].release()
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=1000, burst=100)
+
+    # burst 이내는 대기 없음
+    assert bucket.consume(100) == 0
+    # 부족한 만큼 rate 로 쌓일 때까지 대기
+    assert bucket.consume(50) == pytest.approx(0.05, abs=0.02)
+
+
+def test_bandwidth_bucket_per_domain():
+    controller = make_controller(domain_bandwidth=1000, domain_overrides={"domain-2": {"bandwidth": 0}})
+
+    with controller.admit("domain-1", "download") as ticket, controller.admit("domain-1", "upload") as other:
+        # 같은 domain 의 전송은 bucket 을 공유
+        assert ticket.bucket is not None
+        assert ticket.bucket is other.bucket
+
+    with controller.admit("domain-2", "download") as ticket:
+        assert ticket.bucket is None
+        assert list(ticket.throttle_chunks([b"a", b"b"])) == [b"a", b"b"]
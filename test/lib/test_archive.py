@@ -0,0 +1,78 @@
+"""
+스트리밍 아카이브 단위 테스트
+
+생성한 ZIP/TAR 를 표준 라이브러리로 다시 읽어 내용을 확인하고, 아카이브 내 파일명 중복 처리를 확인한다.
+"""
+
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from spaceone.file_manager.lib.archive import dedupe_archive_names, iter_archive
+
+
+def make_entries():
+    return [
+        ("a.txt", 5, iter([b"hel", b"lo"])),
+        ("dir/b.bin", 3000, iter([b"x" * 1000] * 3)),
+        ("empty.txt", 0, iter([])),
+    ]
+
+
+def test_zip_archive():
+    data = b"".join(iter_archive("zip", make_entries()))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["a.txt", "dir/b.bin", "empty.txt"]
+        assert zf.read("a.txt") == b"hello"
+        assert zf.read("dir/b.bin") == b"x" * 3000
+        assert zf.read("empty.txt") == b""
+
+
+def test_zip_archive_without_size():
+    data = b"".join(iter_archive("zip", [("a.txt", None, iter([b"hello"]))]))
+
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.read("a.txt") == b"hello"
+
+
+def test_tar_archive():
+    data = b"".join(iter_archive("tar", make_entries()))
+
+    assert len(data) % tarfile.RECORDSIZE == 0
+    with tarfile.open(fileobj=io.BytesIO(data)) as tf:
+        assert tf.getnames() == ["a.txt", "dir/b.bin", "empty.txt"]
+        assert tf.extractfile("a.txt").read() == b"hello"
+        assert tf.extractfile("dir/b.bin").read() == b"x" * 3000
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [("a.txt", None, iter([b"hello"])), ("a.txt", 10, iter([b"hello"]))],
+)
+def test_tar_archive_requires_exact_size(entry):
+    with pytest.raises(ValueError):
+        b"".join(iter_archive("tar", [entry]))
+
+
+def test_unsupported_archive_format():
+    with pytest.raises(ValueError):
+        iter_archive("rar", [])
+
+
+def test_dedupe_archive_names():
+    names = ["a.txt", "a.txt", "a.txt", "README", "README", "../../etc/passwd", "", "dir/./a.txt"]
+
+    assert list(dedupe_archive_names(names)) == [
+        "a.txt",
+        "a (1).txt",
+        "a (2).txt",
+        "README",
+        "README (1)",
+        "etc/passwd",
+        "unknown",
+        "dir/a.txt",
+    ]
@@ -0,0 +1,57 @@
+"""
+object key layout 단위 테스트
+
+버전별 object key 형식, 알 수 없는 버전 설정 오류, server-side 복사 비교 기준을 확인한다.
+"""
+
+import hashlib
+
+import pytest
+
+pytest.importorskip("spaceone.core")
+
+from spaceone.core.error import ERROR_CONFIGURATION  # noqa: E402
+from spaceone.file_manager.lib.key_layout import LEGACY_KEY_LAYOUT, KeyLayout  # noqa: E402
+
+
+def test_legacy_layout():
+    key_layout = KeyLayout({})
+
+    assert key_layout.version == LEGACY_KEY_LAYOUT
+    # 기록되지 않은 기존 파일은 legacy layout
+    assert key_layout.make_object_name("PROJECT", "file-123") == "/files/project/file-123"
+    assert key_layout.make_object_name("USER", "file-123", key_layout=1) == "/files/user/file-123"
+
+
+def test_sharded_layout():
+    key_layout = KeyLayout({"version": 2})
+    shard = hashlib.md5(b"file-123").hexdigest()[:2]
+
+    assert key_layout.make_object_name("WORKSPACE", "file-123", 2, "domain-1") == (
+        f"files/{shard}/domain-1/workspace/file-123"
+    )
+    # domain 이 없는 (또는 전체 domain) 파일은 global
+    assert key_layout.make_object_name("SYSTEM", "file-123", 2, "*") == f"files/{shard}/global/public/file-123"
+
+
+def test_custom_layout():
+    key_layout = KeyLayout({"version": 3, "layouts": {"3": "files/{shard4}/{group}/{file_id}"}})
+    shard4 = hashlib.md5(b"file-123").hexdigest()[:4]
+
+    assert key_layout.make_object_name("DOMAIN", "file-123", 3) == f"files/{shard4}/domain/file-123"
+
+
+def test_undefined_layout():
+    with pytest.raises(ERROR_CONFIGURATION):
+        KeyLayout({"version": 9})
+
+    with pytest.raises(ERROR_CONFIGURATION):
+        KeyLayout({}).make_object_name("PROJECT", "file-123", key_layout=9)
+
+
+def test_key_scope():
+    key_layout = KeyLayout({"version": 2})
+
+    # domain 을 사용하지 않는 layout 은 domain 무시
+    assert key_layout.get_key_scope(None, "domain-1") == (LEGACY_KEY_LAYOUT, None)
+    assert key_layout.get_key_scope(2, "domain-1") == (2, "domain-1")
@@ -0,0 +1,59 @@
+"""
+저장 용량 제한 단위 테스트
+
+범위별 한도 선택, 선언된 크기 검사, 사용량 캐시 반영을 확인한다. (사용량은 캐시에 미리 넣어 DB 조회 없이 확인)
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("spaceone.core")
+
+from spaceone.file_manager.error.custom import ERROR_STORAGE_QUOTA_EXCEEDED  # noqa: E402
+from spaceone.file_manager.lib.quota import StorageQuota  # noqa: E402
+
+DOMAIN_KEY = {"domain_id": "domain-1", "scope_type": "DOMAIN", "scope_id": "domain-1"}
+WORKSPACE_KEY = {"domain_id": "domain-1", "scope_type": "WORKSPACE", "scope_id": "workspace-1"}
+USER_KEY = {"domain_id": "domain-1", "scope_type": "USER", "scope_id": "user-1"}
+
+
+def make_quota(usages: dict, **conf) -> StorageQuota:
+    quota = StorageQuota(conf)
+    for usage_key, total_size in usages:
+        quota._cache[quota._get_key(usage_key)] = (total_size, time.monotonic())
+    return quota
+
+
+def test_get_quota():
+    quota = StorageQuota({"quotas": {"DOMAIN": 1000, "WORKSPACE": 100}, "overrides": {"workspace-1": 500}})
+
+    assert quota.get_quota(DOMAIN_KEY) == 1000
+    # scope_id 별 한도가 우선
+    assert quota.get_quota(WORKSPACE_KEY) == 500
+    # 한도가 없으면 0 (제한 없음)
+    assert quota.get_quota(USER_KEY) == 0
+    assert quota.get_limited_keys([DOMAIN_KEY, WORKSPACE_KEY, USER_KEY]) == [DOMAIN_KEY, WORKSPACE_KEY]
+
+
+def test_check():
+    quota = make_quota([(DOMAIN_KEY, 900), (WORKSPACE_KEY, 0)], quotas={"DOMAIN": 1000, "WORKSPACE": 1000})
+
+    quota.check([DOMAIN_KEY, WORKSPACE_KEY, USER_KEY], 100)
+
+    with pytest.raises(ERROR_STORAGE_QUOTA_EXCEEDED):
+        quota.check([DOMAIN_KEY, WORKSPACE_KEY, USER_KEY], 101)
+
+
+def test_add_usage_is_included_in_next_check():
+    quota = make_quota([(DOMAIN_KEY, 0)], quotas={"DOMAIN": 1000})
+
+    # 파일 정보 생성 시 반영한 사용량은 캐시가 만료되기 전에도 다음 검사에 포함
+    quota.add_usage([DOMAIN_KEY], 600)
+    assert quota.get_usage(DOMAIN_KEY) == 600
+
+    with pytest.raises(ERROR_STORAGE_QUOTA_EXCEEDED):
+        quota.check([DOMAIN_KEY], 500)
+
+    quota.add_usage([DOMAIN_KEY], -600)
+    quota.check([DOMAIN_KEY], 500)
@@ -0,0 +1,144 @@
+"""
+backend 호출 보호 단위 테스트
+
+circuit breaker 의 open/half-open/close 전이, AIMD 동시 요청 수 제한의 증가/감소, 재시도 가능한 오류 분류를 확인한다.
+"""
+
+import pytest
+
+pytest.importorskip("spaceone.core")
+
+from spaceone.core.error import ERROR_INVALID_ARGUMENT  # noqa: E402
+from spaceone.file_manager.error.custom import ERROR_BACKEND_UNAVAILABLE  # noqa: E402
+from spaceone.file_manager.lib.resilience import (  # noqa: E402
+    DEFAULT_BACKEND_RESILIENCE,
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    is_retryable_error,
+    is_throttle_error,
+)
+
+
+class FakeBackendError(Exception):
+    def __init__(self, status_code: int, code: str = None):
+        super().__init__(f"{status_code} {code}")
+        self.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status_code}}
+
+
+def make_limiter(**conf) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter("TestBackend", {**DEFAULT_BACKEND_RESILIENCE["concurrency"], **conf})
+
+
+def test_circuit_opens_after_consecutive_failures():
+    circuit_breaker = CircuitBreaker("TestBackend", failure_threshold=3, reset_timeout=60)
+
+    circuit_breaker.record_failure()
+    circuit_breaker.record_failure()
+    # 성공하면 연속 실패 횟수 초기화
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+    circuit_breaker.record_failure()
+    circuit_breaker.before_call()
+
+    circuit_breaker.record_failure()
+    with pytest.raises(ERROR_BACKEND_UNAVAILABLE):
+        circuit_breaker.before_call()
+
+
+def test_circuit_half_open():
+    circuit_breaker = CircuitBreaker("TestBackend", failure_threshold=1, reset_timeout=0)
+    circuit_breaker.record_failure()
+
+    # reset_timeout 이 지나면 시험 요청 1건만 허용
+    circuit_breaker.before_call()
+    with pytest.raises(ERROR_BACKEND_UNAVAILABLE):
+        circuit_breaker.before_call()
+
+    # 시험 요청이 실패하면 다시 open, 성공하면 close
+    circuit_breaker.record_failure()
+    circuit_breaker.before_call()
+    circuit_breaker.record_success()
+    assert circuit_breaker.opened_at is None
+    circuit_breaker.before_call()
+    circuit_breaker.before_call()
+
+
+def test_circuit_disabled():
+    circuit_breaker = CircuitBreaker("TestBackend", failure_threshold=0, reset_timeout=60)
+
+    for _ in range(10):
+        circuit_breaker.record_failure()
+
+    circuit_breaker.before_call()
+
+
+def test_limiter_blocks_at_limit():
+    limiter = make_limiter(initial_limit=2)
+
+    started_at = [limiter.acquire(), limiter.acquire()]
+    assert limiter.acquire(blocking=False) is None
+
+    limiter.release(started_at.pop())
+    assert limiter.acquire(blocking=False) is not None
+
+
+def test_limiter_additive_increase():
+    limiter = make_limiter(initial_limit=2, max_limit=3)
+
+    # 제한만큼 성공하면 increase 만큼 증가 (최대 max_limit)
+    for _ in range(20):
+        started_at = [limiter.acquire(), limiter.acquire()]
+        for value in started_at:
+            limiter.release(value)
+
+    assert limiter.limit == 3
+
+
+def test_limiter_does_not_increase_when_idle():
+    limiter = make_limiter(initial_limit=8)
+
+    for _ in range(20):
+        limiter.release(limiter.acquire())
+
+    assert limiter.limit == 8
+
+
+def test_limiter_multiplicative_decrease():
+    limiter = make_limiter(initial_limit=32, min_limit=4)
+
+    first, second = limiter.acquire(), limiter.acquire()
+    limiter.release(first, throttled=True)
+    assert limiter.limit == 16
+
+    # 감소 이전에 시작된 요청의 throttle 응답은 이미 반영된 것으로 보고 무시
+    limiter.release(second, throttled=True)
+    assert limiter.limit == 16
+
+    for _ in range(5):
+        limiter.release(limiter.acquire(), throttled=True)
+    assert limiter.limit == 4
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (ConnectionError("reset"), True),
+        (FakeBackendError(500), True),
+        (FakeBackendError(503, "SlowDown"), True),
+        (FakeBackendError(429), True),
+        (FakeBackendError(404, "NoSuchKey"), False),
+        (FakeBackendError(403, "AccessDenied"), False),
+        (FileNotFoundError("missing"), False),
+        (ValueError("invalid"), False),
+        (ERROR_INVALID_ARGUMENT(key="file_id"), False),
+    ],
+)
+def test_is_retryable_error(error, retryable):
+    assert is_retryable_error(error) is retryable
+
+
+def test_is_throttle_error():
+    assert is_throttle_error(FakeBackendError(503, "SlowDown"))
+    assert is_throttle_error(FakeBackendError(429))
+    assert not is_throttle_error(FakeBackendError(503))
+    assert not is_throttle_error(FakeBackendError(500, "InternalError"))
@@ -0,0 +1,101 @@
+"""
+서명된 다운로드 링크 단위 테스트
+
+서명/검증 결과, 요청 경로 불일치/변조/만료/key 교체 시 거부, 링크 유효 시간 설정 검사를 확인한다.
+"""
+
+import pytest
+
+pytest.importorskip("spaceone.core")
+
+from spaceone.core.error import ERROR_CONFIGURATION  # noqa: E402
+from spaceone.file_manager.error.custom import ERROR_INVALID_SIGNED_URL  # noqa: E402
+from spaceone.file_manager.lib.signed_url import UrlSigner  # noqa: E402
+
+FILE_INFO = {
+    "file_id": "file-123",
+    "domain_id": "domain-1",
+    "backend": "AWSS3Connector",
+    "key_layout": 2,
+    "name": "report.pdf",
+}
+
+
+def make_signer(**conf) -> UrlSigner:
+    return UrlSigner({"enabled": True, "keys": {"k1": "secret-1"}, **conf})
+
+
+def test_sign_and_verify():
+    signer = make_signer()
+
+    signature = signer.sign(FILE_INFO, "PROJECT")
+
+    assert signature.startswith("k1.")
+    assert signer.verify(signature, "file-123", "PROJECT") == {**FILE_INFO, "resource_group": "PROJECT"}
+
+
+def test_disabled_signer_does_not_sign():
+    signer = UrlSigner({"enabled": False, "keys": {"k1": "secret-1"}})
+
+    assert signer.sign(FILE_INFO, "PROJECT") is None
+    with pytest.raises(ERROR_INVALID_SIGNED_URL):
+        signer.verify(make_signer().sign(FILE_INFO, "PROJECT"), "file-123", "PROJECT")
+
+
+def test_same_window_gives_same_signature():
+    signer = make_signer(ttl=0, window=3600)
+
+    assert signer.sign(FILE_INFO, "PROJECT") == signer.sign(FILE_INFO, "PROJECT")
+
+
+@pytest.mark.parametrize(
+    "file_id, resource_group",
+    [("file-456", "PROJECT"), ("file-123", "DOMAIN")],
+)
+def test_reject_scope_mismatch(file_id, resource_group):
+    signer = make_signer()
+
+    with pytest.raises(ERROR_INVALID_SIGNED_URL):
+        signer.verify(signer.sign(FILE_INFO, "PROJECT"), file_id, resource_group)
+
+
+def test_reject_tampered_signature():
+    signer = make_signer()
+    key_id, payload, digest = signer.sign(FILE_INFO, "PROJECT").split(".")
+    other_payload = make_signer().sign({**FILE_INFO, "name": "other.pdf"}, "PROJECT").split(".")[1]
+
+    with pytest.raises(ERROR_INVALID_SIGNED_URL):
+        signer.verify(f"{key_id}.{other_payload}.{digest}", "file-123", "PROJECT")
+
+    with pytest.raises(ERROR_INVALID_SIGNED_URL):
+        signer.verify("malformed", "file-123", "PROJECT")
+
+
+def test_reject_expired_signature():
+    signer = make_signer(ttl=-10, window=1)
+
+    with pytest.raises(ERROR_INVALID_SIGNED_URL):
+        signer.verify(signer.sign(FILE_INFO, "PROJECT"), "file-123", "PROJECT")
+
+
+def test_key_rotation():
+    old_signer = make_signer()
+    signature = old_signer.sign(FILE_INFO, "PROJECT")
+
+    # 이전 key 를 유지하는 동안에는 기존 링크도 검증
+    rotated_signer = UrlSigner({"enabled": True, "keys": {"k1": "secret-1", "k2": "secret-2"}, "active_key_id": "k2"})
+    assert rotated_signer.sign(FILE_INFO, "PROJECT").startswith("k2.")
+    assert rotated_signer.verify(signature, "file-123", "PROJECT")["file_id"] == "file-123"
+
+    # 이전 key 를 제거하면 거부
+    new_signer = UrlSigner({"enabled": True, "keys": {"k2": "secret-2"}})
+    with pytest.raises(ERROR_INVALID_SIGNED_URL):
+        new_signer.verify(signature, "file-123", "PROJECT")
+
+
+def test_reject_lifetime_longer_than_grace_period():
+    with pytest.raises(ERROR_CONFIGURATION):
+        make_signer(ttl=3600, window=300)
+
+    # 서명을 사용하지 않으면 확인하지 않음
+    UrlSigner({"enabled": False, "ttl": 3600, "window": 300})